@@ -9,15 +9,6 @@ from sqlflow.logging import configure_logging
 # Set up default logging configuration
 configure_logging()
 
-# Apply UDF patches to handle default parameters
-try:
-    from sqlflow.udfs.udf_patch import patch_udf_manager
-
-    patch_udf_manager()
-except ImportError:
-    # This can happen during installation when dependencies are not yet satisfied
-    pass
-
 # V2 Variables module uses pure functions - no need for global imports
 
 from .exceptions import (
@@ -12,7 +12,7 @@ Following technical design principles:
 
 import json
 import os
-from typing import Any, Dict, List, Optional, Tuple
+from typing import TYPE_CHECKING, Any, Dict, Iterator, List, Optional, Tuple
 
 from sqlflow.cli.errors import (
     PipelineNotFoundError,
@@ -24,34 +24,39 @@ from sqlflow.cli.factories import (
     get_planner,
     load_project_for_command,
 )
+from sqlflow.cli.utils import resolve_job_count, run_pipeline_jobs
+from sqlflow.core.storage.artifact_manager import ArtifactManager
+from sqlflow.core.storage.compile_cache import CompileCache, compute_compile_key
 from sqlflow.logging import get_logger
+from sqlflow.parser.ast import Pipeline
 from sqlflow.parser.parser import Parser
+from sqlflow.project import Project
+
+if TYPE_CHECKING:
+    from sqlflow.core.executors.backfill import (
+        BackfillPartitionResult,
+        PartitionCallback,
+    )
 
 logger = get_logger(__name__)
 
 
 # Pipeline Operations
-def compile_pipeline_operation(
-    pipeline_name: str,
-    profile_name: Optional[str] = None,
-    variables: Optional[Dict[str, Any]] = None,
-    output_dir: Optional[str] = None,
-) -> Tuple[List[Dict[str, Any]], str]:
-    """Compile a pipeline to execution plan.
+def _find_pipeline_for_command(
+    pipeline_name: str, profile_name: Optional[str] = None
+) -> Tuple[Project, str]:
+    """Load the project and locate one of its pipelines.
 
     Args:
-        pipeline_name: Name of the pipeline to compile
-        profile_name: Profile to use for compilation
-        variables: Variables for substitution
-        output_dir: Directory to save compilation output
+        pipeline_name: Name of the pipeline
+        profile_name: Profile to load the project with
 
     Returns:
-        Tuple of (operations_list, output_path)
+        Tuple of (project, pipeline_path)
 
     Raises:
         PipelineNotFoundError: If pipeline file not found
         ProfileNotFoundError: If profile not found
-        PipelineValidationError: If pipeline validation fails
     """
     # Load project using factory
     project = load_project_for_command(profile_name)
@@ -73,7 +78,15 @@ def compile_pipeline_operation(
 
         raise PipelineNotFoundError(pipeline_name, [pipelines_dir], available_pipelines)
 
-    # Parse pipeline
+    return project, pipeline_path
+
+
+def _parse_pipeline_file(pipeline_name: str, pipeline_path: str) -> Pipeline:
+    """Parse a pipeline file.
+
+    Raises:
+        PipelineValidationError: If the pipeline cannot be parsed
+    """
     try:
         parser = Parser()
         with open(pipeline_path, "r") as f:
@@ -84,13 +97,95 @@ def compile_pipeline_operation(
     except Exception as e:
         raise PipelineValidationError(pipeline_name, [str(e)])
 
+    return pipeline
+
+
+def _load_pipeline_for_command(
+    pipeline_name: str, profile_name: Optional[str] = None
+) -> Tuple[Project, Pipeline]:
+    """Load the project and parse one of its pipelines.
+
+    Args:
+        pipeline_name: Name of the pipeline to parse
+        profile_name: Profile to load the project with
+
+    Returns:
+        Tuple of (project, parsed_pipeline)
+
+    Raises:
+        PipelineNotFoundError: If pipeline file not found
+        ProfileNotFoundError: If profile not found
+        PipelineValidationError: If the pipeline cannot be parsed
+    """
+    project, pipeline_path = _find_pipeline_for_command(pipeline_name, profile_name)
+    return project, _parse_pipeline_file(pipeline_name, pipeline_path)
+
+
+def compile_pipeline_operation(
+    pipeline_name: str,
+    profile_name: Optional[str] = None,
+    variables: Optional[Dict[str, Any]] = None,
+    output_dir: Optional[str] = None,
+    compile_cache: Optional[CompileCache] = None,
+) -> Tuple[List[Dict[str, Any]], str]:
+    """Compile a pipeline to execution plan.
+
+    With a compile_cache, the saved plan is reused without parsing or
+    planning when the pipeline text, its included files, the variables it
+    references, the profile, the recorded step durations and the SQLFlow
+    version are unchanged.
+    Step durations recorded by the last run are used as cost hints.
+
+    Args:
+        pipeline_name: Name of the pipeline to compile
+        profile_name: Profile to use for compilation
+        variables: Variables for substitution
+        output_dir: Directory to save compilation output
+        compile_cache: Optional cache of previously saved plans
+
+    Returns:
+        Tuple of (operations_list, output_path)
+
+    Raises:
+        PipelineNotFoundError: If pipeline file not found
+        ProfileNotFoundError: If profile not found
+        PipelineValidationError: If pipeline validation fails
+    """
+    project, pipeline_path = _find_pipeline_for_command(pipeline_name, profile_name)
+    profile_variables = project.profile.get("variables", {})
+    output_path = get_compilation_output_path(pipeline_name, output_dir or "target")
+
+    step_durations = ArtifactManager(project.project_dir).load_step_durations(
+        pipeline_name
+    )
+    cache_key = None
+    if compile_cache is not None:
+        with open(pipeline_path, "r") as f:
+            pipeline_text = f.read()
+        # Environment variables have the lowest priority, CLI variables the highest
+        cache_key = compute_compile_key(
+            pipeline_text,
+            pipeline_path,
+            {**os.environ, **profile_variables, **(variables or {})},
+            project.profile,
+            step_durations,
+        )
+        cached_operations = compile_cache.load(output_path, cache_key)
+        if cached_operations is not None:
+            logger.debug(f"Reusing compiled plan for '{pipeline_name}'")
+            return cached_operations, output_path
+        compile_cache.invalidate(output_path)
+
+    pipeline = _parse_pipeline_file(pipeline_name, pipeline_path)
+
     # Create execution plan using factory
     planner = get_planner()
     try:
         operations = planner.create_plan(
             pipeline,
             variables=variables,
-            profile_variables=project.profile.get("variables", {}),
+            profile_variables=profile_variables,
+            step_durations=step_durations,
         )
         logger.debug(f"Created execution plan with {len(operations)} operations")
     except Exception as e:
@@ -100,10 +195,72 @@ def compile_pipeline_operation(
     output_path = save_compilation_result(
         operations, pipeline_name, output_dir or "target"
     )
+    if cache_key is not None:
+        compile_cache.save(output_path, cache_key)
 
     return operations, output_path
 
 
+def _compile_pipeline_job(
+    pipeline_name: str,
+    profile_name: Optional[str],
+    variables: Optional[Dict[str, Any]],
+    output_dir: Optional[str],
+    use_cache: bool,
+) -> Dict[str, Any]:
+    """Compile one pipeline of a multi-pipeline compile, in any process."""
+    result: Dict[str, Any] = {
+        "pipeline_name": pipeline_name,
+        "operations": None,
+        "output_path": None,
+        "errors": [],
+    }
+    try:
+        result["operations"], result["output_path"] = compile_pipeline_operation(
+            pipeline_name,
+            profile_name,
+            variables,
+            output_dir,
+            compile_cache=CompileCache(enabled=use_cache),
+        )
+    except PipelineValidationError as e:
+        result["errors"] = list(e.errors)
+    except Exception as e:
+        result["errors"] = [str(e)]
+    return result
+
+
+def compile_pipelines_operation(
+    pipeline_names: List[str],
+    profile_name: Optional[str] = None,
+    variables: Optional[Dict[str, Any]] = None,
+    output_dir: Optional[str] = None,
+    use_cache: bool = True,
+    jobs: int = 1,
+) -> Iterator[Dict[str, Any]]:
+    """Compile several pipelines, in worker processes when jobs > 1.
+
+    A failing pipeline does not stop the others.
+
+    Args:
+        pipeline_names: Names of the pipelines to compile
+        profile_name: Profile to use for compilation
+        variables: Variables for substitution
+        output_dir: Directory to save compilation output
+        use_cache: Whether unchanged pipelines may reuse their saved plan
+        jobs: Maximum number of worker processes, 0 for all CPUs
+
+    Returns:
+        Iterator over dicts with pipeline_name, operations, output_path and
+        errors, in the order of pipeline_names
+    """
+    job_args = [
+        (pipeline_name, profile_name, variables, output_dir, use_cache)
+        for pipeline_name in pipeline_names
+    ]
+    return run_pipeline_jobs(_compile_pipeline_job, job_args, resolve_job_count(jobs))
+
+
 def run_pipeline_operation(
     pipeline_name: str,
     profile_name: Optional[str] = None,
@@ -139,6 +296,81 @@ def run_pipeline_operation(
         raise PipelineValidationError(pipeline_name, [f"Execution failed: {str(e)}"])
 
 
+def record_step_durations_operation(
+    pipeline_name: str,
+    step_durations: Dict[str, float],
+    profile_name: Optional[str] = None,
+) -> None:
+    """Record the step durations of a run as cost hints for the next compile.
+
+    Args:
+        pipeline_name: Name of the pipeline that ran
+        step_durations: Durations in seconds of the steps that succeeded
+        profile_name: Profile the pipeline ran with
+    """
+    project = load_project_for_command(profile_name)
+    ArtifactManager(project.project_dir).save_step_durations(
+        pipeline_name, step_durations
+    )
+
+
+def backfill_pipeline_operation(
+    pipeline_name: str,
+    variable: str,
+    values: List[str],
+    profile_name: Optional[str] = None,
+    variables: Optional[Dict[str, Any]] = None,
+    parallel: int = 1,
+    on_partition_done: Optional["PartitionCallback"] = None,
+) -> List["BackfillPartitionResult"]:
+    """Run a pipeline once per value of a variable, compiling it only once.
+
+    Args:
+        pipeline_name: Name of the pipeline to backfill
+        variable: Variable taking one value per partition, e.g. run_date
+        values: Values of the variable, one partition each
+        profile_name: Profile to use for execution
+        variables: Other variables, shared by all partitions
+        parallel: Number of partitions running at the same time
+        on_partition_done: Optional callback receiving each partition result
+
+    Returns:
+        Partition results in the order of values
+
+    Raises:
+        PipelineNotFoundError: If pipeline file not found
+        ProfileNotFoundError: If profile not found
+        PipelineValidationError: If the pipeline cannot be parsed or planned
+    """
+    project, pipeline = _load_pipeline_for_command(pipeline_name, profile_name)
+
+    # Imported here so that commands not running pipelines start fast
+    from sqlflow.core.executors.backfill import BackfillRunner
+
+    runner = BackfillRunner(
+        pipeline,
+        variable,
+        variables=variables,
+        profile_variables=project.profile.get("variables", {}),
+        planner=get_planner(),
+        max_workers=parallel,
+        project_dir=project.project_dir,
+        engine_config=project.profile.get("engines", {}).get("duckdb", {}),
+    )
+    try:
+        runner.compile()
+    except Exception as e:
+        raise PipelineValidationError(pipeline_name, [f"Planning failed: {str(e)}"])
+
+    results = runner.run(values, on_partition_done)
+    failed = sum(1 for result in results if not result.success)
+    logger.info(
+        f"Backfilled pipeline '{pipeline_name}' for {len(results)} values of "
+        f"'{variable}': {len(results) - failed} succeeded, {failed} failed"
+    )
+    return results
+
+
 def list_pipelines_operation(
     profile_name: Optional[str] = None,
 ) -> List[Dict[str, str]]:
@@ -214,6 +446,35 @@ def validate_pipeline_operation(
         raise
 
 
+def _validate_pipeline_job(
+    pipeline_name: str, profile_name: Optional[str]
+) -> Tuple[str, bool, List[str]]:
+    """Validate one pipeline of a multi-pipeline validation, in any process."""
+    try:
+        is_valid, errors = validate_pipeline_operation(pipeline_name, profile_name)
+        return pipeline_name, is_valid, errors
+    except Exception as e:
+        return pipeline_name, False, [str(e)]
+
+
+def validate_pipelines_operation(
+    pipeline_names: List[str], profile_name: Optional[str] = None, jobs: int = 1
+) -> Iterator[Tuple[str, bool, List[str]]]:
+    """Validate several pipelines, in worker processes when jobs > 1.
+
+    Args:
+        pipeline_names: Names of the pipelines to validate
+        profile_name: Profile to use for validation
+        jobs: Maximum number of worker processes, 0 for all CPUs
+
+    Returns:
+        Iterator over (pipeline_name, is_valid, error_messages) tuples, in
+        the order of pipeline_names
+    """
+    job_args = [(pipeline_name, profile_name) for pipeline_name in pipeline_names]
+    return run_pipeline_jobs(_validate_pipeline_job, job_args, resolve_job_count(jobs))
+
+
 # Profile Operations
 def list_profiles_operation(project_dir: Optional[str] = None) -> List[Dict[str, Any]]:
     """List available profiles.
@@ -337,6 +598,23 @@ def init_project_operation(project_dir: str, project_name: str) -> str:
 
 
 # Helper Functions
+def get_compilation_output_path(pipeline_name: str, output_dir: str = "target") -> str:
+    """Get the file a pipeline's compilation result is saved to.
+
+    Args:
+        pipeline_name: Name of the pipeline
+        output_dir: Directory to save output, or complete file path if ends with .json
+
+    Returns:
+        Path of the compilation result file
+    """
+    # Check if output_dir is actually a complete file path
+    if output_dir.endswith(".json"):
+        return output_dir
+    # Compiled plans go to the compiled subdirectory of the output directory
+    return os.path.join(output_dir, "compiled", f"{pipeline_name}.json")
+
+
 def save_compilation_result(
     operations: List[Dict[str, Any]], pipeline_name: str, output_dir: str = "target"
 ) -> str:
@@ -350,21 +628,9 @@ def save_compilation_result(
     Returns:
         Path to saved file
     """
-    # Check if output_dir is actually a complete file path
-    if output_dir.endswith(".json"):
-        output_path = output_dir
-        # Ensure directory exists
-        os.makedirs(os.path.dirname(output_path), exist_ok=True)
-    else:
-        # Create compiled subdirectory in output directory
-        compiled_dir = os.path.join(output_dir, "compiled")
-
-        # Ensure output directory exists
-        os.makedirs(compiled_dir, exist_ok=True)
-
-        # Create output filename
-        output_filename = f"{pipeline_name}.json"
-        output_path = os.path.join(compiled_dir, output_filename)
+    output_path = get_compilation_output_path(pipeline_name, output_dir)
+    # Ensure output directory exists
+    os.makedirs(os.path.dirname(output_path) or ".", exist_ok=True)
 
     # Save compilation result
     with open(output_path, "w") as f:
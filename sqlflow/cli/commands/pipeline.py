@@ -5,6 +5,7 @@ commands using Typer framework with Rich display and type safety.
 """
 
 import json
+import time
 from typing import Any, Dict, List, Optional, Tuple
 
 import typer
@@ -16,9 +17,13 @@ from sqlflow.cli.advanced_display import (
     display_pipeline_execution_progress,
 )
 from sqlflow.cli.business_operations import (
+    backfill_pipeline_operation,
     compile_pipeline_operation,
+    compile_pipelines_operation,
     list_pipelines_operation,
+    record_step_durations_operation,
     validate_pipeline_operation,
+    validate_pipelines_operation,
 )
 from sqlflow.cli.display import (
     display_compilation_success,
@@ -35,6 +40,7 @@ from sqlflow.cli.errors import (
     ProfileNotFoundError,
     VariableParsingError,
 )
+from sqlflow.core.storage.compile_cache import CompileCache
 from sqlflow.logging import get_logger
 
 logger = get_logger(__name__)
@@ -78,6 +84,9 @@ def _execute_pipeline_with_progress(
 ) -> Dict[str, Any]:
     """Execute pipeline operations with Rich progress display.
 
+    The durations of the steps that succeed are recorded as cost hints for
+    the next compile.
+
     Args:
         operations: List of operations to execute
         pipeline_name: Name of the pipeline
@@ -91,23 +100,33 @@ def _execute_pipeline_with_progress(
     from sqlflow.core.engines.duckdb.engine import DuckDBEngine
     from sqlflow.core.executors.v2.execution.context import create_test_context
 
+    step_durations: Dict[str, float] = {}
+
     def executor_callback(operation):
         """Callback function to execute a single operation."""
         executor = create_executor_for_command(profile, variables)
+        start_time = time.perf_counter()
         try:
             # Create proper ExecutionContext for V2
             engine = DuckDBEngine(":memory:")
             context = create_test_context(engine=engine, variables=variables or {})
             result = executor.execute([operation], context)
-            return {"status": "success", "result": result}
         except Exception as e:
             return {"status": "error", "message": str(e)}
+        step_durations[operation["id"]] = time.perf_counter() - start_time
+        return {"status": "success", "result": result}
 
-    return display_pipeline_execution_progress(
-        operations=operations,
-        executor_callback=executor_callback,
-        pipeline_name=pipeline_name,
-    )
+    try:
+        return display_pipeline_execution_progress(
+            operations=operations,
+            executor_callback=executor_callback,
+            pipeline_name=pipeline_name,
+        )
+    finally:
+        try:
+            record_step_durations_operation(pipeline_name, step_durations, profile)
+        except Exception as e:
+            logger.debug(f"Could not record step durations: {e}")
 
 
 def _display_execution_results(
@@ -201,18 +220,42 @@ def compile_pipeline(
     output_dir: Optional[str] = typer.Option(
         None, "--output-dir", help="Output directory for compilation results"
     ),
+    all_pipelines: bool = typer.Option(
+        False, "--all", help="Compile every pipeline in the project"
+    ),
+    jobs: int = typer.Option(
+        1,
+        "--jobs",
+        "-j",
+        help="Worker processes for --all (0 uses all CPUs)",
+    ),
+    no_cache: bool = typer.Option(
+        False,
+        "--no-cache",
+        help="Recompile pipelines instead of reusing unchanged plans",
+    ),
 ) -> None:
     """Compile a pipeline to execution plan with Rich display. Shows interactive selection if no pipeline specified.
 
     Parses the pipeline file, validates syntax, creates an execution plan,
-    and saves the result to the target directory.
+    and saves the result to the target directory. Plans of pipelines whose
+    text, included files, referenced variables, profile and SQLFlow version
+    are unchanged are reused from the target directory.
 
     Args:
         pipeline_name: Name of the pipeline to compile (without .sf extension). If not provided, shows interactive selection.
         profile: Profile configuration to use (default: dev)
         variables: Optional variables as JSON string for substitution
         output_dir: Directory to save compilation output (default: target)
+        all_pipelines: Compile every pipeline instead of a single one
+        jobs: Worker processes used with --all
+        no_cache: Recompile even if a saved plan is up to date
     """
+    if all_pipelines:
+        vars_dict = _parse_variables_safely(variables)
+        _compile_all_pipelines(profile, vars_dict, output_dir, jobs, not no_cache)
+        return
+
     try:
         # Auto-interactive when no pipeline name provided
         if not pipeline_name:
@@ -228,6 +271,7 @@ def compile_pipeline(
             profile_name=profile,
             variables=vars_dict,
             output_dir=output_dir,
+            compile_cache=CompileCache(enabled=not no_cache),
         )
 
         # Display success with Rich formatting
@@ -257,6 +301,64 @@ def compile_pipeline(
         raise typer.Exit(1)
 
 
+def _compile_all_pipelines(
+    profile: str,
+    variables: Optional[Dict[str, Any]],
+    output_dir: Optional[str],
+    jobs: int,
+    use_cache: bool,
+) -> None:
+    """Compile all pipelines, reporting them in name order.
+
+    Args:
+        profile: Profile to use
+        variables: Variables for substitution
+        output_dir: Directory to save compilation output
+        jobs: Worker processes, 0 for all CPUs
+        use_cache: Whether unchanged pipelines may reuse their saved plan
+
+    Raises:
+        typer.Exit: If no pipelines are found or any compilation fails
+    """
+    try:
+        pipelines = list_pipelines_operation(profile_name=profile)
+    except ProfileNotFoundError as e:
+        display_profile_not_found_error(e)
+        raise typer.Exit(1)
+    if not pipelines:
+        console.print("📋 [yellow]No pipelines found[/yellow]")
+        raise typer.Exit(1)
+
+    pipeline_names = [pipeline_info["name"] for pipeline_info in pipelines]
+    console.print(f"⚙️ Compiling {len(pipeline_names)} pipelines")
+    failed = 0
+    results = compile_pipelines_operation(
+        pipeline_names, profile, variables, output_dir, use_cache, jobs
+    )
+    for i, result in enumerate(results, 1):
+        name = result["pipeline_name"]
+        if result["errors"]:
+            failed += 1
+            console.print(f"  ❌ [{i}/{len(pipeline_names)}] {name}.sf")
+            for error in result["errors"]:
+                console.print(f"    - {error}")
+        else:
+            console.print(
+                f"  ✅ [{i}/{len(pipeline_names)}] {name}.sf: "
+                f"{len(result['operations'])} operations → {result['output_path']}"
+            )
+
+    if failed:
+        console.print(
+            f"❌ [bold red]Compilation failed for {failed} pipeline(s)[/bold red]"
+        )
+        raise typer.Exit(1)
+    console.print(
+        f"✅ [bold green]All {len(pipeline_names)} pipelines compiled "
+        "successfully[/bold green]"
+    )
+
+
 @pipeline_app.command("run")
 def run_pipeline(
     pipeline_name: Optional[str] = typer.Argument(
@@ -320,6 +422,115 @@ def run_pipeline(
         raise typer.Exit(1)
 
 
+def _parse_backfill_values(var: str) -> Tuple[str, List[str]]:
+    """Expand the --var backfill specification, exiting on invalid input."""
+    from sqlflow.core.executors.backfill import expand_backfill_values
+
+    try:
+        return expand_backfill_values(var)
+    except ValueError as e:
+        display_variable_parsing_error(VariableParsingError(var, str(e)))
+        raise typer.Exit(1)
+
+
+def _display_backfill_results(
+    results: List[Any], pipeline_name: str, duration: float
+) -> None:
+    """Display the backfill summary, exiting with an error if any value failed."""
+    failed = [result.value for result in results if not result.success]
+    if failed:
+        console.print(
+            f"❌ [bold red]{len(failed)} of {len(results)} partitions failed"
+            f"[/bold red] [dim]in {duration:.2f}s[/dim]"
+        )
+        console.print(f"🔧 [dim]Failed values: {', '.join(failed)}[/dim]")
+        raise typer.Exit(1)
+
+    console.print(
+        f"✅ [bold green]Backfilled {len(results)} partitions of "
+        f"'{pipeline_name}'[/bold green] [dim]in {duration:.2f}s[/dim]"
+    )
+
+
+@pipeline_app.command("backfill")
+def backfill_pipeline(
+    pipeline_name: str = typer.Argument(..., help="Pipeline name to backfill"),
+    var: str = typer.Option(
+        ...,
+        "--var",
+        help="Backfill variable and its values: run_date=2024-01-01..2024-12-31, "
+        "batch=1..10 or region=eu,us",
+    ),
+    parallel: int = typer.Option(
+        1, "--parallel", "-j", min=1, help="Number of partitions to run at once"
+    ),
+    profile: str = typer.Option("dev", "--profile", "-p", help="Profile to use"),
+    variables: Optional[str] = typer.Option(
+        None, "--variables", "--vars", help="Other variables as JSON string"
+    ),
+) -> None:
+    """Run a pipeline once per value of a variable, e.g. for every date in a range.
+
+    The pipeline is parsed, planned and its UDFs discovered once. Each value
+    then runs on its own DuckDB engine, up to --parallel at a time. Engines are
+    in-memory, so results should leave each partition through EXPORT steps,
+    unless the profile is persistent: each value then gets its own database
+    file in a <database>_backfill directory next to the profile's database.
+
+    Args:
+        pipeline_name: Name of the pipeline to backfill (without .sf extension)
+        var: Variable name with a date range, integer range or list of values
+        parallel: Number of partitions to run concurrently (default: 1)
+        profile: Profile configuration to use (default: dev)
+        variables: Optional variables shared by all partitions
+    """
+    try:
+        vars_dict = _parse_variables_safely(variables)
+        variable, values = _parse_backfill_values(var)
+
+        console.print(
+            f"🔁 Backfilling [cyan]{pipeline_name}[/cyan] for {len(values)} "
+            f"values of [cyan]{variable}[/cyan] ({parallel} at a time)"
+        )
+
+        def report_partition(result) -> None:
+            partition = f"{variable}={result.value}"
+            if result.success:
+                console.print(f"  ✅ {partition} [dim]({result.duration:.2f}s)[/dim]")
+            else:
+                console.print(f"  ❌ {partition}: [red]{result.error_message}[/red]")
+
+        start_time = time.perf_counter()
+        results = backfill_pipeline_operation(
+            pipeline_name=pipeline_name,
+            variable=variable,
+            values=values,
+            profile_name=profile,
+            variables=vars_dict,
+            parallel=parallel,
+            on_partition_done=report_partition,
+        )
+        _display_backfill_results(
+            results, pipeline_name, time.perf_counter() - start_time
+        )
+
+    except typer.Exit:
+        raise
+    except PipelineNotFoundError as e:
+        display_pipeline_not_found_error(e)
+        raise typer.Exit(1)
+    except ProfileNotFoundError as e:
+        display_profile_not_found_error(e)
+        raise typer.Exit(1)
+    except PipelineValidationError as e:
+        display_pipeline_validation_error(e)
+        raise typer.Exit(1)
+    except Exception as e:
+        logger.error(f"Unexpected error during backfill: {e}")
+        console.print(f"❌ [bold red]Backfill failed: {str(e)}[/bold red]")
+        raise typer.Exit(1)
+
+
 @pipeline_app.command("list")
 def list_pipelines(
     profile: str = typer.Option("dev", "--profile", "-p", help="Profile to use"),
@@ -394,43 +605,34 @@ def _validate_single_pipeline(
         raise typer.Exit(1)
 
 
-def _validate_all_pipelines(profile: str, verbose: bool, quiet: bool) -> None:
+def _validate_all_pipelines(
+    profile: str, verbose: bool, quiet: bool, jobs: int = 1
+) -> None:
     """Validate all pipelines.
 
     Args:
         profile: Profile to use
         verbose: Show detailed validation information
         quiet: Suppress non-error output
+        jobs: Worker processes, 0 for all CPUs
 
     Raises:
         typer.Exit: If any validation fails
     """
-    from sqlflow.cli.business_operations import list_pipelines_operation
-
     pipelines = list_pipelines_operation(profile_name=profile)
     all_valid = True
     failed_pipelines = []
 
-    for pipeline_info in pipelines:
-        pipeline_name = pipeline_info["name"]
-        try:
-            is_valid, errors = validate_pipeline_operation(
-                pipeline_name=pipeline_name,
-                profile_name=profile,
-            )
-
-            if is_valid:
-                if not quiet:
-                    logger.info(f"Pipeline '{pipeline_name}' validation passed")
-            else:
-                all_valid = False
-                failed_pipelines.append((pipeline_name, errors))
-                logger.warning(f"Pipeline '{pipeline_name}' validation failed")
-
-        except Exception as e:
+    pipeline_names = [pipeline_info["name"] for pipeline_info in pipelines]
+    results = validate_pipelines_operation(pipeline_names, profile, jobs)
+    for pipeline_name, is_valid, errors in results:
+        if is_valid:
+            if not quiet:
+                logger.info(f"Pipeline '{pipeline_name}' validation passed")
+        else:
             all_valid = False
-            failed_pipelines.append((pipeline_name, [str(e)]))
-            logger.error(f"Pipeline '{pipeline_name}' validation error: {e}")
+            failed_pipelines.append((pipeline_name, errors))
+            logger.warning(f"Pipeline '{pipeline_name}' validation failed")
 
     _display_bulk_validation_results(
         pipelines, failed_pipelines, all_valid, verbose, quiet
@@ -488,6 +690,12 @@ def validate_pipeline(
     quiet: bool = typer.Option(
         False, "--quiet", "-q", help="Suppress non-error output"
     ),
+    jobs: int = typer.Option(
+        1,
+        "--jobs",
+        "-j",
+        help="Worker processes when validating all pipelines (0 uses all CPUs)",
+    ),
 ) -> None:
     """Validate a pipeline or all pipelines without executing.
 
@@ -499,12 +707,13 @@ def validate_pipeline(
         profile: Profile configuration to use (default: dev)
         verbose: Show detailed validation information including suggestions
         quiet: Suppress non-error output
+        jobs: Worker processes when validating all pipelines
     """
     try:
         if pipeline_name:
             _validate_single_pipeline(pipeline_name, profile, verbose, quiet)
         else:
-            _validate_all_pipelines(profile, verbose, quiet)
+            _validate_all_pipelines(profile, verbose, quiet, jobs)
 
     except PipelineNotFoundError as e:
         display_pipeline_not_found_error(e)
@@ -70,6 +70,8 @@ def display_compilation_success(
         if len(operations) > 5:
             console.print(f"  ... and {len(operations) - 5} more operations")
 
+        display_schedule_summary(operations)
+
     # Show variables if provided
     if variables:
         console.print("\n🔧 [bold blue]Variables:[/bold blue]")
@@ -80,6 +82,30 @@ def display_compilation_success(
             console.print(f"  ... and {len(variables) - 5} more variables")
 
 
+def display_schedule_summary(operations: List[Dict[str, Any]]) -> None:
+    """Display the parallel waves and critical path of an annotated plan.
+
+    Args:
+        operations: Plan steps annotated with waves by the planner
+    """
+    from sqlflow.core.planner.schedule import summarize_schedule
+
+    schedule = summarize_schedule(operations)
+    if not schedule["waves"]:
+        return
+
+    widest = max(len(wave) for wave in schedule["waves"])
+    console.print(
+        f"\n🌊 [bold blue]Parallel waves:[/bold blue] {len(schedule['waves'])} "
+        f"(up to {widest} steps at once)"
+    )
+    console.print(
+        f"⏱️  [bold blue]Critical path[/bold blue] "
+        f"(~{schedule['critical_path_seconds']:.1f}s): "
+        f"{' → '.join(schedule['critical_path'])}"
+    )
+
+
 def display_execution_success(
     pipeline_name: str,
     profile: str,
@@ -6,24 +6,28 @@ Functions are first-class citizens in Python.
 
 import os
 from functools import lru_cache
-from typing import Any, Dict, Optional
+from typing import TYPE_CHECKING, Any, Dict, Optional
 
 from sqlflow.cli.errors import ProfileNotFoundError, ProjectNotFoundError
-from sqlflow.core.executors import get_executor
-from sqlflow.core.planner_main import Planner
 from sqlflow.logging import get_logger
 from sqlflow.project import Project
 
+if TYPE_CHECKING:
+    from sqlflow.core.planner_main import Planner
+
 logger = get_logger(__name__)
 
 
 # Raymond Hettinger: Simple cached factory functions
 @lru_cache(maxsize=None)
-def get_planner() -> Planner:
+def get_planner() -> "Planner":
     """Get planner instance - cached for performance.
 
     Raymond Hettinger: Built-in, tested, optimized.
     """
+    # Imported here so that commands not compiling pipelines start fast
+    from sqlflow.core.planner_main import Planner
+
     return Planner()
 
 
@@ -94,6 +98,9 @@ def create_executor_for_command(
         if not project:
             raise ProjectNotFoundError(os.getcwd())
 
+        # Imported here so that commands not running pipelines start fast
+        from sqlflow.core.executors import get_executor
+
         # Raymond Hettinger: Simple, direct approach
         executor = get_executor(
             project_dir=project.project_dir,
@@ -0,0 +1,79 @@
+"""Lazy loading of CLI command groups.
+
+Each command group (pipeline, profiles, udf, ...) lives in its own module
+under sqlflow.cli.commands, and importing them pulls in the planner, the
+executors and their dependencies. The main application lists these groups
+without importing them and only imports the group that is actually invoked,
+so ``sqlflow --help`` and shell completion stay fast.
+"""
+
+import importlib
+from typing import Dict, List, Optional, Tuple
+
+import click
+import typer
+from typer.core import TyperGroup
+from typer.main import get_group_from_info
+from typer.models import TyperInfo
+
+
+class LazyTyperGroup(TyperGroup):
+    """Typer group importing its sub-apps on first invocation.
+
+    Subclasses declare lazy_subcommands, mapping each command name to the
+    module defining the sub-app, the sub-app attribute and its help text.
+    Listing commands, e.g. for --help, uses the declared help text; resolving
+    a command for execution or completion imports the real sub-app.
+    """
+
+    lazy_subcommands: Dict[str, Tuple[str, str, str]] = {}
+
+    def list_commands(self, ctx: click.Context) -> List[str]:
+        """List eager commands in declaration order, then lazy ones."""
+        names = list(self.commands)
+        names.extend(name for name in self.lazy_subcommands if name not in names)
+        return names
+
+    def get_command(self, ctx: click.Context, cmd_name: str) -> Optional[click.Command]:
+        """Get a loaded command, or a placeholder carrying a lazy command's help."""
+        command = super().get_command(ctx, cmd_name)
+        if command is not None or cmd_name not in self.lazy_subcommands:
+            return command
+        _, _, help_text = self.lazy_subcommands[cmd_name]
+        return click.Command(cmd_name, help=help_text)
+
+    def resolve_command(
+        self, ctx: click.Context, args: List[str]
+    ) -> Tuple[Optional[str], Optional[click.Command], List[str]]:
+        """Import the invoked lazy command before resolving it."""
+        if args:
+            self.load_command(args[0])
+        return super().resolve_command(ctx, args)
+
+    def load_command(self, cmd_name: str) -> Optional[click.Command]:
+        """Import a lazy command's sub-app and register it on this group.
+
+        Args:
+        ----
+            cmd_name: Command name
+
+        Returns:
+        -------
+            The loaded command, or None if cmd_name is not a lazy command
+
+        """
+        if cmd_name in self.commands:
+            return self.commands[cmd_name]
+        if cmd_name not in self.lazy_subcommands:
+            return None
+
+        module_name, attribute, _ = self.lazy_subcommands[cmd_name]
+        sub_app: typer.Typer = getattr(importlib.import_module(module_name), attribute)
+        # Same conversion Typer applies to apps registered with add_typer()
+        command = get_group_from_info(
+            TyperInfo(sub_app, name=cmd_name),
+            pretty_exceptions_short=True,
+            rich_markup_mode=self.rich_markup_mode,
+        )
+        self.add_command(command, cmd_name)
+        return command
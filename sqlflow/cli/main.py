@@ -15,39 +15,64 @@ from typing import Optional
 import typer
 from rich.console import Console
 
-from sqlflow.cli.business_operations import init_project_operation
-from sqlflow.cli.commands.connect import connect_app
-from sqlflow.cli.commands.env import env_app
-from sqlflow.cli.commands.migrate import migrate_app
-from sqlflow.cli.commands.pipeline import pipeline_app
-from sqlflow.cli.commands.profiles import profiles_app
-from sqlflow.cli.commands.udf import udf_app
 from sqlflow.cli.display import (
     display_generic_error,
     display_info_panel,
     display_project_not_found_error,
 )
 from sqlflow.cli.errors import ProjectNotFoundError
+from sqlflow.cli.lazy import LazyTyperGroup
 from sqlflow.logging import get_logger
 
 logger = get_logger(__name__)
 console = Console()
 
+
+class SQLFlowGroup(LazyTyperGroup):
+    """Main command group; subcommand modules are imported when invoked."""
+
+    lazy_subcommands = {
+        "pipeline": (
+            "sqlflow.cli.commands.pipeline",
+            "pipeline_app",
+            "Pipeline management commands - compile, run, list, and validate pipelines",
+        ),
+        "profiles": (
+            "sqlflow.cli.commands.profiles",
+            "profiles_app",
+            "Manage SQLFlow profiles and configurations",
+        ),
+        "udf": (
+            "sqlflow.cli.commands.udf",
+            "udf_app",
+            "Manage User Defined Functions (UDFs) for data transformations",
+        ),
+        "env": (
+            "sqlflow.cli.commands.env",
+            "env_app",
+            "Manage environment variables and configuration",
+        ),
+        "migrate": (
+            "sqlflow.cli.commands.migrate",
+            "migrate_app",
+            "Migrate SQLFlow pipelines to use profile-based configuration",
+        ),
+        "connect": (
+            "sqlflow.cli.commands.connect",
+            "connect_app",
+            "Manage and test data source connections",
+        ),
+    }
+
+
 # Main app with professional appearance
 app = typer.Typer(
     name="sqlflow",
     help="SQLFlow CLI - Transform your data with SQL",
     add_completion=True,  # Shell completion support
+    cls=SQLFlowGroup,  # Subcommands are loaded on demand for fast startup
 )
 
-# Add subcommands - clean organization following Typer patterns
-app.add_typer(pipeline_app, name="pipeline")
-app.add_typer(profiles_app, name="profiles")
-app.add_typer(udf_app, name="udf")
-app.add_typer(env_app, name="env")
-app.add_typer(migrate_app, name="migrate")
-app.add_typer(connect_app, name="connect")
-
 
 @app.callback()
 def main(
@@ -112,6 +137,8 @@ def init(
             project_dir = os.path.join(os.getcwd(), project_dir)
 
         # Execute business operation
+        from sqlflow.cli.business_operations import init_project_operation
+
         created_path = init_project_operation(project_dir, project_name)
 
         # Display success with Rich formatting
@@ -1,8 +1,10 @@
 """Utility functions for the SQLFlow CLI."""
 
 import json
+import multiprocessing
 import os
-from typing import Any, Dict, Optional
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
 
 
 def resolve_pipeline_name(pipeline_name: str, pipelines_dir: str) -> str:
@@ -78,3 +80,43 @@ def parse_vars(vars_input: Optional[str]) -> Dict[str, Any]:
             raise ValueError(
                 f"Failed to parse variables. Use JSON format or 'key=value' pairs (space or comma-separated). Error: {e}"
             )
+
+
+def resolve_job_count(jobs: int) -> int:
+    """Get the number of worker processes, using all CPUs for jobs <= 0."""
+    if jobs <= 0:
+        return os.cpu_count() or 1
+    return jobs
+
+
+def run_pipeline_jobs(
+    job: Callable[..., Any], job_args: List[Tuple[Any, ...]], jobs: int
+) -> Iterator[Any]:
+    """Run a job for each pipeline, in worker processes when jobs > 1.
+
+    Results are yielded in the order of job_args, whatever order the
+    workers finish in, so output stays deterministic.
+
+    Args:
+    ----
+        job: Module-level function to call with each argument tuple
+        job_args: Argument tuples, one per pipeline
+        jobs: Maximum number of worker processes
+
+    Returns:
+    -------
+        Iterator over the job results
+
+    """
+    if jobs <= 1 or len(job_args) <= 1:
+        for args in job_args:
+            yield job(*args)
+        return
+
+    # Workers are spawned rather than forked: the CLI may already hold
+    # threads or open DuckDB connections that a forked child would copy
+    with ProcessPoolExecutor(
+        max_workers=min(jobs, len(job_args)),
+        mp_context=multiprocessing.get_context("spawn"),
+    ) as executor:
+        yield from executor.map(job, *zip(*job_args))
@@ -9,6 +9,7 @@ from typing import List, Optional
 
 import typer
 
+from sqlflow.core.table_suggestions import TableNameSuggester
 from sqlflow.logging import get_logger
 from sqlflow.parser.parser import Parser
 from sqlflow.project import Project
@@ -500,12 +501,11 @@ def _check_for_typos(undefined_table, available_tables):
     should_fail = False
 
     if undefined_table and available_tables:
-        # Use the same sophisticated typo detection as the planner
-        for available_table in available_tables:
-            if _tables_are_similar(undefined_table, available_table):
-                should_fail = True
-                suggestions.append(f"Did you mean '{available_table}'?")
-                break  # Found a likely typo, no need to check others
+        # Use the same typo detection as the planner
+        suggestion = TableNameSuggester(available_tables).suggest(undefined_table)
+        if suggestion:
+            should_fail = True
+            suggestions.append(f"Did you mean '{suggestion}'?")
 
         # If no sophisticated match found, fall back to difflib for other cases
         if not should_fail:
@@ -529,91 +529,6 @@ def _check_for_typos(undefined_table, available_tables):
     return should_fail, suggestions
 
 
-def _tables_are_similar(table1: str, table2: str) -> bool:
-    """Check if two table names are similar enough to be considered typos.
-
-    Following Zen of Python: Simple is better than complex.
-    Practical patterns for real-world typos.
-
-    This uses the same logic as the planner for consistency.
-    """
-    # Same length with small edit distance (1-2 character changes)
-    if abs(len(table1) - len(table2)) <= 2:
-        edit_dist = _edit_distance(table1, table2)
-        if edit_dist <= 2:
-            return True
-
-    # ENHANCED: Common typo patterns (appending or removing suffixes)
-    # Examples: users_table vs users_table_failed, users_table_wrong, etc.
-    longer, shorter = (
-        (table1, table2) if len(table1) > len(table2) else (table2, table1)
-    )
-
-    if shorter in longer:
-        # Check if it's a suffix pattern
-        if longer.startswith(shorter):
-            suffix = longer[len(shorter) :]
-            # Common typo suffixes that people add when debugging/testing
-            common_suffixes = [
-                "_failed",
-                "_wrong",
-                "_test",
-                "_old",
-                "_new",
-                "_backup",
-                "_temp",
-                "_copy",
-                "_typo",
-                "_error",
-                "_bad",
-                "_fixed",
-            ]
-            if suffix in common_suffixes or (
-                suffix.startswith("_") and len(suffix) <= 10
-            ):
-                return True
-
-        # Check if it's a prefix pattern
-        if longer.endswith(shorter):
-            prefix = longer[: -len(shorter)]
-            # Common typo prefixes
-            if prefix.endswith("_") and len(prefix) <= 10:
-                return True
-
-    # Check for single character insertions/deletions that are common typos
-    if abs(len(table1) - len(table2)) == 1:
-        edit_dist = _edit_distance(table1, table2)
-        if edit_dist == 1:  # Single character difference
-            return True
-
-    return False
-
-
-def _edit_distance(s1: str, s2: str) -> int:
-    """Calculate edit distance between two strings.
-
-    Following Zen of Python: Simple is better than complex.
-    Basic edit distance calculation for typo detection.
-    """
-    if len(s1) < len(s2):
-        return _edit_distance(s2, s1)
-
-    if len(s2) == 0:
-        return len(s1)
-
-    previous_row = list(range(len(s2) + 1))
-    for i, c1 in enumerate(s1):
-        current_row = [i + 1]
-        for j, c2 in enumerate(s2):
-            insertions = previous_row[j + 1] + 1
-            deletions = current_row[j] + 1
-            substitutions = previous_row[j] + (c1 != c2)
-            current_row.append(min(insertions, deletions, substitutions))
-        previous_row = current_row
-
-    return previous_row[-1]
-
-
 def _build_context_suggestions(available_tables, available_sources):
     """Build context suggestions for validation errors."""
     suggestions = []
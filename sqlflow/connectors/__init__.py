@@ -15,9 +15,15 @@ Some connectors have external dependencies that must be installed separately:
 - Google Sheets connector requires google-api-python-client, google-auth
 - Shopify connector requires requests
 
-Connectors are automatically registered when this package is imported.
+Connectors are imported and registered on first use: looking up a connector
+type in the registries imports its package, so importing this package does
+not pull in any optional dependency. Connector classes can still be imported
+from here, e.g. ``from sqlflow.connectors import CSVSource``.
 """
 
+import importlib
+
+from sqlflow.connectors.registry.builtin import BUILTIN_CONNECTORS
 from sqlflow.connectors.registry.destination_registry import (
     destination_registry as destination_connector_registry,
 )
@@ -25,24 +31,34 @@ from sqlflow.connectors.registry.source_registry import (
     source_registry as source_connector_registry,
 )
 
-# Register PostgreSQL connector if dependencies are available
-# If psycopg2 is not available, use a placeholder connector that will warn users about
-# the missing dependency when they try to use it
-try:
-    from sqlflow.connectors.postgres import *
-except ImportError:
-    # Use a placeholder connector that satisfies the interface requirements
-    from . import postgres_placeholder
-
-
-# flake8: noqa
-from .csv import *
-from .google_sheets import *
-from .in_memory import *
-from .parquet import *
-from .rest import *
-from .s3 import *
-from .shopify import *
+# Connector class name -> connector type whose package defines it
+_LAZY_EXPORTS = {
+    "CSVSource": "csv",
+    "CSVDestination": "csv",
+    "GoogleSheetsSource": "google_sheets",
+    "InMemorySource": "in_memory",
+    "InMemoryDestination": "in_memory",
+    "IN_MEMORY_DATA_STORE": "in_memory",
+    "ParquetSource": "parquet",
+    "ParquetDestination": "parquet",
+    "PostgresSource": "postgres",
+    "PostgresDestination": "postgres",
+    "RestSource": "rest",
+    "S3Source": "s3",
+    "S3Destination": "s3",
+    "ShopifySource": "shopify",
+}
+
+
+def __getattr__(name: str):
+    """Import connector classes on first access."""
+    if name not in _LAZY_EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module = importlib.import_module(BUILTIN_CONNECTORS[_LAZY_EXPORTS[name]])
+    value = getattr(module, name)
+    globals()[name] = value
+    return value
+
 
 __all__ = [
     "source_connector_registry",
@@ -1,7 +1,8 @@
 from abc import ABC, abstractmethod
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterable, List, Optional
 
 import pandas as pd
+import pyarrow as pa
 
 
 class DestinationConnector(ABC):
@@ -53,3 +54,23 @@ class DestinationConnector(ABC):
         Write data to the destination using a specified mode.
         """
         raise NotImplementedError
+
+    def write_batches(
+        self,
+        batches: Iterable[pa.RecordBatch],
+        schema: pa.Schema,
+        options: Optional[Dict[str, Any]] = None,
+        mode: str = "replace",
+    ) -> int:
+        """
+        Write a stream of Arrow record batches to the destination.
+
+        Connectors that can write incrementally override this so memory stays
+        bounded by one batch. This default collects all batches and delegates
+        to `write`.
+
+        Returns the number of rows written.
+        """
+        table = pa.Table.from_batches(list(batches), schema=schema)
+        self.write(table.to_pandas(), options=options, mode=mode)
+        return table.num_rows
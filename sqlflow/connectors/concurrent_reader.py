@@ -0,0 +1,155 @@
+"""Bounded-concurrency reading of many objects into one chunk stream.
+
+Sources often read many independent objects: the files under an S3
+prefix, where the latency of each GET dominates, or the slices of a
+partitioned database table. read_concurrently reads several objects at
+once on worker threads and hands their chunks to a single consumer.
+Chunks waiting for the consumer are limited by a byte budget, so a slow
+consumer applies backpressure to the readers instead of letting memory
+grow.
+"""
+
+import logging
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Iterable, Iterator
+
+from sqlflow.connectors.data_chunk import DataChunk
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_CONCURRENT_OBJECTS = 8
+DEFAULT_MAX_BUFFERED_BYTES = 256 * 1024 * 1024
+
+# Queue marker put by a worker when it has finished one object
+_OBJECT_DONE = object()
+
+
+class _ByteBudget:
+    """Blocks producers while too many bytes are waiting for the consumer."""
+
+    def __init__(self, limit: int, stopped: threading.Event):
+        self.limit = limit
+        self.in_flight = 0
+        self._stopped = stopped
+        self._condition = threading.Condition()
+
+    def acquire(self, num_bytes: int) -> bool:
+        """Reserve bytes, waiting for room; False if reading was stopped.
+
+        A chunk larger than the whole budget is admitted once nothing else
+        is in flight, so it cannot block forever.
+        """
+        with self._condition:
+            while (
+                self.in_flight > 0
+                and self.in_flight + num_bytes > self.limit
+                and not self._stopped.is_set()
+            ):
+                self._condition.wait(timeout=0.1)
+            if self._stopped.is_set():
+                return False
+            self.in_flight += num_bytes
+            return True
+
+    def release(self, num_bytes: int) -> None:
+        with self._condition:
+            self.in_flight -= num_bytes
+            self._condition.notify_all()
+
+
+def _read_object(
+    read_object: Callable[[str], Iterator[DataChunk]],
+    object_name: str,
+    budget: _ByteBudget,
+    results: "queue.Queue",
+) -> None:
+    """Put the chunks of one object on the results queue, then _OBJECT_DONE.
+
+    A failure is put on the queue as an (object_name, exception) pair.
+    """
+    try:
+        for chunk in read_object(object_name):
+            num_bytes = chunk.memory_usage
+            if not budget.acquire(num_bytes):
+                return
+            results.put((chunk, num_bytes))
+    except Exception as e:
+        results.put((object_name, e))
+    finally:
+        results.put(_OBJECT_DONE)
+
+
+def _drain_results(
+    results: "queue.Queue",
+    object_count: int,
+    budget: _ByteBudget,
+    skip_failed: bool,
+) -> Iterator[DataChunk]:
+    """Yield queued chunks until every object is done, releasing their bytes.
+
+    Raises:
+        Exception: The first failure of an object, unless skip_failed
+    """
+    remaining = object_count
+    while remaining:
+        item = results.get()
+        if item is _OBJECT_DONE:
+            remaining -= 1
+            continue
+
+        payload, detail = item
+        if isinstance(detail, Exception):
+            if not skip_failed:
+                raise detail
+            logger.warning(f"Failed to read {payload}: {detail}")
+            continue
+
+        budget.release(detail)
+        yield payload
+
+
+def read_concurrently(
+    read_object: Callable[[str], Iterator[DataChunk]],
+    object_names: Iterable[str],
+    max_concurrency: int = DEFAULT_MAX_CONCURRENT_OBJECTS,
+    max_buffered_bytes: int = DEFAULT_MAX_BUFFERED_BYTES,
+    skip_failed: bool = False,
+    thread_name_prefix: str = "sqlflow-read",
+) -> Iterator[DataChunk]:
+    """Read objects on worker threads and yield their chunks as they arrive.
+
+    Chunks of one object keep their order; chunks of different objects may
+    interleave.
+
+    Args:
+        read_object: Function returning the chunks of one object
+        object_names: Names of the objects to read
+        max_concurrency: Maximum objects read at the same time
+        max_buffered_bytes: Maximum bytes of chunks waiting for the consumer
+        skip_failed: Log and skip objects that fail instead of raising
+        thread_name_prefix: Name prefix of the worker threads
+
+    Yields:
+        DataChunk objects from all objects
+    """
+    object_names = list(object_names)
+    if not object_names:
+        return
+
+    stopped = threading.Event()
+    budget = _ByteBudget(max_buffered_bytes, stopped)
+    results: "queue.Queue" = queue.Queue()
+    executor = ThreadPoolExecutor(
+        max_workers=max(1, min(max_concurrency, len(object_names))),
+        thread_name_prefix=thread_name_prefix,
+    )
+    try:
+        for object_name in object_names:
+            executor.submit(_read_object, read_object, object_name, budget, results)
+        yield from _drain_results(results, len(object_names), budget, skip_failed)
+    finally:
+        # Unblock workers and drop queued objects if the consumer stops early
+        stopped.set()
+        executor.shutdown(wait=True, cancel_futures=True)
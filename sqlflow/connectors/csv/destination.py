@@ -1,9 +1,10 @@
 import os
 import uuid
 from io import StringIO
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterable, List, Optional
 
 import pandas as pd
+import pyarrow as pa
 
 from sqlflow.connectors.base.destination_connector import DestinationConnector
 from sqlflow.logging import get_logger
@@ -231,3 +232,83 @@ class CSVDestination(DestinationConnector):
         else:
             # Use pandas' built-in append mode for smaller files
             df.to_csv(self.path, mode="a", **write_options)
+
+    def write_batches(
+        self,
+        batches: Iterable[pa.RecordBatch],
+        schema: pa.Schema,
+        options: Optional[Dict[str, Any]] = None,
+        mode: str = "replace",
+    ) -> int:
+        """
+        Stream Arrow record batches to the CSV file, one batch in memory at a time.
+
+        Formatting matches `write`. `replace` stages to a temporary file and
+        atomically swaps it in; `append` writes to the file directly.
+        """
+        if mode.lower() == "upsert":
+            raise NotImplementedError(
+                "UPSERT mode is not supported for CSVDestination."
+            )
+
+        replace = mode.lower() == "replace"
+        write_options = dict(options or {})
+        write_options.setdefault("index", False)
+        write_options.setdefault("header", replace or not os.path.exists(self.path))
+        write_header = write_options.pop("header")
+        encoding = write_options.pop("encoding", "utf-8")
+
+        dir_path = os.path.dirname(self.path)
+        if dir_path:
+            os.makedirs(dir_path, exist_ok=True)
+
+        if not replace:
+            rows_written = self._write_batches_to(
+                self.path, "a", batches, schema, write_header, encoding, write_options
+            )
+        else:
+            temp_path = self._create_optimized_temp_path(self.path)
+            try:
+                rows_written = self._write_batches_to(
+                    temp_path,
+                    "w",
+                    batches,
+                    schema,
+                    write_header,
+                    encoding,
+                    write_options,
+                )
+                os.rename(temp_path, self.path)
+            except Exception:
+                if os.path.exists(temp_path):
+                    try:
+                        os.remove(temp_path)
+                    except OSError:
+                        logger.warning(
+                            "Failed to cleanup temporary file: %s", temp_path
+                        )
+                raise
+
+        logger.debug("Streamed %d rows to %s", rows_written, self.path)
+        return rows_written
+
+    def _write_batches_to(
+        self,
+        path: str,
+        file_mode: str,
+        batches: Iterable[pa.RecordBatch],
+        schema: pa.Schema,
+        write_header: bool,
+        encoding: str,
+        write_options: Dict[str, Any],
+    ) -> int:
+        """Write an optional header and then each batch as CSV rows to path."""
+        rows_written = 0
+        with open(path, file_mode, encoding=encoding, buffering=65536) as f:
+            if write_header:
+                header_df = pd.DataFrame(columns=schema.names)
+                f.write(header_df.to_csv(None, header=True, **write_options))
+            for batch in batches:
+                f.write(batch.to_pandas().to_csv(None, header=False, **write_options))
+                rows_written += batch.num_rows
+        return rows_written
@@ -0,0 +1,281 @@
+"""Parallel parsing of one large CSV file in record-aligned byte ranges.
+
+PyArrow's streaming CSV reader parses a file one block at a time on a
+single thread. read_csv_parallel instead cuts the file into byte ranges
+that start and end on record boundaries, parses the ranges on worker
+threads (PyArrow releases the GIL while parsing) and yields their tables
+in file order. Parsed tables waiting for the consumer are limited by a
+byte budget, so a slow consumer pauses the workers instead of letting
+memory grow.
+
+Range boundaries are placed at the first line break after each nominal
+cut point. When values may contain quoted line breaks, the quote state at
+each cut point is needed to tell a record boundary from a line break
+inside a value; it is found by counting quote characters per range,
+which workers do ahead of parsing.
+"""
+
+import os
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Deque, Iterator, List, Optional, Tuple
+
+DEFAULT_RANGE_SIZE = 64 * 1024 * 1024
+DEFAULT_MAX_BUFFERED_BYTES = 512 * 1024 * 1024
+
+# Bytes compared at a time when counting quote characters, bounding the
+# temporary mask numpy allocates per worker
+QUOTE_COUNT_BLOCK_SIZE = 4 * 1024 * 1024
+
+# Bytes copied at a time when scanning forward for a record boundary
+BOUNDARY_SCAN_SIZE = 64 * 1024
+
+
+def _count_byte(data: Any, start: int, end: int, value: int) -> int:
+    """Count occurrences of a byte value in data[start:end].
+
+    Args:
+        data: numpy uint8 view of the file
+        start: First byte to count
+        end: Byte after the last one to count
+        value: Byte value to count
+
+    Returns:
+        Number of occurrences
+    """
+    import numpy as np
+
+    count = 0
+    for block_start in range(start, end, QUOTE_COUNT_BLOCK_SIZE):
+        block = data[block_start : min(end, block_start + QUOTE_COUNT_BLOCK_SIZE)]
+        count += int(np.count_nonzero(block == value))
+    return count
+
+
+def _next_record_start(
+    data: Any, position: int, in_quotes: bool = False, quote: Optional[bytes] = None
+) -> int:
+    """Find the start of the first record at or after position.
+
+    Args:
+        data: numpy uint8 view of the file
+        position: Offset to scan from
+        in_quotes: Whether position is inside a quoted value
+        quote: Quote character, or None if line breaks always end records
+
+    Returns:
+        Offset just past the first line break outside quotes, or the file
+        size if there is none
+    """
+    size = len(data)
+    while position < size:
+        window = data[position : position + BOUNDARY_SCAN_SIZE].tobytes()
+        index = 0
+        while True:
+            if in_quotes:
+                index = window.find(quote, index)
+                if index < 0:
+                    break
+                in_quotes = False
+                index += 1
+                continue
+            line_end = window.find(b"\n", index)
+            quote_index = -1
+            if quote is not None:
+                search_end = line_end if line_end >= 0 else len(window)
+                quote_index = window.find(quote, index, search_end)
+            if quote_index < 0:
+                if line_end >= 0:
+                    return position + line_end + 1
+                break
+            in_quotes = True
+            index = quote_index + 1
+        position += len(window)
+    return size
+
+
+def _read_schema(
+    file_path: str, read_options: Any, parse_options: Any, convert_options: Any
+) -> Any:
+    """Read the file's schema as inferred from its first block."""
+    import pyarrow.csv as pacsv
+
+    reader = pacsv.open_csv(
+        file_path,
+        read_options=read_options,
+        parse_options=parse_options,
+        convert_options=convert_options,
+    )
+    try:
+        return reader.schema
+    finally:
+        reader.close()
+
+
+def _record_ranges(
+    data: Any,
+    cut_points: List[int],
+    quote: Optional[bytes],
+    executor: ThreadPoolExecutor,
+    lookahead: int,
+) -> Iterator[Tuple[int, int]]:
+    """Move nominal cut points to record boundaries.
+
+    Args:
+        data: numpy uint8 view of the file
+        cut_points: Start of the data, the nominal cut points and the file size
+        quote: Quote character, or None if line breaks always end records
+        executor: Executor counting the quotes of nominal ranges
+        lookahead: Number of nominal ranges to count quotes of ahead
+
+    Yields:
+        (start, end) offsets of non-empty ranges of whole records, in order
+    """
+    # Quote counts of the nominal ranges, submitted ahead of their use
+    quote_counts: Deque[Future] = deque()
+    counted = 0
+    in_quotes = False
+    start = cut_points[0]
+    for index in range(1, len(cut_points)):
+        if quote is not None:
+            while counted < min(len(cut_points) - 1, index + lookahead):
+                quote_counts.append(
+                    executor.submit(
+                        _count_byte,
+                        data,
+                        cut_points[counted],
+                        cut_points[counted + 1],
+                        quote[0],
+                    )
+                )
+                counted += 1
+            in_quotes ^= quote_counts.popleft().result() % 2 == 1
+        end = _next_record_start(data, cut_points[index], in_quotes, quote)
+        if end > start:
+            yield start, end
+            start = end
+
+
+def _parse_in_order(
+    executor: ThreadPoolExecutor,
+    parse_range: Callable[[int, int], Any],
+    ranges: Iterator[Tuple[int, int]],
+    max_in_flight: int,
+) -> Iterator[Any]:
+    """Parse ranges on the executor, yielding their tables in file order.
+
+    Args:
+        executor: Executor parsing the ranges
+        parse_range: Function parsing the range between two offsets
+        ranges: (start, end) offsets of the ranges, in file order
+        max_in_flight: Maximum ranges submitted ahead of the consumer
+
+    Yields:
+        Results of parse_range, in the order of ranges
+    """
+    pending: Deque[Future] = deque()
+    for start, end in ranges:
+        pending.append(executor.submit(parse_range, start, end))
+        if len(pending) >= max_in_flight:
+            yield pending.popleft().result()
+    while pending:
+        yield pending.popleft().result()
+
+
+def read_csv_parallel(
+    file_path: str,
+    read_options: Optional[Any] = None,
+    parse_options: Optional[Any] = None,
+    convert_options: Optional[Any] = None,
+    range_size: int = DEFAULT_RANGE_SIZE,
+    max_workers: Optional[int] = None,
+    max_buffered_bytes: int = DEFAULT_MAX_BUFFERED_BYTES,
+) -> Iterator[Any]:
+    """Parse byte ranges of a CSV file on worker threads, in file order.
+
+    Column types are inferred from the first block, as by pyarrow's
+    streaming reader, and used for every range so all tables share one
+    schema. The encoding must encode a line break as a single 0x0A byte.
+
+    Args:
+        file_path: Path to the CSV file
+        read_options: pyarrow.csv.ReadOptions; skip_rows is not supported
+        parse_options: pyarrow.csv.ParseOptions
+        convert_options: pyarrow.csv.ConvertOptions
+        range_size: Approximate bytes per range
+        max_workers: Maximum ranges parsed at once, defaults to the CPU count
+        max_buffered_bytes: Maximum bytes of ranges parsed or being parsed
+            ahead of the consumer; at least one range is always in flight
+
+    Yields:
+        pyarrow Tables, one per range
+
+    Raises:
+        ValueError: If read_options skip rows
+    """
+    import copy
+
+    import numpy as np
+    import pyarrow as pa
+    import pyarrow.csv as pacsv
+
+    read_options = read_options or pacsv.ReadOptions()
+    parse_options = parse_options or pacsv.ParseOptions()
+    convert_options = convert_options or pacsv.ConvertOptions()
+    if read_options.skip_rows or read_options.skip_rows_after_names:
+        raise ValueError("read_csv_parallel does not support skipping rows")
+
+    size = os.path.getsize(file_path)
+    if size == 0:
+        return
+
+    # Names of all columns, and the types of the converted ones
+    all_columns = copy.copy(convert_options)
+    all_columns.include_columns = []
+    column_names = _read_schema(
+        file_path, read_options, parse_options, all_columns
+    ).names
+    schema = _read_schema(file_path, read_options, parse_options, convert_options)
+
+    range_read_options = pacsv.ReadOptions(
+        use_threads=False,
+        block_size=read_options.block_size,
+        column_names=column_names,
+        encoding=read_options.encoding,
+    )
+    range_convert_options = copy.copy(convert_options)
+    range_convert_options.column_types = {field.name: field.type for field in schema}
+
+    quote = None
+    if parse_options.newlines_in_values and parse_options.quote_char:
+        quote = parse_options.quote_char.encode("ascii")
+
+    max_in_flight = max(1, max_buffered_bytes // max(1, range_size))
+    with pa.memory_map(file_path) as mapped_file:
+        file_buffer = mapped_file.read_buffer()
+        data = np.frombuffer(file_buffer, dtype=np.uint8)
+
+        data_start = 0
+        if not read_options.column_names and not read_options.autogenerate_column_names:
+            data_start = _next_record_start(data, 0, quote=quote)
+        cut_points = list(range(data_start, size, range_size)) + [size]
+
+        def parse_range(start: int, end: int) -> Any:
+            return pacsv.read_csv(
+                pa.BufferReader(file_buffer.slice(start, end - start)),
+                read_options=range_read_options,
+                parse_options=parse_options,
+                convert_options=range_convert_options,
+            )
+
+        executor = ThreadPoolExecutor(
+            max_workers=max(1, min(max_workers or os.cpu_count() or 1, max_in_flight)),
+            thread_name_prefix="sqlflow-csv-parse",
+        )
+        try:
+            ranges = _record_ranges(data, cut_points, quote, executor, max_in_flight)
+            yield from _parse_in_order(executor, parse_range, ranges, max_in_flight)
+        finally:
+            # Drop queued ranges if the consumer stops early; the file is
+            # unmapped only once no worker reads it any more
+            executor.shutdown(wait=True, cancel_futures=True)
@@ -1,4 +1,5 @@
 import os
+from contextlib import contextmanager
 from typing import Any, Dict, Iterator, List, Optional, Union
 
 import pandas as pd
@@ -6,7 +7,15 @@ import pandas as pd
 from sqlflow.connectors.base.connection_test_result import ConnectionTestResult
 from sqlflow.connectors.base.connector import Connector, ConnectorState
 from sqlflow.connectors.base.schema import Schema
+from sqlflow.connectors.csv.parallel_reader import (
+    DEFAULT_MAX_BUFFERED_BYTES,
+    DEFAULT_RANGE_SIZE,
+    read_csv_parallel,
+)
 from sqlflow.connectors.data_chunk import DataChunk
+from sqlflow.logging import get_logger
+
+logger = get_logger(__name__)
 
 # Performance constants following Zen of Python: "Simple is better than complex"
 # These defaults are optimized for typical use cases but can be overridden
@@ -14,6 +23,80 @@ DEFAULT_CHUNK_SIZE = 10000  # Optimal for most CSV files
 LARGE_FILE_THRESHOLD_MB = 50  # Switch to PyArrow for files larger than this
 MEMORY_EFFICIENT_CHUNK_SIZE = 5000  # For memory-constrained environments
 
+# Returned by CSVSource._resolve_cursor_type for files without the cursor column
+_MISSING_CURSOR = object()
+
+# Bytes scanned at a time when looking for the last line break
+LINE_END_SCAN_SIZE = 64 * 1024
+
+
+def _is_ascii_compatible(encoding: str) -> bool:
+    """Check whether line breaks are single 0x0A bytes in an encoding."""
+    try:
+        return "\n".encode(encoding) == b"\n"
+    except LookupError:
+        return False
+
+
+def _find_line_end(file_path: str, start: int, end: int) -> int:
+    """Find the offset just past the last line break between start and end.
+
+    Line breaks inside quoted values do not end a line. Quotes are counted
+    from start, which must be the beginning of a line.
+
+    Args:
+        file_path: Path to the file
+        start: First byte to consider, at the beginning of a line
+        end: Byte after the last one to consider
+
+    Returns:
+        Offset of the byte after the last newline outside quotes, or start if
+        there is none
+    """
+    line_end = start
+    in_quotes = False
+    with open(file_path, "rb") as f:
+        f.seek(start)
+        position = start
+        while position < end:
+            block = f.read(min(LINE_END_SCAN_SIZE, end - position))
+            if not block:
+                break
+            # A newline is outside quotes after an even number of quotes
+            quotes_before = int(in_quotes)
+            newline = block.rfind(b"\n")
+            while newline >= 0 and (quotes_before + block.count(b'"', 0, newline)) % 2:
+                newline = block.rfind(b"\n", 0, newline)
+            if newline >= 0:
+                line_end = position + newline + 1
+            in_quotes = (quotes_before + block.count(b'"')) % 2 == 1
+            position += len(block)
+    return line_end
+
+
+@contextmanager
+def _open_byte_range(file_path: str, start: int, end: Optional[int]) -> Iterator[Any]:
+    """Open the bytes of a file between two offsets for PyArrow to parse.
+
+    Args:
+        file_path: Path to the file
+        start: First byte to read
+        end: Byte after the last one to read, or None for the whole file
+
+    Yields:
+        The file path when reading the whole file, otherwise a reader over
+        the memory-mapped range
+    """
+    if end is None:
+        yield file_path
+        return
+
+    import pyarrow as pa
+
+    with pa.memory_map(file_path) as mapped_file:
+        mapped_file.seek(start)
+        yield pa.BufferReader(mapped_file.read_buffer(end - start))
+
 
 class CSVSource(Connector):
     """
@@ -32,6 +115,8 @@ class CSVSource(Connector):
 
     def __init__(self, config: Optional[Dict[str, Any]] = None):
         super().__init__()
+        # Optional FileManifest of files already ingested, set by the executor
+        self.file_manifest: Optional[Any] = None
         if config:
             self.configure(config)
         elif config is not None:  # Empty dict was passed
@@ -55,6 +140,16 @@ class CSVSource(Connector):
         self.delimiter = params.get("delimiter", ",")
         self.encoding = params.get("encoding", "utf-8")
         self.engine = params.get("engine", "auto")  # 'pandas', 'pyarrow', or 'auto'
+        self.newlines_in_values = params.get("newlines_in_values", False)
+
+        # Parallel range parsing of large files on the PyArrow path
+        self.parallel_workers = params.get("parallel_workers")
+        self.parallel_range_mb = params.get(
+            "parallel_range_mb", DEFAULT_RANGE_SIZE / 1024**2
+        )
+        self.max_buffer_mb = params.get(
+            "max_buffer_mb", DEFAULT_MAX_BUFFERED_BYTES / 1024**2
+        )
         self.state = ConnectorState.CONFIGURED
 
     def _get_optimal_chunk_size(
@@ -112,6 +207,28 @@ class CSVSource(Connector):
             except OSError:
                 return False  # Default to pandas if we can't determine file size
 
+    def _should_parse_in_parallel(
+        self, file_path: str, read_options: Dict[str, Any]
+    ) -> bool:
+        """Determine whether to parse a file in byte ranges on several threads.
+
+        Args:
+            file_path: Path to the CSV file
+            read_options: Prepared read options
+
+        Returns:
+            True if the file spans at least two ranges, more than one worker
+            is allowed and line breaks are single bytes in its encoding
+        """
+        workers = self.parallel_workers or os.cpu_count() or 1
+        if workers < 2 or not _is_ascii_compatible(read_options["encoding"]):
+            return False
+        try:
+            range_size = self.parallel_range_mb * 1024 * 1024
+            return os.path.getsize(file_path) >= 2 * range_size
+        except OSError:
+            return False
+
     def test_connection(self) -> ConnectionTestResult:
         """Test the connection to the CSV file.
 
@@ -253,10 +370,14 @@ class CSVSource(Connector):
         Returns:
             DataFrame or iterator of DataFrames
         """
+        import pyarrow as pa
         import pyarrow.csv as pacsv
 
         arrow_opts = pacsv.ReadOptions()
-        parse_opts = pacsv.ParseOptions(delimiter=read_options["delimiter"])
+        parse_opts = pacsv.ParseOptions(
+            delimiter=read_options["delimiter"],
+            newlines_in_values=self.newlines_in_values,
+        )
         convert_opts = pacsv.ConvertOptions()
         if "usecols" in read_options:
             convert_opts = pacsv.ConvertOptions(include_columns=read_options["usecols"])
@@ -267,34 +388,52 @@ class CSVSource(Connector):
                 """
                 Efficient PyArrow chunked reading.
                 "Readability counts" - clear iterator implementation.
+
+                Uses PyArrow's streaming reader so that only one block of the
+                file is held in memory at a time. Large files are instead
+                parsed in byte ranges on several threads, with at most
+                max_buffer_mb of ranges held at a time.
                 """
-                try:
-                    # Use PyArrow's streaming reader for memory efficiency
-                    table = pacsv.read_csv(
+                if self._should_parse_in_parallel(file_path, read_options):
+                    tables = read_csv_parallel(
                         file_path,
                         read_options=arrow_opts,
                         parse_options=parse_opts,
                         convert_options=convert_opts,
+                        range_size=int(self.parallel_range_mb * 1024 * 1024),
+                        max_workers=self.parallel_workers,
+                        max_buffered_bytes=int(self.max_buffer_mb * 1024 * 1024),
                     )
-
-                    # Convert to pandas and yield in chunks
-                    df = table.to_pandas()
-                    total_rows = len(df)
-
-                    for start_idx in range(0, total_rows, batch_size):
-                        end_idx = min(start_idx + batch_size, total_rows)
-                        yield df.iloc[start_idx:end_idx]
-
-                except Exception:
-                    # "Errors should never pass silently" - but handle gracefully
-                    # If PyArrow chunking fails, fall back to reading entire file
-                    table = pacsv.read_csv(
+                    record_batches = (
+                        record_batch
+                        for table in tables
+                        for record_batch in table.to_batches()
+                    )
+                else:
+                    record_batches = pacsv.open_csv(
                         file_path,
                         read_options=arrow_opts,
                         parse_options=parse_opts,
                         convert_options=convert_opts,
                     )
-                    yield table.to_pandas()
+                rows_read = 0
+                try:
+                    for record_batch in record_batches:
+                        for start_idx in range(0, record_batch.num_rows, batch_size):
+                            yield record_batch.slice(start_idx, batch_size).to_pandas()
+                        rows_read += record_batch.num_rows
+                except pa.ArrowInvalid as e:
+                    # Streaming readers fix column types from the first block;
+                    # read_csv widens them for values later in the file
+                    logger.debug(f"Re-reading {file_path} with read_csv: {e}")
+                    table = pacsv.read_csv(
+                        file_path,
+                        read_options=arrow_opts,
+                        parse_options=parse_opts,
+                        convert_options=convert_opts,
+                    ).slice(rows_read)
+                    for start_idx in range(0, table.num_rows, batch_size):
+                        yield table.slice(start_idx, batch_size).to_pandas()
 
             return pyarrow_chunk_iter()
 
@@ -404,10 +543,21 @@ class CSVSource(Connector):
         """
         Read data incrementally from the CSV file based on cursor field, with chunked reading and PyArrow support.
 
-        Performance optimizations applied:
-        - Uses optimal chunk size calculation automatically
-        - Intelligent engine selection based on file size
-        - Efficient cursor-based filtering
+        Numeric, date and timestamp cursors take a typed PyArrow path: the
+        cursor type is resolved once from the first block of the file, with
+        timestamps widened to nanoseconds, every block is parsed with that
+        type and filtered with Arrow compute, and blocks whose maximum is not
+        past the watermark are skipped. If a later block does not fit the
+        types inferred from the first one, the rest of the file is re-read
+        with types inferred from all of it. Other
+        cursors, the pandas engine and pandas-only options use pandas
+        chunks, comparing as datetimes, then numbers, then strings.
+
+        With a file_manifest attached, an unchanged file is not read at all.
+        The typed path also records the byte offset of the last complete
+        line and the file's fingerprint, and the next run parses only the
+        bytes after that offset, as long as the file was appended to rather
+        than replaced or rewritten.
 
         Args:
             object_name: Name/path of the CSV file (matches self.path)
@@ -425,6 +575,30 @@ class CSVSource(Connector):
         if engine:
             read_opts["engine"] = engine
 
+        file_path = object_name or self.path
+        file_stat = None
+        if self.file_manifest:
+            file_stat = os.stat(file_path)
+            if not self.file_manifest.is_changed(
+                file_path, file_stat.st_size, file_stat.st_mtime_ns
+            ):
+                return
+
+        typed_options = self._typed_incremental_options(read_opts, kwargs)
+        if typed_options is not None:
+            typed_chunks = self._typed_incremental_chunks(
+                file_path,
+                cursor_field,
+                cursor_value,
+                self._get_optimal_chunk_size(file_path, batch_size),
+                typed_options,
+                columns,
+                file_stat,
+            )
+            if typed_chunks is not None:
+                yield from typed_chunks
+                return
+
         # "Explicit is better than implicit" - let the read method handle optimization
         chunk_iter = self.read(
             object_name=object_name,
@@ -434,27 +608,421 @@ class CSVSource(Connector):
             as_iterator=True,
             **kwargs,
         )
+        rows = 0
         for chunk_df in chunk_iter:
             if cursor_field not in chunk_df.columns:
                 continue
-            filtered_df = chunk_df
-            if cursor_value is not None:
-                try:
-                    df_cursor_col = pd.to_datetime(chunk_df[cursor_field])
-                    cursor_value_dt = pd.to_datetime(cursor_value)
-                    filtered_df = chunk_df[df_cursor_col > cursor_value_dt]
-                except (ValueError, TypeError):
-                    try:
-                        filtered_df = chunk_df[
-                            pd.to_numeric(chunk_df[cursor_field])
-                            > pd.to_numeric(cursor_value)
-                        ]
-                    except (ValueError, TypeError):
-                        filtered_df = chunk_df[
-                            chunk_df[cursor_field].astype(str) > str(cursor_value)
-                        ]
+            filtered_df = self._filter_past_cursor(chunk_df, cursor_field, cursor_value)
             if not filtered_df.empty:
+                rows += len(filtered_df)
                 yield DataChunk(filtered_df)
+        self._record_file(file_path, file_stat, rows)
+
+    def _filter_past_cursor(
+        self, chunk_df: pd.DataFrame, cursor_field: str, cursor_value: Any
+    ) -> pd.DataFrame:
+        """Keep the rows of a pandas chunk past the watermark.
+
+        Values are compared as datetimes, then as numbers, then as text.
+
+        Args:
+            chunk_df: Chunk read with pandas
+            cursor_field: Name of the cursor column
+            cursor_value: Watermark from the previous run, or None for all rows
+
+        Returns:
+            Rows whose cursor value is greater than the watermark
+        """
+        if cursor_value is None:
+            return chunk_df
+        cursor_column = chunk_df[cursor_field]
+        try:
+            return chunk_df[
+                pd.to_datetime(cursor_column) > pd.to_datetime(cursor_value)
+            ]
+        except (ValueError, TypeError):
+            pass
+        try:
+            return chunk_df[pd.to_numeric(cursor_column) > pd.to_numeric(cursor_value)]
+        except (ValueError, TypeError):
+            return chunk_df[cursor_column.astype(str) > str(cursor_value)]
+
+    def _typed_incremental_options(
+        self, options: Dict[str, Any], kwargs: Dict[str, Any]
+    ) -> Optional[Dict[str, Any]]:
+        """Get the CSV options for the typed incremental path, if it applies.
+
+        Args:
+            options: Read options passed to read_incremental
+            kwargs: Extra keyword arguments passed to read_incremental
+
+        Returns:
+            Prepared delimiter and encoding options, or None when the pandas
+            engine, a headerless file or pandas-only options are requested
+        """
+        read_options = self._prepare_read_options(options, None, **kwargs)
+        engine = read_options.pop("engine", self.engine)
+        if engine == "pandas" or read_options.get("header") != 0:
+            return None
+        if set(read_options) - {"header", "delimiter", "encoding"}:
+            return None
+        return read_options
+
+    def _typed_incremental_chunks(
+        self,
+        file_path: str,
+        cursor_field: str,
+        cursor_value: Any,
+        batch_size: int,
+        read_options: Dict[str, Any],
+        columns: Optional[List[str]],
+        file_stat: Optional[os.stat_result],
+    ) -> Optional[Iterator[DataChunk]]:
+        """Get the typed PyArrow chunks past the cursor, if the cursor allows it.
+
+        Args:
+            file_path: Path to the CSV file
+            cursor_field: Name of the cursor column
+            cursor_value: Watermark from the previous run
+            batch_size: Maximum number of rows per chunk
+            read_options: Options from _typed_incremental_options
+            columns: Columns to return, or None for all columns
+            file_stat: Stat of the file to read up to and record
+
+        Returns:
+            Iterator of chunks, or None if the cursor column is not numeric or
+            temporal or the watermark does not convert to its type
+        """
+        schema = self._read_schema(file_path, read_options)
+        cursor_type = self._resolve_cursor_type(schema, cursor_field)
+        if cursor_type is _MISSING_CURSOR:
+            return iter([])
+        if cursor_type is None:
+            return None
+
+        cursor = None
+        if cursor_value is not None:
+            cursor = self._coerce_cursor_value(cursor_value, cursor_type)
+            if cursor is None:
+                return None
+        return self._read_incremental_typed(
+            file_path,
+            cursor_field,
+            cursor_type,
+            cursor,
+            batch_size,
+            read_options,
+            columns,
+            schema.names,
+            file_stat,
+        )
+
+    def _read_schema(self, file_path: str, read_options: Dict[str, Any]) -> Any:
+        """Read the column names and types inferred from the first block.
+
+        Args:
+            file_path: Path to the CSV file
+            read_options: Options from _typed_incremental_options
+
+        Returns:
+            Arrow schema of the file
+        """
+        import pyarrow.csv as pacsv
+
+        reader = pacsv.open_csv(
+            file_path,
+            read_options=pacsv.ReadOptions(encoding=read_options["encoding"]),
+            parse_options=pacsv.ParseOptions(delimiter=read_options["delimiter"]),
+        )
+        try:
+            return reader.schema
+        finally:
+            reader.close()
+
+    def _resolve_cursor_type(self, schema: Any, cursor_field: str) -> Any:
+        """Choose the type to parse the cursor column with.
+
+        Args:
+            schema: Arrow schema from _read_schema
+            cursor_field: Name of the cursor column
+
+        Returns:
+            The Arrow type to parse the cursor column with, None if the column
+            is not numeric or temporal, or _MISSING_CURSOR if the file has no
+            such column
+        """
+        import pyarrow as pa
+
+        if schema.get_field_index(cursor_field) < 0:
+            return _MISSING_CURSOR
+
+        data_type = schema.field(cursor_field).type
+        if pa.types.is_timestamp(data_type):
+            # Later blocks may carry fractional seconds the first one lacks
+            return pa.timestamp("ns", tz=data_type.tz)
+        if pa.types.is_integer(data_type):
+            return pa.int64()
+        if pa.types.is_floating(data_type) or pa.types.is_date(data_type):
+            return data_type
+        return None
+
+    def _coerce_cursor_value(self, cursor_value: Any, data_type: Any) -> Any:
+        """Convert a stored watermark to a scalar of the cursor column type.
+
+        Args:
+            cursor_value: Watermark from the previous run
+            data_type: Arrow type of the cursor column
+
+        Returns:
+            Arrow scalar, or None if the watermark does not convert
+        """
+        import pyarrow as pa
+
+        try:
+            return pa.scalar(cursor_value).cast(data_type)
+        except (pa.ArrowInvalid, pa.ArrowNotImplementedError, TypeError):
+            pass
+
+        if pa.types.is_timestamp(data_type) or pa.types.is_date(data_type):
+            try:
+                timestamp = pd.Timestamp(cursor_value)
+                if pa.types.is_date(data_type):
+                    return pa.scalar(timestamp.date(), type=data_type)
+                if data_type.tz is not None:
+                    timestamp = (
+                        timestamp.tz_localize(data_type.tz)
+                        if timestamp.tzinfo is None
+                        else timestamp.tz_convert(data_type.tz)
+                    )
+                elif timestamp.tzinfo is not None:
+                    timestamp = timestamp.tz_convert(None)
+                return pa.scalar(timestamp, type=data_type)
+            except (ValueError, TypeError, pa.ArrowInvalid):
+                pass
+        return None
+
+    def _read_incremental_typed(
+        self,
+        file_path: str,
+        cursor_field: str,
+        cursor_type: Any,
+        cursor: Any,
+        batch_size: int,
+        read_options: Dict[str, Any],
+        columns: Optional[List[str]],
+        column_names: Optional[List[str]] = None,
+        file_stat: Optional[os.stat_result] = None,
+    ) -> Iterator[DataChunk]:
+        """Stream Arrow batches of rows past the cursor.
+
+        Given the file's stat taken before reading (file_manifest attached),
+        only the bytes between the manifest's resume offset and the size in
+        that stat are parsed, and the offset reached is recorded.
+
+        Args:
+            file_path: Path to the CSV file
+            cursor_field: Name of the cursor column
+            cursor_type: Arrow type to parse the cursor column with
+            cursor: Watermark as an Arrow scalar, or None to read all rows
+            batch_size: Maximum number of rows per chunk
+            read_options: Options from _typed_incremental_options
+            columns: Columns to return, or None for all columns
+            column_names: Header of the file, used when resuming past it
+            file_stat: Stat of the file to read up to and record
+
+        Yields:
+            DataChunk objects backed by Arrow record batches
+        """
+        start_offset = 0
+        end_offset = None
+        fingerprint = None
+        if file_stat is not None and _is_ascii_compatible(read_options["encoding"]):
+            from sqlflow.core.state.file_manifest import fingerprint_file
+
+            fingerprint = fingerprint_file(file_path)
+            start_offset = self.file_manifest.get_resume_offset(file_path)
+            end_offset = file_stat.st_size
+            if start_offset >= end_offset:
+                self._record_file(
+                    file_path, file_stat, 0, start_offset, start_offset, fingerprint
+                )
+                return
+
+        rows = 0
+        record_batches = self._read_typed_batches(
+            file_path,
+            start_offset,
+            end_offset,
+            read_options,
+            self._typed_convert_options(cursor_field, cursor_type, columns),
+            column_names,
+        )
+        for record_batch in record_batches:
+            record_batch = self._filter_past_watermark(
+                record_batch, cursor_field, cursor
+            )
+            if columns and cursor_field not in columns:
+                record_batch = record_batch.select(columns)
+            rows += record_batch.num_rows
+            for start_idx in range(0, record_batch.num_rows, batch_size):
+                yield DataChunk(record_batch.slice(start_idx, batch_size))
+
+        offset = None
+        if end_offset is not None:
+            # A last line without a newline may still be being written; it is
+            # read again next run, where the watermark filters it if complete
+            offset = _find_line_end(file_path, start_offset, end_offset)
+        self._record_file(file_path, file_stat, rows, start_offset, offset, fingerprint)
+
+    def _read_typed_batches(
+        self,
+        file_path: str,
+        start_offset: int,
+        end_offset: Optional[int],
+        read_options: Dict[str, Any],
+        convert_options: Any,
+        column_names: Optional[List[str]],
+    ) -> Iterator[Any]:
+        """Parse a byte range of the file into Arrow record batches.
+
+        The streaming reader fixes the column types not set in
+        convert_options from the first block. If a later block does not fit
+        them, the rows not yet returned are re-read with read_csv, which
+        infers every type, the cursor's included, from the whole range.
+
+        Args:
+            file_path: Path to the CSV file
+            start_offset: First byte to parse; past 0 the range has no header
+            end_offset: Byte after the last one to parse, or None for all
+            read_options: Options from _typed_incremental_options
+            convert_options: ConvertOptions from _typed_convert_options
+            column_names: Header of the file, used when resuming past it
+
+        Yields:
+            Arrow record batches
+        """
+        import pyarrow as pa
+        import pyarrow.csv as pacsv
+
+        csv_read_options = pacsv.ReadOptions(
+            encoding=read_options["encoding"],
+            column_names=column_names if start_offset else None,
+        )
+        parse_options = pacsv.ParseOptions(
+            delimiter=read_options["delimiter"],
+            newlines_in_values=self.newlines_in_values,
+        )
+        rows_read = 0
+        # Parse only the unread bytes, which carry no header past offset 0
+        try:
+            with _open_byte_range(file_path, start_offset, end_offset) as source:
+                reader = pacsv.open_csv(
+                    source,
+                    read_options=csv_read_options,
+                    parse_options=parse_options,
+                    convert_options=convert_options,
+                )
+                for record_batch in reader:
+                    rows_read += record_batch.num_rows
+                    yield record_batch
+            return
+        except pa.ArrowInvalid as e:
+            logger.debug(f"Re-reading {file_path} with read_csv: {e}")
+
+        with _open_byte_range(file_path, start_offset, end_offset) as source:
+            table = pacsv.read_csv(
+                source,
+                read_options=csv_read_options,
+                parse_options=parse_options,
+                convert_options=pacsv.ConvertOptions(
+                    include_columns=convert_options.include_columns
+                ),
+            )
+        yield from table.slice(rows_read).to_batches()
+
+    def _typed_convert_options(
+        self, cursor_field: str, cursor_type: Any, columns: Optional[List[str]]
+    ) -> Any:
+        """Build the PyArrow convert options of the typed incremental path.
+
+        Args:
+            cursor_field: Name of the cursor column
+            cursor_type: Arrow type to parse the cursor column with
+            columns: Columns to return, or None for all columns
+
+        Returns:
+            ConvertOptions typing the cursor column
+        """
+        import pyarrow.csv as pacsv
+
+        # The cursor column is needed to filter even if not selected
+        include_columns = []
+        if columns:
+            include_columns = list(columns)
+            if cursor_field not in include_columns:
+                include_columns.append(cursor_field)
+        return pacsv.ConvertOptions(
+            column_types={cursor_field: cursor_type}, include_columns=include_columns
+        )
+
+    def _filter_past_watermark(
+        self, record_batch: Any, cursor_field: str, cursor: Any
+    ) -> Any:
+        """Keep the rows of an Arrow batch past the watermark.
+
+        Args:
+            record_batch: Arrow record batch
+            cursor_field: Name of the cursor column
+            cursor: Watermark as an Arrow scalar, or None to keep all rows
+
+        Returns:
+            Record batch of the rows whose cursor is greater than the watermark
+        """
+        import pyarrow.compute as pc
+
+        if cursor is None:
+            return record_batch
+        cursor_column = record_batch.column(cursor_field)
+        min_max = pc.min_max(cursor_column)
+        if not pc.greater(min_max["max"], cursor).as_py():
+            # All rows are at or before the watermark, or null
+            return record_batch.slice(0, 0)
+        if cursor_column.null_count or not pc.greater(min_max["min"], cursor).as_py():
+            mask = pc.fill_null(pc.greater(cursor_column, cursor), False)
+            return record_batch.filter(mask)
+        return record_batch
+
+    def _record_file(
+        self,
+        file_path: str,
+        file_stat: Optional[os.stat_result],
+        rows: int,
+        start_offset: int = 0,
+        offset: Optional[int] = None,
+        fingerprint: Optional[str] = None,
+    ) -> None:
+        """Record a read file in the file_manifest, if one is attached.
+
+        Args:
+            file_path: Path to the CSV file
+            file_stat: Stat of the file taken before reading
+            rows: Rows read by this run
+            start_offset: Offset this run resumed from, 0 for a full read
+            offset: Offset the next run may resume from
+            fingerprint: Fingerprint of the file the offset belongs to
+        """
+        if file_stat is None:
+            return
+        if start_offset:
+            rows += self.file_manifest.get_rows_ingested(file_path)
+        self.file_manifest.record(
+            file_path,
+            file_stat.st_size,
+            file_stat.st_mtime_ns,
+            rows,
+            offset=offset,
+            fingerprint=fingerprint,
+        )
 
     def get_cursor_value(self, chunk: DataChunk, cursor_field: str) -> Optional[Any]:
         """
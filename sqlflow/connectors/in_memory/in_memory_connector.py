@@ -92,8 +92,10 @@ class InMemoryDestination(DestinationConnector):
         self,
         df: pd.DataFrame,
         options: Optional[Dict[str, Any]] = None,
+        mode: str = "replace",
+        keys: Optional[List[str]] = None,
     ) -> None:
         """
-        Write data to the in-memory store.
+        Write data to the in-memory store, replacing any previous data.
         """
         IN_MEMORY_DATA_STORE[self.table_name] = df
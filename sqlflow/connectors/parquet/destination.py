@@ -1,10 +1,11 @@
 import os
 import uuid
 from io import BytesIO
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterable, List, Optional
 
 import pandas as pd
 import pyarrow as pa
+import pyarrow.dataset as ds
 import pyarrow.parquet as pq
 
 from sqlflow.connectors.base.destination_connector import DestinationConnector
@@ -261,3 +262,74 @@ class ParquetDestination(DestinationConnector):
                 except OSError:
                     logger.warning("Failed to cleanup temporary file: %s", temp_path)
             raise
+
+    def write_batches(
+        self,
+        batches: Iterable[pa.RecordBatch],
+        schema: pa.Schema,
+        options: Optional[Dict[str, Any]] = None,
+        mode: str = "replace",
+    ) -> int:
+        """
+        Stream Arrow record batches into Parquet, one batch in memory at a time.
+
+        Single files are staged and atomically swapped in like `write`.
+        Directory paths or `partition_cols` write a hive-partitioned dataset.
+        """
+        if mode.lower() == "upsert":
+            raise NotImplementedError(
+                "UPSERT mode is not supported for ParquetDestination."
+            )
+
+        write_options = dict(options or {})
+        write_options.pop("index", None)
+        row_group_size = write_options.pop("row_group_size", None)
+        partition_cols = write_options.pop("partition_cols", None)
+
+        counted = _RowCounter(batches)
+        if partition_cols or os.path.isdir(self.path):
+            ds.write_dataset(
+                counted,
+                self.path,
+                schema=schema,
+                format="parquet",
+                partitioning=partition_cols,
+                partitioning_flavor="hive" if partition_cols else None,
+                existing_data_behavior="overwrite_or_ignore",
+            )
+            return counted.rows
+
+        dir_path = os.path.dirname(self.path)
+        if dir_path:
+            os.makedirs(dir_path, exist_ok=True)
+
+        temp_path = self._create_optimized_temp_path(self.path)
+        try:
+            with pq.ParquetWriter(temp_path, schema, **write_options) as writer:
+                for batch in counted:
+                    writer.write_batch(batch, row_group_size=row_group_size)
+
+            os.rename(temp_path, self.path)
+        except Exception:
+            if os.path.exists(temp_path):
+                try:
+                    os.remove(temp_path)
+                except OSError:
+                    logger.warning("Failed to cleanup temporary file: %s", temp_path)
+            raise
+
+        logger.debug("Streamed %d rows to %s", counted.rows, self.path)
+        return counted.rows
+
+
+class _RowCounter:
+    """Iterate record batches while counting the rows that pass through."""
+
+    def __init__(self, batches: Iterable[pa.RecordBatch]):
+        self._batches = batches
+        self.rows = 0
+
+    def __iter__(self):
+        for batch in self._batches:
+            self.rows += batch.num_rows
+            yield batch
@@ -34,6 +34,7 @@ DEFAULT_BATCH_SIZE = 50000  # Optimal for most Parquet files (larger than CSV)
 LARGE_FILE_THRESHOLD_MB = 100  # Threshold for using smaller batch sizes
 MEMORY_EFFICIENT_BATCH_SIZE = 25000  # For very large files
 MAX_PARALLEL_FILES = 4  # Maximum concurrent file reads
+MAX_PARALLEL_FOOTERS = 16  # Footer reads are small, so more can run at once
 
 
 class ParquetSource(Connector):
@@ -58,9 +59,12 @@ class ParquetSource(Connector):
         super().__init__()
         self.path: Optional[str] = None
         self.columns: Optional[List[str]] = None
+        self.filters: Optional[Dict[str, Any]] = None
         self.combine_files: bool = True  # Changed to True for backward compatibility
         self.batch_size: int = DEFAULT_BATCH_SIZE
         self.parallel_reading: bool = True  # Enable parallel reading by default
+        # Optional FileManifest of files already ingested, set by the executor
+        self.file_manifest: Optional[Any] = None
 
     def configure(self, params: Dict[str, Any]) -> None:
         """Configure the Parquet connector.
@@ -73,6 +77,7 @@ class ParquetSource(Connector):
 
         Optional Parameters:
             columns: List of columns to read
+            filters: Row filters pushed down to the reader (see `read`)
             combine_files: Whether to combine multiple files (default: True)
             batch_size: Rows per batch (default: auto-optimized)
             parallel_reading: Enable parallel file reading (default: True)
@@ -82,6 +87,7 @@ class ParquetSource(Connector):
 
         self.path = params["path"]
         self.columns = params.get("columns")
+        self.filters = params.get("filters")
         self.combine_files = params.get("combine_files", True)
         self.batch_size = params.get("batch_size", DEFAULT_BATCH_SIZE)
         self.parallel_reading = params.get("parallel_reading", True)
@@ -176,7 +182,7 @@ class ParquetSource(Connector):
             ">=": pc.greater_equal,
             "<": pc.less,
             "<=": pc.less_equal,
-            "in": pc.is_in,
+            "in": lambda field, values: field.isin(values),
         }
 
         if op in operator_map:
@@ -300,7 +306,8 @@ class ParquetSource(Connector):
         Args:
             object_name: Optional specific file to read
             columns: Optional column list (overrides configured columns)
-            filters: Optional filters with predicate pushdown support
+            filters: Optional filters with predicate pushdown support (overrides
+                    configured filters)
                     Format: {"column": value} or {"column": {">=": value, "<": other_value}}
             batch_size: Optional batch size (overrides configured batch_size)
             options: Optional options for backward compatibility
@@ -313,6 +320,7 @@ class ParquetSource(Connector):
 
         # Use parameters or fall back to configured values
         columns_to_read = columns or self.columns
+        filters = filters or self.filters
 
         try:
             files = self._get_file_list()
@@ -367,35 +375,265 @@ class ParquetSource(Connector):
         """
         return True
 
-    def get_cursor_value(self, object_name: str, cursor_field: str) -> Any:
+    def get_cursor_value(self, object_name: Any, cursor_field: str) -> Any:
         """Get the current cursor value for incremental loading.
 
+        The maximum is taken from Parquet footer statistics where they can be
+        trusted, so most files are never read; other files read only the
+        cursor column. Passing a DataChunk returns the maximum within it.
+
         Args:
-            object_name: Name of the object
+            object_name: Name of the object, or a DataChunk
             cursor_field: Name of the cursor field
 
         Returns:
             Current cursor value
         """
+        if isinstance(object_name, DataChunk):
+            return self._chunk_cursor_max(object_name, cursor_field)
+
         try:
             files = self._get_file_list()
             if not files:
                 return None
 
-            max_value = None
-            for file_path in files:
-                df = pd.read_parquet(file_path, columns=[cursor_field])
-                if cursor_field in df.columns:
-                    file_max = df[cursor_field].max()
-                    if max_value is None or file_max > max_value:
-                        max_value = file_max
+            with ThreadPoolExecutor(
+                max_workers=min(len(files), MAX_PARALLEL_FOOTERS)
+            ) as executor:
+                file_maxes = executor.map(
+                    lambda path: self._file_cursor_max(path, cursor_field), files
+                )
+                values = [value for value in file_maxes if value is not None]
 
-            return max_value
+            return max(values) if values else None
 
         except Exception as e:
             logger.error(f"Cursor value retrieval failed: {e}")
             return None
 
+    def read_incremental(
+        self,
+        object_name: Optional[str],
+        cursor_field: str,
+        cursor_value: Optional[Any] = None,
+        batch_size: Optional[int] = None,
+        columns: Optional[List[str]] = None,
+        **kwargs,
+    ) -> Iterator[DataChunk]:
+        """Read rows whose cursor field is greater than cursor_value.
+
+        Files and row groups whose footer statistics show no rows newer than
+        the watermark are skipped without reading any data pages. With a
+        file_manifest attached, files whose size and mtime match the manifest
+        are skipped without being opened, and read files are recorded in it.
+
+        Args:
+            object_name: Optional file name; ignored unless it names a matched file
+            cursor_field: Column name to use for incremental filtering
+            cursor_value: Last value of cursor field from previous run
+            batch_size: Optional batch size (will be optimized per file)
+            columns: Optional columns to read (overrides configured columns)
+            **kwargs: Additional parameters
+
+        Yields:
+            DataChunk objects containing rows newer than cursor_value
+        """
+        if self.state != ConnectorState.CONFIGURED:
+            raise RuntimeError("Connector not configured")
+
+        files = self._get_file_list()
+        if object_name:
+            named = [f for f in files if os.path.basename(f) == object_name]
+            files = named or files
+
+        columns_to_read = columns or self.columns
+        for file_path in files:
+            file_stat = os.stat(file_path)
+            if self.file_manifest and not self.file_manifest.is_changed(
+                file_path, file_stat.st_size, file_stat.st_mtime_ns
+            ):
+                logger.debug(f"Skipping {file_path}: unchanged since last ingest")
+                continue
+
+            rows = 0
+            for chunk in self._read_file_incremental(
+                file_path,
+                cursor_field,
+                cursor_value,
+                columns_to_read,
+                self._get_optimal_batch_size(file_path, batch_size),
+            ):
+                rows += len(chunk)
+                yield chunk
+
+            if self.file_manifest:
+                self.file_manifest.record(
+                    file_path,
+                    file_stat.st_size,
+                    file_stat.st_mtime_ns,
+                    self.file_manifest.get_rows_ingested(file_path) + rows,
+                )
+
+    def _read_file_incremental(
+        self,
+        file_path: str,
+        cursor_field: str,
+        cursor_value: Optional[Any],
+        columns: Optional[List[str]],
+        batch_size: int,
+    ) -> Iterator[DataChunk]:
+        """Read the row groups of one file that may hold rows past the cursor."""
+        parquet_file = pq.ParquetFile(file_path)
+        schema = parquet_file.schema_arrow
+        if schema.get_field_index(cursor_field) < 0:
+            return
+
+        cursor_type = schema.field(cursor_field).type
+        cursor = (
+            self._coerce_cursor_value(cursor_value, cursor_type)
+            if cursor_value is not None
+            else None
+        )
+
+        row_groups = list(range(parquet_file.metadata.num_row_groups))
+        if cursor is not None:
+            row_groups = [
+                index
+                for index in row_groups
+                if not self._row_group_is_older(
+                    parquet_file.metadata.row_group(index), cursor_field, cursor
+                )
+            ]
+        if not row_groups:
+            logger.debug(f"Skipping {file_path}: no rows past cursor {cursor_value}")
+            return
+
+        # The cursor column is needed to filter even if not selected
+        read_columns = columns
+        if columns and cursor_field not in columns:
+            read_columns = list(columns) + [cursor_field]
+
+        for batch in parquet_file.iter_batches(
+            batch_size=batch_size, row_groups=row_groups, columns=read_columns
+        ):
+            if cursor_value is not None:
+                mask = self._cursor_mask(
+                    batch.column(cursor_field), cursor, cursor_value
+                )
+                batch = batch.filter(mask)
+            if columns and cursor_field not in columns:
+                batch = batch.select(columns)
+            if batch.num_rows:
+                yield DataChunk(data=batch)
+
+    def _file_cursor_max(self, file_path: str, cursor_field: str) -> Any:
+        """Get the cursor maximum of one file, from statistics when possible."""
+        parquet_file = pq.ParquetFile(file_path)
+        schema = parquet_file.schema_arrow
+        if schema.get_field_index(cursor_field) < 0:
+            return None
+
+        if self._has_trusted_statistics(schema.field(cursor_field).type):
+            metadata = parquet_file.metadata
+            maxes = []
+            for index in range(metadata.num_row_groups):
+                statistics = self._column_statistics(
+                    metadata.row_group(index), cursor_field
+                )
+                if statistics is None:
+                    break
+                if statistics.has_min_max:
+                    maxes.append(statistics.max)
+            else:
+                return max(maxes) if maxes else None
+
+        column = parquet_file.read(columns=[cursor_field]).column(cursor_field)
+        return pc.max(column).as_py()
+
+    def _row_group_is_older(
+        self, row_group: pq.RowGroupMetaData, cursor_field: str, cursor: pa.Scalar
+    ) -> bool:
+        """Check from statistics that a row group has no rows past the cursor."""
+        if not self._has_trusted_statistics(cursor.type):
+            return False
+
+        statistics = self._column_statistics(row_group, cursor_field)
+        if statistics is None:
+            return False
+        if not statistics.has_min_max:
+            # Only an all-null row group has no min/max and nothing to load
+            return statistics.null_count == row_group.num_rows
+
+        return statistics.max <= cursor.as_py()
+
+    def _column_statistics(
+        self, row_group: pq.RowGroupMetaData, column_name: str
+    ) -> Optional[pq.Statistics]:
+        """Get the statistics for a top-level column of a row group."""
+        for index in range(row_group.num_columns):
+            column = row_group.column(index)
+            if column.path_in_schema == column_name:
+                return column.statistics if column.is_stats_set else None
+        return None
+
+    def _has_trusted_statistics(self, data_type: pa.DataType) -> bool:
+        """Check that min/max statistics are exact for a type.
+
+        Writers may truncate string and binary statistics, so only numeric
+        and temporal columns are used to skip data.
+        """
+        return (
+            pa.types.is_integer(data_type)
+            or pa.types.is_floating(data_type)
+            or pa.types.is_date(data_type)
+            or pa.types.is_timestamp(data_type)
+        )
+
+    def _coerce_cursor_value(
+        self, cursor_value: Any, data_type: pa.DataType
+    ) -> Optional[pa.Scalar]:
+        """Convert a stored watermark to a scalar of the cursor column type."""
+        try:
+            return pa.scalar(cursor_value).cast(data_type)
+        except (pa.ArrowInvalid, pa.ArrowNotImplementedError, TypeError):
+            pass
+
+        if pa.types.is_timestamp(data_type):
+            try:
+                timestamp = pd.Timestamp(cursor_value)
+                if data_type.tz is not None:
+                    timestamp = (
+                        timestamp.tz_localize(data_type.tz)
+                        if timestamp.tzinfo is None
+                        else timestamp.tz_convert(data_type.tz)
+                    )
+                elif timestamp.tzinfo is not None:
+                    timestamp = timestamp.tz_convert(None)
+                return pa.scalar(timestamp, type=data_type)
+            except (ValueError, TypeError, pa.ArrowInvalid):
+                pass
+
+        logger.debug(f"Cursor value {cursor_value!r} does not convert to {data_type}")
+        return None
+
+    def _cursor_mask(
+        self, column: pa.Array, cursor: Optional[pa.Scalar], cursor_value: Any
+    ) -> pa.Array:
+        """Build the row mask for values past the cursor."""
+        if cursor is not None:
+            return pc.fill_null(pc.greater(column, cursor), False)
+        # Fall back to comparing text, as the CSV connector does
+        return pc.fill_null(
+            pc.greater(pc.cast(column, pa.string()), str(cursor_value)), False
+        )
+
+    def _chunk_cursor_max(self, chunk: DataChunk, cursor_field: str) -> Any:
+        """Get the cursor maximum within a chunk."""
+        table = chunk.arrow_table
+        if cursor_field not in table.column_names or table.num_rows == 0:
+            return None
+        return pc.max(table.column(cursor_field)).as_py()
+
     def _get_file_list(self) -> List[str]:
         """Get list of files matching the path pattern.
 
@@ -433,23 +671,20 @@ class ParquetSource(Connector):
         """
         try:
             if filter_expression is not None:
-                # Use dataset API for predicate pushdown
+                # Use dataset API for predicate pushdown, streaming batches
                 dataset = ds.dataset(file_path, format="parquet")
-                table = dataset.to_table(columns=columns, filter=filter_expression)
-
-                # Convert to pandas and yield in batches
-                df = table.to_pandas()
-                for i in range(0, len(df), batch_size):
-                    batch_df = df.iloc[i : i + batch_size]
-                    yield DataChunk(data=batch_df)
+                for batch in dataset.to_batches(
+                    columns=columns, filter=filter_expression, batch_size=batch_size
+                ):
+                    if batch.num_rows:
+                        yield DataChunk(data=batch)
             else:
                 # Use ParquetFile for efficient streaming without filters
                 parquet_file = pq.ParquetFile(file_path)
                 for batch in parquet_file.iter_batches(
                     columns=columns, batch_size=batch_size
                 ):
-                    df = batch.to_pandas()
-                    yield DataChunk(data=df)
+                    yield DataChunk(data=batch)
 
         except Exception as e:
             logger.error(f"Failed to read file {file_path}: {e}")
@@ -547,15 +782,15 @@ class ParquetSource(Connector):
                 total_size_mb
             )
 
-            # Read with predicate pushdown and column selection using correct API
-            table = dataset.to_table(columns=columns, filter=filter_expression)
-
-            # Convert to pandas and yield in optimized batches
-            df = table.to_pandas()
-
-            for i in range(0, len(df), optimal_batch_size):
-                batch_df = df.iloc[i : i + optimal_batch_size]
-                yield DataChunk(data=batch_df)
+            # Stream batches with predicate pushdown and column selection so
+            # only one batch of the combined dataset is in memory at a time
+            for batch in dataset.to_batches(
+                columns=columns,
+                filter=filter_expression,
+                batch_size=optimal_batch_size,
+            ):
+                if batch.num_rows:
+                    yield DataChunk(data=batch)
 
         except Exception as e:
             logger.error(f"Failed to read combined files: {e}")
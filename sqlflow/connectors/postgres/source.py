@@ -1,6 +1,10 @@
 from __future__ import annotations
 
-from typing import Any, Dict, Iterator, List, Optional
+import datetime
+import decimal
+import os
+import threading
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 
 import pandas as pd
 import pyarrow as pa
@@ -11,6 +15,10 @@ from sqlalchemy.pool import QueuePool, StaticPool
 from sqlflow.connectors.base.connection_test_result import ConnectionTestResult
 from sqlflow.connectors.base.connector import Connector, ConnectorState
 from sqlflow.connectors.base.schema import Schema
+from sqlflow.connectors.concurrent_reader import (
+    DEFAULT_MAX_BUFFERED_BYTES,
+    read_concurrently,
+)
 from sqlflow.connectors.data_chunk import DataChunk
 from sqlflow.connectors.postgres.utils import translate_postgres_parameters
 from sqlflow.connectors.resilience import resilient_operation
@@ -18,6 +26,92 @@ from sqlflow.logging import get_logger
 
 logger = get_logger(__name__)
 
+READ_MODES = ("cursor", "copy")
+
+# Arrow types of COPY CSV output by PostgreSQL type OID. NUMERIC (1700) uses
+# its declared precision; other unlisted types are read as text.
+POSTGRES_ARROW_TYPES = {
+    16: pa.bool_(),
+    20: pa.int64(),
+    21: pa.int16(),
+    23: pa.int32(),
+    26: pa.int64(),
+    700: pa.float32(),
+    701: pa.float64(),
+    1082: pa.date32(),
+    1083: pa.time64("us"),
+    1114: pa.timestamp("us"),
+    1184: pa.timestamp("us", tz="UTC"),
+}
+NUMERIC_OID = 1700
+
+DEFAULT_PARTITIONS = 4
+
+# Pseudo partition column that splits a table by physical page ranges
+CTID_PARTITION_COLUMN = "ctid"
+
+
+def _split_range(lower: Any, upper: Any, partitions: int) -> List[Any]:
+    """Split [lower, upper] into equal slices and return the inner cut points.
+
+    Args:
+        lower: Smallest partition column value
+        upper: Largest partition column value
+        partitions: Number of slices
+
+    Returns:
+        Sorted, distinct cut points strictly between lower and upper
+
+    Raises:
+        ValueError: If the values are not numbers, dates or timestamps
+    """
+    if isinstance(lower, bool) or not isinstance(
+        lower, (int, float, decimal.Decimal, datetime.date)
+    ):
+        raise ValueError(
+            "PostgresSource: partition_column must be a numeric, date or "
+            f"timestamp column, got values of type {type(lower).__name__}"
+        )
+
+    span = upper - lower
+    cuts = []
+    for index in range(1, partitions):
+        if isinstance(lower, int):
+            cut = lower + span * index // partitions
+        else:
+            cut = lower + span * index / partitions
+        if lower < cut < upper and (not cuts or cut > cuts[-1]):
+            cuts.append(cut)
+    return cuts
+
+
+def _range_predicates(column: str, cuts: List[Any], nullable: bool = True) -> List[str]:
+    """Build one WHERE predicate per slice between consecutive cut points.
+
+    Args:
+        column: Quoted column expression
+        cuts: Sorted SQL literals of the cut points
+        nullable: Whether the first slice also takes NULLs, so that every
+            row is read exactly once
+
+    Returns:
+        len(cuts) + 1 predicates
+    """
+    predicates = [f"{column} < {cuts[0]}"]
+    if nullable:
+        predicates[0] += f" OR {column} IS NULL"
+    for lower, upper in zip(cuts, cuts[1:]):
+        predicates.append(f"{column} >= {lower} AND {column} < {upper}")
+    predicates.append(f"{column} >= {cuts[-1]}")
+    return predicates
+
+
+def _sql_literal(value: Any) -> str:
+    """Render a partition cut point as a SQL literal."""
+    if isinstance(value, datetime.date):
+        return f"'{value.isoformat()}'"
+    return str(value)
+
 
 class PostgresSource(Connector):
     """
@@ -29,6 +123,10 @@ class PostgresSource(Connector):
         self._engine = None
         self.conn_params = {}
         self._query_strategy_cache = {}
+        self.read_mode = "cursor"
+        self.partition_column: Optional[str] = None
+        self.partitions = DEFAULT_PARTITIONS
+        self.max_buffer_mb: float = DEFAULT_MAX_BUFFERED_BYTES / 1024**2
 
         if config is not None:
             self.configure(config)
@@ -51,6 +149,27 @@ class PostgresSource(Connector):
                 "or operational parameters (query, table_name, table)"
             )
 
+        # "cursor" fetches rows through psycopg2; "copy" streams COPY output
+        # into PyArrow's CSV reader
+        self.read_mode = self.conn_params.get("read_mode", "cursor")
+        if self.read_mode not in READ_MODES:
+            raise ValueError(
+                f"PostgresSource: read_mode must be one of {', '.join(READ_MODES)}, "
+                f"got '{self.read_mode}'"
+            )
+
+        # Reads split into slices of partition_column, or of physical pages
+        # with "ctid", run concurrently over pooled connections
+        self.partition_column = self.conn_params.get("partition_column")
+        self.partitions = int(self.conn_params.get("partitions", DEFAULT_PARTITIONS))
+        if self.partitions < 1:
+            raise ValueError(
+                f"PostgresSource: partitions must be at least 1, got {self.partitions}"
+            )
+        self.max_buffer_mb = self.conn_params.get(
+            "max_buffer_mb", DEFAULT_MAX_BUFFERED_BYTES / 1024**2
+        )
+
         # Configure resilience patterns
         self._configure_resilience(params)
 
@@ -415,10 +534,149 @@ class PostgresSource(Connector):
                 )
                 raise fallback_error
 
+    def _describe_query(self, cursor, sql: str) -> List[Tuple[str, Any]]:
+        """Get the column names and Arrow types of a query without running it.
+
+        Args:
+            cursor: psycopg2 cursor
+            sql: Query to describe
+
+        Returns:
+            (name, type) pairs in column order
+        """
+        cursor.execute(f"SELECT * FROM ({sql}) AS sqlflow_query LIMIT 0")
+        columns = []
+        for column in cursor.description:
+            name, type_code, precision, scale = (
+                column[0],
+                column[1],
+                column[4],
+                column[5],
+            )
+            if type_code == NUMERIC_OID:
+                # NUMERIC without a precision may hold any scale, so it is kept
+                # as text rather than typed from whatever the first block holds
+                data_type = (
+                    pa.decimal128(precision, scale)
+                    if precision and 0 < precision <= 38
+                    else pa.string()
+                )
+            else:
+                data_type = POSTGRES_ARROW_TYPES.get(type_code, pa.string())
+            columns.append((name, data_type))
+        return columns
+
+    def _read_copy_stream(
+        self, source, columns: List[Tuple[str, Any]], batch_size: int
+    ) -> Iterator[DataChunk]:
+        """Parse COPY CSV output into Arrow batches.
+
+        COPY writes NULL as an empty field and an empty string as "", and
+        booleans as t and f.
+        """
+        import pyarrow.csv as pacsv
+
+        if not source.peek(1):
+            # PyArrow rejects empty input even when column names are given
+            return
+
+        reader = pacsv.open_csv(
+            source,
+            read_options=pacsv.ReadOptions(column_names=[name for name, _ in columns]),
+            # A NULL in a single-column result is an empty line
+            parse_options=pacsv.ParseOptions(
+                newlines_in_values=True, ignore_empty_lines=False
+            ),
+            convert_options=pacsv.ConvertOptions(
+                column_types=dict(columns),
+                null_values=[""],
+                true_values=["t"],
+                false_values=["f"],
+                strings_can_be_null=True,
+                quoted_strings_can_be_null=False,
+            ),
+        )
+        for record_batch in reader:
+            for start_idx in range(0, record_batch.num_rows, batch_size):
+                yield DataChunk(record_batch.slice(start_idx, batch_size))
+
+    def _execute_query_with_copy(
+        self, sql: str, batch_size: int
+    ) -> Iterator[DataChunk]:
+        """Stream query results with COPY (query) TO STDOUT in CSV format.
+
+        A background thread copies the server's output into a pipe while
+        PyArrow parses it block by block, so rows never become Python
+        objects. Column types come from the query's description.
+        """
+        query = sql.strip().rstrip(";")
+        raw_connection = self.engine.raw_connection()
+        # A COPY that was stopped part-way leaves the connection unusable
+        discard_connection = True
+        try:
+            cursor = raw_connection.cursor()
+            # Fix the text form of dates and timestamps for this transaction
+            cursor.execute("SET LOCAL DateStyle = 'ISO, YMD'")
+            cursor.execute("SET LOCAL TimeZone = 'UTC'")
+            columns = self._describe_query(cursor, query)
+
+            read_fd, write_fd = os.pipe()
+            copy_errors: List[Exception] = []
+
+            def copy_to_pipe() -> None:
+                try:
+                    with os.fdopen(write_fd, "wb") as sink:
+                        cursor.copy_expert(
+                            f"COPY ({query}) TO STDOUT "
+                            "WITH (FORMAT csv, ENCODING 'UTF8')",
+                            sink,
+                        )
+                except Exception as e:
+                    copy_errors.append(e)
+
+            copy_thread = threading.Thread(
+                target=copy_to_pipe, name="sqlflow-pg-copy", daemon=True
+            )
+            copy_thread.start()
+            logger.debug(f"Streaming query with COPY, batch_size={batch_size}")
+
+            source = os.fdopen(read_fd, "rb")
+            try:
+                yield from self._read_copy_stream(source, columns, batch_size)
+            except pa.ArrowInvalid:
+                source.close()
+                copy_thread.join()
+                if copy_errors:
+                    # Output cut short by a failed COPY does not parse
+                    raise copy_errors[0] from None
+                raise
+            finally:
+                # Closing the pipe stops the copy if the consumer stopped early
+                source.close()
+                copy_thread.join()
+
+            if copy_errors:
+                raise copy_errors[0]
+            discard_connection = False
+        except Exception as e:
+            logger.error(
+                f"PostgresSource: Failed to stream query with COPY '{sql}': {str(e)}"
+            )
+            raise
+        finally:
+            if discard_connection:
+                raw_connection.invalidate()
+            raw_connection.close()
+
     def _execute_query_in_chunks(
         self, sql: str, batch_size: int
     ) -> Iterator[DataChunk]:
         """Execute SQL query and yield results in chunks with optimization."""
+        if self.read_mode == "copy":
+            logger.debug("Using COPY to stream query results")
+            yield from self._execute_query_with_copy(sql, batch_size)
+            return
+
         # Determine if we should use server-side cursor
         use_cursor = self._use_server_side_cursor(sql)
 
@@ -441,6 +699,145 @@ class PostgresSource(Connector):
                 )
                 raise
 
+    def _get_partition_concurrency(self) -> int:
+        """Get how many partitions can be read at once from the pool."""
+        pool_config = self._get_optimized_pool_config()
+        if pool_config["poolclass"] is StaticPool:
+            # A StaticPool shares one connection, which cannot run two queries
+            return 1
+        return max(
+            1,
+            min(
+                self.partitions,
+                pool_config["pool_size"] + pool_config["max_overflow"],
+            ),
+        )
+
+    def _get_column_partition_queries(self, sql: str) -> List[str]:
+        """Split a query into slices of partition_column between its min and max."""
+        sql = sql.strip().rstrip(";")
+        column = f'"{self.partition_column}"'
+        with self.engine.connect() as connection:
+            lower, upper = connection.execute(
+                text(
+                    f"SELECT MIN({column}), MAX({column}) "
+                    f"FROM ({sql}) AS sqlflow_query"
+                )
+            ).fetchone()
+        if lower is None:
+            return [sql]
+
+        cuts = _split_range(lower, upper, self.partitions)
+        if not cuts:
+            return [sql]
+        predicates = _range_predicates(column, [_sql_literal(cut) for cut in cuts])
+        return [
+            f"SELECT * FROM ({sql}) AS sqlflow_partition WHERE {predicate}"
+            for predicate in predicates
+        ]
+
+    def _get_ctid_partition_queries(
+        self, sql: str, relation: str, filtered: bool
+    ) -> List[str]:
+        """Split a table read into slices of the table's physical pages."""
+        with self.engine.connect() as connection:
+            pages = connection.execute(
+                text(
+                    "SELECT pg_relation_size(:relation) "
+                    "/ current_setting('block_size')::int"
+                ),
+                {"relation": relation},
+            ).scalar()
+
+        cuts = sorted(
+            {
+                pages * index // self.partitions
+                for index in range(1, self.partitions)
+                if pages * index // self.partitions > 0
+            }
+        )
+        if not cuts:
+            return [sql]
+        # The last slice is unbounded, so pages added since sizing are read
+        predicates = _range_predicates(
+            "ctid", [f"'({cut},0)'::tid" for cut in cuts], nullable=False
+        )
+        keyword = "AND" if filtered else "WHERE"
+        return [f"{sql} {keyword} ({predicate})" for predicate in predicates]
+
+    def _read_partitioned(
+        self,
+        sql: str,
+        batch_size: int,
+        relation: Optional[str] = None,
+        filtered: bool = False,
+    ) -> Iterator[DataChunk]:
+        """Read a query in partition_column slices over concurrent connections.
+
+        Chunks of one slice keep their order; chunks of different slices
+        interleave, and empty slices yield no chunks. Readers pause while
+        max_buffer_mb of chunks are waiting for the consumer.
+
+        Args:
+            sql: Query to read
+            batch_size: Number of rows per chunk
+            relation: Quoted schema-qualified table read by sql, required
+                for "ctid" partitioning
+            filtered: Whether sql already has a WHERE clause
+
+        Yields:
+            DataChunk objects from all slices
+
+        Raises:
+            ValueError: If "ctid" partitioning is used on a query
+        """
+        if self.partition_column == CTID_PARTITION_COLUMN:
+            if relation is None:
+                raise ValueError(
+                    "PostgresSource: ctid partitioning requires a table read, "
+                    "not a query"
+                )
+            queries = self._get_ctid_partition_queries(sql, relation, filtered)
+        else:
+            queries = self._get_column_partition_queries(sql)
+
+        if len(queries) == 1:
+            yield from self._execute_query_in_chunks(sql, batch_size)
+            return
+
+        concurrency = self._get_partition_concurrency()
+        logger.info(
+            f"Reading {len(queries)} partitions of {self.partition_column} "
+            f"with up to {concurrency} concurrent connections"
+        )
+
+        def read_slice(query: str) -> Iterator[DataChunk]:
+            # Empty slices would add chunks whose columns have no type
+            for chunk in self._execute_query_in_chunks(query, batch_size):
+                if len(chunk):
+                    yield chunk
+
+        yield from read_concurrently(
+            read_slice,
+            queries,
+            max_concurrency=concurrency,
+            max_buffered_bytes=int(self.max_buffer_mb * 1024**2),
+            thread_name_prefix="sqlflow-pg-read",
+        )
+
+    def _execute_read(
+        self,
+        sql: str,
+        batch_size: int,
+        relation: Optional[str] = None,
+        filtered: bool = False,
+    ) -> Iterator[DataChunk]:
+        """Execute a read, partitioned when a partition_column is configured."""
+        if self.partition_column and self.partitions > 1:
+            yield from self._read_partitioned(sql, batch_size, relation, filtered)
+        else:
+            yield from self._execute_query_in_chunks(sql, batch_size)
+
     @resilient_operation()
     def read(
         self,
@@ -484,7 +881,13 @@ class PostgresSource(Connector):
         logger.info(
             f"Executing optimized query: {sql} (batch_size: {optimized_batch_size})"
         )
-        yield from self._execute_query_in_chunks(sql, optimized_batch_size)
+        schema = self.conn_params.get("schema", "public")
+        yield from self._execute_read(
+            sql,
+            optimized_batch_size,
+            relation=f'{schema}."{object_name}"',
+            filtered=bool(filters),
+        )
 
     def _read_with_options(
         self, options: Dict[str, Any], batch_size: int = 10000
@@ -500,7 +903,7 @@ class PostgresSource(Connector):
             logger.info(
                 f"Executing optimized query: {query} (batch_size: {optimized_batch_size})"
             )
-            yield from self._execute_query_in_chunks(query, optimized_batch_size)
+            yield from self._execute_read(query, optimized_batch_size)
         elif table_name:
             # Table-based read with optimization
             schema = options.get("schema", "public")
@@ -509,7 +912,9 @@ class PostgresSource(Connector):
             logger.info(
                 f"Executing optimized table read: {sql} (batch_size: {optimized_batch_size})"
             )
-            yield from self._execute_query_in_chunks(sql, optimized_batch_size)
+            yield from self._execute_read(
+                sql, optimized_batch_size, relation=f'{schema}."{table_name}"'
+            )
         else:
             # Fallback to legacy method for full backward compatibility
             df = self.read_legacy(options)
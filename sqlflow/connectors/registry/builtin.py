@@ -0,0 +1,85 @@
+"""Lazy loading of the connectors that ship with SQLFlow.
+
+Each connector package registers itself into the global registries when it
+is imported, and several of them pull in heavy or optional dependencies
+(boto3, googleapiclient, psycopg2, requests). Instead of importing them all
+up front, the registries call load_builtin_connector() the first time a
+connector type is looked up, so only the connectors a pipeline actually
+uses are ever imported.
+"""
+
+import importlib
+import sys
+from typing import Dict, List, Set
+
+from sqlflow.logging import get_logger
+
+logger = get_logger(__name__)
+
+# Connector type -> module that registers it when imported
+BUILTIN_CONNECTORS: Dict[str, str] = {
+    "csv": "sqlflow.connectors.csv",
+    "parquet": "sqlflow.connectors.parquet",
+    "postgres": "sqlflow.connectors.postgres",
+    "rest": "sqlflow.connectors.rest",
+    "s3": "sqlflow.connectors.s3",
+    "google_sheets": "sqlflow.connectors.google_sheets",
+    "shopify": "sqlflow.connectors.shopify",
+    "in_memory": "sqlflow.connectors.in_memory",
+}
+
+# Modules registering a stand-in when the real connector cannot be imported
+FALLBACK_CONNECTORS: Dict[str, str] = {
+    "postgres": "sqlflow.connectors.postgres_placeholder",
+}
+
+# Connector types whose modules failed to import, so they are not retried
+_unavailable: Set[str] = set()
+
+
+def load_builtin_connector(connector_type: str) -> bool:
+    """Import the built-in connector module registering a connector type.
+
+    Args:
+    ----
+        connector_type: Connector type, in any case
+
+    Returns:
+    -------
+        True if the module is imported, False if the type is not built in
+        or its dependencies are missing
+
+    """
+    connector_type = connector_type.lower()
+    module_name = BUILTIN_CONNECTORS.get(connector_type)
+    if module_name is None or connector_type in _unavailable:
+        return False
+    if module_name in sys.modules:
+        return True
+
+    try:
+        importlib.import_module(module_name)
+        return True
+    except ImportError as e:
+        _unavailable.add(connector_type)
+        logger.debug(f"Connector '{connector_type}' is not available: {e}")
+
+    fallback = FALLBACK_CONNECTORS.get(connector_type)
+    if fallback is not None:
+        importlib.import_module(fallback)
+    return False
+
+
+def load_all_builtin_connectors() -> List[str]:
+    """Import every built-in connector whose dependencies are installed.
+
+    Returns
+    -------
+        Connector types that were loaded
+
+    """
+    return [
+        connector_type
+        for connector_type in BUILTIN_CONNECTORS
+        if load_builtin_connector(connector_type)
+    ]
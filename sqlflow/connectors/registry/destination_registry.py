@@ -1,6 +1,7 @@
 from typing import Dict, Type
 
 from sqlflow.connectors.base.destination_connector import DestinationConnector
+from sqlflow.connectors.registry.builtin import load_builtin_connector
 
 
 class DestinationConnectorRegistry:
@@ -16,7 +17,9 @@ class DestinationConnectorRegistry:
         self._connectors[connector_type] = connector_class
 
     def get(self, connector_type: str) -> Type[DestinationConnector]:
-        """Get a destination connector class."""
+        """Get a destination connector class, importing built-in ones on first use."""
+        if connector_type not in self._connectors:
+            load_builtin_connector(connector_type)
         if connector_type not in self._connectors:
             raise ValueError(f"Unknown destination connector type: {connector_type}")
         return self._connectors[connector_type]
@@ -13,6 +13,10 @@ from typing import Any, Dict, List, Optional, Type, Union
 
 from sqlflow.connectors.base.connector import Connector
 from sqlflow.connectors.base.destination_connector import DestinationConnector
+from sqlflow.connectors.registry.builtin import (
+    load_all_builtin_connectors,
+    load_builtin_connector,
+)
 from sqlflow.logging import get_logger
 
 logger = get_logger(__name__)
@@ -122,6 +126,19 @@ class EnhancedConnectorRegistry:
         self._destination_connectors[connector_type] = connector_info
         logger.debug(f"Successfully registered destination connector: {connector_type}")
 
+    def _load_builtin(
+        self, connectors: Dict[str, ConnectorTypeInfo], connector_type: str
+    ) -> None:
+        """Import a built-in connector type on its first lookup.
+
+        If the type is not built in, every built-in connector is loaded so
+        that the error listing available types is complete.
+        """
+        if connector_type in connectors:
+            return
+        if not load_builtin_connector(connector_type):
+            load_all_builtin_connectors()
+
     def get_source_connector_class(self, connector_type: str) -> Type[Connector]:
         """Get a source connector class by type.
 
@@ -134,6 +151,7 @@ class EnhancedConnectorRegistry:
         Raises:
             ValueError: If connector type is not registered
         """
+        self._load_builtin(self._source_connectors, connector_type)
         if connector_type not in self._source_connectors:
             available = list(self._source_connectors.keys())
             raise ValueError(
@@ -157,6 +175,7 @@ class EnhancedConnectorRegistry:
         Raises:
             ValueError: If connector type is not registered
         """
+        self._load_builtin(self._destination_connectors, connector_type)
         if connector_type not in self._destination_connectors:
             available = list(self._destination_connectors.keys())
             raise ValueError(
@@ -178,6 +197,7 @@ class EnhancedConnectorRegistry:
         Raises:
             ValueError: If connector type is not registered
         """
+        self._load_builtin(self._source_connectors, connector_type)
         if connector_type not in self._source_connectors:
             available = list(self._source_connectors.keys())
             raise ValueError(
@@ -199,6 +219,7 @@ class EnhancedConnectorRegistry:
         Raises:
             ValueError: If connector type is not registered
         """
+        self._load_builtin(self._destination_connectors, connector_type)
         if connector_type not in self._destination_connectors:
             available = list(self._destination_connectors.keys())
             raise ValueError(
@@ -325,6 +346,7 @@ class EnhancedConnectorRegistry:
         Returns:
             List of source connector type identifiers
         """
+        load_all_builtin_connectors()
         return list(self._source_connectors.keys())
 
     def list_destination_connectors(self) -> List[str]:
@@ -333,6 +355,7 @@ class EnhancedConnectorRegistry:
         Returns:
             List of destination connector type identifiers
         """
+        load_all_builtin_connectors()
         return list(self._destination_connectors.keys())
 
     def get_connector_defaults(
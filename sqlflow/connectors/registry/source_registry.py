@@ -1,6 +1,7 @@
 from typing import Dict, Type
 
 from sqlflow.connectors.base.connector import Connector
+from sqlflow.connectors.registry.builtin import load_builtin_connector
 
 
 class SourceConnectorRegistry:
@@ -14,7 +15,9 @@ class SourceConnectorRegistry:
         self._connectors[connector_type] = connector_class
 
     def get(self, connector_type: str) -> Type[Connector]:
-        """Get a source connector class."""
+        """Get a source connector class, importing built-in ones on first use."""
+        if connector_type not in self._connectors:
+            load_builtin_connector(connector_type)
         if connector_type not in self._connectors:
             raise ValueError(f"Unknown source connector type: {connector_type}")
         return self._connectors[connector_type]
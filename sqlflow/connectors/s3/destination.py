@@ -1,5 +1,5 @@
 import io
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterable, List, Optional
 from urllib.parse import urlparse
 
 import boto3
@@ -32,6 +32,89 @@ class S3WriteBuffer:
         return self._buffer.getvalue()
 
 
+class S3MultipartStream(io.RawIOBase):
+    """Write-only file object that uploads to S3 in multipart chunks.
+
+    Bytes are buffered until `part_size` is reached and then uploaded as one
+    part, so memory stays bounded by a single part. Objects smaller than one
+    part are uploaded with a single PUT when the stream is finished.
+    """
+
+    MIN_PART_SIZE = 5 * 1024 * 1024  # S3 minimum for all but the last part
+
+    def __init__(self, s3_client: Any, bucket: str, key: str, part_size: int):
+        super().__init__()
+        self.s3_client = s3_client
+        self.bucket = bucket
+        self.key = key
+        self.part_size = max(part_size, self.MIN_PART_SIZE)
+        self._buffer = bytearray()
+        self._parts: List[Dict[str, Any]] = []
+        self._upload_id: Optional[str] = None
+        self._position = 0
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data) -> int:
+        self._buffer.extend(data)
+        self._position += len(data)
+        if len(self._buffer) >= self.part_size:
+            self._upload_part()
+        return len(data)
+
+    def tell(self) -> int:
+        return self._position
+
+    def _upload_part(self) -> None:
+        """Upload the buffered bytes as the next part."""
+        if self._upload_id is None:
+            response = self.s3_client.create_multipart_upload(
+                Bucket=self.bucket, Key=self.key
+            )
+            self._upload_id = response["UploadId"]
+
+        part_number = len(self._parts) + 1
+        response = self.s3_client.upload_part(
+            Bucket=self.bucket,
+            Key=self.key,
+            PartNumber=part_number,
+            UploadId=self._upload_id,
+            Body=bytes(self._buffer),
+        )
+        self._parts.append({"ETag": response["ETag"], "PartNumber": part_number})
+        logger.debug("Uploaded part %d: %d bytes", part_number, len(self._buffer))
+        self._buffer.clear()
+
+    def finish(self) -> None:
+        """Upload remaining bytes and complete the object."""
+        if self._upload_id is None:
+            self.s3_client.put_object(
+                Bucket=self.bucket, Key=self.key, Body=bytes(self._buffer)
+            )
+        else:
+            if self._buffer:
+                self._upload_part()
+            self.s3_client.complete_multipart_upload(
+                Bucket=self.bucket,
+                Key=self.key,
+                UploadId=self._upload_id,
+                MultipartUpload={"Parts": self._parts},
+            )
+        self._buffer.clear()
+
+    def abort(self) -> None:
+        """Abort an in-progress multipart upload."""
+        if self._upload_id is None:
+            return
+        try:
+            self.s3_client.abort_multipart_upload(
+                Bucket=self.bucket, Key=self.key, UploadId=self._upload_id
+            )
+        except Exception as cleanup_error:
+            logger.warning("Failed to abort multipart upload: %s", cleanup_error)
+
+
 class S3Destination(DestinationConnector):
     """
     Connector for writing data to S3 with performance optimizations.
@@ -314,9 +397,14 @@ class S3Destination(DestinationConnector):
         self,
         df: pd.DataFrame,
         options: Optional[Dict[str, Any]] = None,
+        mode: str = "replace",
+        keys: Optional[List[str]] = None,
     ) -> None:
         """
         Write data to the S3 file with performance optimizations.
+
+        S3 objects are always replaced; `mode` and `keys` are accepted for
+        interface compatibility.
         """
         file_format = self.key.split(".")[-1].lower()
 
@@ -347,3 +435,73 @@ class S3Destination(DestinationConnector):
         except Exception as e:
             logger.error("Failed to write to S3: %s", str(e))
             raise
+
+    def write_batches(
+        self,
+        batches: Iterable[pa.RecordBatch],
+        schema: pa.Schema,
+        options: Optional[Dict[str, Any]] = None,
+        mode: str = "replace",
+    ) -> int:
+        """
+        Stream Arrow record batches to S3 using a multipart upload.
+
+        CSV and Parquet are encoded one batch at a time, so memory is bounded
+        by one batch plus one upload part. JSON falls back to `write`.
+        """
+        file_format = self.key.split(".")[-1].lower()
+        if file_format not in ["csv", "parquet"]:
+            return super().write_batches(batches, schema, options, mode)
+
+        part_size = int(self.config.get("multipart_chunk_size", 8 * 1024 * 1024))
+        stream = S3MultipartStream(self.s3_client, self.bucket, self.key, part_size)
+        rows_written = 0
+
+        try:
+            if file_format == "csv":
+                rows_written = self._stream_csv(batches, schema, stream)
+            else:
+                rows_written = self._stream_parquet(batches, schema, stream)
+            stream.finish()
+        except Exception as e:
+            stream.abort()
+            logger.error("Failed to stream to S3: %s", str(e))
+            raise
+
+        logger.debug(
+            "Streamed %d rows to s3://%s/%s", rows_written, self.bucket, self.key
+        )
+        return rows_written
+
+    def _stream_csv(
+        self,
+        batches: Iterable[pa.RecordBatch],
+        schema: pa.Schema,
+        stream: S3MultipartStream,
+    ) -> int:
+        """Encode batches as CSV into the upload stream."""
+        options = self._optimize_format_options("csv", pd.DataFrame())
+        header_df = pd.DataFrame(columns=schema.names)
+        self._write_csv_optimized(header_df, stream, options)
+
+        rows_written = 0
+        for batch in batches:
+            self._write_csv_optimized(
+                batch.to_pandas(), stream, {**options, "header": False}
+            )
+            rows_written += batch.num_rows
+        return rows_written
+
+    def _stream_parquet(
+        self,
+        batches: Iterable[pa.RecordBatch],
+        schema: pa.Schema,
+        stream: S3MultipartStream,
+    ) -> int:
+        """Encode batches as a single Parquet file into the upload stream."""
+        rows_written = 0
+        with pq.ParquetWriter(stream, schema, compression="snappy") as writer:
+            for batch in batches:
+                writer.write_batch(batch)
+                rows_written += batch.num_rows
+        return rows_written
@@ -0,0 +1,227 @@
+"""Seekable, range-request backed file object for S3 objects.
+
+Readers such as pyarrow's Parquet reader need a seekable file, but only
+touch a small part of it: the footer and the column chunks being read.
+S3RangedFile fetches just those byte ranges with ranged GET requests,
+keeping a small read-ahead cache and letting callers prefetch several
+ranges concurrently.
+"""
+
+import io
+import logging
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Iterable, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Bytes fetched per cache miss; reads near the end of the object are widened
+# backwards so a Parquet footer usually arrives with the first GET.
+DEFAULT_BLOCK_SIZE = 256 * 1024
+DEFAULT_MAX_CONCURRENCY = 8
+DEFAULT_CACHE_SIZE = 256 * 1024 * 1024
+
+
+class S3RangedFile(io.RawIOBase):
+    """Read-only, seekable view of an S3 object fetched with range GETs."""
+
+    def __init__(
+        self,
+        s3_client: Any,
+        bucket: str,
+        key: str,
+        size: Optional[int] = None,
+        block_size: int = DEFAULT_BLOCK_SIZE,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        cache_size: int = DEFAULT_CACHE_SIZE,
+    ):
+        """Initialize S3RangedFile.
+
+        Args:
+            s3_client: boto3 S3 client
+            bucket: Bucket name
+            key: Object key
+            size: Object size in bytes, looked up with HEAD if not given
+            block_size: Minimum bytes fetched on a cache miss
+            max_concurrency: Maximum concurrent range GETs in prefetch()
+            cache_size: Maximum bytes kept in the range cache
+        """
+        super().__init__()
+        self.s3_client = s3_client
+        self.bucket = bucket
+        self.key = key
+        if size is None:
+            size = s3_client.head_object(Bucket=bucket, Key=key)["ContentLength"]
+        self.size = size
+        self.block_size = block_size
+        self.max_concurrency = max_concurrency
+        self.cache_size = cache_size
+        self.bytes_fetched = 0
+
+        self._pos = 0
+        self._cache: "OrderedDict[int, bytes]" = OrderedDict()
+        self._cached_bytes = 0
+        self._lock = threading.Lock()
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def tell(self) -> int:
+        return self._pos
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        if whence == io.SEEK_SET:
+            pos = offset
+        elif whence == io.SEEK_CUR:
+            pos = self._pos + offset
+        elif whence == io.SEEK_END:
+            pos = self.size + offset
+        else:
+            raise ValueError(f"Invalid whence: {whence}")
+        if pos < 0:
+            raise ValueError(f"Negative seek position {pos}")
+        self._pos = pos
+        return pos
+
+    def read(self, size: int = -1) -> bytes:
+        if self._pos >= self.size:
+            return b""
+        end = self.size
+        if size is not None and size >= 0:
+            end = min(self.size, self._pos + size)
+        data = self._read_range(self._pos, end)
+        self._pos = end
+        return data
+
+    def readinto(self, buffer: Any) -> int:
+        data = self.read(len(buffer))
+        buffer[: len(data)] = data
+        return len(data)
+
+    def prefetch(self, ranges: Iterable[Tuple[int, int]]) -> None:
+        """Fetch byte ranges concurrently into the cache.
+
+        Ranges closer together than block_size are coalesced into one request.
+
+        Args:
+            ranges: (start, end) byte offsets, end exclusive
+        """
+        missing = [
+            (start, end)
+            for start, end in self._coalesce(ranges)
+            if self._cached(start, end) is None
+        ]
+        if not missing:
+            return
+
+        if len(missing) == 1 or self.max_concurrency <= 1:
+            for start, end in missing:
+                self._store(start, self._fetch(start, end))
+            return
+
+        with ThreadPoolExecutor(
+            max_workers=min(self.max_concurrency, len(missing))
+        ) as executor:
+            for (start, _), data in zip(
+                missing, executor.map(lambda r: self._fetch(*r), missing)
+            ):
+                self._store(start, data)
+
+    def _coalesce(self, ranges: Iterable[Tuple[int, int]]) -> List[Tuple[int, int]]:
+        """Sort ranges and merge those separated by less than block_size."""
+        merged: List[Tuple[int, int]] = []
+        for start, end in sorted(ranges):
+            start, end = max(0, start), min(self.size, end)
+            if start >= end:
+                continue
+            if merged and start - merged[-1][1] < self.block_size:
+                merged[-1] = (merged[-1][0], max(merged[-1][1], end))
+            else:
+                merged.append((start, end))
+        return merged
+
+    def _read_range(self, start: int, end: int) -> bytes:
+        """Return bytes [start, end) from the cache, fetching on a miss."""
+        data = self._cached(start, end)
+        if data is not None:
+            return data
+
+        # Read ahead on small reads; near the end of the object, widen the
+        # window backwards instead so footer reads share one request.
+        fetch_start, fetch_end = start, max(end, start + self.block_size)
+        if fetch_end > self.size:
+            fetch_end = self.size
+            fetch_start = min(start, max(0, fetch_end - self.block_size))
+
+        block = self._fetch(fetch_start, fetch_end)
+        self._store(fetch_start, block)
+        return block[start - fetch_start : end - fetch_start]
+
+    def _cached(self, start: int, end: int) -> Optional[bytes]:
+        """Return bytes [start, end) if a single cached block holds them."""
+        with self._lock:
+            for block_start, block in self._cache.items():
+                if block_start <= start and end <= block_start + len(block):
+                    self._cache.move_to_end(block_start)
+                    return block[start - block_start : end - block_start]
+        return None
+
+    def _store(self, start: int, data: bytes) -> None:
+        """Add a block to the cache, evicting least recently used blocks."""
+        with self._lock:
+            previous = self._cache.pop(start, None)
+            if previous is not None:
+                self._cached_bytes -= len(previous)
+            self._cache[start] = data
+            self._cached_bytes += len(data)
+            while self._cached_bytes > self.cache_size and len(self._cache) > 1:
+                _, evicted = self._cache.popitem(last=False)
+                self._cached_bytes -= len(evicted)
+
+    def _fetch(self, start: int, end: int) -> bytes:
+        """Fetch bytes [start, end) with a single range GET."""
+        response = self.s3_client.get_object(
+            Bucket=self.bucket, Key=self.key, Range=f"bytes={start}-{end - 1}"
+        )
+        data = response["Body"].read()
+        with self._lock:
+            self.bytes_fetched += len(data)
+        logger.debug(
+            f"Fetched bytes {start}-{end - 1} of s3://{self.bucket}/{self.key}"
+        )
+        return data
+
+    def close(self) -> None:
+        with self._lock:
+            self._cache.clear()
+            self._cached_bytes = 0
+        super().close()
+
+
+def column_chunk_ranges(
+    row_group: Any, columns: Optional[List[str]] = None
+) -> List[Tuple[int, int]]:
+    """Get the byte ranges of a Parquet row group's column chunks.
+
+    Args:
+        row_group: pyarrow RowGroupMetaData
+        columns: Top-level column names to include, all if None
+
+    Returns:
+        (start, end) byte offsets, end exclusive
+    """
+    wanted = set(columns) if columns else None
+    ranges = []
+    for i in range(row_group.num_columns):
+        column = row_group.column(i)
+        if wanted is not None and column.path_in_schema.split(".")[0] not in wanted:
+            continue
+        start = column.data_page_offset
+        if column.has_dictionary_page and column.dictionary_page_offset:
+            start = min(start, column.dictionary_page_offset)
+        ranges.append((start, start + column.total_compressed_size))
+    return ranges
@@ -17,11 +17,25 @@ from botocore.exceptions import ClientError, NoCredentialsError
 from sqlflow.connectors.base.connection_test_result import ConnectionTestResult
 from sqlflow.connectors.base.connector import Connector, ConnectorState
 from sqlflow.connectors.base.schema import Schema
+from sqlflow.connectors.concurrent_reader import (
+    DEFAULT_MAX_BUFFERED_BYTES,
+    DEFAULT_MAX_CONCURRENT_OBJECTS,
+    read_concurrently,
+)
 from sqlflow.connectors.data_chunk import DataChunk
 from sqlflow.connectors.resilience import resilient_operation
+from sqlflow.connectors.s3.ranged_file import (
+    DEFAULT_BLOCK_SIZE,
+    DEFAULT_MAX_CONCURRENCY,
+    S3RangedFile,
+    column_chunk_ranges,
+)
 
 logger = logging.getLogger(__name__)
 
+# Bytes fetched from the start of CSV/JSONL objects for schema sampling
+SAMPLE_BYTES = 512 * 1024
+
 
 class S3Source(Connector):
     """
@@ -59,6 +73,15 @@ class S3Source(Connector):
         self.json_flatten: bool = True
         self.json_max_depth: int = 10
 
+        # Ranged read attributes
+        self.read_block_size: int = DEFAULT_BLOCK_SIZE
+        self.max_read_concurrency: int = DEFAULT_MAX_CONCURRENCY
+        self.max_concurrent_objects: int = DEFAULT_MAX_CONCURRENT_OBJECTS
+        self.max_buffer_mb: float = DEFAULT_MAX_BUFFERED_BYTES / 1024**2
+
+        # Optional FileManifest of objects already ingested, set by the executor
+        self.file_manifest: Optional[Any] = None
+
         if config is not None:
             self.configure(config)
 
@@ -139,6 +162,18 @@ class S3Source(Connector):
         self.json_flatten = params.get("json_flatten", True)
         self.json_max_depth = params.get("json_max_depth", 10)
 
+        # Ranged read parameters
+        self.read_block_size = params.get("read_block_size", DEFAULT_BLOCK_SIZE)
+        self.max_read_concurrency = params.get(
+            "max_read_concurrency", DEFAULT_MAX_CONCURRENCY
+        )
+        self.max_concurrent_objects = params.get(
+            "max_concurrent_objects", DEFAULT_MAX_CONCURRENT_OBJECTS
+        )
+        self.max_buffer_mb = params.get(
+            "max_buffer_mb", DEFAULT_MAX_BUFFERED_BYTES / 1024**2
+        )
+
     def _configure_partition_parameters(self, params: Dict[str, Any]) -> None:
         """Configure partition-related parameters."""
         partition_keys = params.get("partition_keys")
@@ -380,39 +415,38 @@ class S3Source(Connector):
     @resilient_operation()
     def read(
         self,
-        object_name: str,
+        object_name: Optional[str] = None,
         columns: Optional[List[str]] = None,
         filters: Optional[Dict[str, Any]] = None,
         batch_size: int = 10000,
         options: Optional[Dict[str, Any]] = None,
     ) -> Iterator[DataChunk]:
-        """Read data from an S3 object in chunks with resilience."""
-        # Determine file format from object_name extension if not provided
-        file_format = (options or {}).get("file_format")
-        if not file_format:
-            if object_name.endswith(".csv"):
-                file_format = "csv"
-            elif object_name.endswith((".json", ".jsonl")):
-                file_format = "json"
-            elif object_name.endswith((".parquet", ".parq")):
-                file_format = "parquet"
-            else:
-                raise ValueError(
-                    f"Unsupported file format for '{object_name}'. "
-                    "Please specify 'file_format' in options."
-                )
+        """Read data from an S3 object in chunks with resilience.
+
+        Without object_name, the configured key is read, or every object
+        discovered under path_prefix via read_objects().
+        """
+        if object_name is None:
+            if not self.key:
+                yield from self.read_objects(self.discover(), columns, batch_size)
+                return
+            object_name = self.key
+
+        file_format = (options or {}).get("file_format") or self._format_from_name(
+            object_name
+        )
+        readers = {
+            "csv": lambda: self._read_csv_chunks(object_name, batch_size),
+            "json": lambda: self._read_json_chunks(object_name, batch_size),
+            "parquet": lambda: self._read_parquet_chunks(
+                object_name, batch_size, columns
+            ),
+        }
 
         try:
-            if file_format == "csv":
-                reader = self._read_csv_chunks
-            elif file_format == "json":
-                reader = self._read_json_chunks
-            elif file_format == "parquet":
-                reader = self._read_parquet_chunks
-            else:
+            if file_format not in readers:
                 raise ValueError(f"Unsupported file format: {file_format}")
-
-            yield from reader(object_name, batch_size)
+            yield from readers[file_format]()
 
         except Exception as e:
             logger.error(
@@ -420,6 +454,55 @@ class S3Source(Connector):
             )
             raise
 
+    @staticmethod
+    def _format_from_name(object_name: str) -> str:
+        """Determine the file format from an object name's extension."""
+        if object_name.endswith(".csv"):
+            return "csv"
+        if object_name.endswith((".json", ".jsonl")):
+            return "json"
+        if object_name.endswith((".parquet", ".parq")):
+            return "parquet"
+        raise ValueError(
+            f"Unsupported file format for '{object_name}'. "
+            "Please specify 'file_format' in options."
+        )
+
+    def read_objects(
+        self,
+        object_names: List[str],
+        columns: Optional[List[str]] = None,
+        batch_size: int = 10000,
+        skip_failed: bool = False,
+    ) -> Iterator[DataChunk]:
+        """Read several objects concurrently as one stream of chunks.
+
+        Up to max_concurrent_objects objects are downloaded and parsed at
+        once. Readers pause while max_buffer_mb of chunks are waiting for the
+        consumer, so memory stays bounded however many objects there are.
+
+        Args:
+            object_names: S3 object keys
+            columns: Optional list of columns to read
+            batch_size: Number of rows per chunk
+            skip_failed: Log and skip objects that fail to read
+
+        Yields:
+            DataChunk objects from all objects
+        """
+        logger.info(
+            f"Reading {len(object_names)} objects from S3 bucket '{self.bucket}' "
+            f"with up to {self.max_concurrent_objects} concurrent reads"
+        )
+        yield from read_concurrently(
+            lambda key: self.read(key, columns=columns, batch_size=batch_size),
+            object_names,
+            max_concurrency=self.max_concurrent_objects,
+            max_buffered_bytes=int(self.max_buffer_mb * 1024**2),
+            skip_failed=skip_failed,
+            thread_name_prefix="sqlflow-s3-read",
+        )
+
     def read_incremental(
         self,
         object_name: str,
@@ -428,20 +511,93 @@ class S3Source(Connector):
         batch_size: int = 10000,
         **kwargs,
     ) -> Iterator[DataChunk]:
-        """Read data incrementally using a cursor field."""
-        # For S3, incremental loading is typically based on object modification time
-        # or object key patterns, not data content
+        """Read data incrementally using a cursor field.
+
+        For S3, what changes between runs is the set of objects, not the rows
+        inside one. With a file_manifest attached, every object under the key
+        or prefix whose size and ETag differ from the manifest is read and
+        recorded; unchanged objects are skipped without a GET. Without a
+        manifest, object_name is read in full.
+        """
         filters = kwargs.get("filters", {})
 
-        # For simplicity, we'll use the standard read method
-        # In a real implementation, you might filter objects by modification time
-        return self.read(
-            object_name=object_name,
-            columns=kwargs.get("columns"),
-            filters=filters,
-            batch_size=batch_size,
+        if self.file_manifest is None:
+            return self.read(
+                object_name=object_name,
+                columns=kwargs.get("columns"),
+                filters=filters,
+                batch_size=batch_size,
+            )
+
+        return self._read_changed_objects(kwargs.get("columns"), filters, batch_size)
+
+    def _read_changed_objects(
+        self,
+        columns: Optional[List[str]],
+        filters: Optional[Dict[str, Any]],
+        batch_size: int,
+    ) -> Iterator[DataChunk]:
+        """Read the objects that are new or changed since the manifest."""
+        changed = [
+            obj
+            for obj in self._list_objects()
+            if self.file_manifest.is_changed(obj["Key"], obj["Size"], obj["ETag"])
+        ]
+        if len(changed) > self.max_files_per_run:
+            logger.warning(
+                f"{len(changed)} changed objects, reading the first "
+                f"{self.max_files_per_run}; the rest are read on later runs"
+            )
+            changed = changed[: self.max_files_per_run]
+
+        logger.info(
+            f"Reading {len(changed)} new or changed objects from S3 bucket "
+            f"'{self.bucket}'"
         )
 
+        for obj in changed:
+            key = obj["Key"]
+            rows = 0
+            for chunk in self.read(
+                object_name=key, columns=columns, filters=filters, batch_size=batch_size
+            ):
+                rows += len(chunk)
+                yield chunk
+
+            # A changed object is read in full, so its rows replace the count
+            self.file_manifest.record(key, obj["Size"], obj["ETag"], rows)
+
+    def _list_objects(self) -> List[Dict[str, Any]]:
+        """List the configured key or prefix with sizes and ETags."""
+        if self.key:
+            try:
+                head = self.s3_client.head_object(Bucket=self.bucket, Key=self.key)
+            except ClientError as e:
+                if e.response["Error"]["Code"] == "404":
+                    return []
+                raise
+            return [
+                {
+                    "Key": self.key,
+                    "Size": head["ContentLength"],
+                    "ETag": head["ETag"].strip('"'),
+                }
+            ]
+
+        objects = []
+        paginator = self.s3_client.get_paginator("list_objects_v2")
+        for page in paginator.paginate(Bucket=self.bucket, Prefix=self.path_prefix):
+            for obj in page.get("Contents", []):
+                if self._matches_file_format(obj["Key"]):
+                    objects.append(
+                        {
+                            "Key": obj["Key"],
+                            "Size": obj["Size"],
+                            "ETag": obj["ETag"].strip('"'),
+                        }
+                    )
+        return objects
+
     def supports_incremental(self) -> bool:
         """Check if connector supports incremental reading."""
         return True
@@ -494,13 +650,22 @@ class S3Source(Connector):
 
     @resilient_operation()
     def _read_object_sample(self, key: str, nrows: int = 100) -> Optional[pd.DataFrame]:
-        """Read a sample of an S3 object for schema detection with resilience."""
-        try:
-            response = self.s3_client.get_object(Bucket=self.bucket, Key=key)
-            content = response["Body"].read()
+        """Read a sample of an S3 object for schema detection with resilience.
 
+        Parquet samples read the footer and first rows with range requests,
+        CSV and JSONL samples only the first SAMPLE_BYTES of the object.
+        """
+        try:
             file_format = self._detect_file_format(key)
-            options = {"nrows": nrows} if file_format == "csv" else {}
+            if file_format == "parquet":
+                return self._read_parquet_sample(key, nrows)
+
+            if file_format in ("csv", "jsonl"):
+                content = self._read_head_lines(key)
+                options = {"nrows": nrows}
+            else:
+                content = self._get_s3_object(key)["Body"].read()
+                options = {}
 
             return self._parse_file_content(content, file_format, options)
 
@@ -508,6 +673,38 @@ class S3Source(Connector):
             logger.error(f"Failed to read sample from {key}: {str(e)}")
             return None
 
+    def _read_head_lines(self, key: str) -> bytes:
+        """Read the complete lines within the first SAMPLE_BYTES of an object."""
+        response = self.s3_client.get_object(
+            Bucket=self.bucket, Key=key, Range=f"bytes=0-{SAMPLE_BYTES - 1}"
+        )
+        content = response["Body"].read()
+        if len(content) < SAMPLE_BYTES:
+            return content
+
+        # Drop the partial last line; fall back to the whole object if the
+        # sample does not even hold one complete line.
+        last_newline = content.rfind(b"\n")
+        if last_newline == -1:
+            return self._get_s3_object(key)["Body"].read()
+        return content[: last_newline + 1]
+
+    def _read_parquet_sample(self, key: str, nrows: int) -> pd.DataFrame:
+        """Read the first rows of a Parquet object with range requests."""
+        with self._open_ranged_file(key) as ranged_file:
+            parquet_file = pq.ParquetFile(ranged_file)
+            batch = None
+            if parquet_file.metadata.num_row_groups > 0:
+                ranged_file.prefetch(
+                    column_chunk_ranges(parquet_file.metadata.row_group(0))
+                )
+                batch = next(
+                    parquet_file.iter_batches(batch_size=nrows, row_groups=[0]), None
+                )
+            if batch is None:
+                return parquet_file.schema_arrow.empty_table().to_pandas()
+            return batch.to_pandas()
+
     def _parse_file_content(
         self, content: bytes, file_format: str, options: Dict[str, Any]
     ) -> Optional[pd.DataFrame]:
@@ -696,16 +893,51 @@ class S3Source(Connector):
             raise
 
     def _read_parquet_chunks(
-        self, object_name: str, batch_size: int
+        self, object_name: str, batch_size: int, columns: Optional[List[str]] = None
     ) -> Iterator[DataChunk]:
-        """Read a Parquet file from S3 in chunks."""
-        s3_object = self._get_s3_object(object_name)
-        # The Parquet reader needs a seekable file-like object.
-        # The StreamingBody from S3 is not seekable, so we read it into a buffer.
-        with io.BytesIO(s3_object["Body"].read()) as buffer:
-            parquet_file = pq.ParquetFile(buffer)
-            for batch in parquet_file.iter_batches(batch_size=batch_size):
-                yield DataChunk(pa.Table.from_batches([batch]))
+        """Read a Parquet file from S3 in chunks.
+
+        Only the footer and the column chunks of the selected columns are
+        fetched, one row group at a time, with concurrent range requests.
+        """
+        with self._open_ranged_file(object_name) as ranged_file:
+            parquet_file = pq.ParquetFile(ranged_file)
+            for row_group in range(parquet_file.metadata.num_row_groups):
+                ranged_file.prefetch(
+                    column_chunk_ranges(
+                        parquet_file.metadata.row_group(row_group), columns
+                    )
+                )
+                for batch in parquet_file.iter_batches(
+                    batch_size=batch_size, row_groups=[row_group], columns=columns
+                ):
+                    yield DataChunk(pa.Table.from_batches([batch]))
+
+            logger.debug(
+                f"S3Source: Fetched {ranged_file.bytes_fetched} of "
+                f"{ranged_file.size} bytes from '{object_name}'"
+            )
+
+    def _open_ranged_file(self, object_name: str) -> S3RangedFile:
+        """Open a seekable, range-request backed view of an S3 object."""
+        try:
+            size = self.s3_client.head_object(Bucket=self.bucket, Key=object_name)[
+                "ContentLength"
+            ]
+        except ClientError as e:
+            if e.response["Error"]["Code"] in ("404", "NoSuchKey"):
+                raise FileNotFoundError(
+                    f"S3 object '{object_name}' not found in bucket '{self.bucket}'"
+                ) from e
+            raise
+        return S3RangedFile(
+            self.s3_client,
+            self.bucket,
+            object_name,
+            size=size,
+            block_size=self.read_block_size,
+            max_concurrency=self.max_read_concurrency,
+        )
 
     def _get_s3_object(self, object_name: str) -> Dict[str, Any]:
         """Get an S3 object with resilience."""
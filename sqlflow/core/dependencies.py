@@ -3,7 +3,7 @@
 import logging
 from typing import Dict, List, Optional, Set
 
-from sqlflow.core.errors import CircularDependencyError
+from sqlflow.core.graph import DependencyGraph
 
 logger = logging.getLogger(__name__)
 
@@ -14,10 +14,9 @@ class DependencyResolver:
     def __init__(self):
         """Initialize a DependencyResolver."""
         self.dependencies: Dict[str, List[str]] = {}
-        self.visited: Set[str] = set()
-        self.temp_visited: Set[str] = set()
         self.execution_order: List[str] = []
         self.last_resolved_order: Optional[List[str]] = None
+        self.graph = DependencyGraph()
         logger.debug("DependencyResolver initialized with empty state")
 
     def add_dependency(self, pipeline: str, depends_on: str) -> None:
@@ -32,8 +31,8 @@ class DependencyResolver:
         if pipeline not in self.dependencies:
             self.dependencies[pipeline] = []
         self.dependencies[pipeline].append(depends_on)
+        self.graph.add_edge(pipeline, depends_on)
         logger.debug("Added dependency: %s depends on %s", pipeline, depends_on)
-        logger.debug("Current dependencies: %s", self.dependencies)
 
     def extract_dependencies(self, pipeline_path: str) -> List[str]:
         """Extract dependencies from a pipeline file.
@@ -66,70 +65,77 @@ class DependencyResolver:
 
         """
         logger.debug("Resolving dependencies starting from %s", start_pipeline)
-        logger.debug("Current dependency graph: %s", self.dependencies)
+        return self.resolve_order([start_pipeline])
 
-        self.visited = set()
-        self.temp_visited = set()
-        self.execution_order = []
+    def resolve_order(self, start_pipelines: List[str]) -> List[str]:
+        """Resolve the dependencies of several pipelines in one pass.
 
-        self._visit(start_pipeline)
+        Equivalent to resolving each start pipeline in turn and keeping the
+        first occurrence of every pipeline, without revisiting shared
+        dependencies.
 
+        Args:
+        ----
+            start_pipelines: Starting pipelines, in priority order
+
+        Returns:
+        -------
+            List of pipelines in execution order
+
+        Raises:
+        ------
+            CircularDependencyError: If a circular dependency is detected
+
+        """
+        self.execution_order = self.graph.dependency_order(start_pipelines)
         self.last_resolved_order = self.execution_order.copy()
         logger.debug("Resolved execution order: %s", self.last_resolved_order)
         return self.execution_order
 
-    def validate(self, pipeline: str) -> None:
-        """Validate that a pipeline has no circular dependencies.
+    def find_cycles(self) -> List[List[str]]:
+        """Find one cycle per group of mutually dependent pipelines.
+
+        Returns
+        -------
+            Cycles as lists of pipelines, each depending on the next and the
+            last depending on the first
+
+        """
+        return self.graph.find_cycles()
+
+    def get_all_dependencies(self, pipeline: str) -> Set[str]:
+        """Get every pipeline a pipeline depends on, directly or transitively.
+
+        Closures are cached until the next dependency is added.
 
         Args:
         ----
-            pipeline: Pipeline to validate
+            pipeline: Pipeline to inspect
 
-        Raises:
-        ------
-            CircularDependencyError: If a circular dependency is detected
+        Returns:
+        -------
+            Set of pipelines depended on
 
         """
-        # This will raise CircularDependencyError if a cycle is detected
-        self.resolve_dependencies(pipeline)
+        return self.graph.transitive_dependencies(pipeline)
 
-    def _visit(self, pipeline: str) -> None:
-        """Visit a pipeline and its dependencies.
+    def validate(self, pipeline: str) -> None:
+        """Validate that a pipeline has no circular dependencies.
 
         Args:
         ----
-            pipeline: Pipeline to visit
+            pipeline: Pipeline to validate
 
         Raises:
         ------
             CircularDependencyError: If a circular dependency is detected
 
         """
-        logger.debug("Visiting %s", pipeline)
-        logger.debug("temp_visited=%s, visited=%s", self.temp_visited, self.visited)
-
-        if pipeline in self.temp_visited:
-            cycle = self._find_cycle(pipeline)
-            logger.debug("Cycle detected: %s", cycle)
-            raise CircularDependencyError(cycle)
-
-        if pipeline in self.visited:
-            logger.debug("Already visited %s, skipping", pipeline)
-            return
-
-        self.temp_visited.add(pipeline)
-
-        for dependency in self.dependencies.get(pipeline, []):
-            logger.debug("Processing dependency %s of %s", dependency, pipeline)
-            self._visit(dependency)
-
-        self.temp_visited.remove(pipeline)
-        self.visited.add(pipeline)
-        self.execution_order.append(pipeline)
-        logger.debug("Added %s to execution order: %s", pipeline, self.execution_order)
+        # This will raise CircularDependencyError if a cycle is detected
+        self.resolve_dependencies(pipeline)
 
     def _find_cycle(self, start: str) -> List[str]:
-        """Find a cycle in the dependency graph.
+        """Find the cycle through a pipeline in the dependency graph.
 
         Args:
         ----
@@ -137,22 +143,9 @@ class DependencyResolver:
 
         Returns:
         -------
-            List of pipelines forming a cycle
+            List of pipelines forming a cycle, starting and ending with
+            start, or just [start] if it is not on a cycle
 
         """
-        cycle = [start]
-        current = start
-
-        while True:
-            found_next = False
-            for dependency in self.dependencies.get(current, []):
-                if dependency in self.temp_visited:
-                    cycle.append(dependency)
-                    current = dependency
-                    found_next = True
-                    if dependency == start:
-                        return cycle
-                    break
-
-            if not found_next:
-                return cycle
+        cycle = self.graph.cycle_through(start)
+        return cycle + [start] if cycle else [start]
@@ -1,7 +1,10 @@
 """Main DuckDB engine implementation."""
 
+import copy
 import os
+import threading
 import time
+import uuid
 from typing import Any, Callable, Dict, List, Optional
 
 import duckdb
@@ -13,6 +16,12 @@ from sqlflow.logging import get_logger
 
 from .constants import DuckDBConstants, SQLTemplates
 from .exceptions import DuckDBConnectionError, UDFError, UDFRegistrationError
+from .export import (
+    build_copy_statement,
+    format_booleans_as_python,
+    get_partition_columns,
+)
+from .scan import build_scan_query
 from .transaction_manager import TransactionManager
 from .udf import AdvancedUDFQueryProcessor, UDFHandlerFactory
 
@@ -20,7 +29,11 @@ logger = get_logger(name=__name__)
 
 
 class ExecutionStats:
-    """Track execution statistics for the engine."""
+    """Track execution statistics for the engine.
+
+    Cursor engines used by worker threads share one instance, so updates
+    are made under a lock.
+    """
 
     def __init__(self):
         """Initialize execution statistics."""
@@ -29,6 +42,7 @@ class ExecutionStats:
         self.udf_errors = 0
         self.last_error = None
         self.query_times = []
+        self._lock = threading.Lock()
 
     def record_query(self, duration: float):
         """Record a query execution.
@@ -38,8 +52,9 @@ class ExecutionStats:
             duration: Query execution time in seconds
 
         """
-        self.query_count += 1
-        self.query_times.append(duration)
+        with self._lock:
+            self.query_count += 1
+            self.query_times.append(duration)
 
     def record_udf_execution(self, success: bool, error: Optional[Exception] = None):
         """Record a UDF execution.
@@ -50,10 +65,11 @@ class ExecutionStats:
             error: Optional error if the execution failed
 
         """
-        self.udf_executions += 1
-        if not success:
-            self.udf_errors += 1
-            self.last_error = error
+        with self._lock:
+            self.udf_executions += 1
+            if not success:
+                self.udf_errors += 1
+                self.last_error = error
 
     def get_avg_query_time(self) -> float:
         """Get the average query execution time.
@@ -63,9 +79,10 @@ class ExecutionStats:
             Average query execution time in seconds
 
         """
-        if not self.query_times:
-            return 0.0
-        return sum(self.query_times) / len(self.query_times)
+        with self._lock:
+            if not self.query_times:
+                return 0.0
+            return sum(self.query_times) / len(self.query_times)
 
     def get_summary(self) -> Dict[str, Any]:
         """Get a summary of execution statistics.
@@ -549,7 +566,8 @@ class DuckDBEngine(SQLEngine):
             raise DuckDBConnectionError("No database connection available")
 
         logger.debug("Registering table %s", name)
-        logger.debug(f"Registering table {name} with schema: {data.dtypes}")
+        schema = data.schema if isinstance(data, pa.Table) else data.dtypes
+        logger.debug(f"Registering table {name} with schema: {schema}")
 
         if manage_transaction:
             with self.transaction_manager:
@@ -591,7 +609,11 @@ class DuckDBEngine(SQLEngine):
 
         try:
             if hasattr(data, "columns"):
-                column_names = list(data.columns)
+                column_names = (
+                    data.column_names
+                    if isinstance(data, pa.Table)
+                    else list(data.columns)
+                )
                 if column_names:
                     # Create a select statement that explicitly names each column
                     columns_sql = ", ".join(
@@ -885,6 +907,24 @@ class DuckDBEngine(SQLEngine):
         """Clean up resources when the object is garbage collected."""
         self.close()
 
+    def create_cursor_engine(self) -> "DuckDBEngine":
+        """Create an engine bound to a new cursor on this database.
+
+        DuckDB connections must not be shared between threads; a cursor is
+        a separate connection to the same database, so tables, views and
+        registered UDFs stay visible. Stats, variables and UDF bookkeeping
+        are shared with this engine.
+
+        Returns
+        -------
+            DuckDBEngine using its own cursor. Closing it closes only the cursor.
+
+        """
+        cursor_engine = copy.copy(self)
+        cursor_engine._connection = self.connection.cursor()
+        cursor_engine.transaction_manager = TransactionManager(cursor_engine)
+        return cursor_engine
+
     # Additional methods for UDF execution and management
     def execute_udf_with_context(
         self, udf_name: str, udf_func: Callable, *args, **kwargs
@@ -1230,11 +1270,9 @@ class DuckDBEngine(SQLEngine):
     def register_arrow(
         self, table_name: str, arrow_table: pa.Table, manage_transaction: bool = True
     ) -> None:
-        """Register an Arrow table with the engine."""
+        """Register an Arrow table with the engine without converting to pandas."""
         logger.info(f"Registering Arrow table {table_name}")
-        # Convert to pandas if needed for now - this would be expanded in full implementation
-        df = arrow_table.to_pandas()
-        self.register_table(table_name, df, manage_transaction)
+        self.register_table(table_name, arrow_table, manage_transaction)
 
     def commit(self):
         """Commit any pending changes to the database."""
@@ -1753,6 +1791,11 @@ class DuckDBEngine(SQLEngine):
         logger.debug(f"Export data via {connector_type} to {destination}")
 
         try:
+            if hasattr(data, "fetch_record_batch") and self._is_csv_export(
+                connector_type, destination
+            ):
+                return self._stream_to_csv(data, destination, options)
+
             df = self._convert_data_to_dataframe(data)
 
             if df is None or df.empty:
@@ -1766,6 +1809,119 @@ class DuckDBEngine(SQLEngine):
             logger.error(f"Export failed: {e}")
             return {"status": "error", "error": str(e), "rows_exported": 0}
 
+    def can_copy_to_file(
+        self,
+        destination: str,
+        file_format: str,
+        options: Optional[Dict[str, Any]] = None,
+    ) -> bool:
+        """Check whether an export can be written natively with COPY ... TO.
+
+        Args:
+            destination: Destination path or URI
+            file_format: Export format
+            options: Export options
+
+        Returns:
+            True for local CSV/Parquet exports whose options all map to COPY
+        """
+        return (
+            build_copy_statement("SELECT 1", destination, file_format, options)
+            is not None
+        )
+
+    def native_scan_query(
+        self, connector_type: str, configuration: Dict[str, Any]
+    ) -> Optional[str]:
+        """Build a native read_csv/read_parquet scan for a local file source.
+
+        Args:
+            connector_type: Source connector type
+            configuration: Source parameters
+
+        Returns:
+            SELECT over the file scan with columns and filters pushed down,
+            or None if the source must be read through its connector
+        """
+        return build_scan_query(connector_type, configuration)
+
+    def copy_query_to_file(
+        self,
+        query: str,
+        destination: str,
+        file_format: str,
+        options: Optional[Dict[str, Any]] = None,
+    ) -> int:
+        """Export a query result to a local file with DuckDB's native COPY.
+
+        DuckDB writes the file itself, multi-threaded, so no rows pass
+        through Python. A single file is written next to the destination and
+        renamed over it once complete, so a failed export leaves the previous
+        file in place. CSV booleans are written as True/False, like the CSV
+        connector does.
+
+        Args:
+            query: SELECT query producing the exported rows
+            destination: Local file, or directory for partitioned exports
+            file_format: Export format, "csv" or "parquet"
+            options: Export options (compression, row_group_size, partition_by, ...)
+
+        Returns:
+            Number of rows exported
+
+        Raises:
+            ValueError: If the export cannot be expressed as a COPY statement
+        """
+        if not self.can_copy_to_file(destination, file_format, options):
+            raise ValueError(
+                f"Cannot export {file_format} to {destination} with native COPY"
+            )
+
+        parent_dir = os.path.dirname(destination)
+        if parent_dir:
+            os.makedirs(parent_dir, exist_ok=True)
+
+        if file_format.lower() == "csv":
+            query = format_booleans_as_python(query, self._boolean_columns(query))
+
+        if get_partition_columns(options):
+            # Partitioned exports write into a directory of files
+            statement = build_copy_statement(query, destination, file_format, options)
+            rows = self.execute_query(statement).fetchone()[0]
+        else:
+            rows = self._copy_to_staged_file(query, destination, file_format, options)
+        logger.info(f"Exported {rows} rows to {destination} with native COPY")
+        return rows
+
+    def _copy_to_staged_file(
+        self,
+        query: str,
+        destination: str,
+        file_format: str,
+        options: Optional[Dict[str, Any]],
+    ) -> int:
+        """COPY a query to a temporary file and move it over the destination."""
+        # Same directory, so the rename is atomic; same extension, so DuckDB
+        # picks the same compression for it
+        directory, name = os.path.split(destination)
+        staging_path = os.path.join(directory, f".{uuid.uuid4().hex[:8]}.{name}")
+        statement = build_copy_statement(query, staging_path, file_format, options)
+        try:
+            rows = self.execute_query(statement).fetchone()[0]
+            os.replace(staging_path, destination)
+        except BaseException:
+            if os.path.exists(staging_path):
+                os.remove(staging_path)
+            raise
+        return rows
+
+    def _boolean_columns(self, query: str) -> List[str]:
+        """Return the names of the BOOLEAN columns a query produces."""
+        description = self.connection.execute(
+            f"DESCRIBE {query.strip().rstrip(';')}"
+        ).fetchall()
+        return [row[0] for row in description if row[1] == "BOOLEAN"]
+
     def _convert_data_to_dataframe(self, data):
         """Convert various data types to pandas DataFrame."""
         import pandas as pd
@@ -1849,6 +2005,20 @@ class DuckDBEngine(SQLEngine):
         logger.info(f"Exported {len(df)} rows to {destination}")
         return {"status": "success", "rows_exported": len(df)}
 
+    def _stream_to_csv(
+        self, result, destination: str, options: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """Export a DuckDB query result to CSV one Arrow batch at a time."""
+        from sqlflow.connectors.csv.destination import CSVDestination
+        from sqlflow.core.executors.v2.steps.export import DEFAULT_EXPORT_BATCH_SIZE
+
+        reader = result.fetch_record_batch(DEFAULT_EXPORT_BATCH_SIZE)
+        rows = CSVDestination({"path": destination}).write_batches(
+            reader, reader.schema, options=options
+        )
+        logger.info(f"Exported {rows} rows to {destination}")
+        return {"status": "success", "rows_exported": rows}
+
     def _export_to_other_format(
         self, df, connector_type: str, destination: str, options: Dict[str, Any]
     ) -> Dict[str, Any]:
@@ -0,0 +1,224 @@
+"""Native COPY ... TO statements for DuckDB file exports.
+
+DuckDB writes CSV and Parquet itself, multi-threaded, without moving rows
+through Python. This module maps EXPORT OPTIONS onto COPY options and
+decides whether an export can be pushed down. Any option without a COPY
+equivalent keeps the export on the connector path so behaviour never
+silently changes.
+"""
+
+from typing import Any, Dict, List, Optional
+
+from sqlflow.logging import get_logger
+from sqlflow.utils.sql_security import SQLSafeFormatter, validate_identifier
+
+logger = get_logger(__name__)
+
+NATIVE_COPY_FORMATS = {"csv", "parquet"}
+
+CSV_COMPRESSION = {"none": "none", "gzip": "gzip", "zstd": "zstd"}
+PARQUET_COMPRESSION = {
+    "none": "uncompressed",
+    "uncompressed": "uncompressed",
+    "snappy": "snappy",
+    "gzip": "gzip",
+    "zstd": "zstd",
+    "lz4": "lz4",
+    "brotli": "brotli",
+}
+
+# EXPORT option name -> COPY option name, per format
+CSV_STRING_OPTIONS = {
+    "delimiter": "DELIMITER",
+    "sep": "DELIMITER",
+    "quote": "QUOTE",
+    "quotechar": "QUOTE",
+    "quote_char": "QUOTE",
+    "escape": "ESCAPE",
+    "escapechar": "ESCAPE",
+    "null": "NULLSTR",
+    "na_rep": "NULLSTR",
+    "date_format": "DATEFORMAT",
+    "dateformat": "DATEFORMAT",
+    "timestamp_format": "TIMESTAMPFORMAT",
+    "timestampformat": "TIMESTAMPFORMAT",
+}
+PARQUET_INTEGER_OPTIONS = {
+    "row_group_size": "ROW_GROUP_SIZE",
+    "compression_level": "COMPRESSION_LEVEL",
+}
+PARTITION_OPTIONS = ("partition_by", "partition_cols")
+# Options describing the export itself rather than the file layout
+IGNORED_OPTIONS = {"file_format", "format"}
+
+
+def is_local_path(path: str) -> bool:
+    """Return True if path refers to the local filesystem."""
+    return bool(path) and "://" not in path
+
+
+def build_copy_options(
+    file_format: str, options: Optional[Dict[str, Any]] = None
+) -> Optional[List[str]]:
+    """Map EXPORT OPTIONS to DuckDB COPY options.
+
+    Args:
+    ----
+        file_format: Export format, "csv" or "parquet"
+        options: EXPORT OPTIONS from the pipeline
+
+    Returns:
+    -------
+        List of COPY option clauses, or None if some option has no COPY
+        equivalent and the export must use the connector path
+
+    """
+    file_format = file_format.lower()
+    if file_format not in NATIVE_COPY_FORMATS:
+        return None
+
+    options = {name.lower(): value for name, value in (options or {}).items()}
+    copy_options = [f"FORMAT {file_format.upper()}"]
+    if file_format == "csv" and "header" not in options:
+        copy_options.append("HEADER true")
+
+    for name, value in options.items():
+        clause = _map_option(file_format, name, value)
+        if clause is None:
+            logger.debug(f"No COPY equivalent for export option {name}={value!r}")
+            return None
+        if clause:
+            copy_options.append(clause)
+
+    return copy_options
+
+
+def build_copy_statement(
+    query: str,
+    path: str,
+    file_format: str,
+    options: Optional[Dict[str, Any]] = None,
+) -> Optional[str]:
+    """Build a COPY (query) TO 'path' statement for a local export.
+
+    Args:
+    ----
+        query: SELECT query producing the exported rows
+        path: Local destination file, or directory for partitioned exports
+        file_format: Export format, "csv" or "parquet"
+        options: EXPORT OPTIONS from the pipeline
+
+    Returns:
+    -------
+        COPY statement, or None if the export cannot be pushed down
+
+    """
+    if not is_local_path(path):
+        return None
+
+    copy_options = build_copy_options(file_format, options)
+    if copy_options is None:
+        return None
+
+    return (
+        f"COPY ({query.strip().rstrip(';')}) TO {quote_literal(path)} "
+        f"({', '.join(copy_options)})"
+    )
+
+
+def format_booleans_as_python(query: str, boolean_columns: List[str]) -> str:
+    """Wrap a CSV export query so booleans are written as True and False.
+
+    COPY writes booleans as true/false, while the CSV connector writes them
+    the way pandas prints them. NULLs stay empty in both.
+
+    Args:
+    ----
+        query: SELECT query producing the exported rows
+        boolean_columns: Names of the BOOLEAN columns of the query
+
+    Returns:
+    -------
+        Query producing the same rows with booleans as text
+
+    """
+    if not boolean_columns:
+        return query
+
+    replacements = []
+    for column in boolean_columns:
+        quoted = '"' + column.replace('"', '""') + '"'
+        replacements.append(
+            f"CASE WHEN {quoted} THEN 'True' WHEN NOT {quoted} THEN 'False' END "
+            f"AS {quoted}"
+        )
+    return (
+        f"SELECT * REPLACE ({', '.join(replacements)}) "
+        f"FROM ({query.strip().rstrip(';')}) AS sqlflow_export"
+    )
+
+
+def get_partition_columns(options: Optional[Dict[str, Any]]) -> List[str]:
+    """Return the partition columns named in EXPORT OPTIONS."""
+    for name in PARTITION_OPTIONS:
+        value = (options or {}).get(name)
+        if value:
+            if isinstance(value, str):
+                value = value.split(",")
+            return [str(column).strip() for column in value]
+    return []
+
+
+def _map_option(file_format: str, name: str, value: Any) -> Optional[str]:
+    """Map a single EXPORT option to a COPY clause.
+
+    Returns "" for options that need no clause and None for options that
+    cannot be expressed with COPY.
+    """
+    if name in IGNORED_OPTIONS:
+        return ""
+    if name == "index":
+        return "" if not value else None
+    if name in PARTITION_OPTIONS:
+        return _partition_clause({name: value})
+    if name == "compression":
+        codecs = CSV_COMPRESSION if file_format == "csv" else PARQUET_COMPRESSION
+        codec = codecs.get(str(value or "none").lower())
+        return f"COMPRESSION {codec}" if codec else None
+
+    if file_format == "csv":
+        if name == "header" and isinstance(value, bool):
+            return f"HEADER {str(value).lower()}"
+        if name in CSV_STRING_OPTIONS and isinstance(value, str):
+            return f"{CSV_STRING_OPTIONS[name]} {quote_literal(value)}"
+    elif name in PARQUET_INTEGER_OPTIONS and _is_positive_int(value):
+        return f"{PARQUET_INTEGER_OPTIONS[name]} {int(value)}"
+
+    return None
+
+
+def _partition_clause(options: Dict[str, Any]) -> Optional[str]:
+    """Build the PARTITION_BY clause for hive-partitioned output."""
+    columns = get_partition_columns(options)
+    if not columns:
+        return ""
+
+    formatter = SQLSafeFormatter("duckdb")
+    try:
+        for column in columns:
+            validate_identifier(column)
+    except ValueError:
+        return None
+
+    quoted = ", ".join(formatter.quote_identifier(column) for column in columns)
+    return f"PARTITION_BY ({quoted}), OVERWRITE_OR_IGNORE true"
+
+
+def _is_positive_int(value: Any) -> bool:
+    """Check that value is a positive integer (bools excluded)."""
+    return isinstance(value, int) and not isinstance(value, bool) and value > 0
+
+
+def quote_literal(value: str) -> str:
+    """Quote a string as a SQL literal."""
+    return "'" + value.replace("'", "''") + "'"
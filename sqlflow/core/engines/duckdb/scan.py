@@ -0,0 +1,204 @@
+"""Native DuckDB scans for local CSV and Parquet sources.
+
+A LOAD from a local CSV or Parquet SOURCE does not need to parse the file
+in Python and re-register it: DuckDB's parallel `read_csv`/`read_parquet`
+scanners can feed `CREATE TABLE ... AS SELECT` directly. This module turns
+a source configuration into such a scan, pushing column selection and the
+Parquet `filters` into it. Configurations the scanners cannot express
+exactly, or sources with `"native_scan": false`, return None so the load
+keeps the connector path.
+"""
+
+import datetime
+import glob
+import math
+import os
+from typing import Any, Dict, List, Optional
+
+from sqlflow.logging import get_logger
+from sqlflow.utils.sql_security import SQLSafeFormatter
+
+from .export import is_local_path, quote_literal
+
+logger = get_logger(__name__)
+
+NATIVE_SCAN_TYPES = {"csv", "parquet"}
+
+# Filter operators understood by ParquetSource._build_filter_expression
+FILTER_OPERATORS = {
+    "==": "=",
+    "!=": "<>",
+    ">": ">",
+    ">=": ">=",
+    "<": "<",
+    "<=": "<=",
+}
+
+CSV_ENCODINGS = {"utf-8", "utf8"}
+
+# Keep read_csv to the types CSVSource infers, so dates and timestamps
+# stay strings exactly as they do on the connector path
+CSV_TYPE_CANDIDATES = "['BOOLEAN', 'BIGINT', 'DOUBLE', 'VARCHAR']"
+
+
+def build_scan_query(
+    connector_type: str, configuration: Dict[str, Any]
+) -> Optional[str]:
+    """Build a SELECT over a native DuckDB file scan for a source.
+
+    Args:
+    ----
+        connector_type: Source connector type
+        configuration: Source PARAMS
+
+    Returns:
+    -------
+        SELECT statement, or None if the source needs its connector
+
+    """
+    connector_type = (connector_type or "").lower()
+    if connector_type not in NATIVE_SCAN_TYPES:
+        return None
+    if not configuration.get("native_scan", True):
+        return None
+
+    files = resolve_local_files(configuration.get("path", ""))
+    if not files:
+        return None
+
+    if connector_type == "parquet":
+        return _build_parquet_scan(files, configuration)
+    return _build_csv_scan(files, configuration)
+
+
+def resolve_local_files(path: str) -> List[str]:
+    """Resolve a local path or glob pattern to the files that exist.
+
+    Mirrors the connectors: patterns are expanded and sorted, a plain path
+    must exist. Remote URIs resolve to no files.
+    """
+    if not is_local_path(path):
+        return []
+    if "*" in path or "?" in path:
+        return sorted(glob.glob(path))
+    return [path] if os.path.isfile(path) else []
+
+
+def build_filter_clause(filters: Optional[Dict[str, Any]]) -> Optional[str]:
+    """Translate ParquetSource filters into a SQL predicate.
+
+    Args:
+    ----
+        filters: {"column": value} or {"column": {">=": value, "in": [...]}}
+
+    Returns:
+    -------
+        Predicate joined with AND, "" when there are no filters, or None if a
+        filter cannot be expressed in SQL
+
+    """
+    formatter = SQLSafeFormatter("duckdb")
+    predicates = []
+
+    for column, condition in (filters or {}).items():
+        try:
+            field = formatter.quote_identifier(column)
+        except ValueError:
+            return None
+
+        conditions = condition if isinstance(condition, dict) else {"==": condition}
+        for op, value in conditions.items():
+            predicate = _build_predicate(field, op, value)
+            if predicate is None:
+                logger.debug(f"Cannot push filter {column} {op} {value!r} into scan")
+                return None
+            predicates.append(predicate)
+
+    return " AND ".join(predicates)
+
+
+def _build_parquet_scan(
+    files: List[str], configuration: Dict[str, Any]
+) -> Optional[str]:
+    """Build a read_parquet scan with column and filter pushdown."""
+    select_list = _build_select_list(configuration.get("columns"))
+    where_clause = build_filter_clause(configuration.get("filters"))
+    if select_list is None or where_clause is None:
+        return None
+
+    scan_options = ", union_by_name = true" if len(files) > 1 else ""
+    query = f"SELECT {select_list} FROM read_parquet({_file_list(files)}{scan_options})"
+    return f"{query} WHERE {where_clause}" if where_clause else query
+
+
+def _build_csv_scan(files: List[str], configuration: Dict[str, Any]) -> Optional[str]:
+    """Build a read_csv scan for the options CSVSource understands."""
+    # Headerless files get positional names from pandas that read_csv
+    # would not reproduce, and other encodings go through the connector.
+    if not configuration.get("has_header", True):
+        return None
+    if str(configuration.get("encoding", "utf-8")).lower() not in CSV_ENCODINGS:
+        return None
+
+    delimiter = configuration.get("delimiter", ",")
+    if not isinstance(delimiter, str) or not delimiter:
+        return None
+
+    return (
+        f"SELECT * FROM read_csv({_file_list(files)}, header = true, "
+        f"delim = {quote_literal(delimiter)}, "
+        f"auto_type_candidates = {CSV_TYPE_CANDIDATES})"
+    )
+
+
+def _build_select_list(columns: Optional[List[str]]) -> Optional[str]:
+    """Quote the configured columns, or select everything."""
+    if not columns:
+        return "*"
+
+    formatter = SQLSafeFormatter("duckdb")
+    try:
+        return ", ".join(formatter.quote_identifier(column) for column in columns)
+    except ValueError:
+        return None
+
+
+def _build_predicate(field: str, op: str, value: Any) -> Optional[str]:
+    """Build a single comparison predicate."""
+    if op == "in":
+        if not isinstance(value, (list, tuple, set)) or not value:
+            return None
+        literals = [_sql_literal(item) for item in value]
+        if None in literals:
+            return None
+        return f"{field} IN ({', '.join(literals)})"
+
+    if op not in FILTER_OPERATORS:
+        return None
+
+    literal = _sql_literal(value)
+    if literal is None:
+        return None
+    return f"{field} {FILTER_OPERATORS[op]} {literal}"
+
+
+def _sql_literal(value: Any) -> Optional[str]:
+    """Render a Python value as a SQL literal, or None if unsupported."""
+    if value is None:
+        return "NULL"
+    if isinstance(value, bool):
+        return "TRUE" if value else "FALSE"
+    if isinstance(value, int) or (isinstance(value, float) and math.isfinite(value)):
+        return repr(value)
+    if isinstance(value, str):
+        return quote_literal(value)
+    if isinstance(value, datetime.datetime):
+        return f"TIMESTAMP {quote_literal(value.isoformat(sep=' '))}"
+    if isinstance(value, datetime.date):
+        return f"DATE {quote_literal(value.isoformat())}"
+    return None
+
+
+def _file_list(files: List[str]) -> str:
+    """Render a list of file paths as a DuckDB list literal."""
+    return "[" + ", ".join(quote_literal(path) for path in files) + "]"
@@ -7,6 +7,8 @@ cycle detection, and execution order optimization for table UDFs.
 import re
 from typing import Any, Callable, Dict, List, Set
 
+from sqlflow.core.graph import DependencyGraph
+from sqlflow.core.sql_references import extract_table_references
 from sqlflow.logging import get_logger
 
 logger = get_logger(__name__)
@@ -39,11 +41,10 @@ class TableUDFDependencyResolver:
     def extract_table_dependencies(self, sql_query: str) -> List[str]:
         """Extract table dependencies from UDF SQL patterns.
 
-        Phase 2 enhancement with sophisticated pattern recognition for:
-        - Standard table references in FROM clauses
-        - Subquery table dependencies
-        - UDF parameter table references
-        - CTEs and temporary table dependencies
+        Uses the shared SQL reference extractor, which covers:
+        - Table references in FROM and JOIN clauses
+        - Subquery table dependencies, with CTE names scoped out
+        - Tables passed as the first argument of registered table UDFs
 
         Args:
         ----
@@ -54,35 +55,13 @@ class TableUDFDependencyResolver:
             List of table names that the query depends on
 
         """
-        dependencies = []
-
-        # Pattern 1: Standard FROM clause dependencies
-        from_dependencies = self._extract_from_clause_tables(sql_query)
-        dependencies.extend(from_dependencies)
-
-        # Pattern 2: JOIN clause dependencies
-        join_dependencies = self._extract_join_clause_tables(sql_query)
-        dependencies.extend(join_dependencies)
-
-        # Pattern 3: UDF parameter dependencies
-        udf_dependencies = self._extract_udf_parameter_tables(sql_query)
-        dependencies.extend(udf_dependencies)
-
-        # Pattern 4: Subquery dependencies
-        subquery_dependencies = self._extract_subquery_tables(sql_query)
-        dependencies.extend(subquery_dependencies)
-
-        # Pattern 5: CTE dependencies
-        cte_dependencies = self._extract_cte_tables(sql_query)
-        dependencies.extend(cte_dependencies)
-
-        # Remove duplicates and built-in functions
-        unique_dependencies = self._filter_and_deduplicate(dependencies)
+        table_functions = [udf_name.split(".")[-1] for udf_name in self.udfs]
+        dependencies = extract_table_references(sql_query, table_functions)
 
         logger.debug(
-            f"Extracted {len(unique_dependencies)} table dependencies: {unique_dependencies}"
+            f"Extracted {len(dependencies)} table dependencies: {dependencies}"
         )
-        return unique_dependencies
+        return dependencies
 
     def validate_dependency_graph(self, dependencies: Dict[str, List[str]]) -> bool:
         """Validate UDF dependency graph for cycles and consistency.
@@ -152,188 +131,11 @@ class TableUDFDependencyResolver:
         logger.info(f"Resolved execution order: {execution_order}")
         return execution_order
 
-    def _extract_from_clause_tables(self, sql_query: str) -> List[str]:
-        """Extract table names from FROM clauses.
-
-        Args:
-        ----
-            sql_query: SQL query to analyze
-
-        Returns:
-        -------
-            List of table names from FROM clauses
-
-        """
-        tables = []
-
-        # Pattern: FROM table_name
-        # Also handles: FROM schema.table_name
-        from_pattern = r"\bFROM\s+([a-zA-Z_][a-zA-Z0-9_]*(?:\.[a-zA-Z_][a-zA-Z0-9_]*)?)"
-
-        for match in re.finditer(from_pattern, sql_query, re.IGNORECASE):
-            table_name = match.group(1)
-            if table_name and table_name not in tables:
-                tables.append(table_name)
-
-        return tables
-
-    def _extract_join_clause_tables(self, sql_query: str) -> List[str]:
-        """Extract table names from JOIN clauses.
-
-        Args:
-        ----
-            sql_query: SQL query to analyze
-
-        Returns:
-        -------
-            List of table names from JOIN clauses
-
-        """
-        tables = []
-
-        # Pattern: JOIN table_name
-        # Handles: INNER JOIN, LEFT JOIN, RIGHT JOIN, FULL OUTER JOIN, etc.
-        join_pattern = r"\b(?:INNER\s+|LEFT\s+|RIGHT\s+|FULL\s+OUTER\s+|CROSS\s+)?JOIN\s+([a-zA-Z_][a-zA-Z0-9_]*(?:\.[a-zA-Z_][a-zA-Z0-9_]*)?)"
-
-        for match in re.finditer(join_pattern, sql_query, re.IGNORECASE):
-            table_name = match.group(1)
-            if table_name and table_name not in tables:
-                tables.append(table_name)
-
-        return tables
-
-    def _extract_udf_parameter_tables(self, sql_query: str) -> List[str]:
-        """Extract table names from UDF parameters.
-
-        Args:
-        ----
-            sql_query: SQL query to analyze
-
-        Returns:
-        -------
-            List of table names referenced in UDF parameters
-
-        """
-        tables = []
-
-        # Pattern 1: PYTHON_FUNC("module.function", table_name)
-        python_func_pattern = (
-            r"PYTHON_FUNC\s*\(\s*['\"][^'\"]+['\"]\s*,\s*([a-zA-Z_][a-zA-Z0-9_]*)"
-        )
-
-        for match in re.finditer(python_func_pattern, sql_query, re.IGNORECASE):
-            table_name = match.group(1)
-            if table_name and table_name not in tables:
-                tables.append(table_name)
-
-        # Pattern 2: Direct UDF calls with table parameters
-        # udf_function(table_name, other_params)
-        for udf_name in self.udfs:
-            flat_name = udf_name.split(".")[-1]
-            udf_call_pattern = (
-                rf"\b{re.escape(flat_name)}\s*\(\s*([a-zA-Z_][a-zA-Z0-9_]*)"
-            )
-
-            for match in re.finditer(udf_call_pattern, sql_query, re.IGNORECASE):
-                table_name = match.group(1)
-                if table_name and table_name not in tables:
-                    tables.append(table_name)
-
-        return tables
-
-    def _extract_subquery_tables(self, sql_query: str) -> List[str]:
-        """Extract table names from subqueries.
-
-        Args:
-        ----
-            sql_query: SQL query to analyze
-
-        Returns:
-        -------
-            List of table names from subqueries
-
-        """
-        tables = []
-
-        # Find subqueries (simplified pattern)
-        subquery_pattern = r"\(\s*(SELECT.*?)\)"
-
-        for match in re.finditer(
-            subquery_pattern, sql_query, re.IGNORECASE | re.DOTALL
-        ):
-            subquery = match.group(1)
-            # Recursively extract dependencies from subquery
-            subquery_deps = self.extract_table_dependencies(subquery)
-            tables.extend(subquery_deps)
-
-        return tables
-
-    def _extract_cte_tables(self, sql_query: str) -> List[str]:
-        """Extract table names from Common Table Expressions (CTEs).
-
-        Args:
-        ----
-            sql_query: SQL query to analyze
-
-        Returns:
-        -------
-            List of table names from CTEs
-
-        """
-        tables = []
-
-        # Pattern: WITH cte_name AS (SELECT ... FROM table_name ...)
-        cte_pattern = r"\bWITH\s+[a-zA-Z_][a-zA-Z0-9_]*\s+AS\s*\(\s*(SELECT.*?)\)"
-
-        for match in re.finditer(cte_pattern, sql_query, re.IGNORECASE | re.DOTALL):
-            cte_query = match.group(1)
-            # Recursively extract dependencies from CTE query
-            cte_deps = self.extract_table_dependencies(cte_query)
-            tables.extend(cte_deps)
-
-        return tables
-
-    def _filter_and_deduplicate(self, dependencies: List[str]) -> List[str]:
-        """Filter out built-in functions and deduplicate dependencies.
-
-        Args:
-        ----
-            dependencies: Raw list of dependencies
-
-        Returns:
-        -------
-            Filtered and deduplicated list
-
-        """
-        # DuckDB built-in functions that are not table references
-        builtin_functions = {
-            "read_csv_auto",
-            "read_csv",
-            "read_parquet",
-            "read_json",
-            "information_schema",
-            "pg_catalog",
-            "main",
-            "memory",
-            "temp",
-            "temporary",
-            "pg_temp",
-            "sqlite_temp_master",
-        }
-
-        # Filter and deduplicate
-        filtered = []
-        seen = set()
-
-        for dep in dependencies:
-            if dep and dep.lower() not in builtin_functions and dep not in seen:
-                filtered.append(dep)
-                seen.add(dep)
-
-        return filtered
-
     def _has_cycles(self, dependencies: Dict[str, List[str]]) -> bool:
-        """Check for cycles in dependency graph using DFS.
+        """Check for cycles in dependency graph.
+
+        Only dependencies on nodes of the graph are considered; references
+        to external tables cannot close a cycle.
 
         Args:
         ----
@@ -344,31 +146,8 @@ class TableUDFDependencyResolver:
             True if cycles are detected
 
         """
-        # Colors: 0=white (unvisited), 1=gray (visiting), 2=black (visited)
-        colors = {node: 0 for node in dependencies}
-
-        def dfs(node: str) -> bool:
-            if colors[node] == 1:  # Gray - back edge found (cycle)
-                return True
-            if colors[node] == 2:  # Black - already processed
-                return False
-
-            colors[node] = 1  # Mark as gray (visiting)
-
-            # Visit all dependencies
-            for dep in dependencies.get(node, []):
-                if dep in dependencies and dfs(dep):
-                    return True
-
-            colors[node] = 2  # Mark as black (visited)
-            return False
-
-        # Check all nodes
-        for node in dependencies:
-            if colors[node] == 0 and dfs(node):
-                return True
-
-        return False
+        graph = DependencyGraph.from_mapping(dependencies, known_only=True)
+        return graph.has_cycles()
 
     def _log_cycle_details(self, dependencies: Dict[str, List[str]]) -> None:
         """Log detailed information about detected cycles.
@@ -0,0 +1,235 @@
+"""Process-pool execution for CPU-bound table UDFs.
+
+Pure-Python table UDFs hold the GIL, so running them in the main
+interpreter uses a single core. Table UDFs that opt in with
+``@python_table_udf(processes=N)`` are instead run over row ranges of
+their input in N worker processes:
+
+1. The input Arrow table is written once as an Arrow IPC file.
+2. Each worker memory-maps that file and slices its row range (zero-copy).
+3. Each worker writes its result as its own IPC file.
+4. The parent reads the parts back in order as one Arrow table.
+
+Row ranges are independent, so this mode is only correct for UDFs whose
+output rows depend on their own input rows alone.
+
+Workers are started with "spawn": forking a process that holds DuckDB
+connections and threads can deadlock the child. A spawned worker finds
+the UDF by loading its module file, so UDFs from project files that are
+not importable by name work too, as long as they are defined at module
+level.
+"""
+
+import importlib
+import importlib.util
+import inspect
+import multiprocessing
+import os
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from typing import Callable, Dict, List, Optional, Tuple
+
+import pandas as pd
+import pyarrow as pa
+
+from sqlflow.logging import get_logger
+
+logger = get_logger(__name__)
+
+# (module name, module file, qualified name) of a module-level UDF
+UDFLocation = Tuple[str, str, str]
+
+# UDFs already loaded by this worker process, by location
+_LOADED_UDFS: Dict[UDFLocation, Callable] = {}
+
+
+def get_udf_processes(udf_function: Callable) -> int:
+    """Return the number of worker processes a table UDF opted into.
+
+    Args:
+    ----
+        udf_function: Table UDF, as decorated by python_table_udf
+
+    Returns:
+    -------
+        Number of processes, or 0 when the UDF runs in-process
+
+    """
+    processes = getattr(udf_function, "_processes", None) or 0
+    return processes if processes > 1 else 0
+
+
+def split_row_ranges(num_rows: int, partitions: int) -> List[Tuple[int, int]]:
+    """Split num_rows into at most `partitions` contiguous (offset, length) ranges.
+
+    Args:
+    ----
+        num_rows: Number of rows to split
+        partitions: Desired number of ranges
+
+    Returns:
+    -------
+        List of (offset, length) tuples covering every row exactly once
+
+    """
+    partitions = max(1, min(partitions, num_rows))
+    base, extra = divmod(num_rows, partitions)
+    ranges = []
+    offset = 0
+    for index in range(partitions):
+        length = base + (1 if index < extra else 0)
+        ranges.append((offset, length))
+        offset += length
+    return ranges
+
+
+def run_table_udf_in_processes(
+    udf_function: Callable, table: pa.Table, processes: int
+) -> pa.Table:
+    """Run a table UDF over row ranges of `table` in worker processes.
+
+    Args:
+    ----
+        udf_function: Table UDF taking and returning a pandas DataFrame
+        table: Input data
+        processes: Number of worker processes
+
+    Returns:
+    -------
+        Arrow table with the partition results concatenated in input order
+
+    """
+    ranges = split_row_ranges(table.num_rows, processes)
+    location = locate_udf(udf_function)
+    if location is None:
+        logger.warning(
+            f"Table UDF {getattr(udf_function, '__name__', udf_function)} is not "
+            "defined at module level, running it in-process"
+        )
+    if len(ranges) < 2 or location is None:
+        return _to_arrow(udf_function(table.to_pandas()))
+
+    with tempfile.TemporaryDirectory(prefix="sqlflow_udf_") as work_dir:
+        input_path = os.path.join(work_dir, "input.arrow")
+        with pa.OSFile(input_path, "wb") as sink:
+            with pa.ipc.new_file(sink, table.schema) as writer:
+                writer.write_table(table)
+
+        tasks = [
+            (
+                location,
+                input_path,
+                offset,
+                length,
+                os.path.join(work_dir, f"part-{index}.arrow"),
+            )
+            for index, (offset, length) in enumerate(ranges)
+        ]
+        with ProcessPoolExecutor(
+            max_workers=len(ranges), mp_context=multiprocessing.get_context("spawn")
+        ) as pool:
+            part_paths = list(pool.map(_run_partition, *zip(*tasks)))
+
+        parts = [_read_ipc_file(path) for path in part_paths]
+
+    logger.debug(
+        f"Table UDF ran on {table.num_rows} rows across {len(ranges)} processes"
+    )
+    return _concat_parts(parts)
+
+
+def locate_udf(udf_function: Callable) -> Optional[UDFLocation]:
+    """Find where a worker process can load a UDF from.
+
+    Args:
+    ----
+        udf_function: Table UDF, possibly wrapped by python_table_udf
+
+    Returns:
+    -------
+        (module name, module file, qualified name), or None if the UDF is
+        not reachable from its module, e.g. because it is defined inside a
+        function
+
+    """
+    qualname = getattr(udf_function, "__qualname__", "")
+    module_name = getattr(udf_function, "__module__", None)
+    if not module_name or not qualname or "<locals>" in qualname:
+        return None
+    try:
+        module_file = inspect.getsourcefile(inspect.unwrap(udf_function))
+    except TypeError:
+        return None
+    if not module_file:
+        return None
+    return module_name, module_file, qualname
+
+
+def _load_udf(location: UDFLocation) -> Callable:
+    """Load a UDF in a worker, importing its module by name or from its file."""
+    if location in _LOADED_UDFS:
+        return _LOADED_UDFS[location]
+
+    module_name, module_file, qualname = location
+    try:
+        module = importlib.import_module(module_name)
+    except ImportError:
+        module = None
+    if module is None or not _is_module_file(module, module_file):
+        # Project UDF files are loaded from their path, not importable by name
+        spec = importlib.util.spec_from_file_location(module_name, module_file)
+        if spec is None or spec.loader is None:
+            raise ImportError(f"Cannot load UDF module from {module_file}")
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+
+    udf_function = module
+    for name in qualname.split("."):
+        udf_function = getattr(udf_function, name)
+    _LOADED_UDFS[location] = udf_function
+    return udf_function
+
+
+def _is_module_file(module: object, module_file: str) -> bool:
+    """Check whether an imported module was loaded from module_file."""
+    path = getattr(module, "__file__", None)
+    try:
+        return bool(path) and os.path.samefile(path, module_file)
+    except OSError:
+        return False
+
+
+def _run_partition(
+    location: UDFLocation,
+    input_path: str,
+    offset: int,
+    length: int,
+    output_path: str,
+) -> str:
+    """Worker entry point: run the UDF on one row range and write the result."""
+    udf_function = _load_udf(location)
+    with pa.memory_map(input_path, "r") as source:
+        partition = pa.ipc.open_file(source).read_all().slice(offset, length)
+        result = _to_arrow(udf_function(partition.to_pandas()))
+
+    with pa.OSFile(output_path, "wb") as sink:
+        with pa.ipc.new_file(sink, result.schema) as writer:
+            writer.write_table(result)
+    return output_path
+
+
+def _read_ipc_file(path: str) -> pa.Table:
+    """Read an Arrow IPC file fully into memory."""
+    with pa.OSFile(path, "rb") as source:
+        return pa.ipc.open_file(source).read_all()
+
+
+def _concat_parts(parts: List[pa.Table]) -> pa.Table:
+    """Concatenate partition results, unifying all-null columns across parts."""
+    schema = pa.unify_schemas([part.schema for part in parts])
+    return pa.concat_tables([part.select(schema.names).cast(schema) for part in parts])
+
+
+def _to_arrow(result: pd.DataFrame) -> pa.Table:
+    """Convert a UDF result DataFrame to Arrow without its index."""
+    return pa.Table.from_pandas(result, preserve_index=False)
@@ -6,6 +6,7 @@ from typing import TYPE_CHECKING, Callable, Dict, List, NamedTuple
 from sqlflow.logging import get_logger
 
 from ..constants import RegexPatterns
+from .parallel import get_udf_processes, run_table_udf_in_processes
 
 if TYPE_CHECKING:
     from ..engine import DuckDBEngine
@@ -809,6 +810,9 @@ class AdvancedUDFQueryProcessor:
         2. Process with pandas using the table UDF
         3. Register result back to DuckDB
 
+        UDFs declared with ``processes=N`` fetch the source as Arrow and run
+        across N worker processes instead (see udf.parallel).
+
         Args:
         ----
             udf_name: Name of the UDF function
@@ -832,6 +836,22 @@ class AdvancedUDFQueryProcessor:
             # Step 1: Fetch data from DuckDB
             fetch_query = f"SELECT * FROM {source_table}"
             result = self.engine.execute_query(fetch_query)
+
+            processes = get_udf_processes(udf_function)
+            if processes:
+                source_arrow = result.fetch_record_batch().read_all()
+                processed_arrow = run_table_udf_in_processes(
+                    udf_function, source_arrow, processes
+                )
+                self.engine.register_arrow(
+                    result_table_name, processed_arrow, manage_transaction=False
+                )
+                logger.debug(
+                    f"Table UDF produced {processed_arrow.num_rows} rows "
+                    f"using {processes} processes"
+                )
+                return result_table_name
+
             source_df = result.fetchdf()
 
             logger.debug(f"Fetched {len(source_df)} rows from {source_table}")
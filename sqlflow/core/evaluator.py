@@ -5,6 +5,7 @@ This module provides a class to evaluate conditional expressions with variable s
 
 import ast
 import re
+from functools import lru_cache
 from typing import Any, Dict
 
 from sqlflow.core.variables import substitute_variables
@@ -12,6 +13,58 @@ from sqlflow.logging import get_logger
 
 logger = get_logger(__name__)
 
+# '=' that is not part of '==', '!=', '>=' or '<='
+_ASSIGNMENT_PATTERN = re.compile(r"(?<![=!<>])=(?![=])")
+_TRUE_PATTERN = re.compile(r"(?i)\btrue\b")
+_FALSE_PATTERN = re.compile(r"(?i)\bfalse\b")
+
+# Unsubstituted ${var} references, evaluated as None
+_UNRESOLVED_VARIABLE_PATTERN = re.compile(r"\$\{[^}]+\}")
+# Unquoted identifiers with hyphens, like us-east-1
+_HYPHENATED_IDENTIFIER_PATTERN = re.compile(
+    r"(?<!')(?<!\")\b([a-zA-Z][a-zA-Z0-9]*(-[a-zA-Z0-9]+)+)\b(?!')(?!\")"
+)
+# Unquoted words before a comparison operator
+_WORD_BEFORE_COMPARISON_PATTERN = re.compile(
+    r"(?<!')(?<!\")\b([a-zA-Z][a-zA-Z0-9_]*)\b(?!')(?!\") *(?===|!=|<|>)"
+)
+_PYTHON_KEYWORDS = {"True", "False", "None", "and", "or", "not", "in", "is"}
+
+
+@lru_cache(maxsize=1024)
+def _format_for_ast(condition: str) -> str:
+    """Quote bare identifiers of a substituted condition; see ConditionEvaluator."""
+    # Handle any remaining unsubstituted variables (missing variables) - convert to None
+    condition = _UNRESOLVED_VARIABLE_PATTERN.sub("None", condition)
+
+    # Find unquoted identifiers and quote them if they look like string values
+    # This handles cases like: global == 'us-east' -> 'global' == 'us-east'
+
+    # First, handle identifiers with hyphens (like us-east-1)
+    def quote_identifier(match):
+        identifier = match.group(1)
+        return f"'{identifier}'"
+
+    condition = _HYPHENATED_IDENTIFIER_PATTERN.sub(quote_identifier, condition)
+
+    # Then, handle simple word identifiers that appear before comparison operators
+    # Look for patterns like: word == 'value' or word != 'value'
+    def quote_word_before_comparison(match):
+        word = match.group(1)
+        # Don't quote Python keywords or boolean values that should remain as identifiers
+        # Note: 'global' is intentionally excluded here because in our context it should be quoted as a string
+        if word in _PYTHON_KEYWORDS:
+            return match.group(0)  # Return unchanged
+        return f"'{word}'" + match.group(0)[len(word) :]
+
+    return _WORD_BEFORE_COMPARISON_PATTERN.sub(quote_word_before_comparison, condition)
+
+
+@lru_cache(maxsize=1024)
+def _parse_expression(expr: str) -> ast.expr:
+    """Parse an expression once; conditions repeat across plans and branches."""
+    return ast.parse(expr, mode="eval").body
+
 
 class EvaluationError(Exception):
     """Exception raised for evaluation errors."""
@@ -80,7 +133,7 @@ class ConditionEvaluator:
         logger.debug(f"After substitution: '{substituted_condition}'")
 
         # Detect accidental use of '=' instead of '==' (not part of '==', '!=', '>=', '<=')
-        if re.search(r"(?<![=!<>])=(?![=])", substituted_condition):
+        if _ASSIGNMENT_PATTERN.search(substituted_condition):
             raise EvaluationError(
                 f"Syntax error in condition: '{condition}'.\n"
                 "Hint: Use '==' for equality, not '='. "
@@ -89,8 +142,8 @@ class ConditionEvaluator:
 
         # Handle case-insensitive true/false by replacing them with True/False
         # This allows for consistent handling of boolean literals regardless of case
-        substituted_condition = re.sub(r"(?i)\btrue\b", "True", substituted_condition)
-        substituted_condition = re.sub(r"(?i)\bfalse\b", "False", substituted_condition)
+        substituted_condition = _TRUE_PATTERN.sub("True", substituted_condition)
+        substituted_condition = _FALSE_PATTERN.sub("False", substituted_condition)
 
         logger.debug(f"After true/false replacement: '{substituted_condition}'")
 
@@ -258,49 +311,7 @@ class ConditionEvaluator:
         -------
             Condition formatted for Python AST evaluation
         """
-        # Handle any remaining unsubstituted variables (missing variables) - convert to None
-        # Simple pattern matching for ${var} style variables
-        import re
-
-        variable_pattern = r"\$\{[^}]+\}"
-        condition = re.sub(variable_pattern, "None", condition)
-
-        # Find unquoted identifiers and quote them if they look like string values
-        # This handles cases like: global == 'us-east' -> 'global' == 'us-east'
-
-        # Pattern to find unquoted identifiers that could be string values
-        # Look for word characters (possibly with hyphens) that aren't already quoted
-        # and appear in comparison contexts
-
-        # First, handle identifiers with hyphens (like us-east-1)
-        pattern_hyphen = (
-            r"(?<!')(?<!\")\b([a-zA-Z][a-zA-Z0-9]*(-[a-zA-Z0-9]+)+)\b(?!')(?!\")"
-        )
-
-        def quote_identifier(match):
-            identifier = match.group(1)
-            return f"'{identifier}'"
-
-        condition = re.sub(pattern_hyphen, quote_identifier, condition)
-
-        # Then, handle simple word identifiers that appear before comparison operators
-        # Look for patterns like: word == 'value' or word != 'value'
-        pattern_word = (
-            r"(?<!')(?<!\")\b([a-zA-Z][a-zA-Z0-9_]*)\b(?!')(?!\") *(?===|!=|<|>)"
-        )
-
-        def quote_word_before_comparison(match):
-            word = match.group(1)
-            # Don't quote Python keywords or boolean values that should remain as identifiers
-            # Note: 'global' is intentionally excluded here because in our context it should be quoted as a string
-            python_keywords = {"True", "False", "None", "and", "or", "not", "in", "is"}
-            if word in python_keywords:
-                return match.group(0)  # Return unchanged
-            return f"'{word}'" + match.group(0)[len(word) :]
-
-        condition = re.sub(pattern_word, quote_word_before_comparison, condition)
-
-        return condition
+        return _format_for_ast(condition)
 
     def _safe_eval(self, expr: str) -> bool:
         """Safely evaluate an expression to a boolean result.
@@ -320,7 +331,7 @@ class ConditionEvaluator:
         """
         try:
             # Parse the expression into an AST
-            tree = ast.parse(expr, mode="eval").body
+            tree = _parse_expression(expr)
 
             # Evaluate the AST
             result = self._eval_node(tree)
@@ -0,0 +1,378 @@
+"""Backfill runner executing one pipeline for many values of a variable.
+
+A backfill runs the same pipeline once per partition, e.g. once per
+run_date over a year. Running each partition as a separate pipeline run
+re-parses the file, re-plans it, re-discovers UDFs and opens a new engine
+every time. The runner instead plans the pipeline once and renders the plan
+for each value through a compiled variable template, discovers UDFs once,
+and executes partitions concurrently, each on its own DuckDB engine so that
+partitions never see each other's tables. Engines are in-memory, unless the
+profile uses a persistent database: each partition then writes to its own
+database file next to it, named after the partition, since several processes
+cannot write to one DuckDB file at the same time.
+
+The plan is only shared when no IF/ELSEIF condition depends on the backfill
+variable, directly or through SET variables. Otherwise the set of steps can
+change from one value to the next and each partition is planned on its own.
+"""
+
+import datetime
+import hashlib
+import json
+import logging
+import os
+import re
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
+
+from sqlflow.core.engines.duckdb.engine import DuckDBEngine
+from sqlflow.core.executors.v2.execution.context import create_execution_context
+from sqlflow.core.executors.v2.orchestration.coordinator import ExecutionCoordinator
+from sqlflow.core.executors.v2.results.models import ExecutionResult
+from sqlflow.core.executors.v2.steps.registry import create_default_registry
+from sqlflow.core.planner_main import Planner
+from sqlflow.core.variables import VariableTemplate, compile_template
+from sqlflow.parser.ast import (
+    ConditionalBlockStep,
+    ConditionalBranchStep,
+    Pipeline,
+    PipelineStep,
+    SetStep,
+)
+from sqlflow.udfs.enhanced_manager import enhance_udf_manager
+from sqlflow.udfs.manager import PythonUDFManager
+
+logger = logging.getLogger(__name__)
+
+# Called with each partition result as soon as the partition finishes
+PartitionCallback = Callable[["BackfillPartitionResult"], None]
+
+
+@dataclass(frozen=True)
+class BackfillPartitionResult:
+    """Outcome of running the pipeline for one backfill value."""
+
+    value: str
+    success: bool
+    duration: float
+    error_message: Optional[str] = None
+    result: Optional[ExecutionResult] = None
+
+
+def expand_backfill_values(spec: str) -> Tuple[str, List[str]]:
+    """Expand a backfill specification into a variable name and its values.
+
+    Supported forms are inclusive date ranges (run_date=2024-01-01..2024-01-31,
+    one value per day), inclusive integer ranges (batch=1..10) and explicit
+    lists (region=eu,us,apac).
+
+    Args:
+        spec: Specification in name=start..end or name=value,value form
+
+    Returns:
+        Tuple of (variable_name, values)
+
+    Raises:
+        ValueError: If the specification cannot be parsed or the range is empty
+    """
+    name, separator, values_spec = spec.partition("=")
+    name = name.strip()
+    if not separator or not name or not values_spec.strip():
+        raise ValueError(f"Expected name=start..end or name=a,b,c, got '{spec}'")
+
+    if ".." not in values_spec:
+        values = [value.strip() for value in values_spec.split(",") if value.strip()]
+        return name, values
+
+    start, _, end = (part.strip() for part in values_spec.partition(".."))
+    try:
+        first_day = datetime.date.fromisoformat(start)
+        last_day = datetime.date.fromisoformat(end)
+    except ValueError:
+        first_day = last_day = None
+
+    if first_day is not None:
+        days = (last_day - first_day).days
+        values = [str(first_day + datetime.timedelta(days=i)) for i in range(days + 1)]
+    elif start.lstrip("-").isdigit() and end.lstrip("-").isdigit():
+        values = [str(i) for i in range(int(start), int(end) + 1)]
+    else:
+        raise ValueError(
+            f"Range '{values_spec}' must be between two ISO dates or two integers"
+        )
+
+    if not values:
+        raise ValueError(f"Range '{values_spec}' is empty: start is after end")
+    return name, values
+
+
+def partition_database_path(database_path: str, variable: str, value: str) -> str:
+    """Return the database file of one partition of a persistent database.
+
+    Partitions of target/prod.duckdb for run_date are stored as
+    target/prod_backfill/run_date=2024-01-01.duckdb. Characters that are not
+    safe in file names are replaced, with a hash of the value appended so that
+    different values never share a file.
+
+    Args:
+        database_path: Path of the profile's persistent database
+        variable: Name of the backfill variable
+        value: Value of the backfill variable
+
+    Returns:
+        Path of the partition's database file
+    """
+    root, extension = os.path.splitext(database_path)
+    safe_value = re.sub(r"[^\w.-]", "_", str(value))
+    if safe_value != str(value):
+        digest = hashlib.sha1(str(value).encode("utf-8")).hexdigest()[:8]
+        safe_value = f"{safe_value}-{digest}"
+    return os.path.join(
+        f"{root}_backfill", f"{variable}={safe_value}{extension or '.duckdb'}"
+    )
+
+
+def _walk_steps(steps: List[PipelineStep]):
+    """Yield steps, descending into all branches of conditional blocks."""
+    for step in steps:
+        yield step
+        if isinstance(step, ConditionalBlockStep):
+            for branch in step.branches:
+                yield branch
+                yield from _walk_steps(branch.steps)
+            yield from _walk_steps(step.else_branch or [])
+
+
+def conditions_depend_on(pipeline: Pipeline, variable: str) -> bool:
+    """Check whether any condition of a pipeline depends on a variable.
+
+    A condition depends on the variable if it references it, or references
+    a SET variable whose value (transitively) references it.
+
+    Args:
+        pipeline: Parsed pipeline
+        variable: Variable name
+
+    Returns:
+        True if choosing branches may depend on the variable's value
+    """
+    steps = list(_walk_steps(pipeline.steps))
+    set_references = {}
+    for step in steps:
+        if isinstance(step, SetStep):
+            references = compile_template(step.variable_value).variable_names
+            set_references.setdefault(step.variable_name.strip(), set()).update(
+                references
+            )
+
+    dependent: Set[str] = {variable}
+    changed = True
+    while changed:
+        changed = False
+        for name, references in set_references.items():
+            if name not in dependent and references & dependent:
+                dependent.add(name)
+                changed = True
+
+    return any(
+        compile_template(step.condition).variable_names & dependent
+        for step in steps
+        if isinstance(step, ConditionalBranchStep)
+    )
+
+
+class BackfillRunner:
+    """Run one pipeline for many values of a variable, in parallel."""
+
+    def __init__(
+        self,
+        pipeline: Pipeline,
+        variable: str,
+        variables: Optional[Dict[str, Any]] = None,
+        profile_variables: Optional[Dict[str, Any]] = None,
+        planner: Optional[Planner] = None,
+        max_workers: int = 1,
+        project_dir: Optional[str] = None,
+        engine_config: Optional[Dict[str, Any]] = None,
+    ):
+        """Initialize a BackfillRunner.
+
+        Args:
+            pipeline: Parsed pipeline to backfill
+            variable: Name of the variable taking one value per partition
+            variables: Other CLI variables, shared by all partitions
+            profile_variables: Profile variables, shared by all partitions
+            planner: Planner to use; planning is serialized on it
+            max_workers: Number of partitions running at the same time
+            project_dir: Project directory for UDF discovery
+            engine_config: DuckDB engine settings from the profile
+        """
+        self.pipeline = pipeline
+        self.variable = variable
+        self.variables = dict(variables or {})
+        self.profile_variables = dict(profile_variables or {})
+        self.planner = planner or Planner()
+        self.max_workers = max(1, max_workers)
+        self.project_dir = project_dir
+        self.engine_config = engine_config or {}
+        self.registry = create_default_registry()
+        self.udfs: Dict[str, Callable] = {}
+        self._template: Optional[VariableTemplate] = None
+        self._compiled = False
+        self._plan_lock = threading.Lock()
+
+    @property
+    def shares_plan(self) -> bool:
+        """Whether all partitions are rendered from one compiled plan."""
+        return self._template is not None
+
+    def compile(self) -> None:
+        """Plan the pipeline once and discover UDFs once for all partitions.
+
+        The plan is built with the backfill variable bound to its own
+        ${variable} placeholder, which survives substitution and is filled
+        in per partition by plan_for().
+        """
+        if self._compiled:
+            return
+
+        if conditions_depend_on(self.pipeline, self.variable):
+            logger.info(
+                f"Conditions depend on '{self.variable}'; "
+                "planning each partition separately"
+            )
+        else:
+            placeholder = {self.variable: "${" + self.variable + "}"}
+            plan = self.planner.create_plan(
+                self.pipeline,
+                variables={**self.variables, **placeholder},
+                profile_variables=self.profile_variables,
+            )
+            self._template = compile_template(json.dumps(plan))
+
+        if self.project_dir:
+            udf_manager = PythonUDFManager(self.project_dir)
+            enhance_udf_manager(udf_manager)
+            self.udfs = udf_manager.discover_udfs()
+        self._compiled = True
+
+    def plan_for(self, value: str) -> List[Dict[str, Any]]:
+        """Return the execution plan for one backfill value.
+
+        Args:
+            value: Value of the backfill variable
+
+        Returns:
+            Execution plan with the value substituted
+        """
+        self.compile()
+        if self._template is not None:
+            # Escape the value for the JSON string it is substituted into
+            escaped = json.dumps(str(value))[1:-1]
+            return json.loads(self._template.render({self.variable: escaped}))
+
+        with self._plan_lock:
+            return self.planner.create_plan(
+                self.pipeline,
+                variables={**self.variables, self.variable: value},
+                profile_variables=self.profile_variables,
+            )
+
+    def run(
+        self, values: List[str], on_partition_done: Optional[PartitionCallback] = None
+    ) -> List[BackfillPartitionResult]:
+        """Run all partitions, at most max_workers at a time.
+
+        A failing partition does not stop the others.
+
+        Args:
+            values: Values of the backfill variable, one partition each
+            on_partition_done: Optional callback receiving each result as soon
+                as its partition finishes
+
+        Returns:
+            Partition results in the order of values
+        """
+        self.compile()
+        results: Dict[str, BackfillPartitionResult] = {}
+        with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+            futures = {
+                pool.submit(self._run_partition, value): value for value in values
+            }
+            for future in as_completed(futures):
+                partition_result = future.result()
+                results[futures[future]] = partition_result
+                if on_partition_done is not None:
+                    on_partition_done(partition_result)
+        return [results[value] for value in values]
+
+    def _run_partition(self, value: str) -> BackfillPartitionResult:
+        """Plan and execute one partition on its own engine."""
+        start_time = time.perf_counter()
+        engine = None
+        try:
+            plan = self.plan_for(value)
+            engine = self._create_engine(value)
+            context = create_execution_context(
+                engine=engine,
+                variables={
+                    **self.profile_variables,
+                    **self.variables,
+                    self.variable: value,
+                },
+                execution_id=f"backfill-{value}-{uuid.uuid4().hex[:8]}",
+            )
+            result = ExecutionCoordinator(self.registry).execute(plan, context)
+            error_message = None
+            if not result.success:
+                failed = result.failed_steps[0]
+                error_message = f"{failed.step_id}: {failed.error_message}"
+            return BackfillPartitionResult(
+                value=value,
+                success=result.success,
+                duration=time.perf_counter() - start_time,
+                error_message=error_message,
+                result=result,
+            )
+        except Exception as e:
+            logger.error(f"Backfill partition {self.variable}={value} failed: {e}")
+            return BackfillPartitionResult(
+                value=value,
+                success=False,
+                duration=time.perf_counter() - start_time,
+                error_message=str(e),
+            )
+        finally:
+            if engine is not None:
+                engine.close()
+
+    def _create_engine(self, value: str) -> DuckDBEngine:
+        """Create an isolated engine for one partition, with the shared UDFs."""
+        engine = DuckDBEngine(self._database_path(value))
+        engine.configure(self.engine_config, self.profile_variables)
+        if self.max_workers > 1:
+            # Split the cores between partitions instead of oversubscribing them
+            threads = max(1, (os.cpu_count() or 1) // self.max_workers)
+            engine.connection.execute(f"SET threads TO {threads}")
+
+        for udf_name, udf_function in self.udfs.items():
+            try:
+                engine.register_python_udf(udf_name, udf_function)
+            except Exception as e:
+                logger.warning(f"Failed to register UDF {udf_name}: {e}")
+        return engine
+
+    def _database_path(self, value: str) -> str:
+        """Return the database of one partition, in memory unless persistent."""
+        database_path = self.engine_config.get("path")
+        if self.engine_config.get("mode") != "persistent" or not database_path:
+            return ":memory:"
+
+        path = partition_database_path(database_path, self.variable, value)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        logger.info(f"Backfill partition {self.variable}={value} writes to {path}")
+        return path
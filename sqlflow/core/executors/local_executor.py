@@ -5,7 +5,8 @@ from __future__ import annotations
 import os
 import time
 import uuid
-from typing import Any, Dict, List, Optional, Protocol, Tuple
+from itertools import chain
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Protocol, Tuple
 
 import pandas as pd
 
@@ -18,6 +19,7 @@ from sqlflow.core.executors.base_executor import BaseExecutor
 # Removed ProfileConnectorIntegration - using simplified approach
 from sqlflow.core.profiles import ProfileManager
 from sqlflow.core.state.backends import DuckDBStateBackend
+from sqlflow.core.state.file_manifest import FileManifest
 from sqlflow.core.state.watermark_manager import WatermarkManager
 from sqlflow.logging import get_logger
 from sqlflow.project import Project
@@ -330,6 +332,9 @@ class ConnectorEngineStub:
                     connector_instance, source_name, table_name
                 )
 
+            if not isinstance(df, pd.DataFrame):
+                # Discovered S3 objects are passed on as their chunks arrive
+                return df
             data_chunk = DataChunk(df)
             return [data_chunk]
 
@@ -340,7 +345,10 @@ class ConnectorEngineStub:
             raise
 
     def _load_s3_data(self, connector_instance, source_name):
-        """Load data from S3 connector with discovery mode support."""
+        """Load data from S3 connector with discovery mode support.
+
+        Discovered objects are returned as a lazy iterator of chunks.
+        """
         import pandas as pd
 
         from sqlflow.connectors.data_chunk import DataChunk
@@ -359,12 +367,10 @@ class ConnectorEngineStub:
                 )
                 return pd.DataFrame()
 
-            # Read the first discovered file (simplified for demo)
-            first_file = discovered_files[0]
-            result = connector_instance.read(object_name=first_file)
             logger.debug(
-                f"ConnectorEngineStub: Reading S3 file '{first_file}' (discovered from prefix) for source '{source_name}'"
+                f"ConnectorEngineStub: Reading {len(discovered_files)} S3 files (discovered from prefix) for source '{source_name}'"
             )
+            return self._read_discovered_objects(connector_instance, discovered_files)
         else:
             # Use specific key for reading
             if has_specific_key:
@@ -466,14 +472,19 @@ class ConnectorEngineStub:
             )
             return pd.DataFrame()
 
-        # Read the first discovered file
-        first_file = discovered_files[0]
-        result = connector_instance.read(object_name=first_file)
+        result = self._read_discovered_objects(connector_instance, discovered_files)
         logger.debug(
-            f"ConnectorEngineStub: Using S3 discovery mode, reading file '{first_file}' from prefix '{path_prefix}'"
+            f"ConnectorEngineStub: Using S3 discovery mode, reading {len(discovered_files)} files from prefix '{path_prefix}'"
         )
         return result
 
+    def _read_discovered_objects(self, connector_instance, discovered_files):
+        """Read all discovered objects, concurrently when supported."""
+        if hasattr(connector_instance, "read_objects"):
+            return connector_instance.read_objects(discovered_files)
+        # Connectors without concurrent reads only get the first file
+        return connector_instance.read(object_name=discovered_files[0])
+
     def _load_s3_specific_key_data(
         self, connector_instance, source_name, table_name, has_specific_key
     ):
@@ -603,6 +614,8 @@ class LocalExecutor(BaseExecutor):
         self.source_connectors = {}
         self.step_table_map = {}
         self.table_data = {}
+        # Row counts of sources already streamed into DuckDB
+        self.streamed_sources: Dict[str, int] = {}
         self.connector_engine = None
 
         # Initialize project and configuration
@@ -1544,6 +1557,10 @@ class LocalExecutor(BaseExecutor):
 
             return len(data_chunk)
 
+        # Discovered S3 files are registered with DuckDB as they are read
+        if source_name in getattr(self, "streamed_sources", {}):
+            return self.streamed_sources[source_name]
+
         # Otherwise, use the standard source definition loading
         source_definition = self._get_source_definition(source_name)
 
@@ -1933,11 +1950,13 @@ class LocalExecutor(BaseExecutor):
             source_df = self._load_incremental_source_data(
                 load_step, connector_params, cursor_field, last_cursor_value
             )
+            connector_instance = self._get_connector_instance(load_step.source_name)
 
             if source_df.empty:
                 logger.info(
                     f"No new data found for incremental load of '{load_step.source_name}'"
                 )
+                self._commit_file_manifest(connector_instance)
                 return 0
 
             # Update watermark if we have new data
@@ -1952,9 +1971,14 @@ class LocalExecutor(BaseExecutor):
                     f"Registered incremental SOURCE data '{load_step.source_name}' with DuckDB"
                 )
 
+            # Files count as ingested only once their rows are registered
+            self._commit_file_manifest(connector_instance)
             return len(source_df)
 
         except Exception as e:
+            self._discard_file_manifest(
+                self._get_connector_instance(load_step.source_name)
+            )
             logger.error(f"Failed to load incremental data: {e}")
             # On error, fall back to full refresh
             logger.warning(
@@ -1983,6 +2007,13 @@ class LocalExecutor(BaseExecutor):
 
         # Use read_incremental if connector supports it
         if connector_instance and hasattr(connector_instance, "read_incremental"):
+            self._attach_file_manifest(
+                connector_instance,
+                getattr(load_step, "pipeline_name", "default"),
+                load_step.source_name,
+                load_step.table_name,
+            )
+
             # Handle S3 connectors specially for incremental loading
             if hasattr(connector_instance, "connection_params"):
                 config = connector_instance.connection_params
@@ -2049,9 +2080,7 @@ class LocalExecutor(BaseExecutor):
 
             return pd.DataFrame()
 
-        # Get the first chunk
-        data_chunk = data_chunks[0]
-        return data_chunk.pandas_df
+        return self._combine_chunks(data_chunks).pandas_df
 
     def _get_connector_instance(self, source_name: str):
         """Get connector instance from ConnectorEngine."""
@@ -2115,27 +2144,22 @@ class LocalExecutor(BaseExecutor):
         if not self.connector_engine:
             raise ValueError("ConnectorEngine is not initialized")
 
-        data_chunks = list(
-            self.connector_engine.load_data(
-                load_step.source_name, table_name_for_source
-            )
+        data_chunks = self.connector_engine.load_data(
+            load_step.source_name, table_name_for_source
         )
 
-        if not data_chunks:
-            raise ValueError(f"No data loaded from SOURCE '{load_step.source_name}'")
-
-        # Get the first chunk and register it with DuckDB as the source table
-        data_chunk = data_chunks[0]
-        source_df = data_chunk.pandas_df
-
         # Register the source data with DuckDB using the source_name
         if self.duckdb_engine:
-            self.duckdb_engine.register_table(load_step.source_name, source_df)
-            logger.debug(
-                f"Registered SOURCE data '{load_step.source_name}' with DuckDB"
-            )
+            rows_loaded = self._register_chunks(load_step.source_name, data_chunks)
+        else:
+            rows_loaded = next(
+                (len(chunk) for chunk in data_chunks), None
+            )  # Without an engine only the row count matters
+        if rows_loaded is None:
+            raise ValueError(f"No data loaded from SOURCE '{load_step.source_name}'")
 
-        return len(source_df)
+        logger.debug(f"Registered SOURCE data '{load_step.source_name}' with DuckDB")
+        return rows_loaded
 
     def _execute_load_common(self, load_step, rows_loaded: int) -> Dict[str, Any]:
         """Common load execution logic with result reporting.
@@ -2693,27 +2717,28 @@ class LocalExecutor(BaseExecutor):
         source_name: str,
         discovered_files: List[str],
     ) -> Dict[str, Any]:
-        """Process discovered S3 files and combine data."""
-        combined_chunks = []
-        total_rows = 0
+        """Process discovered S3 files and combine data.
 
-        for file_key in discovered_files[:10]:  # Limit to first 10 files for demo
-            try:
-                for chunk in connector.read(
-                    object_name=file_key,
-                    batch_size=step.get("batch_size", 10000),
-                ):
-                    combined_chunks.append(chunk)
-                    total_rows += len(chunk)
-            except Exception as e:
-                logger.warning(f"Failed to read S3 file {file_key}: {e}")
-                continue
+        Files are read concurrently; files that fail to read are skipped.
+        With a DuckDB engine the chunks are registered as they arrive
+        instead of being combined in memory.
+        """
+        chunks = self._read_discovered_s3_files(
+            connector, discovered_files, step.get("batch_size", 10000)
+        )
+        if not hasattr(self, "table_data"):
+            self.table_data = {}
 
-        # Store the last chunk (or create empty if none)
-        if combined_chunks:
-            if not hasattr(self, "table_data"):
-                self.table_data = {}
-            self.table_data[source_name] = combined_chunks[-1]  # Use last chunk
+        if self.duckdb_engine:
+            self.table_data.pop(source_name, None)
+            total_rows = self._register_chunks(source_name, chunks) or 0
+            if total_rows:
+                self.streamed_sources[source_name] = total_rows
+        else:
+            combined_chunks = list(chunks)
+            total_rows = sum(len(chunk) for chunk in combined_chunks)
+            if combined_chunks:
+                self.table_data[source_name] = self._combine_chunks(combined_chunks)
 
         return {
             "status": "success",
@@ -2722,6 +2747,22 @@ class LocalExecutor(BaseExecutor):
             "rows_processed": total_rows,
         }
 
+    def _read_discovered_s3_files(
+        self, connector, discovered_files: List[str], batch_size: int
+    ) -> Iterator[DataChunk]:
+        """Read discovered S3 files, concurrently when the connector supports it."""
+        if hasattr(connector, "read_objects"):
+            yield from connector.read_objects(
+                discovered_files, batch_size=batch_size, skip_failed=True
+            )
+            return
+
+        for file_key in discovered_files:
+            try:
+                yield from connector.read(object_name=file_key, batch_size=batch_size)
+            except Exception as e:
+                logger.warning(f"Failed to read S3 file {file_key}: {e}")
+
     def _handle_profile_based_source(
         self, step: Dict[str, Any], step_id: str, source_name: str
     ) -> Dict[str, Any]:
@@ -3335,6 +3376,7 @@ class LocalExecutor(BaseExecutor):
                 f"Connector {source_name} doesn't support incremental, falling back to full refresh"
             )
             return self._handle_traditional_source(step, step["id"], source_name)
+        self._attach_file_manifest(connector, pipeline_name, source_name, source_name)
 
         # Handle S3 discovery mode and get object name
         object_name = self._handle_s3_incremental_discovery(
@@ -3346,15 +3388,25 @@ class LocalExecutor(BaseExecutor):
                 source_name, step, last_cursor_value, last_cursor_value, 0
             )
 
-        # Read incremental data
-        max_cursor_value, total_rows = self._read_incremental_data(
-            connector, object_name, cursor_field, last_cursor_value, step, source_name
-        )
+        try:
+            # Read incremental data
+            max_cursor_value, total_rows = self._read_incremental_data(
+                connector,
+                object_name,
+                cursor_field,
+                last_cursor_value,
+                step,
+                source_name,
+            )
 
-        # Update watermark after successful incremental read
-        self._update_incremental_watermark(
-            pipeline_name, source_name, cursor_field, max_cursor_value
-        )
+            # Update watermark and file manifest after successful incremental read
+            self._update_incremental_watermark(
+                pipeline_name, source_name, cursor_field, max_cursor_value
+            )
+            self._commit_file_manifest(connector)
+        except Exception:
+            self._discard_file_manifest(connector)
+            raise
 
         logger.info(
             f"Incremental SOURCE {source_name} read {total_rows} rows, max cursor: {max_cursor_value}"
@@ -3426,6 +3478,7 @@ class LocalExecutor(BaseExecutor):
         """Read incremental data and track the maximum cursor value."""
         max_cursor_value = last_cursor_value
         total_rows = 0
+        chunks = []
 
         for chunk in connector.read_incremental(
             object_name=object_name,
@@ -3433,10 +3486,7 @@ class LocalExecutor(BaseExecutor):
             cursor_value=last_cursor_value,
             batch_size=step.get("batch_size", 10000),
         ):
-            # Store chunk data for subsequent LOAD operations
-            if not hasattr(self, "table_data"):
-                self.table_data = {}
-            self.table_data[source_name] = chunk
+            chunks.append(chunk)
             total_rows += len(chunk)  # DataChunk has __len__ method
 
             # Track maximum cursor value in this chunk
@@ -3444,8 +3494,93 @@ class LocalExecutor(BaseExecutor):
             if chunk_max and (not max_cursor_value or chunk_max > max_cursor_value):
                 max_cursor_value = chunk_max
 
+        # Store the data for subsequent LOAD operations. Incremental reads
+        # may span several files, so keep every chunk rather than the last.
+        if chunks:
+            if not hasattr(self, "table_data"):
+                self.table_data = {}
+            self.table_data[source_name] = self._combine_chunks(chunks)
+
         return max_cursor_value, total_rows
 
+    def _register_chunks(self, name: str, chunks: Iterable[DataChunk]) -> Optional[int]:
+        """Register a source's chunks with DuckDB as they are read.
+
+        A single chunk is registered as a view of its DataFrame. When more
+        arrive, they are inserted into a table one at a time, so memory
+        holds a chunk or two rather than the whole source.
+
+        Args:
+        ----
+            name: Name to register the source data under
+            chunks: Chunks read from the source
+
+        Returns:
+        -------
+            Rows registered, or None if there were no chunks
+
+        """
+        iterator = iter(chunks)
+        first = next(iterator, None)
+        if first is None:
+            return None
+        second = next(iterator, None)
+        if second is None:
+            self.duckdb_engine.register_table(name, first.pandas_df)
+            return len(first)
+
+        connection = self.duckdb_engine.connection
+        # A view left by an earlier registration would hide the table
+        connection.unregister(name)
+        remaining = chain([first, second], iterator)
+        del first, second
+
+        rows = 0
+        for chunk in remaining:
+            chunk_view = f"sqlflow_chunk_{uuid.uuid4().hex}"
+            connection.register(chunk_view, chunk.arrow_table)
+            try:
+                if rows == 0:
+                    connection.execute(
+                        f"CREATE OR REPLACE TABLE {name} AS SELECT * FROM {chunk_view}"
+                    )
+                else:
+                    connection.execute(f"INSERT INTO {name} SELECT * FROM {chunk_view}")
+            finally:
+                connection.unregister(chunk_view)
+            rows += len(chunk)
+        return rows
+
+    def _combine_chunks(self, chunks: List[DataChunk]) -> DataChunk:
+        """Combine the chunks read from a source into one."""
+        if len(chunks) == 1:
+            return chunks[0]
+        return DataChunk(
+            pd.concat([chunk.pandas_df for chunk in chunks], ignore_index=True)
+        )
+
+    def _attach_file_manifest(
+        self, connector, pipeline_name: str, source_name: str, target: str
+    ) -> None:
+        """Give file-based connectors the manifest of files already ingested."""
+        if self.watermark_manager and hasattr(connector, "file_manifest"):
+            connector.file_manifest = FileManifest(
+                self.watermark_manager.backend,
+                FileManifest.get_manifest_key(pipeline_name, source_name, target),
+            )
+
+    def _commit_file_manifest(self, connector) -> None:
+        """Record the files a successful incremental load has ingested."""
+        file_manifest = getattr(connector, "file_manifest", None)
+        if file_manifest is not None:
+            file_manifest.commit()
+
+    def _discard_file_manifest(self, connector) -> None:
+        """Forget the files staged by a failed incremental load."""
+        file_manifest = getattr(connector, "file_manifest", None)
+        if file_manifest is not None:
+            file_manifest.discard()
+
     def _update_incremental_watermark(
         self, pipeline_name, source_name, cursor_field, max_cursor_value
     ):
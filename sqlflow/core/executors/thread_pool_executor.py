@@ -1,4 +1,9 @@
-"""Thread-pool executor for SQLFlow pipelines."""
+"""Thread-pool executor for SQLFlow pipelines.
+
+Steps are dispatched through the V2 step executors as soon as the steps
+they depend on have succeeded, so independent loads, transforms and
+exports overlap. Each worker thread runs against its own DuckDB cursor.
+"""
 
 import json
 import logging
@@ -6,12 +11,25 @@ import os
 import threading
 import time
 import uuid
+from concurrent.futures import FIRST_COMPLETED
 from concurrent.futures import ThreadPoolExecutor as ConcurrentThreadPoolExecutor
+from concurrent.futures import wait
 from typing import Any, Dict, List, Optional, Set
 
 from sqlflow.core.dependencies import DependencyResolver
 from sqlflow.core.executors.base_executor import BaseExecutor
 from sqlflow.core.executors.task_status import TaskState, TaskStatus
+from sqlflow.core.executors.v2.execution.context import (
+    ExecutionContext,
+    create_execution_context,
+    with_worker_engine,
+)
+from sqlflow.core.executors.v2.steps.definitions import create_step_from_dict
+from sqlflow.core.executors.v2.steps.registry import (
+    StepExecutorRegistry,
+    create_default_registry,
+)
+from sqlflow.core.executors.v2.variables.substitution import substitute_in_step
 
 logger = logging.getLogger("sqlflow.core.executors.thread_pool_executor")
 
@@ -27,6 +45,8 @@ class ThreadPoolTaskExecutor(BaseExecutor):
         max_retries: int = 3,
         retry_delay: float = 1.0,
         project_dir: Optional[str] = None,
+        context: Optional[ExecutionContext] = None,
+        registry: Optional[StepExecutorRegistry] = None,
     ):
         """Initialize a ThreadPoolTaskExecutor.
 
@@ -40,6 +60,9 @@ class ThreadPoolTaskExecutor(BaseExecutor):
             max_retries: Maximum number of retries for failed tasks.
             retry_delay: Delay in seconds between retries.
             project_dir: Project directory for UDF discovery.
+            context: V2 execution context holding the engine, variables and
+                     connectors. Defaults to an in-memory DuckDB context.
+            registry: Step executor registry used to dispatch steps.
 
         """
         # Initialize base executor (UDF manager)
@@ -57,6 +80,10 @@ class ThreadPoolTaskExecutor(BaseExecutor):
         self.max_retries = max_retries
         self.retry_delay = retry_delay
         self.original_plan: List[Dict[str, Any]] = []
+        self.context = context
+        self.registry = registry or create_default_registry()
+        self._worker_contexts: Dict[int, ExecutionContext] = {}
+        self._shared_engine_lock: Optional[threading.Lock] = None
 
         # Discover UDFs if project_dir is provided
         if project_dir:
@@ -68,6 +95,7 @@ class ThreadPoolTaskExecutor(BaseExecutor):
         dependency_resolver: Optional[DependencyResolver] = None,
         resume: bool = False,
         project_dir: Optional[str] = None,
+        context: Optional[ExecutionContext] = None,
     ) -> Dict[str, Any]:
         """Execute a pipeline plan concurrently.
 
@@ -77,6 +105,8 @@ class ThreadPoolTaskExecutor(BaseExecutor):
             dependency_resolver: Optional DependencyResolver to cross-check execution order
             resume: Whether to resume from a previous execution
             project_dir: Project directory for UDF discovery
+            context: Optional V2 execution context overriding the one given
+                     at construction
 
         Returns:
         -------
@@ -86,6 +116,8 @@ class ThreadPoolTaskExecutor(BaseExecutor):
         self.results = {}
         self.dependency_resolver = dependency_resolver
         self.original_plan = plan.copy()
+        if context is not None:
+            self.context = context
 
         # Ensure UDFs are discovered
         if project_dir:
@@ -95,9 +127,59 @@ class ThreadPoolTaskExecutor(BaseExecutor):
 
         self._check_execution_order(plan, dependency_resolver)
         self._initialize_execution_state(plan, resume)
+        self._prepare_context()
+
+        try:
+            with ConcurrentThreadPoolExecutor(max_workers=self.max_workers) as executor:
+                return self._execute_with_thread_pool(executor, plan)
+        finally:
+            self._close_worker_engines()
+
+    def _prepare_context(self) -> None:
+        """Create the default context and register discovered UDFs on its engine."""
+        if self.context is None:
+            from sqlflow.core.engines.duckdb.engine import DuckDBEngine
+
+            self.context = create_execution_context(engine=DuckDBEngine(":memory:"))
+
+        engine = self.context.engine
+        if not hasattr(engine, "create_cursor_engine"):
+            logger.info("Engine has no cursor support; steps will run one at a time")
+            self._shared_engine_lock = threading.Lock()
+        else:
+            self._shared_engine_lock = None
+
+        if self.discovered_udfs and hasattr(engine, "register_python_udf"):
+            for udf_name, udf_function in self.discovered_udfs.items():
+                try:
+                    engine.register_python_udf(udf_name, udf_function)
+                except Exception as e:
+                    logger.warning(f"Failed to register UDF {udf_name}: {e}")
+
+    def _get_worker_context(self) -> ExecutionContext:
+        """Return the execution context for the current worker thread.
 
-        with ConcurrentThreadPoolExecutor(max_workers=self.max_workers) as executor:
-            return self._execute_with_thread_pool(executor, plan)
+        Each thread gets its own cursor engine on first use, so concurrent
+        steps never share a DuckDB connection.
+        """
+        if self._shared_engine_lock is not None:
+            return self.context
+
+        thread_id = threading.get_ident()
+        worker_context = self._worker_contexts.get(thread_id)
+        if worker_context is None:
+            worker_engine = self.context.engine.create_cursor_engine()
+            worker_context = with_worker_engine(self.context, worker_engine)
+            with self.lock:
+                self._worker_contexts[thread_id] = worker_context
+        return worker_context
+
+    def _close_worker_engines(self) -> None:
+        """Close the cursors opened by worker threads."""
+        with self.lock:
+            worker_contexts, self._worker_contexts = self._worker_contexts, {}
+        for worker_context in worker_contexts.values():
+            worker_context.engine.close()
 
     def _check_execution_order(
         self,
@@ -189,7 +271,7 @@ class ThreadPoolTaskExecutor(BaseExecutor):
                 return self.results
 
             if futures and len(completed_tasks) < len(plan):
-                time.sleep(0.1)
+                wait(futures.values(), return_when=FIRST_COMPLETED)
 
         if self.state_backend is not None:
             self.state_backend.update_run_status(self.run_id, "SUCCESS")
@@ -354,6 +436,10 @@ class ThreadPoolTaskExecutor(BaseExecutor):
     def execute_step(self, step: Dict[str, Any]) -> Dict[str, Any]:
         """Execute a single step in the pipeline.
 
+        The step is converted to a typed V2 step and run by the matching
+        step executor on this worker's engine. A failed step raises so that
+        the retry and failure handling of the scheduler applies.
+
         Args:
         ----
             step: Operation to execute
@@ -362,30 +448,19 @@ class ThreadPoolTaskExecutor(BaseExecutor):
         -------
             Dict containing execution results
 
+        Raises:
+        ------
+            RuntimeError: If the step executor reports a failure
+
         """
         step_id = step.get("id", "unknown")
         step_type = step.get("type", "unknown")
 
         logger.info(f"Executing step {step_id} of type {step_type}")
 
-        # For SQL-based steps, check if they reference UDFs
-        if step_type in ["transform", "query"] and "query" in step:
-            # Get the SQL query
-            sql_query = step["query"]
-            if isinstance(sql_query, str):
-                # Extract UDFs referenced in the query
-                udfs = self.get_udfs_for_query(sql_query)
-                if udfs:
-                    logger.info(f"Found {len(udfs)} UDF references in step {step_id}")
-
-        # In practice, this executor would implement different step types
-        # For now, we just return success to indicate that the step was "executed"
-        # In a real implementation, you would delegate to specific handlers for each step type
-
-        # Sample implementation for special INCLUDE steps that affect UDFs
+        # INCLUDE of a Python file only affects UDF discovery
         if step_type == "INCLUDE" and step.get("file_path", "").endswith(".py"):
             try:
-                # For Python files, trigger rediscovery of UDFs
                 logger.info(f"Including Python file for UDFs: {step['file_path']}")
                 self.discover_udfs()
                 logger.info(f"Now have {len(self.discovered_udfs)} UDFs available")
@@ -394,7 +469,60 @@ class ThreadPoolTaskExecutor(BaseExecutor):
                 logger.error(f"Error including Python file: {e}")
                 return {"status": "failed", "error": str(e)}
 
-        return {"status": "success"}
+        if self.context is None:
+            self._prepare_context()
+
+        context = self._get_worker_context()
+        if context.variables:
+            step = substitute_in_step(step, context.variables)
+        typed_step = create_step_from_dict(step)
+
+        if self._shared_engine_lock is not None:
+            with self._shared_engine_lock:
+                result = self._run_typed_step(typed_step, context)
+        else:
+            result = self._run_typed_step(typed_step, context)
+
+        if not result.success:
+            raise RuntimeError(result.error_message or f"Step {step_id} failed")
+
+        return {
+            "status": "success",
+            "rows_affected": result.rows_affected,
+            "duration_ms": result.duration_ms,
+            "metadata": dict(result.metadata),
+        }
+
+    def _run_typed_step(self, step: Any, context: ExecutionContext) -> Any:
+        """Run a typed step through its registered executor.
+
+        Args:
+        ----
+            step: Typed V2 step
+            context: Execution context for the current worker
+
+        Returns:
+        -------
+            StepResult from the step executor
+
+        """
+        if context.observability:
+            context.observability.start_step(step.id)
+
+        executor = self.registry.find_executor(step)
+        try:
+            result = executor.execute(step, context)
+        except Exception as e:
+            if context.observability:
+                context.observability.end_step(step.id, False, str(e))
+            raise
+
+        if context.observability:
+            context.observability.end_step(
+                step.id, result.success, result.error_message
+            )
+            context.observability.record_rows_affected(step.id, result.rows_affected)
+        return result
 
     def can_resume(self) -> bool:
         """Check if the executor supports resuming from failure.
@@ -492,6 +620,7 @@ class ThreadPoolTaskExecutor(BaseExecutor):
         self.failed_step = None
         plan = self._get_plan_for_resume()
 
+        self._prepare_context()
         try:
             self._execute_failed_step(failed_step)
 
@@ -505,6 +634,8 @@ class ThreadPoolTaskExecutor(BaseExecutor):
             self.results["failed_step"] = failed_step["id"]
             self._update_task_state(failed_step["id"], TaskState.FAILED, str(e))
             return self.results
+        finally:
+            self._close_worker_engines()
 
         return self.results
 
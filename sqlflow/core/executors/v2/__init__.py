@@ -16,6 +16,7 @@ from .execution.context import (
     create_test_context,
     with_engine,
     with_variables,
+    with_worker_engine,
 )
 from .observability.metrics import SimpleObservabilityManager
 from .orchestration.coordinator import ExecutionCoordinator
@@ -54,6 +55,7 @@ __all__ = [
     "create_test_context",
     "with_variables",
     "with_engine",
+    "with_worker_engine",
     # Step definitions
     "LoadStep",
     "TransformStep",
@@ -132,6 +132,7 @@ def _register_standard_connectors(registry: EnhancedConnectorRegistry) -> None:
             "ParquetSource",
             "ParquetDestination",
         ),
+        ("s3", "sqlflow.connectors.s3", "S3Source", "S3Destination"),
     ]
 
     for conn_type, module_name, source_class, dest_class in connectors_to_register:
@@ -201,3 +202,16 @@ def with_engine(context: ExecutionContext, engine: Any) -> ExecutionContext:
         new_context.add_source_definition(name, definition)
 
     return new_context
+
+
+def with_worker_engine(context: ExecutionContext, engine: Any) -> ExecutionContext:
+    """Create a context for a concurrent worker with its own engine.
+
+    Unlike with_engine, source definitions are shared rather than copied,
+    so a source defined on one worker is visible to loads on any other.
+    """
+    worker_context = with_engine(context, engine)
+    object.__setattr__(
+        worker_context, "_source_definitions", context._source_definitions
+    )
+    return worker_context
@@ -53,6 +53,10 @@ class StepMetrics:
     rows_affected: int = 0
     metadata: Dict[str, Any] = field(default_factory=dict)
 
+    # Streaming batch tracking
+    batches: int = 0
+    bytes_processed: int = 0
+
     # Aggregate metrics for multiple executions
     calls: int = 0
     failures: int = 0
@@ -199,6 +203,14 @@ class SimpleObservabilityManager:
         if step_id in self._step_metrics:
             self._step_metrics[step_id].rows_affected = rows
 
+    def record_batch(self, step_id: str, rows: int, num_bytes: int) -> None:
+        """Record one streamed batch of rows and bytes for a step."""
+        if step_id in self._step_metrics:
+            metrics = self._step_metrics[step_id]
+            metrics.batches += 1
+            metrics.bytes_processed += num_bytes
+            metrics.rows_affected += rows
+
     def add_step_metadata(self, step_id: str, metadata: Dict[str, Any]) -> None:
         """Add metadata to a step."""
         if step_id in self._step_metrics:
@@ -240,6 +252,8 @@ class SimpleObservabilityManager:
                     "duration_ms": metrics.duration_ms,
                     "success": metrics.success,
                     "rows_affected": metrics.rows_affected,
+                    "batches": metrics.batches,
+                    "bytes_processed": metrics.bytes_processed,
                     "error_message": metrics.error_message,
                     "metadata": metrics.metadata,
                 }
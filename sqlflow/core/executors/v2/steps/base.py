@@ -63,6 +63,21 @@ class BaseStepExecutor(StepExecutor):
                 metadata=full_metadata,
             )
 
+    def _process_sql_for_udfs(self, sql: str, engine) -> str:
+        """Process SQL for UDF references if engine supports it."""
+        process_query_method = getattr(engine, "process_query_for_udfs", None)
+        if process_query_method is None or not hasattr(engine, "registered_udfs"):
+            return sql
+
+        registered_udfs = getattr(engine, "registered_udfs", {})
+        if not registered_udfs:
+            return sql
+
+        logger.debug(f"Processing SQL for UDFs: {list(registered_udfs.keys())}")
+        processed_sql = process_query_method(sql, registered_udfs)
+        logger.debug(f"SQL after UDF processing: {processed_sql}")
+        return processed_sql
+
     def _handle_execution_error(
         self, step_id: str, error: Exception, execution_time: float
     ) -> StepResult:
@@ -8,7 +8,7 @@ Following Raymond Hettinger's guidance:
 """
 
 from enum import Enum
-from typing import Any, Dict, List, NamedTuple, Union
+from typing import Any, Dict, List, NamedTuple, Optional, Union
 
 
 class LoadMode(Enum):
@@ -63,6 +63,8 @@ class ExportStep(NamedTuple):
     source_table: str
     destination: str
     format: ExportFormat = ExportFormat.CSV
+    query: str = ""
+    options: Optional[Dict[str, Any]] = None
 
     @property
     def step_type(self) -> str:
@@ -164,11 +166,15 @@ def create_export_step(data: Dict[str, Any]) -> ExportStep:
     # Handle nested structure if present
     destination = data.get("destination", "")
     format_str = data.get("format", "csv")
+    sql_query = data.get("sql_query", "")
+    options = data.get("options", {})
 
-    if not destination and "query" in data:
+    if not destination and isinstance(data.get("query"), dict):
         query_data = data["query"]
         destination = query_data.get("destination_uri", "")
         format_str = query_data.get("type", "csv")
+        sql_query = query_data.get("sql_query", "")
+        options = query_data.get("options", {})
 
     format_enum = (
         ExportFormat(format_str.lower()) if isinstance(format_str, str) else format_str
@@ -179,6 +185,8 @@ def create_export_step(data: Dict[str, Any]) -> ExportStep:
         source_table=data.get("source_table", ""),
         destination=destination,
         format=format_enum,
+        query=sql_query or "",
+        options=options or None,
     )
     validate_export_step(step)
     return step
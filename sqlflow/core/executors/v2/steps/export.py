@@ -17,6 +17,9 @@ from .base import BaseStepExecutor
 
 logger = get_logger(__name__)
 
+# Rows per Arrow batch when streaming query results to a destination
+DEFAULT_EXPORT_BATCH_SIZE = 100_000
+
 
 @dataclass
 class ExportStepExecutor(BaseStepExecutor):
@@ -26,8 +29,15 @@ class ExportStepExecutor(BaseStepExecutor):
     - Reading data from tables
     - Writing to external destinations
     - Format conversion and validation
+
+    Local CSV and Parquet exports are pushed down to the engine as a single
+    native COPY when it supports one; everything else streams Arrow batches
+    of `batch_size` rows through a destination connector.
     """
 
+    batch_size: int = DEFAULT_EXPORT_BATCH_SIZE
+    native_copy: bool = True
+
     def can_execute(self, step: Any) -> bool:
         """Check if this executor can handle the step."""
         return hasattr(step, "step_type") and step.step_type == "export"
@@ -45,13 +55,22 @@ class ExportStepExecutor(BaseStepExecutor):
                 step
             )
 
-            # Read data from source table
-            data = self._read_source_data(source_table, context)
+            query = self._build_export_query(step, source_table, context)
+            native_copy = self._can_copy_natively(step, context)
 
-            # Create destination connector and export
             with self._observability_scope(context, "export_step"):
-                connector = self._create_destination_connector(step, context)
-                rows_exported = connector.write(data)
+                if native_copy:
+                    # DuckDB writes the file itself; no rows pass through Python
+                    rows_exported = context.engine.copy_query_to_file(
+                        query,
+                        destination,
+                        self._format_name(export_format),
+                        getattr(step, "options", None) or {},
+                    )
+                else:
+                    # Stream the query result into the destination connector
+                    connector = self._create_destination_connector(step, context)
+                    rows_exported = self._export_source_data(query, connector, context)
 
             execution_time = time.time() - start_time
 
@@ -65,6 +84,7 @@ class ExportStepExecutor(BaseStepExecutor):
                     "source_table": source_table,
                     "destination": destination,
                     "format": export_format,
+                    "native_copy": native_copy,
                 },
             )
 
@@ -87,18 +107,54 @@ class ExportStepExecutor(BaseStepExecutor):
 
         return source_table, destination, export_format
 
-    def _read_source_data(self, source_table: str, context: ExecutionContext):
-        """Read data from the source table."""
+    def _build_export_query(
+        self, step: Step, source_table: str, context: ExecutionContext
+    ) -> str:
+        """Return the EXPORT query, defaulting to the whole source table."""
+        query = getattr(step, "query", "") or f"SELECT * FROM {source_table}"
+        return self._process_sql_for_udfs(query, context.engine)
+
+    def _can_copy_natively(self, step: Step, context: ExecutionContext) -> bool:
+        """Check whether the engine can write the destination file itself."""
+        engine = context.engine
+        if not self.native_copy or not hasattr(engine, "copy_query_to_file"):
+            return False
+
+        return engine.can_copy_to_file(
+            getattr(step, "destination", ""),
+            self._format_name(getattr(step, "format", "csv")),
+            getattr(step, "options", None) or {},
+        )
+
+    def _format_name(self, export_format: Any) -> str:
+        """Return the export format as a lowercase name."""
+        return str(getattr(export_format, "value", export_format)).lower()
+
+    def _export_source_data(
+        self, query: str, connector: Any, context: ExecutionContext
+    ) -> int:
+        """Export the query result, streaming Arrow batches when the engine can."""
+        result = self._query_source_data(query, context)
+
+        if hasattr(result, "fetch_record_batch"):
+            reader = result.fetch_record_batch(self.batch_size)
+            return connector.write_batches(reader, reader.schema)
+
+        data = self._result_to_dataframe(result)
+        connector.write(data)
+        return len(data)
+
+    def _query_source_data(self, query: str, context: ExecutionContext):
+        """Run the export query."""
         engine = context.engine
 
         if not engine:
             raise ValueError("No database engine available in execution context")
 
-        # Use engine's execute_query method to get results, then convert to DataFrame
-        query = f"SELECT * FROM {source_table}"
-        result = engine.execute_query(query)
+        return engine.execute_query(query)
 
-        # Convert result to pandas DataFrame
+    def _result_to_dataframe(self, result: Any):
+        """Convert a query result to a pandas DataFrame."""
         try:
             import pandas as pd
 
@@ -133,10 +189,12 @@ class ExportStepExecutor(BaseStepExecutor):
         # Extract destination configuration
         destination_path = getattr(step, "destination", "")
         export_format = getattr(step, "format", "csv")
-        options = getattr(step, "options", {})
+        options = getattr(step, "options", None) or {}
 
-        # Determine connector type based on file extension
-        if destination_path.endswith(".csv"):
+        # Determine connector type based on scheme, then file extension
+        if destination_path.startswith("s3://"):
+            connector_type = "s3"
+        elif destination_path.endswith(".csv"):
             connector_type = "csv"
         elif destination_path.endswith(".parquet"):
             connector_type = "parquet"
@@ -152,6 +210,8 @@ class ExportStepExecutor(BaseStepExecutor):
             "format": export_format,
             **options,
         }
+        if connector_type == "s3":
+            resolved_config["uri"] = destination_path
 
         return context.connector_registry.create_destination_connector(
             connector_type, resolved_config
@@ -159,8 +219,9 @@ class ExportStepExecutor(BaseStepExecutor):
 
     def _observability_scope(self, context: ExecutionContext, scope_name: str):
         """Create observability scope for measurements."""
-        if hasattr(context, "observability") and context.observability is not None:
-            return context.observability.measure_scope(scope_name)
+        observability = getattr(context, "observability", None)
+        if observability is not None and hasattr(observability, "measure_scope"):
+            return observability.measure_scope(scope_name)
         else:
             # Fallback no-op context manager
             return nullcontext()
@@ -9,15 +9,21 @@ Following Raymond Hettinger's guidance:
 """
 
 import time
+import uuid
 from dataclasses import dataclass
-from typing import Any, Dict, List, Tuple
+from itertools import chain
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
 
+import pandas as pd
+import pyarrow as pa
+
+from sqlflow.connectors.data_chunk import DataChunk
 from sqlflow.logging import get_logger
 
 from ..protocols.core import ExecutionContext, Step
 from ..results.models import StepResult
 from .base import BaseStepExecutor
-from .definitions import LoadStep
+from .definitions import LoadMode, LoadStep
 
 logger = get_logger(__name__)
 
@@ -95,6 +101,131 @@ def create_connector(step: LoadStep, context: ExecutionContext):
     return connector_registry.create_source_connector(connector_type, configuration)
 
 
+def get_stream_batch_size(context: ExecutionContext, source_name: str) -> Optional[int]:
+    """Get the configured streaming batch size for a source, if any."""
+    source_definition = get_source_definition(context, source_name)
+    batch_size = source_definition.get("configuration", {}).get("batch_size")
+    return batch_size if isinstance(batch_size, int) and batch_size > 0 else None
+
+
+def get_native_scan_query(step: LoadStep, context: ExecutionContext) -> Optional[str]:
+    """Get an engine-native file scan for the step's source, if it has one.
+
+    UPSERT needs the source rows twice, so it keeps the connector path.
+    """
+    if step.mode == LoadMode.UPSERT:
+        return None
+
+    native_scan_query = getattr(context.engine, "native_scan_query", None)
+    source_definition = get_source_definition(context, step.source)
+    if native_scan_query is None or not source_definition:
+        return None
+
+    query = native_scan_query(
+        source_definition.get("connector_type", ""),
+        source_definition.get("configuration", {}),
+    )
+    return query if isinstance(query, str) else None
+
+
+def load_scan_to_table(
+    engine: Any, scan_query: str, target_table: str, load_mode: str
+) -> int:
+    """Handle REPLACE/APPEND straight from a native scan - no Python data path."""
+    if load_mode == "APPEND" and engine.table_exists(target_table):
+        result = engine.execute_query(f"INSERT INTO {target_table} {scan_query}")
+    else:
+        if load_mode != "APPEND":
+            engine.execute_query(f"DROP TABLE IF EXISTS {target_table}")
+        result = engine.execute_query(f"CREATE TABLE {target_table} AS {scan_query}")
+    return result.fetchone()[0]
+
+
+def read_source_data(connector: Any, batch_size: Optional[int]) -> Any:
+    """Read from the connector, requesting batches when a batch size is set."""
+    if batch_size:
+        return connector.read(batch_size=batch_size)
+    return connector.read()
+
+
+def iter_record_batches(data: Any) -> Iterator[pa.RecordBatch]:
+    """Normalize connector output into Arrow record batches - lazy generator.
+
+    Accepts a single DataFrame/DataChunk/Arrow object or an iterator of them,
+    so that at most one connector chunk is materialized at a time.
+    """
+    single_types = (pd.DataFrame, DataChunk, pa.Table, pa.RecordBatch)
+    items = [data] if isinstance(data, single_types) else data
+
+    for item in items:
+        if isinstance(item, pa.RecordBatch):
+            yield item
+        elif isinstance(item, pa.Table):
+            yield from item.to_batches()
+        elif isinstance(item, DataChunk):
+            yield from item.arrow_table.to_batches()
+        elif isinstance(item, pd.DataFrame):
+            yield from pa.Table.from_pandas(item, preserve_index=False).to_batches()
+        else:
+            raise ValueError(f"Unsupported data chunk type: {type(item)}")
+
+
+def conform_batch(batch: pa.RecordBatch, schema: pa.Schema) -> List[pa.RecordBatch]:
+    """Cast a batch to the stream schema, e.g. when chunk type inference drifts."""
+    try:
+        table = pa.Table.from_batches([batch]).select(schema.names).cast(schema)
+    except (KeyError, pa.ArrowInvalid, pa.ArrowNotImplementedError) as e:
+        raise ValueError(
+            f"Batch schema does not match stream schema: {batch.schema} vs {schema}"
+        ) from e
+    return table.to_batches()
+
+
+def create_record_batch_reader(
+    batches: Iterator[pa.RecordBatch],
+    on_batch: Optional[Callable[[pa.RecordBatch], None]] = None,
+) -> Optional[pa.RecordBatchReader]:
+    """Wrap a batch iterator in a RecordBatchReader.
+
+    The schema is taken from the first batch; later batches are conformed to it.
+
+    Returns:
+        RecordBatchReader, or None if the iterator yields no batches
+    """
+    batches = iter(batches)
+    first_batch = next(batches, None)
+    if first_batch is None:
+        return None
+    schema = first_batch.schema
+
+    def conformed_batches() -> Iterator[pa.RecordBatch]:
+        for batch in chain([first_batch], batches):
+            if batch.schema.equals(schema):
+                parts = [batch]
+            else:
+                parts = conform_batch(batch, schema)
+            for part in parts:
+                if on_batch is not None:
+                    on_batch(part)
+                yield part
+
+    return pa.RecordBatchReader.from_batches(schema, conformed_batches())
+
+
+@dataclass
+class StreamStats:
+    """Running totals for a streamed load."""
+
+    rows: int = 0
+    bytes: int = 0
+    batches: int = 0
+
+    def add(self, batch: pa.RecordBatch) -> None:
+        self.rows += batch.num_rows
+        self.bytes += batch.nbytes
+        self.batches += 1
+
+
 def load_data_replace(engine: Any, data: Any, target_table: str, temp_view: str) -> int:
     """Handle REPLACE load mode - pure business logic."""
     engine.execute_query(f"DROP TABLE IF EXISTS {target_table}")
@@ -163,11 +294,6 @@ def load_dataframe_to_table(
     if not engine:
         raise ValueError("No database engine available")
 
-    try:
-        import pandas as pd
-    except ImportError:
-        raise RuntimeError("pandas is required for DataFrame operations")
-
     if not isinstance(data, pd.DataFrame):
         raise ValueError("Expected pandas DataFrame")
 
@@ -201,6 +327,108 @@ def load_dataframe_to_table(
         engine.execute_query(f"DROP VIEW IF EXISTS {temp_view}")
 
 
+def scratch_view_name(kind: str) -> str:
+    """Get a unique view name that is valid however the target is qualified."""
+    return f"sqlflow_{kind}_{uuid.uuid4().hex}"
+
+
+def get_arrow_connection(engine: Any) -> Any:
+    """Get the DuckDB connection used to register Arrow streams."""
+    connection = getattr(engine, "connection", None)
+    if connection is None or not hasattr(connection, "register"):
+        raise RuntimeError("Database engine does not support Arrow stream registration")
+    return connection
+
+
+def stream_reader_to_table(
+    engine: Any, reader: pa.RecordBatchReader, target_table: str, load_mode: str
+) -> None:
+    """Handle REPLACE/APPEND by scanning the reader in a single statement.
+
+    DuckDB pulls batches from the reader as it inserts, so only the batches
+    in flight are held in memory.
+    """
+    connection = get_arrow_connection(engine)
+    stream_view = scratch_view_name("stream")
+    connection.register(stream_view, reader)
+
+    try:
+        if load_mode == "APPEND" and engine.table_exists(target_table):
+            engine.execute_query(
+                f"INSERT INTO {target_table} SELECT * FROM {stream_view}"
+            )
+        else:
+            if load_mode != "APPEND":
+                engine.execute_query(f"DROP TABLE IF EXISTS {target_table}")
+            engine.execute_query(
+                f"CREATE TABLE {target_table} AS SELECT * FROM {stream_view}"
+            )
+    finally:
+        connection.unregister(stream_view)
+
+
+def upsert_reader_batches(
+    engine: Any,
+    reader: pa.RecordBatchReader,
+    target_table: str,
+    upsert_keys: List[str],
+) -> None:
+    """Handle UPSERT one batch at a time - each batch is scanned twice."""
+    connection = get_arrow_connection(engine)
+
+    for batch in reader:
+        batch_view = scratch_view_name("batch")
+        connection.register(batch_view, pa.Table.from_batches([batch]))
+        try:
+            load_data_upsert(engine, batch, target_table, batch_view, upsert_keys)
+        finally:
+            connection.unregister(batch_view)
+
+
+def load_batches_to_table(
+    data: Any,
+    target_table: str,
+    load_mode: str,
+    step: LoadStep,
+    context: ExecutionContext,
+) -> StreamStats:
+    """Stream connector chunks into a table as Arrow batches - focused function.
+
+    Peak memory is bounded by the batches in flight rather than the whole
+    source. Rows and bytes per batch are reported to observability.
+    """
+    engine = context.engine
+    if not engine:
+        raise ValueError("No database engine available")
+
+    stats = StreamStats()
+    observability = getattr(context, "observability", None)
+
+    def on_batch(batch: pa.RecordBatch) -> None:
+        stats.add(batch)
+        if observability is not None and hasattr(observability, "record_batch"):
+            observability.record_batch(step.id, batch.num_rows, batch.nbytes)
+
+    reader = create_record_batch_reader(iter_record_batches(data), on_batch)
+    if reader is None:
+        logger.warning(f"Source '{step.source}' produced no data for {target_table}")
+        return stats
+
+    mode = load_mode.upper()
+    if mode == "UPSERT":
+        upsert_reader_batches(engine, reader, target_table, get_upsert_keys(step))
+    else:
+        stream_reader_to_table(
+            engine, reader, target_table, "APPEND" if mode == "APPEND" else "REPLACE"
+        )
+
+    logger.debug(
+        f"Streamed {stats.rows} rows ({stats.bytes} bytes) in "
+        f"{stats.batches} batches to {target_table}"
+    )
+    return stats
+
+
 @dataclass
 class LoadStepExecutor(BaseStepExecutor):
     """Executes load steps using functional decomposition.
@@ -242,14 +470,19 @@ class LoadStepExecutor(BaseStepExecutor):
             source, target_table, load_mode = extract_load_details(step)
             validate_load_inputs(source, target_table)
 
-            # Create connector and load data
-            connector = create_connector(step, context)
-            data = connector.read()
-
-            # Load data using functional approach
-            rows_loaded = load_dataframe_to_table(
-                data, target_table, load_mode, step, context
-            )
+            # Local files the engine can scan itself skip the connector
+            scan_query = get_native_scan_query(step, context)
+            rows_loaded = None
+            if scan_query is not None:
+                rows_loaded = self._load_from_scan(
+                    context, scan_query, target_table, load_mode
+                )
+            if rows_loaded is not None:
+                metadata: Dict[str, Any] = {"native_scan": True}
+            else:
+                rows_loaded, metadata = self._load_from_connector(
+                    step, context, source, target_table, load_mode
+                )
 
             execution_time = time.time() - start_time
 
@@ -260,9 +493,63 @@ class LoadStepExecutor(BaseStepExecutor):
                 execution_time=execution_time,
                 rows_affected=rows_loaded,
                 table_name=target_table,
+                metadata=metadata,
             )
 
         except Exception as error:
             execution_time = time.time() - start_time
             logger.error(f"Load step {step_id} failed: {error}")
             return self._handle_execution_error(step_id, error, execution_time)
+
+    def _load_from_scan(
+        self,
+        context: ExecutionContext,
+        scan_query: str,
+        target_table: str,
+        load_mode: str,
+    ) -> Optional[int]:
+        """Load a native scan, or return None if its sniffed types do not fit.
+
+        read_csv sniffs column types from a sample of the file, so a value
+        further down may not convert. The connector reads such files instead.
+        """
+        import duckdb
+
+        try:
+            return load_scan_to_table(
+                context.engine, scan_query, target_table, load_mode.upper()
+            )
+        except duckdb.ConversionException as error:
+            logger.info(
+                f"Native scan of {target_table} failed, loading through the "
+                f"connector: {error}"
+            )
+            return None
+
+    def _load_from_connector(
+        self,
+        step: LoadStep,
+        context: ExecutionContext,
+        source: str,
+        target_table: str,
+        load_mode: str,
+    ) -> Tuple[int, Dict[str, Any]]:
+        """Read the source through its connector and load the data."""
+        connector = create_connector(step, context)
+        batch_size = get_stream_batch_size(context, source)
+        data = read_source_data(connector, batch_size)
+
+        # Load data using functional approach - stream anything that
+        # is not already a single in-memory DataFrame
+        if isinstance(data, pd.DataFrame):
+            rows_loaded = load_dataframe_to_table(
+                data, target_table, load_mode, step, context
+            )
+            return rows_loaded, {}
+
+        stats = load_batches_to_table(data, target_table, load_mode, step, context)
+        return stats.rows, {
+            "streamed": True,
+            "batches": stats.batches,
+            "bytes_loaded": stats.bytes,
+        }
@@ -0,0 +1,423 @@
+"""Compact directed graph for dependency analysis.
+
+Planner steps, pipelines, visualizer nodes and table UDFs are all ordered by
+the same kind of graph. This module stores such a graph once, with names
+mapped to integer IDs and edges kept as adjacency lists of integers, and
+runs every analysis over it without recursion:
+
+- Strongly connected components (Tarjan), computed once and cached
+- Cycle reporting, one simple cycle per cyclic component
+- Dependencies-first ordering from a set of roots
+- Transitive closures, kept as integer bitsets over components
+
+All analyses are O(V + E), except closures which add one bitset union per
+edge of the component graph. Caches are dropped when the graph changes.
+"""
+
+from collections import deque
+from typing import Dict, Iterable, List, Mapping, Optional, Set, Tuple
+
+from sqlflow.core.errors import CircularDependencyError
+
+
+class DependencyGraph:
+    """Directed graph over named nodes with cached structural analyses.
+
+    An edge from A to B means A depends on B, so ordering methods return
+    B before A.
+    """
+
+    def __init__(self):
+        """Initialize an empty DependencyGraph."""
+        self._ids: Dict[str, int] = {}
+        self._names: List[str] = []
+        self._successors: List[List[int]] = []
+        self._component_of: Optional[List[int]] = None
+        self._components: Optional[List[List[int]]] = None
+        self._closures: Optional[List[int]] = None
+
+    @classmethod
+    def from_mapping(
+        cls, dependencies: Mapping[str, Iterable[str]], known_only: bool = False
+    ) -> "DependencyGraph":
+        """Build a graph from a mapping of node to the nodes it depends on.
+
+        Args:
+        ----
+            dependencies: Dependencies by node
+            known_only: Drop edges to nodes that are not keys of the mapping
+
+        Returns:
+        -------
+            The graph
+
+        """
+        graph = cls()
+        for node in dependencies:
+            graph.add_node(node)
+        for node, targets in dependencies.items():
+            for target in targets:
+                if not known_only or target in dependencies:
+                    graph.add_edge(node, target)
+        return graph
+
+    @classmethod
+    def from_edges(
+        cls, edges: Iterable[Tuple[str, str]], nodes: Iterable[str] = ()
+    ) -> "DependencyGraph":
+        """Build a graph from (source, target) pairs and optional lone nodes.
+
+        Args:
+        ----
+            edges: Edges as (source, target) pairs
+            nodes: Nodes to add first, in order
+
+        Returns:
+        -------
+            The graph
+
+        """
+        graph = cls()
+        for node in nodes:
+            graph.add_node(node)
+        for source, target in edges:
+            graph.add_edge(source, target)
+        return graph
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+    def __contains__(self, node: object) -> bool:
+        return node in self._ids
+
+    @property
+    def nodes(self) -> List[str]:
+        """Node names in insertion order."""
+        return list(self._names)
+
+    def add_node(self, node: str) -> int:
+        """Add a node if it is new.
+
+        Args:
+        ----
+            node: Node name
+
+        Returns:
+        -------
+            Integer ID of the node
+
+        """
+        node_id = self._ids.get(node)
+        if node_id is None:
+            node_id = len(self._names)
+            self._ids[node] = node_id
+            self._names.append(node)
+            self._successors.append([])
+            self._invalidate()
+        return node_id
+
+    def add_edge(self, source: str, target: str) -> None:
+        """Add an edge, meaning source depends on target.
+
+        Args:
+        ----
+            source: Dependent node
+            target: Node depended on
+
+        """
+        source_id = self.add_node(source)
+        target_id = self.add_node(target)
+        self._successors[source_id].append(target_id)
+        self._invalidate()
+
+    def successors(self, node: str) -> List[str]:
+        """Get the direct dependencies of a node, in insertion order."""
+        node_id = self._ids.get(node)
+        if node_id is None:
+            return []
+        return [self._names[target] for target in self._successors[node_id]]
+
+    def _invalidate(self) -> None:
+        self._component_of = None
+        self._components = None
+        self._closures = None
+
+    # --- STRONGLY CONNECTED COMPONENTS ---
+    def strongly_connected_components(self) -> List[List[str]]:
+        """Get strongly connected components, dependencies before dependents.
+
+        Returns
+        -------
+            Components as lists of node names
+
+        """
+        return [[self._names[i] for i in comp] for comp in self._get_components()]
+
+    def _get_components(self) -> List[List[int]]:
+        if self._components is None:
+            self._component_of, self._components = self._tarjan()
+        return self._components
+
+    def _tarjan(self) -> Tuple[List[int], List[List[int]]]:
+        """Iterative Tarjan SCC; components come out in reverse topological order."""
+        return _TarjanSearch(self._successors).run()
+
+    # --- CYCLES ---
+    def _is_cyclic(self, component: List[int]) -> bool:
+        if len(component) > 1:
+            return True
+        node = component[0]
+        return node in self._successors[node]
+
+    def has_cycles(self) -> bool:
+        """Check whether any node depends on itself, directly or not."""
+        return any(self._is_cyclic(comp) for comp in self._get_components())
+
+    def find_cycles(self) -> List[List[str]]:
+        """Find one simple cycle per cyclic component.
+
+        Each cycle is a shortest one through the earliest added node of its
+        component, starts at that node and follows dependency edges; the
+        starting node is not repeated at the end. Cycles are ordered by their
+        starting node.
+
+        Returns
+        -------
+            Cycles as lists of node names
+
+        """
+        self._get_components()
+        cycles = []
+        for component in self._components:
+            if self._is_cyclic(component):
+                # Components are sorted, so component[0] was added first
+                cycles.append(self._shortest_cycle(component[0]))
+        cycles.sort(key=lambda cycle: cycle[0])
+        return [[self._names[i] for i in cycle] for cycle in cycles]
+
+    def cycle_through(self, node: str) -> List[str]:
+        """Find a shortest cycle through a node.
+
+        Args:
+        ----
+            node: Node name
+
+        Returns:
+        -------
+            Node names from node along dependency edges back to it, without
+            repeating node; empty if node is not on a cycle
+
+        """
+        node_id = self._ids.get(node)
+        if node_id is None:
+            return []
+        self._get_components()
+        return [self._names[i] for i in self._shortest_cycle(node_id)]
+
+    def _shortest_cycle(self, node_id: int) -> List[int]:
+        """Breadth-first search inside node_id's component back to node_id."""
+        component_id = self._component_of[node_id]
+        parents: Dict[int, int] = {node_id: node_id}
+        queue = deque([node_id])
+        while queue:
+            current = queue.popleft()
+            for target in self._successors[current]:
+                if target == node_id:
+                    return self._path_to(current, parents)
+                if self._component_of[target] == component_id and (
+                    target not in parents
+                ):
+                    parents[target] = current
+                    queue.append(target)
+        return []
+
+    def _path_to(self, node_id: int, parents: Dict[int, int]) -> List[int]:
+        """Nodes on the path from the search root to node_id."""
+        path = [node_id]
+        while parents[path[-1]] != path[-1]:
+            path.append(parents[path[-1]])
+        path.reverse()
+        return path
+
+    # --- ORDERING ---
+    def dependency_order(self, roots: Iterable[str]) -> List[str]:
+        """Order the nodes reachable from roots so dependencies come first.
+
+        Roots are visited in order and dependencies in insertion order, so
+        the result is a depth-first post-order and is stable across runs.
+
+        Args:
+        ----
+            roots: Nodes to start from; unknown names are returned as is
+
+        Returns:
+        -------
+            Node names, each after everything it depends on
+
+        Raises:
+        ------
+            CircularDependencyError: If a cycle is reachable from the roots,
+                reported as [node, ..., node]
+
+        """
+        successors = self._successors
+        # 0 = unvisited, 1 = on the current path, 2 = done
+        state = [0] * len(self._names)
+        order: List[str] = []
+        unknown_roots: Set[str] = set()
+
+        for root in roots:
+            root_id = self._ids.get(root)
+            if root_id is None:
+                if root not in unknown_roots:
+                    unknown_roots.add(root)
+                    order.append(root)
+                continue
+            if state[root_id] == 2:
+                continue
+
+            state[root_id] = 1
+            path = [root_id]
+            work = [(root_id, 0)]
+            while work:
+                node, position = work[-1]
+                if position < len(successors[node]):
+                    work[-1] = (node, position + 1)
+                    target = successors[node][position]
+                    if state[target] == 1:
+                        cycle = path[path.index(target) :] + [target]
+                        raise CircularDependencyError([self._names[i] for i in cycle])
+                    if state[target] == 0:
+                        state[target] = 1
+                        path.append(target)
+                        work.append((target, 0))
+                    continue
+                work.pop()
+                path.pop()
+                state[node] = 2
+                order.append(self._names[node])
+
+        return order
+
+    # --- TRANSITIVE CLOSURE ---
+    def _get_closures(self) -> List[int]:
+        """Bitsets of components reachable from each component, itself included."""
+        if self._closures is None:
+            components = self._get_components()
+            component_of = self._component_of
+            closures = [0] * len(components)
+            # Tarjan emits dependencies first, so their closures are ready
+            for component_id, component in enumerate(components):
+                reach = 1 << component_id
+                for node in component:
+                    for target in self._successors[node]:
+                        target_component = component_of[target]
+                        if target_component != component_id:
+                            reach |= closures[target_component]
+                closures[component_id] = reach
+            self._closures = closures
+        return self._closures
+
+    def depends_on(self, node: str, other: str) -> bool:
+        """Check whether node depends on other, directly or transitively."""
+        node_id = self._ids.get(node)
+        other_id = self._ids.get(other)
+        if node_id is None or other_id is None:
+            return False
+        if node_id == other_id:
+            return self._is_cyclic(self._get_components()[self._component_of[node_id]])
+        closures = self._get_closures()
+        return bool(
+            closures[self._component_of[node_id]] >> self._component_of[other_id] & 1
+        )
+
+    def transitive_dependencies(self, node: str) -> Set[str]:
+        """Get every node that node depends on, directly or transitively.
+
+        Args:
+        ----
+            node: Node name
+
+        Returns:
+        -------
+            Names of the nodes depended on; node itself only if on a cycle
+
+        """
+        node_id = self._ids.get(node)
+        if node_id is None:
+            return set()
+        closures = self._get_closures()
+        components = self._components
+        own_component = self._component_of[node_id]
+        reach = closures[own_component]
+
+        result: Set[str] = set()
+        for component_id, bit in enumerate(reversed(bin(reach)[2:])):
+            if bit == "1":
+                result.update(self._names[i] for i in components[component_id])
+        if not self._is_cyclic(components[own_component]):
+            result.discard(node)
+        return result
+
+
+class _TarjanSearch:
+    """State of one iterative run of Tarjan's SCC algorithm."""
+
+    def __init__(self, successors: List[List[int]]):
+        count = len(successors)
+        self.successors = successors
+        self.index = [-1] * count
+        self.low = [0] * count
+        self.on_stack = [False] * count
+        self.component_of = [-1] * count
+        self.components: List[List[int]] = []
+        self.stack: List[int] = []
+        self.counter = 0
+
+    def run(self) -> Tuple[List[int], List[List[int]]]:
+        for root in range(len(self.successors)):
+            if self.index[root] == -1:
+                self._visit(root)
+        return self.component_of, self.components
+
+    def _push(self, node: int) -> None:
+        self.index[node] = self.low[node] = self.counter
+        self.counter += 1
+        self.stack.append(node)
+        self.on_stack[node] = True
+
+    def _visit(self, root: int) -> None:
+        """Depth-first search from root with an explicit work stack."""
+        successors, index, low = self.successors, self.index, self.low
+        self._push(root)
+        work = [(root, 0)]
+        while work:
+            node, position = work[-1]
+            if position < len(successors[node]):
+                work[-1] = (node, position + 1)
+                target = successors[node][position]
+                if index[target] == -1:
+                    self._push(target)
+                    work.append((target, 0))
+                elif self.on_stack[target] and index[target] < low[node]:
+                    low[node] = index[target]
+                continue
+
+            work.pop()
+            if work and low[node] < low[work[-1][0]]:
+                low[work[-1][0]] = low[node]
+            if low[node] == index[node]:
+                self._pop_component(node)
+
+    def _pop_component(self, node: int) -> None:
+        """Pop the component rooted at node off the stack."""
+        component = []
+        while True:
+            member = self.stack.pop()
+            self.on_stack[member] = False
+            self.component_of[member] = len(self.components)
+            component.append(member)
+            if member == node:
+                break
+        component.sort()
+        self.components.append(component)
@@ -9,9 +9,9 @@ Following Zen of Python:
 - Practicality beats purity: Compatible with existing ExecutionPlanBuilder
 """
 
-import re
 from typing import Dict, List
 
+from sqlflow.core.sql_references import extract_table_references
 from sqlflow.logging import get_logger
 from sqlflow.parser.ast import (
     ExportStep,
@@ -198,90 +198,10 @@ class DependencyAnalyzer(IDependencyAnalyzer):
     def _extract_referenced_tables(self, sql_query: str) -> List[str]:
         """Extract table names referenced in SQL query.
 
-        Following Zen of Python: Simple is better than complex.
-        But also: Practicality beats purity - avoid false positives from aliases.
-        """
-        sql_lower = sql_query.lower()
-        tables = []
-
-        # DuckDB built-in functions that are not table references
-        builtin_functions = {
-            "read_csv_auto",
-            "read_csv",
-            "read_parquet",
-            "read_json",
-            "information_schema",
-            "pg_catalog",
-            "main",
-        }
-
-        # Extract table aliases to avoid false positives
-        table_aliases = self._extract_table_aliases(sql_lower)
-
-        # Handle standard SQL FROM clauses with optional aliases
-        # Pattern: FROM table_name [AS] alias
-        from_matches = re.finditer(
-            r"from\s+([a-zA-Z0-9_]+)(?:\s+(?:as\s+)?[a-zA-Z0-9_]+)?", sql_lower
-        )
-        for match in from_matches:
-            table_name = match.group(1).strip()
-            if (
-                table_name
-                and table_name not in tables
-                and table_name not in builtin_functions
-                and len(table_name) > 1  # Avoid single-letter false positives
-            ):
-                tables.append(table_name)
-
-        # Handle standard SQL JOINs with optional aliases
-        # Pattern: JOIN table_name [AS] alias
-        join_matches = re.finditer(
-            r"join\s+([a-zA-Z0-9_]+)(?:\s+(?:as\s+)?[a-zA-Z0-9_]+)?", sql_lower
-        )
-        for match in join_matches:
-            table_name = match.group(1).strip()
-            if (
-                table_name
-                and table_name not in tables
-                and table_name not in builtin_functions
-                and table_name not in table_aliases  # Skip if it's an alias
-                and len(table_name) > 1  # Avoid single-letter false positives
-            ):
-                tables.append(table_name)
-
-        # Note: PYTHON_FUNC patterns are not included because they typically reference
-        # columns, not tables. Table dependencies for UDFs should be handled through
-        # the FROM clause analysis above.
-
-        return tables
-
-    def _extract_table_aliases(self, sql_lower: str) -> set:
-        """Extract table aliases from SQL to avoid false positives.
-
-        Following Zen of Python: Simple is better than complex.
-        Basic alias extraction to improve table detection accuracy.
+        Following Zen of Python: There should be one obvious way to do it.
+        Uses the same tokenizer-based extraction as the rest of the planner.
         """
-        aliases = set()
-
-        # Pattern: FROM table_name [AS] alias
-        from_alias_matches = re.finditer(
-            r"from\s+[a-zA-Z0-9_]+\s+(?:as\s+)?([a-zA-Z0-9_]+)", sql_lower
-        )
-        for match in from_alias_matches:
-            alias = match.group(1).strip()
-            if alias and len(alias) <= 3:  # Short aliases are common (s, st, etc.)
-                aliases.add(alias)
-
-        # Pattern: JOIN table_name [AS] alias
-        join_alias_matches = re.finditer(
-            r"join\s+[a-zA-Z0-9_]+\s+(?:as\s+)?([a-zA-Z0-9_]+)", sql_lower
-        )
-        for match in join_alias_matches:
-            alias = match.group(1).strip()
-            if alias and len(alias) <= 3:  # Short aliases are common
-                aliases.add(alias)
-
-        return aliases
+        return extract_table_references(sql_query)
 
     def _add_dependency(
         self, dependent_step: PipelineStep, dependency_step: PipelineStep
@@ -91,43 +91,9 @@ class ExecutionOrderResolver(IExecutionOrderResolver):
         """Detect cycles in the dependency graph.
 
         Following Zen of Python: Explicit is better than implicit.
-        Clear cycle detection using depth-first search.
+        One cycle per group of mutually dependent steps, found in linear time.
         """
-        visited = set()
-        rec_stack = set()
-        cycles = []
-
-        def dfs(node):
-            if node in rec_stack:
-                # Found a cycle, but we need to extract it
-                # For now, just return the problematic node
-                return [node]
-            if node in visited:
-                return []
-
-            visited.add(node)
-            rec_stack.add(node)
-
-            for neighbor in resolver.dependencies.get(node, []):
-                cycle = dfs(neighbor)
-                if cycle:
-                    if node not in cycle:
-                        cycle.append(node)
-                    cycles.append(cycle)
-
-            rec_stack.remove(node)
-            return []
-
-        # Get all nodes from the dependencies dict
-        all_nodes = set(resolver.dependencies.keys())
-        for deps in resolver.dependencies.values():
-            all_nodes.update(deps)
-
-        for node in all_nodes:
-            if node not in visited:
-                dfs(node)
-
-        return cycles
+        return resolver.find_cycles()
 
     def _format_cycle_error(self, cycles: List[List[str]]) -> str:
         """Format cycle detection error message.
@@ -180,21 +146,7 @@ class ExecutionOrderResolver(IExecutionOrderResolver):
         Following Zen of Python: Explicit is better than implicit.
         Clear execution order building from dependency resolution.
         """
-        execution_order = []
-
-        for entry_point in entry_points:
-            if entry_point in execution_order:
-                continue
-
-            # Get topological order starting from this entry point
-            step_order = resolver.resolve_dependencies(entry_point)
-
-            # Add steps to execution order if not already present
-            for step_id in step_order:
-                if step_id not in execution_order:
-                    execution_order.append(step_id)
-
-        return execution_order
+        return list(resolver.resolve_order(entry_points))
 
     def _ensure_all_steps_included(
         self, execution_order: List[str], all_step_ids: List[str]
@@ -204,7 +156,9 @@ class ExecutionOrderResolver(IExecutionOrderResolver):
         Following Zen of Python: Explicit is better than implicit.
         Clear verification that all steps are included.
         """
+        included = set(execution_order)
         for step_id in all_step_ids:
-            if step_id not in execution_order:
+            if step_id not in included:
                 logger.debug(f"Adding missing step to execution order: {step_id}")
+                included.add(step_id)
                 execution_order.append(step_id)
@@ -0,0 +1,222 @@
+"""Level-based parallel schedule for execution plans.
+
+The planner emits steps in one linear order, but most pipelines are wide:
+independent loads and transforms could run side by side. This module
+annotates each step of a plan with:
+
+- depends_on: the explicit list of steps it must wait for, including the
+  implicit ordering between steps that write the same table
+- wave: its topological level; all steps of a wave can run concurrently
+  once the previous waves are done
+- estimated_seconds: a cost hint from past run durations or source size
+- on_critical_path: whether it lies on the longest path through the plan
+
+Following Zen of Python:
+- Explicit is better than implicit: Concurrency is recorded in the plan
+- Practicality beats purity: Cost hints are estimates, not guarantees
+"""
+
+import heapq
+import os
+from typing import Any, Dict, List, Optional
+
+from sqlflow.logging import get_logger
+
+logger = get_logger(__name__)
+
+# Cost of a step without a past duration or a known source size
+DEFAULT_STEP_SECONDS = 1.0
+
+# Rough local read throughput used to turn source file sizes into seconds
+DEFAULT_BYTES_PER_SECOND = 50 * 1024 * 1024
+
+
+def annotate_schedule(
+    operations: List[Dict[str, Any]],
+    step_durations: Optional[Dict[str, float]] = None,
+) -> List[Dict[str, Any]]:
+    """Add dependency, wave and critical-path fields to plan steps in place.
+
+    Args:
+    ----
+        operations: Execution plan steps
+        step_durations: Past durations in seconds by step ID
+
+    Returns:
+    -------
+        The same operations, annotated
+
+    """
+    _add_write_order_dependencies(operations)
+    costs = estimate_step_costs(operations, step_durations)
+    order = _topological_order(operations)
+    by_id = {op["id"]: op for op in operations}
+
+    waves: Dict[str, int] = {}
+    finish: Dict[str, float] = {}
+    critical_parent: Dict[str, Optional[str]] = {}
+    for step_id in order:
+        # Only dependencies already placed: unknown steps and cycles are ignored
+        deps = [dep for dep in by_id[step_id]["depends_on"] if dep in waves]
+        waves[step_id] = 1 + max((waves[dep] for dep in deps), default=-1)
+        parent = max(deps, key=lambda dep: finish[dep], default=None)
+        critical_parent[step_id] = parent
+        finish[step_id] = costs[step_id] + (finish[parent] if parent else 0.0)
+
+    critical_path = set()
+    step_id = max(finish, key=finish.get, default=None)
+    while step_id is not None:
+        critical_path.add(step_id)
+        step_id = critical_parent[step_id]
+
+    for op in operations:
+        op["wave"] = waves[op["id"]]
+        op["estimated_seconds"] = round(costs[op["id"]], 3)
+        op["on_critical_path"] = op["id"] in critical_path
+
+    return operations
+
+
+def summarize_schedule(operations: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Summarize the schedule of an annotated plan.
+
+    Args:
+    ----
+        operations: Plan steps annotated by annotate_schedule
+
+    Returns:
+    -------
+        Dict with the steps of each wave, the critical path in execution
+        order and its estimated duration in seconds
+
+    """
+    waves: List[List[str]] = []
+    for op in operations:
+        wave = op.get("wave")
+        if wave is None:
+            continue
+        while len(waves) <= wave:
+            waves.append([])
+        waves[wave].append(op["id"])
+
+    critical = sorted(
+        (op for op in operations if op.get("on_critical_path")),
+        key=lambda op: op["wave"],
+    )
+    return {
+        "waves": waves,
+        "critical_path": [op["id"] for op in critical],
+        "critical_path_seconds": round(
+            sum(op.get("estimated_seconds", 0.0) for op in critical), 3
+        ),
+    }
+
+
+def estimate_step_costs(
+    operations: List[Dict[str, Any]],
+    step_durations: Optional[Dict[str, float]] = None,
+) -> Dict[str, float]:
+    """Estimate the cost in seconds of each plan step.
+
+    Past durations win; loads from local files are estimated from the
+    file size; everything else gets DEFAULT_STEP_SECONDS.
+
+    Args:
+    ----
+        operations: Execution plan steps
+        step_durations: Past durations in seconds by step ID
+
+    Returns:
+    -------
+        Estimated seconds by step ID
+
+    """
+    step_durations = step_durations or {}
+    source_paths = {
+        op.get("name"): (op.get("query") or {}).get("path")
+        for op in operations
+        if op.get("type") == "source_definition" and isinstance(op.get("query"), dict)
+    }
+
+    costs = {}
+    for op in operations:
+        step_id = op["id"]
+        if step_id in step_durations:
+            costs[step_id] = float(step_durations[step_id])
+        elif op.get("type") == "load":
+            costs[step_id] = _estimate_load_seconds(
+                source_paths.get(op.get("source_name"))
+            )
+        else:
+            costs[step_id] = DEFAULT_STEP_SECONDS
+    return costs
+
+
+def _estimate_load_seconds(path: Optional[str]) -> float:
+    """Estimate a load from the size of its local source file, if any."""
+    if not isinstance(path, str) or not os.path.isfile(path):
+        return DEFAULT_STEP_SECONDS
+    size = os.path.getsize(path)
+    return max(DEFAULT_STEP_SECONDS, size / DEFAULT_BYTES_PER_SECOND)
+
+
+def _add_write_order_dependencies(operations: List[Dict[str, Any]]) -> None:
+    """Make depends_on explicit, chaining steps that write the same table.
+
+    Several LOADs into one table, or CREATE followed by CREATE OR REPLACE,
+    must keep their plan order even though neither reads the other.
+    """
+    last_writer: Dict[str, str] = {}
+    for op in operations:
+        depends_on = list(dict.fromkeys(op.get("depends_on") or []))
+        target = _written_table(op)
+        if target is not None:
+            previous = last_writer.get(target)
+            if previous is not None and previous not in depends_on:
+                depends_on.append(previous)
+            last_writer[target] = op["id"]
+        op["depends_on"] = depends_on
+
+
+def _written_table(op: Dict[str, Any]) -> Optional[str]:
+    if op.get("type") == "load":
+        return op.get("target_table") or op.get("name")
+    if op.get("type") == "transform":
+        return op.get("name")
+    return None
+
+
+def _topological_order(operations: List[Dict[str, Any]]) -> List[str]:
+    """Order step IDs so dependencies come first, keeping plan order on ties.
+
+    Dependencies on unknown steps are ignored. Steps left over by a cycle,
+    which the planner rejects earlier, are appended in plan order.
+    """
+    ids = [op["id"] for op in operations]
+    known = set(ids)
+    remaining = {
+        op["id"]: sum(1 for dep in set(op["depends_on"]) if dep in known)
+        for op in operations
+    }
+    dependents: Dict[str, List[str]] = {step_id: [] for step_id in ids}
+    for op in operations:
+        for dep in set(op["depends_on"]):
+            if dep in known:
+                dependents[dep].append(op["id"])
+
+    position = {step_id: i for i, step_id in enumerate(ids)}
+    ready = [(i, step_id) for i, step_id in enumerate(ids) if remaining[step_id] == 0]
+    order: List[str] = []
+    while ready:
+        _, step_id = heapq.heappop(ready)
+        order.append(step_id)
+        for dependent in dependents[step_id]:
+            remaining[dependent] -= 1
+            if remaining[dependent] == 0:
+                heapq.heappush(ready, (position[dependent], dependent))
+
+    if len(order) < len(ids):
+        logger.warning("Plan has cyclic dependencies; waves may be inaccurate")
+        done = set(order)
+        order.extend(step_id for step_id in ids if step_id not in done)
+    return order
@@ -10,6 +10,7 @@ from typing import Any, Dict, List, Optional, Set
 from sqlflow.core.dependencies import DependencyResolver
 from sqlflow.core.errors import PlanningError
 from sqlflow.core.evaluator import ConditionEvaluator, EvaluationError
+from sqlflow.core.graph import DependencyGraph
 from sqlflow.core.planner.dependency_analyzer import DependencyAnalyzer
 from sqlflow.core.planner.factory import PlannerConfig, PlannerFactory
 from sqlflow.core.planner.interfaces import (
@@ -18,12 +19,11 @@ from sqlflow.core.planner.interfaces import (
     IStepBuilder,
 )
 from sqlflow.core.planner.order_resolver import ExecutionOrderResolver
+from sqlflow.core.planner.schedule import annotate_schedule
 from sqlflow.core.planner.step_builder import StepBuilder
-from sqlflow.core.variables import (
-    find_variables,
-    resolve_variables,
-    substitute_variables,
-)
+from sqlflow.core.sql_references import extract_table_references
+from sqlflow.core.table_suggestions import TableNameSuggester
+from sqlflow.core.variables import compile_template, resolve_variables
 from sqlflow.logging import get_logger
 from sqlflow.parser.ast import (
     ConditionalBlockStep,
@@ -784,60 +784,7 @@ class ExecutionPlanBuilder:
             raise PlanningError(error_msg)
 
     def _extract_referenced_tables(self, sql_query: str) -> List[str]:
-        sql_lower = sql_query.lower()
-        tables = []
-
-        # DuckDB built-in functions that are not table references
-        builtin_functions = {
-            "read_csv_auto",
-            "read_csv",
-            "read_parquet",
-            "read_json",
-            "information_schema",
-            "pg_catalog",
-            "main",
-        }
-
-        # Handle standard SQL FROM clauses
-        from_matches = re.finditer(
-            r"from\s+([a-zA-Z0-9_]+(?:\s*,\s*[a-zA-Z0-9_]+)*)", sql_lower
-        )
-        for match in from_matches:
-            table_list = match.group(1).split(",")
-            for table in table_list:
-                table_name = table.strip()
-                if (
-                    table_name
-                    and table_name not in tables
-                    and table_name not in builtin_functions
-                ):
-                    tables.append(table_name)
-
-        # Handle standard SQL JOINs
-        join_matches = re.finditer(r"join\s+([a-zA-Z0-9_]+)", sql_lower)
-        for match in join_matches:
-            table_name = match.group(1).strip()
-            if (
-                table_name
-                and table_name not in tables
-                and table_name not in builtin_functions
-            ):
-                tables.append(table_name)
-
-        # Handle table UDF pattern: PYTHON_FUNC("module.function", table_name)
-        udf_table_matches = re.finditer(
-            r"python_func\s*\(\s*['\"][\w\.]+['\"]\s*,\s*([a-zA-Z0-9_]+)", sql_lower
-        )
-        for match in udf_table_matches:
-            table_name = match.group(1).strip()
-            if (
-                table_name
-                and table_name not in tables
-                and table_name not in builtin_functions
-            ):
-                tables.append(table_name)
-
-        return tables
+        return extract_table_references(sql_query)
 
     def _find_table_references(
         self, step: PipelineStep, sql_query: str, table_to_step: Dict[str, PipelineStep]
@@ -891,15 +838,18 @@ class ExecutionPlanBuilder:
         likely_typos = []
         context_locations = {}
         suggestions_map = {}
+        suggester = TableNameSuggester(defined_tables)
 
         for table, step, line_number in self._undefined_tables:
             self._collect_table_context(table, step, line_number, context_locations)
 
-            if self._is_likely_typo(table, defined_tables):
+            # Very short names are common test tables, not typos
+            if len(table) <= 3:
+                continue
+            best_suggestion = suggester.suggest(table)
+            if best_suggestion:
                 likely_typos.append(table)
-                best_suggestion = self._find_best_suggestion(table, defined_tables)
-                if best_suggestion:
-                    suggestions_map[table] = best_suggestion
+                suggestions_map[table] = best_suggestion
 
         return {
             "likely_typos": likely_typos,
@@ -966,159 +916,17 @@ class ExecutionPlanBuilder:
 
     def _log_external_table_warnings(self, likely_typos: List[str]) -> None:
         """Log warnings for tables that might be external/intentional."""
+        typos = set(likely_typos)
         for table in set(table for table, _, _ in self._undefined_tables):
-            if table not in likely_typos:
+            if table not in typos:
                 logger.warning(
                     f"Table '{table}' is referenced but not defined - this might be an external table"
                 )
 
-    def _find_best_suggestion(
-        self, undefined_table: str, defined_tables: set
-    ) -> Optional[str]:
-        """Find the best suggestion for a typo among defined tables."""
-        best_match = None
-        best_score = float("inf")
-
-        for defined_table in defined_tables:
-            # Check if this matches our typo detection criteria
-            if self._tables_are_similar(undefined_table, defined_table):
-                # Use edit distance as score (lower is better)
-                score = self._edit_distance(undefined_table, defined_table)
-                if score < best_score:
-                    best_score = score
-                    best_match = defined_table
-
-        return best_match
-
-    def _tables_are_similar(self, table1: str, table2: str) -> bool:
-        """Check if two table names are similar enough to be considered typos.
-
-        Following Zen of Python: Simple is better than complex.
-        Practical patterns for real-world typos.
-        """
-        # Same length with small edit distance (1-2 character changes)
-        if abs(len(table1) - len(table2)) <= 2:
-            edit_dist = self._edit_distance(table1, table2)
-            if edit_dist <= 2:
-                return True
-
-        # ENHANCED: Common typo patterns (appending or removing suffixes)
-        # Examples: users_table vs users_table_failed, users_table_wrong, etc.
-        longer, shorter = (
-            (table1, table2) if len(table1) > len(table2) else (table2, table1)
-        )
-
-        if shorter in longer:
-            # Check if it's a suffix pattern
-            if longer.startswith(shorter):
-                suffix = longer[len(shorter) :]
-                # Common typo suffixes that people add when debugging/testing
-                common_suffixes = [
-                    "_failed",
-                    "_wrong",
-                    "_test",
-                    "_old",
-                    "_new",
-                    "_backup",
-                    "_temp",
-                    "_copy",
-                    "_typo",
-                    "_error",
-                    "_bad",
-                    "_fixed",
-                ]
-                if suffix in common_suffixes or (
-                    suffix.startswith("_") and len(suffix) <= 10
-                ):
-                    return True
-
-            # Check if it's a prefix pattern
-            if longer.endswith(shorter):
-                prefix = longer[: -len(shorter)]
-                # Common typo prefixes
-                if prefix.endswith("_") and len(prefix) <= 10:
-                    return True
-
-        # Check for single character insertions/deletions that are common typos
-        if abs(len(table1) - len(table2)) == 1:
-            edit_dist = self._edit_distance(table1, table2)
-            if edit_dist == 1:  # Single character difference
-                return True
-
-        return False
-
-    def _is_likely_typo(self, undefined_table: str, defined_tables: set) -> bool:
-        """Check if an undefined table is likely a typo of a defined table.
-
-        Following Zen of Python: Simple is better than complex.
-        Practicality beats purity - be conservative about flagging typos but catch obvious ones.
-
-        Only flag as typos when there's strong evidence:
-        1. Very close edit distance (1-2 characters different)
-        2. OR similar table names with common typo patterns (appending/removing suffixes)
-        3. BUT not very short table names (common test table names like 'data', 'users')
-        """
-        if not defined_tables:
-            return False
-
-        # Don't flag very short table names as typos (common test table names)
-        if len(undefined_table) <= 3:
-            return False
-
-        for defined_table in defined_tables:
-            # ENHANCED: Check for common typo patterns
-            if self._tables_are_similar(undefined_table, defined_table):
-                return True
-
-        return False
-
-    def _edit_distance(self, s1: str, s2: str) -> int:
-        """Calculate edit distance between two strings.
-
-        Following Zen of Python: Simple is better than complex.
-        Basic edit distance calculation for typo detection.
-        """
-        if len(s1) < len(s2):
-            return self._edit_distance(s2, s1)
-
-        if len(s2) == 0:
-            return len(s1)
-
-        previous_row = list(range(len(s2) + 1))
-        for i, c1 in enumerate(s1):
-            current_row = [i + 1]
-            for j, c2 in enumerate(s2):
-                insertions = previous_row[j + 1] + 1
-                deletions = current_row[j] + 1
-                substitutions = previous_row[j] + (c1 != c2)
-                current_row.append(min(insertions, deletions, substitutions))
-            previous_row = current_row
-
-        return previous_row[-1]
-
     # --- CYCLE DETECTION ---
     def _detect_cycles(self, resolver: DependencyResolver) -> List[List[str]]:
-        cycles = []
-        visited = set()
-        path = []
-
-        def dfs(node):
-            if node in path:
-                cycle_start = path.index(node)
-                cycles.append(path[cycle_start:] + [node])
-                return
-            if node in visited:
-                return
-            visited.add(node)
-            path.append(node)
-            for dep in resolver.dependencies.get(node, []):
-                dfs(dep)
-            path.pop()
-
-        for node in resolver.dependencies:
-            if node not in visited:
-                dfs(node)
-        return cycles
+        graph = DependencyGraph.from_mapping(resolver.dependencies)
+        return [cycle + [cycle[0]] for cycle in graph.find_cycles()]
 
     def _format_cycle_error(self, cycles: List[List[str]]) -> str:
         if not cycles:
@@ -1604,20 +1412,24 @@ class ExecutionPlanBuilder:
         self, resolver: DependencyResolver, entry_points: List[str]
     ) -> List[str]:
         execution_order = []
+        included = set()
         for entry_point in entry_points:
-            if entry_point in execution_order:
+            if entry_point in included:
                 continue
             step_order = resolver.resolve_dependencies(entry_point)
             for step_id in step_order:
-                if step_id not in execution_order:
+                if step_id not in included:
+                    included.add(step_id)
                     execution_order.append(step_id)
         return execution_order
 
     def _ensure_all_steps_included(
         self, execution_order: List[str], all_step_ids: List[str]
     ) -> None:
+        included = set(execution_order)
         for step_id in all_step_ids:
-            if step_id not in execution_order:
+            if step_id not in included:
+                included.add(step_id)
                 execution_order.append(step_id)
 
     def _build_execution_steps(
@@ -2063,14 +1875,20 @@ class Planner:
         pipeline: Pipeline,
         variables: Optional[Dict[str, Any]] = None,
         profile_variables: Optional[Dict[str, Any]] = None,
+        step_durations: Optional[Dict[str, float]] = None,
     ) -> List[Dict[str, Any]]:
         """Create an execution plan from a pipeline.
 
+        Each step is annotated with its explicit depends_on list, the wave
+        of steps it can run concurrently with, an estimated duration and
+        whether it lies on the critical path.
+
         Args:
         ----
             pipeline: The pipeline to build a plan for
             variables: Variables to substitute in the plan (CLI variables - highest priority)
             profile_variables: Profile variables (medium priority)
+            step_durations: Past step durations in seconds, used as cost hints
 
         Returns:
         -------
@@ -2100,19 +1918,18 @@ class Planner:
         # Build the plan using all variables for validation purposes
         execution_plan = self.builder.build_plan(pipeline, all_variables)
 
-        # Apply variable substitution to the execution plan using V2 functions
-        execution_plan = substitute_variables(json.dumps(execution_plan), all_variables)
-        execution_plan = json.loads(execution_plan)
+        # Apply variable substitution to the execution plan. The compiled
+        # template is cached by plan text, so planning the same pipeline again
+        # with other variables (e.g. per backfill date) only joins strings
+        plan_template = compile_template(json.dumps(execution_plan))
+        execution_plan = json.loads(plan_template.render(all_variables))
 
-        # Check for any missing variables using V2 validation
-        plan_text = json.dumps(execution_plan)
-        referenced_vars = find_variables(plan_text)
-        resolved_vars = resolve_variables(all_variables, all_variables)
-        missing_vars = [var for var in referenced_vars if var not in resolved_vars]
+        # Check for any variables left unresolved
+        missing_vars = plan_template.missing_variables(all_variables)
 
         if missing_vars:
             logger.warning(
                 f"Plan contains unresolved variables: {', '.join(missing_vars)}"
             )
 
-        return execution_plan
+        return annotate_schedule(execution_plan, step_durations)
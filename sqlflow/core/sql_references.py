@@ -0,0 +1,329 @@
+"""Table reference extraction for SQL queries.
+
+The planner orders steps by the tables their SQL reads, so references must
+be precise: a missed table loses an edge, and a false one serializes steps
+that could run side by side. This module tokenizes the SQL, skipping string
+literals and comments, and follows query structure. It handles:
+
+- FROM lists and JOINs, including quoted and schema-qualified names and
+  parenthesized joins
+- Subqueries, with CTE names scoped to the query that defines them
+- Table functions such as PYTHON_FUNC("module.func", table)
+- FROM used inside function calls, e.g. EXTRACT(year FROM ts)
+
+Results are cached per SQL text, since the same queries are analyzed by
+the planner, validation and the UDF dependency resolver.
+"""
+
+import re
+from functools import lru_cache
+from typing import Iterable, List, Optional, Set, Tuple
+
+# Token kinds
+_WORD = "word"
+_QUOTED = "quoted"
+_STRING = "string"
+_PUNCT = "punct"
+
+_TOKEN_REGEX = re.compile(
+    r"""
+    (?P<space>\s+)
+    | (?P<line_comment>--[^\n]*)
+    | (?P<block_comment>/\*.*?(?:\*/|\Z))
+    | (?P<string>'(?:[^']|'')*(?:'|\Z))
+    | (?P<quoted>"(?:[^"]|"")*(?:"|\Z))
+    | (?P<word>[A-Za-z_][A-Za-z0-9_$]*)
+    | (?P<number>\d+(?:\.\d*)?(?:[eE][+-]?\d+)?)
+    | (?P<punct>[(),.;])
+    | (?P<other>.)
+    """,
+    re.VERBOSE | re.DOTALL,
+)
+
+# Keywords that start a query when they open a parenthesized group
+_QUERY_START_KEYWORDS = {"select", "with", "from", "values", "table"}
+
+# Keywords that end a table factor instead of naming its alias
+_CLAUSE_KEYWORDS = {
+    "anti",
+    "asof",
+    "cross",
+    "except",
+    "from",
+    "full",
+    "group",
+    "having",
+    "inner",
+    "intersect",
+    "join",
+    "lateral",
+    "left",
+    "limit",
+    "natural",
+    "offset",
+    "on",
+    "order",
+    "outer",
+    "pivot",
+    "positional",
+    "qualify",
+    "returning",
+    "right",
+    "select",
+    "semi",
+    "set",
+    "tablesample",
+    "union",
+    "unpivot",
+    "using",
+    "values",
+    "where",
+    "window",
+    "with",
+}
+
+# Schemas that resolve to the default database; main.users is users
+_DEFAULT_SCHEMAS = {"main", "memory", "temp"}
+
+# System catalogs that never refer to pipeline tables
+_SYSTEM_SCHEMAS = {"information_schema", "pg_catalog"}
+
+Token = Tuple[str, str]
+
+
+def extract_table_references(
+    sql_query: str, table_functions: Optional[Iterable[str]] = None
+) -> List[str]:
+    """Extract the tables a SQL query reads from.
+
+    CTE names are not reported, and neither are table functions such as
+    read_csv_auto(...) or string paths in FROM. Names are lower-cased, as
+    identifiers are case-insensitive in DuckDB.
+
+    Args:
+    ----
+        sql_query: SQL query to analyze
+        table_functions: Names of table UDFs whose first argument is a table
+
+    Returns:
+    -------
+        Referenced table names in order of first appearance
+
+    """
+    functions = tuple(sorted({name.lower() for name in table_functions or ()}))
+    return list(_extract_cached(sql_query, functions))
+
+
+@lru_cache(maxsize=2048)
+def _extract_cached(
+    sql_query: str, table_functions: Tuple[str, ...]
+) -> Tuple[str, ...]:
+    extractor = _ReferenceExtractor(_tokenize(sql_query), set(table_functions))
+    extractor.parse_query(0, [], top_level=True)
+    return tuple(extractor.tables)
+
+
+def _tokenize(sql_query: str) -> List[Token]:
+    """Split SQL into tokens, dropping whitespace and comments."""
+    tokens: List[Token] = []
+    for match in _TOKEN_REGEX.finditer(sql_query):
+        kind = match.lastgroup
+        value = match.group()
+        if kind == "word":
+            tokens.append((_WORD, value.lower()))
+        elif kind == "quoted":
+            tokens.append((_QUOTED, value[1:-1].replace('""', '"').lower()))
+        elif kind == "string":
+            tokens.append((_STRING, value))
+        elif kind in ("punct", "other", "number"):
+            tokens.append((_PUNCT, value))
+    return tokens
+
+
+class _ReferenceExtractor:
+    """Walks SQL tokens, collecting table references per query scope."""
+
+    def __init__(self, tokens: List[Token], table_functions: Set[str]):
+        self.tokens = tokens
+        self.table_functions = table_functions
+        self.tables: List[str] = []
+
+    def _peek(self, pos: int) -> Token:
+        if pos < len(self.tokens):
+            return self.tokens[pos]
+        return ("", "")
+
+    def _is(self, pos: int, kind: str, value: Optional[str] = None) -> bool:
+        token = self._peek(pos)
+        return token[0] == kind and (value is None or token[1] == value)
+
+    def _add_table(self, name_parts: List[str], ctes: List[Set[str]]) -> None:
+        if len(name_parts) == 1 and any(name_parts[0] in scope for scope in ctes):
+            return
+        if name_parts[0] in _SYSTEM_SCHEMAS:
+            return
+        while len(name_parts) > 1 and name_parts[0] in _DEFAULT_SCHEMAS:
+            name_parts = name_parts[1:]
+        name = ".".join(name_parts)
+        if name not in self.tables:
+            self.tables.append(name)
+
+    def parse_query(
+        self, pos: int, ctes: List[Set[str]], top_level: bool = False
+    ) -> int:
+        """Parse tokens up to the closing parenthesis of this query level.
+
+        Args:
+        ----
+            pos: Index of the first token of the level
+            ctes: CTE names visible from enclosing queries
+            top_level: Whether this is the statement level
+
+        Returns:
+        -------
+            Index just past the closing parenthesis, or the token count
+
+        """
+        scope: Set[str] = set()
+        ctes = ctes + [scope]
+        is_query = top_level or self._peek(pos)[1] in _QUERY_START_KEYWORDS
+
+        while pos < len(self.tokens):
+            kind, value = self.tokens[pos]
+            if kind == _PUNCT and value == ")":
+                if not top_level:
+                    return pos + 1
+                pos += 1
+            elif kind == _PUNCT and value == "(":
+                pos = self.parse_query(pos + 1, ctes)
+            elif kind != _WORD:
+                pos += 1
+            elif value == "with":
+                pos = self._parse_ctes(pos + 1, ctes, scope)
+            elif value == "select":
+                is_query = True
+                pos += 1
+            elif value == "from" and is_query:
+                pos = self._parse_from_list(pos + 1, ctes)
+            elif value == "join":
+                pos = self._parse_table_factor(pos + 1, ctes)
+            else:
+                pos += 1
+        return pos
+
+    def _parse_ctes(self, pos: int, ctes: List[Set[str]], scope: Set[str]) -> int:
+        """Parse WITH [RECURSIVE] name [(cols)] AS [[NOT] MATERIALIZED] (...)."""
+        recursive = self._is(pos, _WORD, "recursive")
+        if recursive:
+            pos += 1
+
+        while pos < len(self.tokens) and self._peek(pos)[0] in (_WORD, _QUOTED):
+            name = self._peek(pos)[1]
+            pos += 1
+            if recursive:
+                scope.add(name)
+            if self._is(pos, _PUNCT, "("):
+                pos = self._skip_parens(pos)
+            if self._is(pos, _WORD, "as"):
+                pos += 1
+            if self._is(pos, _WORD, "not"):
+                pos += 1
+            if self._is(pos, _WORD, "materialized"):
+                pos += 1
+            if self._is(pos, _PUNCT, "("):
+                pos = self.parse_query(pos + 1, ctes)
+            scope.add(name)
+            if not self._is(pos, _PUNCT, ","):
+                break
+            pos += 1
+        return pos
+
+    def _parse_from_list(self, pos: int, ctes: List[Set[str]]) -> int:
+        """Parse comma-separated table factors after FROM."""
+        pos = self._parse_table_factor(pos, ctes)
+        while self._is(pos, _PUNCT, ","):
+            pos = self._parse_table_factor(pos + 1, ctes)
+        return pos
+
+    def _parse_table_factor(self, pos: int, ctes: List[Set[str]]) -> int:
+        """Parse one table, subquery or table function and its alias."""
+        while self._is(pos, _WORD, "lateral") or self._is(pos, _WORD, "only"):
+            pos += 1
+
+        kind, value = self._peek(pos)
+        if kind == _PUNCT and value == "(":
+            if self._peek(pos + 1)[1] in _QUERY_START_KEYWORDS:
+                pos = self.parse_query(pos + 1, ctes)
+            else:
+                # Parenthesized join: (a JOIN b ON ...)
+                pos = self.parse_query(self._parse_from_list(pos + 1, ctes), ctes)
+        elif kind in (_WORD, _QUOTED) and not (
+            kind == _WORD and value in _CLAUSE_KEYWORDS
+        ):
+            name_parts = [value]
+            pos += 1
+            while self._is(pos, _PUNCT, ".") and self._peek(pos + 1)[0] in (
+                _WORD,
+                _QUOTED,
+            ):
+                name_parts.append(self._peek(pos + 1)[1])
+                pos += 2
+            if self._is(pos, _PUNCT, "("):
+                pos = self._parse_table_function(pos, name_parts[-1], ctes)
+            else:
+                self._add_table(name_parts, ctes)
+        else:
+            # String paths and anything unexpected are left to parse_query
+            return pos
+
+        return self._skip_alias(pos)
+
+    def _parse_table_function(
+        self, pos: int, function_name: str, ctes: List[Set[str]]
+    ) -> int:
+        """Record the table argument of a table UDF call, then parse its args."""
+        table_arg = None
+        if function_name == "python_func":
+            # PYTHON_FUNC("module.function", table_name)
+            if self._is(pos + 2, _PUNCT, ","):
+                table_arg = pos + 3
+        elif function_name in self.table_functions:
+            table_arg = pos + 1
+
+        if table_arg is not None:
+            kind, value = self._peek(table_arg)
+            next_kind, next_value = self._peek(table_arg + 1)
+            if kind in (_WORD, _QUOTED) and (
+                next_kind == _PUNCT and next_value in (",", ")")
+            ):
+                self._add_table([value], ctes)
+
+        return self.parse_query(pos + 1, ctes)
+
+    def _skip_alias(self, pos: int) -> int:
+        """Skip [AS] alias [(column, ...)] after a table factor."""
+        has_as = self._is(pos, _WORD, "as")
+        if has_as:
+            pos += 1
+        kind, value = self._peek(pos)
+        if kind == _QUOTED or (
+            kind == _WORD and (has_as or value not in _CLAUSE_KEYWORDS)
+        ):
+            pos += 1
+            if self._is(pos, _PUNCT, "("):
+                pos = self._skip_parens(pos)
+        return pos
+
+    def _skip_parens(self, pos: int) -> int:
+        """Skip a balanced parenthesized group starting at pos."""
+        depth = 0
+        while pos < len(self.tokens):
+            kind, value = self.tokens[pos]
+            pos += 1
+            if kind == _PUNCT and value == "(":
+                depth += 1
+            elif kind == _PUNCT and value == ")":
+                depth -= 1
+                if depth == 0:
+                    break
+        return pos
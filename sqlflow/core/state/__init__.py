@@ -6,10 +6,12 @@ while providing robust state persistence using DuckDB as the backend.
 """
 
 from sqlflow.core.state.backends import DuckDBStateBackend, StateBackend
+from sqlflow.core.state.file_manifest import FileManifest
 from sqlflow.core.state.watermark_manager import WatermarkManager
 
 __all__ = [
     "StateBackend",
     "DuckDBStateBackend",
     "WatermarkManager",
+    "FileManifest",
 ]
@@ -8,9 +8,10 @@ for lightweight, self-contained state management.
 import json
 from abc import ABC, abstractmethod
 from datetime import datetime
-from typing import Any, ContextManager, Optional
+from typing import Any, ContextManager, Dict, List, Optional
 
 import duckdb
+import pyarrow as pa
 
 from sqlflow.logging import get_logger
 
@@ -56,6 +57,34 @@ class StateBackend(ABC):
     def transaction(self) -> ContextManager[Any]:
         """Context manager for atomic transactions."""
 
+    def get_file_manifest(self, manifest_key: str) -> Dict[str, Dict[str, Any]]:
+        """Get the files recorded for a manifest.
+
+        The default implementation keeps the manifest as a single state value;
+        backends with tables can override it with something more efficient.
+
+        Args:
+            manifest_key: Key identifying the incremental source
+
+        Returns:
+            Mapping of file path to its recorded size, modified and rows_ingested
+        """
+        return self.get(f"file_manifest.{manifest_key}") or {}
+
+    def update_file_manifest(
+        self, manifest_key: str, entries: List[Dict[str, Any]]
+    ) -> None:
+        """Insert or replace file entries in a manifest.
+
+        Args:
+            manifest_key: Key identifying the incremental source
+            entries: Dicts with path, size, modified and rows_ingested, and
+                optionally offset and fingerprint
+        """
+        manifest = self.get_file_manifest(manifest_key)
+        manifest.update({entry["path"]: entry for entry in entries})
+        self.set(f"file_manifest.{manifest_key}", manifest)
+
     @abstractmethod
     def close(self) -> None:
         """Close the backend and clean up resources."""
@@ -124,6 +153,32 @@ class DuckDBStateBackend(StateBackend):
         """
         )
 
+        # Files already ingested by incremental file-based sources
+        self.connection.execute(
+            """
+            CREATE TABLE IF NOT EXISTS sqlflow_file_manifest (
+                manifest_key VARCHAR NOT NULL,
+                path VARCHAR NOT NULL,
+                size BIGINT,
+                modified VARCHAR,  -- mtime or ETag
+                rows_ingested BIGINT DEFAULT 0,
+                last_ingested TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                byte_offset BIGINT,  -- resume point of append-only files
+                fingerprint VARCHAR,
+                PRIMARY KEY(manifest_key, path)
+            )
+        """
+        )
+        # Manifests created before resume points were tracked
+        for column, column_type in [
+            ("byte_offset", "BIGINT"),
+            ("fingerprint", "VARCHAR"),
+        ]:
+            self.connection.execute(
+                f"ALTER TABLE sqlflow_file_manifest "
+                f"ADD COLUMN IF NOT EXISTS {column} {column_type}"
+            )
+
         # Create indexes for performance
         self.connection.execute(
             """
@@ -220,6 +275,100 @@ class DuckDBStateBackend(StateBackend):
             logger.error(f"Failed to delete state for key {key}: {e}")
             raise
 
+    def get_file_manifest(self, manifest_key: str) -> Dict[str, Dict[str, Any]]:
+        """Get the files recorded for a manifest.
+
+        Args:
+            manifest_key: Key identifying the incremental source
+
+        Returns:
+            Mapping of file path to its recorded size, modified, rows_ingested,
+            offset and fingerprint
+        """
+        try:
+            rows = self.connection.execute(
+                """
+                SELECT path, size, modified, rows_ingested, byte_offset, fingerprint
+                FROM sqlflow_file_manifest WHERE manifest_key = ?
+            """,
+                [manifest_key],
+            ).fetchall()
+
+            return {
+                path: {
+                    "path": path,
+                    "size": size,
+                    "modified": modified,
+                    "rows_ingested": rows_ingested,
+                    "offset": offset,
+                    "fingerprint": fingerprint,
+                }
+                for path, size, modified, rows_ingested, offset, fingerprint in rows
+            }
+
+        except Exception as e:
+            logger.error(f"Failed to get file manifest {manifest_key}: {e}")
+            raise
+
+    def update_file_manifest(
+        self, manifest_key: str, entries: List[Dict[str, Any]]
+    ) -> None:
+        """Insert or replace file entries in a manifest.
+
+        Entries are written in one statement from an Arrow table, so
+        recording tens of thousands of files stays a single round trip.
+
+        Args:
+            manifest_key: Key identifying the incremental source
+            entries: Dicts with path, size, modified and rows_ingested, and
+                optionally offset and fingerprint
+        """
+        if not entries:
+            return
+
+        updates = pa.table(
+            {
+                "path": [entry["path"] for entry in entries],
+                "size": pa.array([entry.get("size") for entry in entries], pa.int64()),
+                "modified": [
+                    None if entry.get("modified") is None else str(entry["modified"])
+                    for entry in entries
+                ],
+                "rows_ingested": pa.array(
+                    [entry.get("rows_ingested", 0) for entry in entries], pa.int64()
+                ),
+                "byte_offset": pa.array(
+                    [entry.get("offset") for entry in entries], pa.int64()
+                ),
+                "fingerprint": pa.array(
+                    [entry.get("fingerprint") for entry in entries], pa.string()
+                ),
+            }
+        )
+
+        try:
+            self.connection.register("sqlflow_file_manifest_updates", updates)
+            try:
+                self.connection.execute(
+                    """
+                    INSERT OR REPLACE INTO sqlflow_file_manifest
+                        (manifest_key, path, size, modified, rows_ingested,
+                         last_ingested, byte_offset, fingerprint)
+                    SELECT ?, path, size, modified, rows_ingested, ?, byte_offset,
+                        fingerprint
+                    FROM sqlflow_file_manifest_updates
+                """,
+                    [manifest_key, datetime.utcnow()],
+                )
+            finally:
+                self.connection.unregister("sqlflow_file_manifest_updates")
+
+            logger.debug(f"Recorded {len(entries)} files in manifest {manifest_key}")
+
+        except Exception as e:
+            logger.error(f"Failed to update file manifest {manifest_key}: {e}")
+            raise
+
     def transaction(self) -> ContextManager[Any]:
         """Context manager for atomic transactions."""
         return DuckDBTransaction(self.connection)
@@ -0,0 +1,206 @@
+"""File manifests for incremental file-based sources in SQLFlow.
+
+This module provides the FileManifest class which remembers which files an
+incremental source has already ingested, so later runs read only new or
+changed files instead of every file under a path or prefix. For local
+append-only files it also remembers how far into the file the last run
+read, so the next run can parse only the bytes appended since.
+"""
+
+import hashlib
+import os
+from typing import Any, Dict, Optional
+
+from sqlflow.core.errors import ConnectorError
+from sqlflow.core.state.backends import StateBackend
+from sqlflow.logging import get_logger
+
+logger = get_logger(__name__)
+
+# Bytes hashed from the start of a file to recognise it across runs
+FINGERPRINT_BLOCK_SIZE = 64 * 1024
+
+
+def fingerprint_file(path: str, length: Optional[int] = None) -> str:
+    """Fingerprint a local file by its inode and a hash of its first block.
+
+    Appending to a file keeps its fingerprint; replacing, rotating or
+    rewriting the start of the file changes it.
+
+    Args:
+        path: Path to the file
+        length: Bytes to hash, by default the first block or the whole file
+            if it is smaller
+
+    Returns:
+        Fingerprint in inode:length:sha256 form
+    """
+    file_stat = os.stat(path)
+    if length is None:
+        length = min(FINGERPRINT_BLOCK_SIZE, file_stat.st_size)
+    with open(path, "rb") as f:
+        digest = hashlib.sha256(f.read(length)).hexdigest()
+    return f"{file_stat.st_ino}:{length}:{digest}"
+
+
+class FileManifest:
+    """Tracks the files ingested by one incremental source.
+
+    A file is identified by its path and versioned by its size and a
+    modification marker (mtime for local files, ETag for S3 objects).
+    Connectors record files as they finish reading them; the records are
+    persisted only by commit(), after the load they belong to succeeds.
+
+    Connectors able to resume inside a file also record the byte offset
+    they read up to and the file's fingerprint, next to the watermark
+    committed for the same load.
+    """
+
+    def __init__(self, state_backend: StateBackend, manifest_key: str):
+        """Initialize FileManifest.
+
+        Args:
+            state_backend: Backend for state persistence
+            manifest_key: Key identifying the incremental source
+        """
+        self.backend = state_backend
+        self.manifest_key = manifest_key
+        self._entries: Optional[Dict[str, Dict[str, Any]]] = None
+        self._pending: Dict[str, Dict[str, Any]] = {}
+
+    @staticmethod
+    def get_manifest_key(pipeline: str, source: str, target: str) -> str:
+        """Generate the manifest key for a source->target combination.
+
+        Args:
+            pipeline: Pipeline name
+            source: Source name
+            target: Target table name
+
+        Returns:
+            Unique manifest key for the combination
+        """
+        return f"{pipeline}.{source}.{target}"
+
+    @property
+    def entries(self) -> Dict[str, Dict[str, Any]]:
+        """Files recorded by previous runs, loaded once per manifest."""
+        if self._entries is None:
+            try:
+                self._entries = self.backend.get_file_manifest(self.manifest_key)
+            except Exception as e:
+                raise ConnectorError(
+                    "file_manifest", f"Failed to load file manifest: {str(e)}"
+                ) from e
+            logger.debug(
+                f"Loaded {len(self._entries)} files for manifest {self.manifest_key}"
+            )
+        return self._entries
+
+    def is_changed(self, path: str, size: Optional[int], modified: Any) -> bool:
+        """Check whether a file is new or differs from its recorded version.
+
+        Args:
+            path: File path or object key
+            size: Current size in bytes
+            modified: Current mtime or ETag
+
+        Returns:
+            True if the file must be read
+        """
+        entry = self.entries.get(path)
+        if entry is None:
+            return True
+        return entry.get("size") != size or entry.get("modified") != str(modified)
+
+    def get_rows_ingested(self, path: str) -> int:
+        """Get the rows already ingested from a file, 0 if it is unknown."""
+        entry = self.entries.get(path) or {}
+        return entry.get("rows_ingested") or 0
+
+    def get_resume_offset(self, path: str) -> int:
+        """Get the byte offset a local file can be resumed from.
+
+        The recorded offset is only trusted while the file keeps its
+        fingerprint and has not shrunk below it; otherwise the file has
+        been replaced or rewritten and must be read from the start.
+
+        Args:
+            path: Path to the local file
+
+        Returns:
+            Offset of the first byte not yet ingested, 0 to read everything
+        """
+        entry = self.entries.get(path) or {}
+        offset = entry.get("offset")
+        fingerprint = entry.get("fingerprint")
+        if not offset or not fingerprint:
+            return 0
+
+        try:
+            length = int(fingerprint.split(":")[1])
+            if os.path.getsize(path) >= offset and (
+                fingerprint_file(path, length) == fingerprint
+            ):
+                return offset
+        except (OSError, ValueError, IndexError):
+            pass
+
+        logger.info(f"{path} changed since it was last ingested; reading it fully")
+        return 0
+
+    def record(
+        self,
+        path: str,
+        size: Optional[int],
+        modified: Any,
+        rows_ingested: int,
+        offset: Optional[int] = None,
+        fingerprint: Optional[str] = None,
+    ) -> None:
+        """Stage a file as ingested; it is persisted by commit().
+
+        Args:
+            path: File path or object key
+            size: Size in bytes when it was read
+            modified: mtime or ETag when it was read
+            rows_ingested: Rows read from the file
+            offset: Optional byte offset the next run may resume from
+            fingerprint: Fingerprint of the file the offset belongs to
+        """
+        self._pending[path] = {
+            "path": path,
+            "size": size,
+            "modified": str(modified),
+            "rows_ingested": rows_ingested,
+            "offset": offset,
+            "fingerprint": fingerprint,
+        }
+
+    def commit(self) -> int:
+        """Persist the staged files.
+
+        Returns:
+            Number of files recorded
+        """
+        if not self._pending:
+            return 0
+
+        pending = list(self._pending.values())
+        try:
+            with self.backend.transaction():
+                self.backend.update_file_manifest(self.manifest_key, pending)
+        except Exception as e:
+            logger.error(f"Failed to commit file manifest {self.manifest_key}: {e}")
+            raise ConnectorError(
+                "file_manifest", f"Failed to commit file manifest: {str(e)}"
+            ) from e
+
+        self.entries.update(self._pending)
+        self._pending = {}
+        logger.info(f"Recorded {len(pending)} files in manifest {self.manifest_key}")
+        return len(pending)
+
+    def discard(self) -> None:
+        """Drop staged files, e.g. after a failed load."""
+        self._pending = {}
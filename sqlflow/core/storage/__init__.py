@@ -2,6 +2,7 @@
 
 from sqlflow.core.storage.artifact_manager import ArtifactManager
 from sqlflow.core.storage.base import MemoryStorageManager, StorageManagerProtocol
+from sqlflow.core.storage.compile_cache import CompileCache
 from sqlflow.core.storage.duckdb_state_backend import DuckDBStateBackend
 
 __all__ = [
@@ -9,4 +10,5 @@ __all__ = [
     "MemoryStorageManager",
     "DuckDBStateBackend",
     "ArtifactManager",
+    "CompileCache",
 ]
@@ -148,6 +148,70 @@ class ArtifactManager:
         with open(path, "r") as f:
             return json.load(f)
 
+    def get_durations_path(self, pipeline_name: str) -> str:
+        """Get path to the step durations recorded for a pipeline.
+
+        The file lives next to the run directory so that cleaning the run
+        directory before a run keeps the durations of previous runs.
+
+        Args:
+        ----
+            pipeline_name: Name of the pipeline.
+
+        Returns:
+        -------
+            Path to the step durations file.
+
+        """
+        return os.path.join(
+            self.project_dir, "target", "run", f"{pipeline_name}.durations.json"
+        )
+
+    def load_step_durations(self, pipeline_name: str) -> Dict[str, float]:
+        """Load the last recorded duration of each step of a pipeline.
+
+        Args:
+        ----
+            pipeline_name: Name of the pipeline.
+
+        Returns:
+        -------
+            Durations in seconds by step ID, empty if none were recorded.
+
+        """
+        try:
+            with open(self.get_durations_path(pipeline_name), "r") as f:
+                durations = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        if not isinstance(durations, dict):
+            return {}
+        return {
+            step_id: float(seconds)
+            for step_id, seconds in durations.items()
+            if isinstance(seconds, (int, float))
+        }
+
+    def save_step_durations(
+        self, pipeline_name: str, durations: Dict[str, float]
+    ) -> None:
+        """Record step durations of a run, keeping those of other steps.
+
+        Args:
+        ----
+            pipeline_name: Name of the pipeline.
+            durations: Durations in seconds by step ID.
+
+        """
+        if not durations:
+            return
+        merged = self.load_step_durations(pipeline_name)
+        merged.update(durations)
+        path = self.get_durations_path(pipeline_name)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "w") as f:
+            json.dump(merged, f, indent=2, sort_keys=True)
+
     def initialize_execution(
         self, pipeline_name: str, variables: Dict[str, Any], profile: str
     ) -> Tuple[str, Dict[str, Any]]:
@@ -0,0 +1,221 @@
+"""Compile cache for SQLFlow pipelines.
+
+This module lets `sqlflow pipeline compile` reuse plans in target/compiled
+when nothing that affects them has changed. Each plan gets a cache key,
+stored under target/compiled/.cache. The key is a hash of the pipeline
+text, the files it INCLUDEs (nested ones too), the variables those
+reference, the profile and the SQLFlow version.
+"""
+
+import hashlib
+import json
+import logging
+import os
+from typing import Any, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+CACHE_DIR_NAME = ".cache"
+
+
+def compute_compile_key(
+    pipeline_text: str,
+    pipeline_path: str,
+    variables: Dict[str, Any],
+    profile: Optional[Dict[str, Any]] = None,
+    step_durations: Optional[Dict[str, float]] = None,
+) -> str:
+    """Compute the cache key for compiling a pipeline.
+
+    Only variables referenced by the pipeline or the files it includes,
+    directly or through nested INCLUDEs, are part of the key, so unrelated
+    environment variables do not invalidate cached plans. Recorded step
+    durations are part of it too, since the plan's schedule is estimated
+    from them.
+
+    Args:
+    ----
+        pipeline_text: Pipeline text before variable substitution
+        pipeline_path: Path to the pipeline file
+        variables: All variables available to the compiler
+        profile: Profile configuration used for compilation
+        step_durations: Step durations recorded by the last run
+
+    Returns:
+    -------
+        Hex digest identifying the compile inputs
+
+    """
+    from sqlflow import __version__
+    from sqlflow.core.variables import find_variables
+
+    includes = _read_include_tree(pipeline_text, pipeline_path)
+    texts = [pipeline_text] + [text for _, text in includes if text is not None]
+    referenced = sorted({var.name for text in texts for var in find_variables(text)})
+    inputs = {
+        "sqlflow_version": __version__,
+        "pipeline": pipeline_text,
+        "includes": includes,
+        "variables": {name: variables.get(name) for name in referenced},
+        "profile": profile or {},
+        "step_durations": step_durations or {},
+    }
+    payload = json.dumps(inputs, sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def _find_include_paths(text: str) -> List[str]:
+    """Get the file paths of the INCLUDE directives in a pipeline text.
+
+    The DSL lexer is used rather than the full parser, so a cache hit does
+    not cost a parse; INCLUDEs inside comments or strings are not matched.
+    """
+    from sqlflow.parser.lexer import Lexer, TokenType
+
+    tokens = Lexer(text).tokenize()
+    return [
+        value.value[1:-1]
+        for token, value in zip(tokens, tokens[1:])
+        if token.type == TokenType.INCLUDE and value.type == TokenType.STRING
+    ]
+
+
+def _read_include_tree(
+    pipeline_text: str, pipeline_path: str
+) -> List[Tuple[str, Optional[str]]]:
+    """Read the files a pipeline includes, following nested INCLUDEs.
+
+    Included paths are looked up relative to the working directory, then
+    to the including file. Each file is read once, so include cycles end.
+
+    Returns:
+    -------
+        (include path, text) pairs in depth-first order, with None as the
+        text of missing files
+
+    """
+    includes: List[Tuple[str, Optional[str]]] = []
+    seen = {os.path.abspath(pipeline_path)}
+    pending = [(pipeline_text, pipeline_path)]
+    while pending:
+        text, path = pending.pop()
+        search_dirs = [os.getcwd(), os.path.dirname(os.path.abspath(path))]
+        children = []
+        for include_path in _find_include_paths(text):
+            resolved = _resolve_include(include_path, search_dirs)
+            if resolved is None:
+                includes.append((include_path, None))
+            elif resolved not in seen:
+                seen.add(resolved)
+                with open(resolved, "r") as f:
+                    include_text = f.read()
+                includes.append((include_path, include_text))
+                children.append((include_text, resolved))
+        pending.extend(reversed(children))
+    return includes
+
+
+def _resolve_include(include_path: str, search_dirs: List[str]) -> Optional[str]:
+    """Get the absolute path of an included file, None if it is missing."""
+    for base_dir in search_dirs:
+        candidate = os.path.abspath(os.path.join(base_dir, include_path))
+        if os.path.isfile(candidate):
+            return candidate
+    return None
+
+
+class CompileCache:
+    """Reuses compiled plans whose compile inputs have not changed.
+
+    Args:
+    ----
+        enabled: Whether plans may be reused; keys are recorded either way
+
+    """
+
+    def __init__(self, enabled: bool = True):
+        """Initialize the compile cache.
+
+        Args:
+        ----
+            enabled: Whether plans may be reused
+
+        """
+        self.enabled = enabled
+
+    @staticmethod
+    def get_key_path(target_path: str) -> str:
+        """Get the path of the cache key file for a compiled plan.
+
+        Args:
+        ----
+            target_path: Path to the compiled plan file
+
+        Returns:
+        -------
+            Path to the cache key file
+
+        """
+        target_dir, file_name = os.path.split(target_path)
+        return os.path.join(target_dir, CACHE_DIR_NAME, f"{file_name}.key")
+
+    def load(self, target_path: str, key: str) -> Optional[List[Dict[str, Any]]]:
+        """Load a compiled plan if it was compiled from the same inputs.
+
+        Args:
+        ----
+            target_path: Path to the compiled plan file
+            key: Cache key of the current compile inputs
+
+        Returns:
+        -------
+            The cached operations, or None on a cache miss
+
+        """
+        if not self.enabled:
+            return None
+
+        try:
+            with open(self.get_key_path(target_path), "r") as f:
+                if f.read().strip() != key:
+                    return None
+            with open(target_path, "r") as f:
+                operations = json.load(f)
+        except (OSError, ValueError):
+            return None
+
+        # Plans written by the pipeline commands wrap the operations
+        if isinstance(operations, dict):
+            operations = operations.get("operations")
+        if not isinstance(operations, list):
+            return None
+
+        logger.debug(f"Reusing cached execution plan {target_path}")
+        return operations
+
+    def invalidate(self, target_path: str) -> None:
+        """Forget the cache key of a plan that is about to be rewritten.
+
+        Args:
+        ----
+            target_path: Path to the compiled plan file
+
+        """
+        try:
+            os.remove(self.get_key_path(target_path))
+        except FileNotFoundError:
+            pass
+
+    def save(self, target_path: str, key: str) -> None:
+        """Record the cache key of a plan that was just written.
+
+        Args:
+        ----
+            target_path: Path to the compiled plan file
+            key: Cache key of the compile inputs
+
+        """
+        key_path = self.get_key_path(target_path)
+        os.makedirs(os.path.dirname(key_path), exist_ok=True)
+        with open(key_path, "w") as f:
+            f.write(key)
@@ -0,0 +1,220 @@
+"""Typo suggestions for undefined table references.
+
+When a query reads a table that no step defines, validation checks whether
+the name is a likely typo of a defined table. A defined table is a
+candidate when either:
+
+- Its edit distance to the undefined name is at most 2, or
+- One name is the other plus a "_..." suffix or a "..._" prefix of at most
+  10 characters, e.g. users vs users_backup or stg_users
+
+Comparing every undefined name with every defined name does not scale to
+projects with thousands of tables, so defined names are indexed up front:
+
+- Edit distance: names are bucketed by length and split into 3 segments.
+  Two edits can change at most 2 segments, so any name within distance 2
+  shares an unchanged segment with the query, at most 2 positions away.
+  Only names sharing a segment are compared, with a banded edit distance
+  that stops once the bound is exceeded.
+- Affixes: every name is indexed under the names obtained by stripping an
+  underscore suffix or prefix, so affix matches are dictionary lookups.
+"""
+
+from collections import defaultdict
+from typing import Dict, Iterable, List, Optional, Tuple
+
+# Largest edit distance still considered a typo
+MAX_EDIT_DISTANCE = 2
+
+# Longest "_..." suffix or "..._" prefix still considered a typo
+MAX_AFFIX_LENGTH = 10
+
+
+def bounded_edit_distance(s1: str, s2: str, max_distance: int) -> int:
+    """Calculate the Levenshtein distance between two strings, up to a bound.
+
+    Only the diagonal band of width 2 * max_distance + 1 is computed, and
+    the computation stops as soon as every cell exceeds the bound.
+
+    Args:
+    ----
+        s1: First string
+        s2: Second string
+        max_distance: Largest distance of interest
+
+    Returns:
+    -------
+        The edit distance, or max_distance + 1 if it exceeds max_distance
+
+    """
+    if len(s1) < len(s2):
+        s1, s2 = s2, s1
+    over = max_distance + 1
+    if len(s1) - len(s2) > max_distance:
+        return over
+
+    s1, s2 = _strip_common_affixes(s1, s2)
+    if not s2:
+        return len(s1) if len(s1) <= max_distance else over
+
+    width = len(s2)
+    previous = [j if j <= max_distance else over for j in range(width + 1)]
+    for i, c1 in enumerate(s1, 1):
+        current = [over] * (width + 1)
+        if i <= max_distance:
+            current[0] = i
+        low, high = _band_bounds(i, width, max_distance)
+        for j in range(low, high + 1):
+            value = previous[j - 1] + (c1 != s2[j - 1])
+            if previous[j] + 1 < value:
+                value = previous[j] + 1
+            if current[j - 1] + 1 < value:
+                value = current[j - 1] + 1
+            current[j] = value if value < over else over
+        if min(current) > max_distance:
+            return over
+        previous = current
+    return previous[width]
+
+
+def _strip_common_affixes(s1: str, s2: str) -> Tuple[str, str]:
+    """Drop the common prefix and suffix, which never change the distance.
+
+    s2 must not be longer than s1.
+    """
+    start = 0
+    while start < len(s2) and s1[start] == s2[start]:
+        start += 1
+    end1, end2 = len(s1), len(s2)
+    while end2 > start and s1[end1 - 1] == s2[end2 - 1]:
+        end1 -= 1
+        end2 -= 1
+    return s1[start:end1], s2[start:end2]
+
+
+def _band_bounds(row: int, width: int, max_distance: int) -> Tuple[int, int]:
+    """First and last column of a row within the diagonal band."""
+    return max(1, row - max_distance), min(width, row + max_distance)
+
+
+def _segment_bounds(length: int, segments: int) -> List[Tuple[int, int]]:
+    """Split range(length) into contiguous, nearly equal segments."""
+    cuts = [length * i // segments for i in range(segments + 1)]
+    return list(zip(cuts, cuts[1:]))
+
+
+class TableNameSuggester:
+    """Index of defined table names answering "did you mean" queries."""
+
+    def __init__(
+        self,
+        table_names: Iterable[str],
+        max_distance: int = MAX_EDIT_DISTANCE,
+        max_affix_length: int = MAX_AFFIX_LENGTH,
+    ):
+        """Index the defined table names.
+
+        Args:
+        ----
+            table_names: Defined table names
+            max_distance: Largest edit distance considered a typo
+            max_affix_length: Longest underscore suffix or prefix considered
+                a typo
+
+        """
+        self.max_distance = max_distance
+        self.max_affix_length = max_affix_length
+        self._names = set(table_names)
+        # (name length, segment number, segment text) -> names
+        self._segments: Dict[Tuple[int, int, str], List[str]] = defaultdict(list)
+        # name without an underscore suffix or prefix -> names
+        self._stems: Dict[str, List[str]] = defaultdict(list)
+        self._suggestions: Dict[str, Optional[str]] = {}
+
+        for name in sorted(self._names):
+            bounds = _segment_bounds(len(name), max_distance + 1)
+            for number, (start, end) in enumerate(bounds):
+                self._segments[(len(name), number, name[start:end])].append(name)
+            for stem in self._stems_of(name):
+                self._stems[stem].append(name)
+
+    def _stems_of(self, name: str) -> Iterable[str]:
+        """Yield name without each underscore suffix or prefix short enough."""
+        length = len(name)
+        for position in range(max(1, length - self.max_affix_length), length):
+            if name[position] == "_":
+                yield name[:position]
+        for position in range(1, min(self.max_affix_length, length - 1) + 1):
+            if name[position - 1] == "_":
+                yield name[position:]
+
+    def suggest(self, name: str) -> Optional[str]:
+        """Find the defined table an undefined name most likely meant.
+
+        Args:
+        ----
+            name: Undefined table name
+
+        Returns:
+        -------
+            The closest candidate by edit distance, ties broken by name, or
+            None if no defined table is similar enough
+
+        """
+        if name not in self._suggestions:
+            candidates = self.candidates(name)
+            self._suggestions[name] = (
+                min(candidates, key=lambda table: (candidates[table], table))
+                if candidates
+                else None
+            )
+        return self._suggestions[name]
+
+    def candidates(self, name: str) -> Dict[str, int]:
+        """Find every defined table similar enough to name to be a typo.
+
+        Args:
+        ----
+            name: Undefined table name
+
+        Returns:
+        -------
+            Edit distance to name by candidate table
+
+        """
+        found: Dict[str, int] = {}
+        self._add_edit_candidates(name, found)
+
+        # Affix matches are pure insertions: the distance is the affix length
+        for stem in self._stems_of(name):
+            if stem in self._names:
+                found.setdefault(stem, len(name) - len(stem))
+        for longer in self._stems.get(name, ()):
+            found.setdefault(longer, len(longer) - len(name))
+
+        found.pop(name, None)
+        return found
+
+    def _add_edit_candidates(self, name: str, found: Dict[str, int]) -> None:
+        """Add names within max_distance edits, found through shared segments."""
+        max_distance = self.max_distance
+        length = len(name)
+        checked = set()
+        for candidate_length in range(
+            max(0, length - max_distance), length + max_distance + 1
+        ):
+            bounds = _segment_bounds(candidate_length, max_distance + 1)
+            for number, (start, end) in enumerate(bounds):
+                for shift in range(-max_distance, max_distance + 1):
+                    begin = start + shift
+                    if begin < 0 or begin + end - start > length:
+                        continue
+                    segment = name[begin : begin + end - start]
+                    key = (candidate_length, number, segment)
+                    for candidate in self._segments.get(key, ()):
+                        if candidate in checked:
+                            continue
+                        checked.add(candidate)
+                        distance = bounded_edit_distance(name, candidate, max_distance)
+                        if distance <= max_distance:
+                            found[candidate] = distance
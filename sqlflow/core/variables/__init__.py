@@ -16,6 +16,8 @@ from .v2 import (
     VariableError,
     VariableInfo,
     VariableSources,
+    VariableTemplate,
+    compile_template,
     find_variables,
     format_for_context,
     get_variable_priority,
@@ -79,6 +81,8 @@ __all__ = [
     "substitute_in_list",
     "substitute_any",
     "substitute_variables_for_sql",
+    "compile_template",
+    "VariableTemplate",
     # Resolution functions
     "resolve_variables",
     "resolve_variables_legacy",
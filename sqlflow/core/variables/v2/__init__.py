@@ -20,6 +20,8 @@ from .resolution import (
     resolve_with_sources,
 )
 from .substitution import (
+    VariableTemplate,
+    compile_template,
     find_variables,
     substitute_any,
     substitute_in_dict,
@@ -49,6 +51,8 @@ __all__ = [
     "substitute_in_list",
     "substitute_any",
     "substitute_variables_for_sql",
+    "compile_template",
+    "VariableTemplate",
     # Resolution functions
     "resolve_variables",
     "resolve_variables_legacy",
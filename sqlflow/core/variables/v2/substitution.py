@@ -9,7 +9,7 @@ for all V1 syntax patterns. Following Zen of Python principles:
 
 import re
 from functools import lru_cache
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional, Tuple
 
 from .formatting import format_for_context
 from .types import VariableInfo
@@ -35,13 +35,11 @@ def substitute_variables(text: str, variables: Dict[str, Any]) -> str:
     Returns:
         Text with variables substituted
     """
-    if not text:
+    if not text or "$" not in text:
         return text
 
     # Always run substitution logic so defaults are applied
-    result = _substitute_braced_variables(text, variables)
-    result = _substitute_simple_variables(result, variables)
-    return result
+    return compile_template(text).render(variables)
 
 
 def _substitute_braced_variables(text: str, variables: Dict[str, Any]) -> str:
@@ -74,6 +72,157 @@ def _substitute_simple_variables(text: str, variables: Dict[str, Any]) -> str:
     return _SIMPLE_DOLLAR_PATTERN.sub(replace, text)
 
 
+# Characters that may continue a $variable name
+_NAME_CHARS = frozenset(
+    "abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789_"
+)
+
+
+class VariableTemplate:
+    """Text with the positions of its variable references recorded once.
+
+    Compiling scans the text for ${var}, ${var|default} and $var references;
+    rendering only looks values up and joins strings, so the same text can
+    be rendered for many variable sets (e.g. one per backfill date) without
+    any regex scan. render() returns exactly what substitute_variables()
+    returns for the same text and variables.
+    """
+
+    __slots__ = ("text", "_pieces", "_braced", "_simple", "_names", "_rescan")
+
+    def __init__(self, text: str):
+        """Compile text into literal pieces and variable references.
+
+        Args:
+            text: Text containing variable placeholders
+        """
+        self.text = text
+        # Literal text, with each reference's original text in its slot
+        self._pieces: List[str] = []
+        # (slot, name, default, original) of ${var} and ${var|default}
+        self._braced: List[Tuple[int, str, Optional[str], str]] = []
+        # (slot, name) of $var
+        self._simple: List[Tuple[int, str]] = []
+        # A $var split by a braced reference, e.g. "$a${b}", is only
+        # found by rescanning the joined text like substitute_variables
+        self._rescan = False
+
+        position = 0
+        for match in _VARIABLE_PATTERN.finditer(text):
+            self._add_literal(text[position : match.start()])
+            if _ends_with_dollar_name(text, match.start()):
+                self._rescan = True
+            default = match.group(2).strip() if match.group(2) else None
+            original = match.group(0)
+            self._braced.append(
+                (
+                    len(self._pieces),
+                    match.group(1).strip(),
+                    _clean_default_value(default) if default is not None else None,
+                    original,
+                )
+            )
+            self._pieces.append(original)
+            position = match.end()
+        self._add_literal(text[position:])
+        self._names = frozenset(
+            [ref[1] for ref in self._braced] + [ref[1] for ref in self._simple]
+        )
+
+    def _add_literal(self, literal: str) -> None:
+        """Split a literal between braced references on its $var references."""
+        position = 0
+        for match in _SIMPLE_DOLLAR_PATTERN.finditer(literal):
+            if match.start() > position:
+                self._pieces.append(literal[position : match.start()])
+            self._simple.append((len(self._pieces), match.group(1)))
+            self._pieces.append(match.group(0))
+            position = match.end()
+        if position < len(literal):
+            self._pieces.append(literal[position:])
+
+    @property
+    def variable_names(self) -> frozenset:
+        """Names of all variables referenced by the text."""
+        return self._names
+
+    def missing_variables(self, variables: Dict[str, Any]) -> List[str]:
+        """List referenced variables that have neither a value nor a default.
+
+        Args:
+            variables: Dictionary of variable values
+
+        Returns:
+            Names left unsubstituted by render(), in order of appearance
+        """
+        references = sorted(
+            [(slot, name, default) for slot, name, default, _ in self._braced]
+            + [(slot, name, None) for slot, name in self._simple]
+        )
+        missing = []
+        for _, name, default in references:
+            if name not in variables and default is None and name not in missing:
+                missing.append(name)
+        return missing
+
+    def render(self, variables: Dict[str, Any]) -> str:
+        """Substitute variables into the compiled text.
+
+        Args:
+            variables: Dictionary of variable values
+
+        Returns:
+            Text with variables substituted
+        """
+        if not self._names:
+            return self.text
+
+        values = {
+            name: str(variables[name]) for name in self._names if name in variables
+        }
+        pieces = self._pieces.copy()
+        rescan = self._rescan
+        for slot, name, default, original in self._braced:
+            value = values.get(name, default)
+            if value is None:
+                # Kept as is; its own "${" never starts a $var reference
+                if "$" in original[2:]:
+                    rescan = True
+                continue
+            # Substituted text is scanned again for $var references
+            if "$" in value:
+                rescan = True
+            pieces[slot] = value
+
+        if rescan:
+            return _substitute_simple_variables("".join(pieces), variables)
+        for slot, name in self._simple:
+            if name in values:
+                pieces[slot] = values[name]
+        return "".join(pieces)
+
+
+def _ends_with_dollar_name(text: str, end: int) -> bool:
+    """Check whether text[:end] ends with "$" followed by name characters."""
+    position = end - 1
+    while position >= 0 and text[position] in _NAME_CHARS:
+        position -= 1
+    return position >= 0 and text[position] == "$"
+
+
+@lru_cache(maxsize=1024)
+def compile_template(text: str) -> VariableTemplate:
+    """Compile text into a reusable VariableTemplate, cached by text.
+
+    Args:
+        text: Text containing variable placeholders
+
+    Returns:
+        The compiled template
+    """
+    return VariableTemplate(text)
+
+
 def substitute_simple_dollar(text: str, variables: Dict[str, Any]) -> str:
     """Handle simple $variable syntax with word boundary checking.
 
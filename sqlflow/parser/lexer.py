@@ -123,10 +123,90 @@ class Token:
     char_position: int = 0  # Absolute character position for error reporting
 
 
+# Keywords are matched as identifiers and then looked up, case-insensitively
+KEYWORDS: Dict[str, TokenType] = {
+    "SOURCE": TokenType.SOURCE,
+    "TYPE": TokenType.TYPE,
+    "PARAMS": TokenType.PARAMS,
+    "LOAD": TokenType.LOAD,
+    "FROM": TokenType.FROM,
+    "EXPORT": TokenType.EXPORT,
+    "TO": TokenType.TO,
+    "OPTIONS": TokenType.OPTIONS,
+    "SELECT": TokenType.SELECT,
+    "INCLUDE": TokenType.INCLUDE,
+    "AS": TokenType.AS,
+    "SET": TokenType.SET,
+    "CREATE": TokenType.CREATE,
+    "TABLE": TokenType.TABLE,
+    "BETWEEN": TokenType.BETWEEN,
+    "IN": TokenType.IN,
+    "AND": TokenType.AND,
+    "OR": TokenType.OR,
+    "UNION": TokenType.UNION,
+    "ALL": TokenType.ALL,
+    # Load mode keywords
+    "MODE": TokenType.MODE,
+    "REPLACE": TokenType.REPLACE,
+    "APPEND": TokenType.APPEND,
+    "UPSERT": TokenType.UPSERT,
+    "INCREMENTAL": TokenType.INCREMENTAL,
+    # Transform mode keywords
+    "BY": TokenType.BY,
+    "KEY": TokenType.KEY,
+    "LOOKBACK": TokenType.LOOKBACK,
+    # Conditional execution keywords
+    "IF": TokenType.IF,
+    "THEN": TokenType.THEN,
+    "ELSE": TokenType.ELSE,
+}
+
+# Token patterns in order of precedence; the first alternative that matches
+# at the current position wins. WORD covers identifiers and keywords.
+_TOKEN_PATTERNS: List[Tuple[str, str]] = [
+    ("WHITESPACE", r"\s+"),
+    ("COMMENT", r"--.*?(?:\n|$)"),
+    # ELSEIF / ELSE IF and ENDIF / END IF may be written as one or two words
+    ("ELSE_IF", r"(?i:ELSE\s*IF)\b"),
+    ("END_IF", r"(?i:END\s*IF)\b"),
+    ("WORD", r"[a-zA-Z_][a-zA-Z0-9_]*"),
+    # Compound operators (must come before single char operators)
+    ("GREATER_EQUAL", r">="),
+    ("LESS_EQUAL", r"<="),
+    ("NOT_EQUAL", r"!="),
+    ("CONCAT", r"\|\|"),  # SQL concatenation operator ||
+    # ${var} or ${var|default} style variables (must come before operators)
+    ("VARIABLE", r"\$\{[^}]+\}"),
+    # Single char operators
+    ("GREATER_THAN", r">"),
+    ("LESS_THAN", r"<"),
+    ("EQUALS", r"="),
+    ("PIPE", r"\|"),
+    ("DOLLAR", r"\$"),
+    ("LEFT_BRACE", r"{"),
+    ("RIGHT_BRACE", r"}"),
+    ("LEFT_PAREN", r"\("),
+    ("RIGHT_PAREN", r"\)"),
+    ("COMMA", r","),
+    ("SEMICOLON", r";"),
+    ("COLON", r":"),
+    ("DOT", r"\."),
+    ("STRING", r'"(?:[^"\\]|\\.)*"|\'(?:[^\'\\]|\\.)*\''),
+    ("NUMBER", r"\d+(?:\.\d+)?"),
+]
+
+TOKEN_REGEX: Pattern = re.compile(
+    "|".join(f"(?P<{name}>{pattern})" for name, pattern in _TOKEN_PATTERNS)
+)
+# Keywords must end at a word boundary, which also excludes non-ASCII letters
+_WORD_CHAR = re.compile(r"\w")
+
+
 class Lexer:
     """Lexer for SQLFlow DSL.
 
-    The lexer tokenizes the input text into a sequence of tokens.
+    The lexer tokenizes the input text into a sequence of tokens in a single
+    pass, matching one combined regex at the current position.
     """
 
     def __init__(self, text: str):
@@ -143,76 +223,6 @@ class Lexer:
         self.column = 1
         self.tokens: List[Token] = []
 
-        # Define patterns in order of precedence
-        self.patterns: List[Tuple[TokenType, Pattern]] = [
-            (TokenType.WHITESPACE, re.compile(r"\s+")),
-            (TokenType.COMMENT, re.compile(r"--.*?(?:\n|$)")),
-            # SQL keywords
-            (TokenType.SOURCE, re.compile(r"SOURCE\b", re.IGNORECASE)),
-            (TokenType.TYPE, re.compile(r"TYPE\b", re.IGNORECASE)),
-            (TokenType.PARAMS, re.compile(r"PARAMS\b", re.IGNORECASE)),
-            (TokenType.LOAD, re.compile(r"LOAD\b", re.IGNORECASE)),
-            (TokenType.FROM, re.compile(r"FROM\b", re.IGNORECASE)),
-            (TokenType.EXPORT, re.compile(r"EXPORT\b", re.IGNORECASE)),
-            (TokenType.TO, re.compile(r"TO\b", re.IGNORECASE)),
-            (TokenType.OPTIONS, re.compile(r"OPTIONS\b", re.IGNORECASE)),
-            (TokenType.SELECT, re.compile(r"SELECT\b", re.IGNORECASE)),
-            (TokenType.INCLUDE, re.compile(r"INCLUDE\b", re.IGNORECASE)),
-            (TokenType.AS, re.compile(r"AS\b", re.IGNORECASE)),
-            (TokenType.SET, re.compile(r"SET\b", re.IGNORECASE)),
-            (TokenType.CREATE, re.compile(r"CREATE\b", re.IGNORECASE)),
-            (TokenType.TABLE, re.compile(r"TABLE\b", re.IGNORECASE)),
-            (TokenType.BETWEEN, re.compile(r"BETWEEN\b", re.IGNORECASE)),
-            (TokenType.IN, re.compile(r"IN\b", re.IGNORECASE)),
-            (TokenType.AND, re.compile(r"AND\b", re.IGNORECASE)),
-            (TokenType.OR, re.compile(r"OR\b", re.IGNORECASE)),
-            (TokenType.UNION, re.compile(r"UNION\b", re.IGNORECASE)),
-            (TokenType.ALL, re.compile(r"ALL\b", re.IGNORECASE)),
-            # Load mode patterns
-            (TokenType.MODE, re.compile(r"MODE\b", re.IGNORECASE)),
-            (TokenType.REPLACE, re.compile(r"REPLACE\b", re.IGNORECASE)),
-            (TokenType.APPEND, re.compile(r"APPEND\b", re.IGNORECASE)),
-            (TokenType.UPSERT, re.compile(r"UPSERT\b", re.IGNORECASE)),
-            (TokenType.INCREMENTAL, re.compile(r"INCREMENTAL\b", re.IGNORECASE)),  # NEW
-            # Transform mode patterns
-            (TokenType.BY, re.compile(r"BY\b", re.IGNORECASE)),  # NEW
-            (TokenType.KEY, re.compile(r"KEY\b", re.IGNORECASE)),  # NEW
-            (TokenType.LOOKBACK, re.compile(r"LOOKBACK\b", re.IGNORECASE)),  # NEW
-            # Conditional execution patterns
-            (TokenType.IF, re.compile(r"IF\b", re.IGNORECASE)),
-            (TokenType.THEN, re.compile(r"THEN\b", re.IGNORECASE)),
-            (TokenType.ELSE_IF, re.compile(r"ELSE\s*IF\b", re.IGNORECASE)),
-            (TokenType.ELSE, re.compile(r"ELSE\b", re.IGNORECASE)),
-            (TokenType.END_IF, re.compile(r"END\s*IF\b", re.IGNORECASE)),
-            # Compound operators (must come before single char operators)
-            (TokenType.GREATER_EQUAL, re.compile(r">=")),
-            (TokenType.LESS_EQUAL, re.compile(r"<=")),
-            (TokenType.NOT_EQUAL, re.compile(r"!=")),
-            (TokenType.CONCAT, re.compile(r"\|\|")),  # SQL concatenation operator ||
-            # Handle ${var} or ${var|default} style variables (must come before individual operators)
-            (TokenType.VARIABLE, re.compile(r"\$\{[^}]+\}")),
-            # Single char operators
-            (TokenType.GREATER_THAN, re.compile(r">")),
-            (TokenType.LESS_THAN, re.compile(r"<")),
-            (TokenType.EQUALS, re.compile(r"=")),
-            (TokenType.PIPE, re.compile(r"\|")),
-            (TokenType.DOLLAR, re.compile(r"\$")),
-            (TokenType.LEFT_BRACE, re.compile(r"{")),
-            (TokenType.RIGHT_BRACE, re.compile(r"}")),
-            (TokenType.LEFT_PAREN, re.compile(r"\(")),
-            (TokenType.RIGHT_PAREN, re.compile(r"\)")),
-            (TokenType.COMMA, re.compile(r",")),
-            (TokenType.SEMICOLON, re.compile(r";")),
-            (TokenType.COLON, re.compile(r":")),  # NEW: For JSON key-value pairs
-            (TokenType.DOT, re.compile(r"\.")),
-            (
-                TokenType.STRING,
-                re.compile(r'"(?:[^"\\]|\\.)*"|\'(?:[^\'\\]|\\.)*\''),
-            ),
-            (TokenType.NUMBER, re.compile(r"\d+(?:\.\d+)?")),
-            (TokenType.IDENTIFIER, re.compile(r"[a-zA-Z_][a-zA-Z0-9_]*")),
-        ]
-
     def tokenize(self) -> List[Token]:
         """Tokenize the input text.
 
@@ -229,13 +239,12 @@ class Lexer:
 
     def _tokenize_next(self) -> None:
         """Tokenize the next token in the input text."""
+        start_line = self.line
+        start_column = self.column
+        start_pos = self.pos
+
         # Check for JSON object first
         if self.text[self.pos] == "{":
-            # Capture position before extraction
-            start_line = self.line
-            start_column = self.column
-            start_pos = self.pos
-
             json_value, success = self._extract_json_object()
             if success:
                 self.tokens.append(
@@ -247,52 +256,53 @@ class Lexer:
                         start_pos,
                     )
                 )
-                # Now advance position based on the extracted JSON
-                for char in json_value:
-                    if char == "\n":
-                        self.line += 1
-                        self.column = 1
-                    else:
-                        self.column += 1
-                self.pos += len(json_value)
-                return
-
-        # Capture position before pattern matching
-        start_line = self.line
-        start_column = self.column
-        start_pos = self.pos
-
-        for token_type, pattern in self.patterns:
-            match = pattern.match(self.text[self.pos :])
-            if match:
-                value = match.group(0)
-
-                if token_type not in (TokenType.WHITESPACE, TokenType.COMMENT):
-                    self.tokens.append(
-                        Token(token_type, value, start_line, start_column, start_pos)
-                    )
-
-                for char in value:
-                    if char == "\n":
-                        self.line += 1
-                        self.column = 1
-                    else:
-                        self.column += 1
-
-                self.pos += len(value)
+                self._advance(json_value)
                 return
 
-        self.tokens.append(
-            Token(
-                TokenType.ERROR,
-                self.text[self.pos],
-                start_line,
-                start_column,
-                start_pos,
+        match = TOKEN_REGEX.match(self.text, self.pos)
+        if match is None:
+            self.tokens.append(
+                Token(
+                    TokenType.ERROR,
+                    self.text[self.pos],
+                    start_line,
+                    start_column,
+                    start_pos,
+                )
             )
-        )
-        self.column += 1
-        self.pos += 1
+            self.column += 1
+            self.pos += 1
+            return
+
+        value = match.group()
+        kind = match.lastgroup
+        if kind == "WORD":
+            token_type = self._word_token_type(value, match.end())
+        else:
+            token_type = TokenType[kind]
+
+        if token_type not in (TokenType.WHITESPACE, TokenType.COMMENT):
+            self.tokens.append(
+                Token(token_type, value, start_line, start_column, start_pos)
+            )
+        self._advance(value)
+
+    def _word_token_type(self, word: str, end: int) -> TokenType:
+        """Get the keyword type of a word, or IDENTIFIER."""
+        token_type = KEYWORDS.get(word.upper())
+        if token_type is None or _WORD_CHAR.match(self.text, end):
+            return TokenType.IDENTIFIER
+        return token_type
+
+    def _advance(self, value: str) -> None:
+        """Move past a matched value, updating line and column."""
+        newlines = value.count("\n")
+        if newlines:
+            self.line += newlines
+            self.column = len(value) - value.rfind("\n")
+        else:
+            self.column += len(value)
+        self.pos += len(value)
 
     def _is_character_in_string(
         self, in_string: bool, escape_next: bool, char: str
@@ -1421,7 +1421,12 @@ class Parser:
 
             # Pre-process the JSON to handle variables and trailing commas
             json_text = json_token.value
-            json_text_for_validation = replace_variables_for_validation(json_text)
+            try:
+                # Keep ${var} references inside strings for substitution at
+                # run time instead of baking in the validation dummy values
+                return json.loads(replace_variables_for_validation(json_text, {}))
+            except json.JSONDecodeError:
+                json_text_for_validation = replace_variables_for_validation(json_text)
 
             # Try to parse the JSON
             return json.loads(json_text_for_validation)
@@ -6,6 +6,11 @@ that can be used within SQLFlow pipelines.
 
 from sqlflow.udfs.decorators import python_scalar_udf, python_table_udf
 from sqlflow.udfs.manager import PythonUDFManager
+from sqlflow.udfs.udf_patch import patch_udf_manager
+
+# Handle default parameters in UDFs; applied here rather than when sqlflow is
+# imported so that pandas is only loaded by code that uses UDFs
+patch_udf_manager()
 
 __all__ = [
     "python_scalar_udf",
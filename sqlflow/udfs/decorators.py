@@ -315,6 +315,7 @@ def python_table_udf(
     required_columns: Optional[List[str]] = None,
     output_schema: Optional[Dict[str, str]] = None,
     infer: bool = False,
+    processes: Optional[int] = None,
 ) -> Callable:
     """Decorator to mark a function as a SQLFlow table UDF.
 
@@ -331,6 +332,10 @@ def python_table_udf(
                       (e.g., {"name": "VARCHAR", "age": "INTEGER"})
         infer: If True, automatically infer the output schema from the first execution
               Note: This should only be used for development or quick prototypes
+        processes: Optional number of worker processes. When greater than 1, the
+                  input is split into row ranges that run in parallel processes.
+                  Only use this for UDFs where each output row depends only on
+                  its own input row.
 
     Returns:
     -------
@@ -400,6 +405,7 @@ def python_table_udf(
         wrapper._param_info = _create_param_info(sig.parameters)  # type: ignore
         wrapper._output_schema = output_schema  # type: ignore
         wrapper._infer_schema = infer  # type: ignore
+        wrapper._processes = processes  # type: ignore
 
         return cast(FuncType, wrapper)
 
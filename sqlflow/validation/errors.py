@@ -42,6 +42,24 @@ class ValidationError(Exception):
 
         return result
 
+    def __reduce__(self):
+        """Pickle by field values so errors can cross process boundaries.
+
+        Exception pickling replays the constructor's positional args, which
+        dataclass keyword construction leaves empty.
+        """
+        return (
+            self.__class__,
+            (
+                self.message,
+                self.line,
+                self.column,
+                self.error_type,
+                self.suggestions,
+                self.help_url,
+            ),
+        )
+
     @classmethod
     def from_parse_error(cls, parse_error: Exception) -> "ValidationError":
         """Convert parser errors to validation errors.
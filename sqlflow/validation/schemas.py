@@ -10,7 +10,7 @@ class FieldSchema:
 
     name: str
     required: bool = True
-    field_type: str = "string"  # string, integer, boolean, array
+    field_type: str = "string"  # string, integer, boolean, array, object
     description: str = ""
     allowed_values: Optional[List[Any]] = None
     pattern: Optional[str] = None  # regex pattern for string validation
@@ -62,6 +62,10 @@ class FieldSchema:
             errors.append(
                 f"Field '{self.name}' must be an array, got {type(value).__name__}"
             )
+        elif self.field_type == "object" and not isinstance(value, dict):
+            errors.append(
+                f"Field '{self.name}' must be an object, got {type(value).__name__}"
+            )
         elif self.field_type == "number" and not isinstance(value, (int, float, str)):
             errors.append(
                 f"Field '{self.name}' must be a number (int, float, or string), got {type(value).__name__}"
@@ -207,6 +211,12 @@ CSV_SCHEMA = ConnectorSchema(
             field_type="integer",
             description="Maximum number of retry attempts",
         ),
+        FieldSchema(
+            name="native_scan",
+            required=False,
+            field_type="boolean",
+            description="Load local files with DuckDB's read_csv scanner (default: true)",
+        ),
     ],
 )
 
@@ -668,6 +678,18 @@ PARQUET_SCHEMA = ConnectorSchema(
             field_type="integer",
             description="Number of rows per batch for large files",
         ),
+        FieldSchema(
+            name="filters",
+            required=False,
+            field_type="object",
+            description=('Row filters, e.g. {"year": 2024} or {"amount": {">=": 100}}'),
+        ),
+        FieldSchema(
+            name="native_scan",
+            required=False,
+            field_type="boolean",
+            description="Load local files with DuckDB's read_parquet scanner (default: true)",
+        ),
         # Standard sync parameters (Airbyte/Fivetran compatible)
         FieldSchema(
             name="sync_mode",
@@ -4,6 +4,8 @@ from typing import Any, Dict, List, Optional
 
 import networkx as nx
 
+from sqlflow.core.graph import DependencyGraph
+
 
 class PipelineDAG:
     """Directed Acyclic Graph representation of a pipeline."""
@@ -96,7 +98,7 @@ class PipelineDAG:
             True if the DAG has cycles, False otherwise
 
         """
-        return not nx.is_directed_acyclic_graph(self.graph)
+        return self._dependency_graph().has_cycles()
 
     def find_cycle(self) -> Optional[List[str]]:
         """Find a cycle in the DAG.
@@ -104,13 +106,12 @@ class PipelineDAG:
         Returns:
             A list of nodes representing the cycle, or None if no cycle exists.
         """
-        try:
-            # find_cycle returns edges, so we extract the nodes.
-            cycle_edges = list(nx.find_cycle(self.graph))
-            # To get a clean node path, we take the source node of each edge.
-            return [u for u, v in cycle_edges]
-        except nx.NetworkXNoCycle:
-            return None
+        cycles = self._dependency_graph().find_cycles()
+        return cycles[0] if cycles else None
+
+    def _dependency_graph(self) -> DependencyGraph:
+        """Build the shared compact graph used for structural checks."""
+        return DependencyGraph.from_edges(self.graph.edges, nodes=self.graph.nodes)
 
     def get_topological_sort(self) -> List[str]:
         """Get a topological sort of the DAG.
@@ -148,11 +149,15 @@ class DAGBuilder:
         dag = PipelineDAG()
 
         for step in pipeline_steps:
-            dag.add_node(
-                step["id"],
-                label=step.get("name", step["id"]),
-                type=step.get("type", "unknown"),
-            )
+            attrs = {
+                "label": step.get("name", step["id"]),
+                "type": step.get("type", "unknown"),
+            }
+            # Schedule annotations from the planner, when present
+            for key in ("wave", "estimated_seconds", "on_critical_path"):
+                if key in step:
+                    attrs[key] = step[key]
+            dag.add_node(step["id"], **attrs)
 
         for step in pipeline_steps:
             if "depends_on" in step:
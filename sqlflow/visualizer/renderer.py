@@ -1,7 +1,16 @@
 """Renderer for SQLFlow pipeline visualizations."""
 
+from typing import Dict, List
+
 from sqlflow.visualizer.dag_builder import PipelineDAG
 
+# DOT node attributes by step type
+NODE_STYLES = {
+    "source": 'style="filled" fillcolor="#e6f3ff"',
+    "transform": 'style="filled" fillcolor="#e6ffe6"',
+    "export": 'style="filled" fillcolor="#fff0e6"',
+}
+
 
 class Renderer:
     """Renders DAG visualizations."""
@@ -33,18 +42,14 @@ class Renderer:
         for node_id in dag.get_all_nodes():
             attrs = dag.get_node_attributes(node_id)
             label = attrs.get("label", node_id)
-            node_type = attrs.get("type", "unknown")
-
-            style = ""
-            if node_type == "source":
-                style = 'style="filled" fillcolor="#e6f3ff"'
-            elif node_type == "transform":
-                style = 'style="filled" fillcolor="#e6ffe6"'
-            elif node_type == "export":
-                style = 'style="filled" fillcolor="#fff0e6"'
+            style = NODE_STYLES.get(attrs.get("type", "unknown"), "")
+            if attrs.get("on_critical_path"):
+                style += " penwidth=2"
 
             dot.append(f'  "{node_id}" [label="{label}" {style}];')
 
+        dot.extend(self._render_wave_ranks(dag))
+
         for node_id in dag.get_all_nodes():
             for successor in dag.get_successors(node_id):
                 dot.append(f'  "{node_id}" -> "{successor}";')
@@ -52,6 +57,23 @@ class Renderer:
         dot.append("}")
         return "\n".join(dot)
 
+    def _render_wave_ranks(self, dag: PipelineDAG) -> List[str]:
+        """Render DOT rank groups that draw the steps of a wave side by side.
+
+        Steps of the same wave can run concurrently.
+        """
+        waves: Dict[int, List[str]] = {}
+        for node_id in dag.get_all_nodes():
+            wave = dag.get_node_attributes(node_id).get("wave")
+            if wave is not None:
+                waves.setdefault(wave, []).append(node_id)
+        return [
+            "  { rank=same; "
+            + " ".join(f'"{node_id}";' for node_id in waves[wave])
+            + " }"
+            for wave in sorted(waves)
+        ]
+
     def render_png(self, dag: PipelineDAG, output_path: str) -> None:
         """Render a DAG as a PNG image.
 
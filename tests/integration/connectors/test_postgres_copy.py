@@ -0,0 +1,133 @@
+"""Integration tests for PostgresSource reads streamed through COPY."""
+
+import os
+import time
+
+import psycopg2
+import pyarrow as pa
+import pytest
+
+from sqlflow.connectors.postgres.source import PostgresSource
+
+# Mark all tests in this module as requiring external services
+pytestmark = pytest.mark.external_services
+
+ROWS = 200_000
+
+
+@pytest.fixture(scope="module")
+def postgres_config():
+    """Real PostgreSQL configuration from docker-compose.yml."""
+    return {
+        "host": "localhost",
+        "port": 5432,
+        "dbname": "postgres",
+        "user": "postgres",
+        "password": "postgres",
+    }
+
+
+@pytest.fixture(scope="module")
+def copy_test_table(postgres_config):
+    """Create a table covering the types COPY output is parsed into."""
+    if not os.getenv("INTEGRATION_TESTS", "").lower() in ["true", "1"]:
+        pytest.skip("Integration tests disabled. Set INTEGRATION_TESTS=true to enable.")
+
+    try:
+        conn = psycopg2.connect(**postgres_config)
+    except Exception as e:
+        pytest.skip(f"PostgreSQL service not available: {e}")
+
+    with conn, conn.cursor() as cursor:
+        cursor.execute("DROP TABLE IF EXISTS copy_read_test")
+        cursor.execute(
+            f"""
+            CREATE TABLE copy_read_test AS
+            SELECT
+                g AS id,
+                CASE
+                    WHEN g % 7 = 0 THEN NULL
+                    WHEN g % 5 = 0 THEN ''
+                    WHEN g % 3 = 0 THEN E'two\\nlines, "quoted"'
+                    ELSE 'NA'
+                END AS note,
+                (g * 1.25)::numeric(12, 2) AS amount,
+                g % 2 = 0 AS active,
+                timestamptz '2024-01-01 00:00:00+02' + g * interval '1 second'
+                    AS created_at,
+                date '2024-01-01' + g % 365 AS created_on
+            FROM generate_series(1, {ROWS}) AS g
+            """
+        )
+    yield "copy_read_test"
+
+    with conn, conn.cursor() as cursor:
+        cursor.execute("DROP TABLE IF EXISTS copy_read_test")
+    conn.close()
+
+
+def read_table(config, read_mode, query, batch_size=50_000):
+    """Read a query into one Arrow table with the given read mode."""
+    source = PostgresSource({**config, "read_mode": read_mode})
+    chunks = list(source.read(options={"query": query}, batch_size=batch_size))
+    return pa.concat_tables(chunk.arrow_table for chunk in chunks)
+
+
+class TestPostgresCopyRead:
+    """Test COPY reads against a real PostgreSQL service."""
+
+    def test_copy_matches_cursor_read(self, postgres_config, copy_test_table):
+        """Test that COPY returns the same rows as the cursor path."""
+        query = f"SELECT * FROM {copy_test_table} ORDER BY id"
+        copied = read_table(postgres_config, "copy", query)
+        fetched = read_table(postgres_config, "cursor", query)
+
+        assert copied.num_rows == ROWS
+        assert copied.schema.field("amount").type == pa.decimal128(12, 2)
+        for column in ["id", "note", "active", "created_at", "created_on"]:
+            assert copied[column].to_pylist() == fetched[column].to_pylist()
+        assert [float(value) for value in copied["amount"].to_pylist()] == fetched[
+            "amount"
+        ].to_pylist()
+
+    def test_stopping_early_releases_connection(self, postgres_config, copy_test_table):
+        """Test that an abandoned COPY does not leak or poison connections."""
+        source = PostgresSource({**postgres_config, "read_mode": "copy"})
+        chunks = source.read(
+            options={"query": f"SELECT * FROM {copy_test_table}"}, batch_size=100
+        )
+        assert next(chunks).arrow_table.num_rows < ROWS
+        chunks.close()
+
+        (chunk,) = source.read(options={"query": "SELECT 42 AS answer"})
+        assert chunk.arrow_table.to_pylist() == [{"answer": 42}]
+        assert source.engine.pool.checkedout() == 0
+
+    def test_query_errors_are_raised(self, postgres_config, copy_test_table):
+        """Test that errors raised by the server surface unchanged."""
+        with pytest.raises(psycopg2.errors.DivisionByZero):
+            read_table(postgres_config, "copy", f"SELECT id / 0 FROM {copy_test_table}")
+
+
+@pytest.mark.performance
+class TestPostgresCopyReadPerformance:
+    """Benchmark COPY reads against the cursor path."""
+
+    def test_copy_read_speed(self, postgres_config, copy_test_table):
+        """Test that streaming COPY output beats fetching rows."""
+        query = f"SELECT * FROM {copy_test_table}"
+
+        start = time.perf_counter()
+        copied = read_table(postgres_config, "copy", query)
+        elapsed = time.perf_counter() - start
+
+        start = time.perf_counter()
+        read_table(postgres_config, "cursor", query)
+        cursor_elapsed = time.perf_counter() - start
+
+        print(
+            f"\nRead {copied.num_rows} rows with COPY in {elapsed:.3f}s "
+            f"(cursor: {cursor_elapsed:.3f}s)"
+        )
+        assert copied.num_rows == ROWS
+        assert elapsed < 5.0
@@ -0,0 +1,261 @@
+"""Integration tests and benchmark for the backfill runner.
+
+These tests parse real pipelines once and run them for several values of a
+variable, checking that the shared plan matches planning each value on its
+own and that every partition runs on an isolated DuckDB engine.
+"""
+
+import time
+
+import duckdb
+import pandas as pd
+import pytest
+
+from sqlflow.core.executors.backfill import (
+    BackfillRunner,
+    conditions_depend_on,
+    expand_backfill_values,
+    partition_database_path,
+)
+from sqlflow.core.planner_main import Planner
+from sqlflow.parser import SQLFlowParser
+
+DATES = ["2024-01-01", "2024-01-02", "2024-01-03", "2024-01-04"]
+
+
+def _daily_pipeline(data_dir, output_dir):
+    """Pipeline loading one CSV per run_date and exporting its total."""
+    return f"""
+    SET region = "${{region|eu}}";
+    SOURCE daily TYPE CSV PARAMS {{
+        "path": "{data_dir}/${{run_date}}.csv", "has_header": true
+    }};
+    LOAD orders FROM daily;
+    CREATE TABLE totals AS
+        SELECT '${{run_date}}' AS run_date, '${{region}}' AS region,
+               SUM(amount) AS total
+        FROM orders;
+    EXPORT SELECT * FROM totals TO "{output_dir}/${{run_date}}.csv"
+        TYPE CSV OPTIONS {{"header": true}};
+    """
+
+
+class TestExpandBackfillValues:
+    """Test parsing of --var backfill specifications."""
+
+    def test_date_range_is_inclusive_and_daily(self):
+        """Test that date ranges yield one value per day across months."""
+        assert expand_backfill_values("run_date=2024-02-28..2024-03-01") == (
+            "run_date",
+            ["2024-02-28", "2024-02-29", "2024-03-01"],
+        )
+
+    def test_integer_range_and_list(self):
+        """Test integer ranges and explicit comma-separated values."""
+        assert expand_backfill_values("batch=1..3") == ("batch", ["1", "2", "3"])
+        assert expand_backfill_values("region=eu, us") == ("region", ["eu", "us"])
+
+    @pytest.mark.parametrize(
+        "spec", ["run_date", "=1..2", "d=2024-01-02..2024-01-01", "d=a..b"]
+    )
+    def test_invalid_specifications(self, spec):
+        """Test that malformed and empty ranges are rejected."""
+        with pytest.raises(ValueError):
+            expand_backfill_values(spec)
+
+
+class TestConditionsDependOn:
+    """Test detection of conditions depending on the backfill variable."""
+
+    def test_direct_and_transitive_references(self):
+        """Test references in conditions, directly and through SET variables."""
+        pipeline = SQLFlowParser(
+            """
+        SET month = "${run_date}";
+        IF '${month}' == '2024-01-01' THEN
+            CREATE TABLE first_day AS SELECT 1 AS x;
+        END IF;
+        """
+        ).parse()
+        assert conditions_depend_on(pipeline, "run_date")
+        assert conditions_depend_on(pipeline, "month")
+        assert not conditions_depend_on(pipeline, "region")
+
+    def test_steps_only_references(self):
+        """Test that references outside conditions do not count."""
+        pipeline = SQLFlowParser(_daily_pipeline("data", "out")).parse()
+        assert not conditions_depend_on(pipeline, "run_date")
+
+
+class TestPartitionDatabasePath:
+    """Test naming of per-partition database files."""
+
+    def test_partition_files_sit_next_to_the_database(self):
+        """Test that each value gets its own file in a backfill directory."""
+        path = partition_database_path("target/prod.duckdb", "run_date", "2024-01-01")
+
+        assert path == "target/prod_backfill/run_date=2024-01-01.duckdb"
+
+    def test_unsafe_values_get_distinct_names(self):
+        """Test that values differing only in unsafe characters never collide."""
+        slash = partition_database_path("prod.db", "region", "eu/west")
+        colon = partition_database_path("prod.db", "region", "eu:west")
+
+        assert "/" not in slash.split("prod_backfill/")[1]
+        assert slash != colon
+
+
+@pytest.mark.integration
+class TestBackfillRunner:
+    """Integration tests running backfills on real DuckDB engines."""
+
+    @pytest.fixture(scope="function")
+    def daily_files(self, tmp_path):
+        """Create one orders CSV per date, with the day number as amounts."""
+        data_dir = tmp_path / "data"
+        data_dir.mkdir()
+        for day, date in enumerate(DATES, start=1):
+            pd.DataFrame({"amount": [day, day * 10]}).to_csv(
+                data_dir / f"{date}.csv", index=False
+            )
+        return data_dir, tmp_path / "out"
+
+    def test_shared_plan_matches_planning_each_value(self, daily_files):
+        """Test that rendered plans equal plans created for each value."""
+        data_dir, output_dir = daily_files
+        pipeline_text = _daily_pipeline(data_dir, output_dir)
+        runner = BackfillRunner(
+            SQLFlowParser(pipeline_text).parse(),
+            "run_date",
+            variables={"region": "us"},
+        )
+        runner.compile()
+
+        assert runner.shares_plan
+        for date in DATES:
+            expected = Planner().create_plan(
+                SQLFlowParser(pipeline_text).parse(),
+                variables={"region": "us", "run_date": date},
+            )
+            assert runner.plan_for(date) == expected
+
+    def test_conditional_pipelines_are_planned_per_value(self):
+        """Test that branches are chosen per value when conditions depend on it."""
+        runner = BackfillRunner(
+            SQLFlowParser(
+                """
+            IF '${run_date}' == '2024-01-01' THEN
+                CREATE TABLE first_day AS SELECT 1 AS x;
+            ELSE
+                CREATE TABLE other_day AS SELECT 2 AS x;
+            END IF;
+            """
+            ).parse(),
+            "run_date",
+        )
+        runner.compile()
+
+        assert not runner.shares_plan
+        (first_day,) = runner.plan_for("2024-01-01")
+        (other_day,) = runner.plan_for("2024-01-02")
+        assert first_day["id"].startswith("transform_first_day")
+        assert other_day["id"].startswith("transform_other_day")
+
+    def test_runs_partitions_in_parallel_on_isolated_engines(self, daily_files):
+        """Test that each date is loaded, transformed and exported on its own."""
+        data_dir, output_dir = daily_files
+        runner = BackfillRunner(
+            SQLFlowParser(_daily_pipeline(data_dir, output_dir)).parse(),
+            "run_date",
+            max_workers=3,
+        )
+        finished = []
+
+        results = runner.run(DATES, on_partition_done=finished.append)
+
+        assert [result.value for result in results] == DATES
+        assert all(result.success for result in results), [
+            result.error_message for result in results
+        ]
+        assert sorted(result.value for result in finished) == DATES
+        for day, date in enumerate(DATES, start=1):
+            exported = pd.read_csv(output_dir / f"{date}.csv")
+            assert exported.to_dict("records") == [
+                {"run_date": date, "region": "eu", "total": day * 11}
+            ]
+
+    def test_persistent_profile_writes_one_database_per_partition(
+        self, daily_files, tmp_path
+    ):
+        """Test that persistent profiles keep each partition's tables on disk."""
+        data_dir, output_dir = daily_files
+        database_path = str(tmp_path / "prod.duckdb")
+        runner = BackfillRunner(
+            SQLFlowParser(_daily_pipeline(data_dir, output_dir)).parse(),
+            "run_date",
+            max_workers=2,
+            engine_config={"mode": "persistent", "path": database_path},
+        )
+
+        results = runner.run(DATES[:2])
+
+        assert all(result.success for result in results)
+        assert not (tmp_path / "prod.duckdb").exists()
+        for day, date in enumerate(DATES[:2], start=1):
+            path = partition_database_path(database_path, "run_date", date)
+            with duckdb.connect(path, read_only=True) as connection:
+                total = connection.execute("SELECT total FROM totals").fetchone()
+            assert total == (day * 11,)
+
+    def test_failed_partition_does_not_stop_others(self, daily_files):
+        """Test that a missing input fails only its own partition."""
+        data_dir, output_dir = daily_files
+        (data_dir / f"{DATES[1]}.csv").unlink()
+        runner = BackfillRunner(
+            SQLFlowParser(_daily_pipeline(data_dir, output_dir)).parse(),
+            "run_date",
+            max_workers=2,
+        )
+
+        results = runner.run(DATES)
+
+        assert [result.success for result in results] == [True, False, True, True]
+        assert results[1].error_message
+        assert not (output_dir / f"{DATES[1]}.csv").exists()
+        assert (output_dir / f"{DATES[3]}.csv").exists()
+
+
+@pytest.mark.performance
+class TestBackfillPlanningPerformance:
+    """Benchmark planning a year of partitions."""
+
+    def test_plan_year_of_dates(self):
+        """Test that rendering 365 plans beats planning every date."""
+        steps = "\n".join(
+            f"CREATE TABLE t{i} AS SELECT * FROM "
+            f"{'t' + str(i - 1) if i else 'raw'} WHERE dt = '${{run_date}}';"
+            for i in range(200)
+        )
+        pipeline_text = (
+            'SOURCE s TYPE CSV PARAMS {"path": "data/${run_date}.csv"};\n'
+            "LOAD raw FROM s;\n" + steps
+        )
+        dates = expand_backfill_values("run_date=2024-01-01..2024-12-30")[1]
+
+        start = time.perf_counter()
+        runner = BackfillRunner(SQLFlowParser(pipeline_text).parse(), "run_date")
+        plans = [runner.plan_for(date) for date in dates]
+        elapsed = time.perf_counter() - start
+
+        planner_start = time.perf_counter()
+        pipeline = SQLFlowParser(pipeline_text).parse()
+        for date in dates[:30]:
+            Planner().create_plan(pipeline, variables={"run_date": date})
+        planner_elapsed = (time.perf_counter() - planner_start) * len(dates) / 30
+
+        print(
+            f"\nPlanned {len(plans)} partitions in {elapsed:.3f}s "
+            f"(planning each date: ~{planner_elapsed:.3f}s)"
+        )
+        assert len(plans) == 365
+        assert elapsed < 5.0
@@ -0,0 +1,152 @@
+"""Integration tests for the thread-pool executor.
+
+These tests run real plans from the planner through ThreadPoolTaskExecutor,
+checking that steps are dispatched to the V2 step executors in dependency
+order and that independent steps overlap on per-worker DuckDB cursors.
+"""
+
+import os
+import threading
+
+import pandas as pd
+import pytest
+
+from sqlflow.core.engines.duckdb.engine import DuckDBEngine
+from sqlflow.core.executors.thread_pool_executor import ThreadPoolTaskExecutor
+from sqlflow.core.executors.v2.execution.context import create_test_context
+from sqlflow.core.executors.v2.steps.registry import StepExecutorRegistry
+from sqlflow.core.executors.v2.steps.transform import TransformStepExecutor
+from sqlflow.core.planner_main import Planner
+from sqlflow.parser import SQLFlowParser
+
+
+class BarrierTransformStepExecutor(TransformStepExecutor):
+    """Transform executor waiting until `parties` steps run at the same time.
+
+    Steps that do not overlap time out on the barrier and fail.
+    """
+
+    def __init__(self, parties: int, timeout: float = 10.0):
+        super().__init__()
+        self.barrier = threading.Barrier(parties, timeout=timeout)
+        self.thread_ids = set()
+
+    def execute(self, step, context):
+        self.thread_ids.add(threading.get_ident())
+        self.barrier.wait()
+        return super().execute(step, context)
+
+
+def _create_plan(pipeline_sql):
+    """Parse and plan a pipeline."""
+    return Planner().create_plan(SQLFlowParser(pipeline_sql).parse())
+
+
+@pytest.mark.integration
+class TestThreadPoolTaskExecutor:
+    """Integration tests for DAG-parallel step execution."""
+
+    @pytest.fixture(scope="function")
+    def real_duckdb_engine(self):
+        """Create a real DuckDB engine for testing."""
+        engine = DuckDBEngine(":memory:")
+        yield engine
+        engine.close()
+
+    @pytest.fixture(scope="function")
+    def execution_context(self, real_duckdb_engine):
+        """Create execution context with real DuckDB engine."""
+        return create_test_context(engine=real_duckdb_engine)
+
+    @pytest.fixture(scope="function")
+    def csv_files(self, tmp_path):
+        """Create two CSV files sharing an id column."""
+        customers = tmp_path / "customers.csv"
+        orders = tmp_path / "orders.csv"
+        pd.DataFrame({"id": [1, 2, 3], "name": ["Alice", "Bob", "Cara"]}).to_csv(
+            customers, index=False
+        )
+        pd.DataFrame({"id": [1, 1, 3], "amount": [10, 20, 30]}).to_csv(
+            orders, index=False
+        )
+        return str(customers), str(orders)
+
+    def test_executes_full_pipeline(
+        self, execution_context, real_duckdb_engine, csv_files, tmp_path
+    ):
+        """Test that source, load, transform and export steps all run."""
+        customers, orders = csv_files
+        output_path = tmp_path / "totals.csv"
+        plan = _create_plan(
+            f"""
+        SOURCE customers TYPE CSV PARAMS {{"path": "{customers}", "has_header": true}};
+        SOURCE orders TYPE CSV PARAMS {{"path": "{orders}", "has_header": true}};
+        LOAD customers_raw FROM customers;
+        LOAD orders_raw FROM orders;
+        CREATE TABLE totals AS
+            SELECT c.name, SUM(o.amount) AS total
+            FROM customers_raw c JOIN orders_raw o ON c.id = o.id
+            GROUP BY c.name;
+        EXPORT SELECT * FROM totals ORDER BY name TO "{output_path}"
+            TYPE CSV OPTIONS {{"header": true}};
+        """
+        )
+
+        executor = ThreadPoolTaskExecutor(max_workers=4, context=execution_context)
+        results = executor.execute(plan)
+
+        assert "error" not in results, results.get("error")
+        assert {step["id"] for step in plan} <= set(results)
+        assert all(results[step["id"]]["status"] == "success" for step in plan)
+
+        rows = real_duckdb_engine.execute_query(
+            "SELECT name, total FROM totals ORDER BY name"
+        ).fetchall()
+        assert rows == [("Alice", 30), ("Cara", 30)]
+        assert os.path.exists(output_path)
+
+    def test_independent_steps_overlap(self, execution_context, real_duckdb_engine):
+        """Test that independent steps run concurrently on separate workers."""
+        real_duckdb_engine.execute_query("CREATE TABLE base AS SELECT 1 AS id")
+        plan = _create_plan(
+            """
+        CREATE TABLE first_copy AS SELECT * FROM base;
+        CREATE TABLE second_copy AS SELECT * FROM base;
+        """
+        )
+        overlapping_executor = BarrierTransformStepExecutor(parties=2)
+        registry = StepExecutorRegistry()
+        registry.register(overlapping_executor)
+
+        executor = ThreadPoolTaskExecutor(
+            max_workers=2, context=execution_context, registry=registry
+        )
+        results = executor.execute(plan)
+
+        assert "error" not in results, results.get("error")
+        assert not overlapping_executor.barrier.broken
+        assert len(overlapping_executor.thread_ids) == 2
+        assert real_duckdb_engine.table_exists("first_copy")
+        assert real_duckdb_engine.table_exists("second_copy")
+
+    def test_failed_step_stops_dependents(self, execution_context, tmp_path):
+        """Test that a failing step is reported and its dependents never run."""
+        missing = tmp_path / "missing.csv"
+        plan = _create_plan(
+            f"""
+        SOURCE broken TYPE CSV PARAMS {{"path": "{missing}", "has_header": true}};
+        LOAD broken_raw FROM broken;
+        CREATE TABLE broken_summary AS SELECT COUNT(*) AS n FROM broken_raw;
+        """
+        )
+
+        executor = ThreadPoolTaskExecutor(
+            max_workers=2, context=execution_context, max_retries=1
+        )
+        results = executor.execute(plan)
+
+        load_id = next(step["id"] for step in plan if step["type"] == "load")
+        transform_id = next(step["id"] for step in plan if step["type"] == "transform")
+        assert results["failed_step"] == load_id
+        assert transform_id not in results
+        assert executor.can_resume()
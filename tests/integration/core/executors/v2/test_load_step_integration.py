@@ -202,3 +202,218 @@ class TestLoadStepIntegration:
             keyword in error_msg
             for keyword in ["file", "not found", "no such", "does not exist"]
         ), f"Error should mention file issue: {failed_step.error_message}"
+
+    @pytest.fixture(scope="function")
+    def sample_parquet_file(self):
+        """Create a temporary Parquet file with several row groups."""
+        import pandas as pd
+
+        with tempfile.NamedTemporaryFile(suffix=".parquet", delete=False) as f:
+            parquet_path = f.name
+
+        df = pd.DataFrame({"id": range(1000), "value": [f"v{i}" for i in range(1000)]})
+        df.to_parquet(parquet_path, index=False, row_group_size=100)
+
+        try:
+            yield parquet_path
+        finally:
+            if os.path.exists(parquet_path):
+                os.unlink(parquet_path)
+
+    def _run_pipeline(self, pipeline_sql, execution_context):
+        """Plan and execute a pipeline through the V2 coordinator."""
+        from sqlflow.core.executors import get_executor
+        from sqlflow.core.planner_main import Planner
+        from sqlflow.parser import SQLFlowParser
+
+        pipeline = SQLFlowParser(pipeline_sql).parse()
+        execution_plan = Planner().create_plan(pipeline)
+        return get_executor().execute(execution_plan, execution_context)
+
+    def test_load_parquet_streams_batches(
+        self, execution_context, real_duckdb_engine, sample_parquet_file
+    ):
+        """Test that iterator sources are streamed batch by batch into DuckDB."""
+        pipeline_sql = f"""
+        SOURCE events TYPE PARQUET PARAMS {{
+            "path": "{sample_parquet_file}",
+            "batch_size": 250,
+            "native_scan": false
+        }};
+
+        LOAD events_table FROM events MODE REPLACE;
+        """
+
+        result = self._run_pipeline(pipeline_sql, execution_context)
+
+        assert result.success is True, f"Load failed: {result}"
+        load_result = result.step_results[-1]
+        assert load_result.rows_affected == 1000
+        assert load_result.metadata["streamed"] is True
+        assert load_result.metadata["batches"] == 4
+        assert load_result.metadata["bytes_loaded"] > 0
+
+        count = real_duckdb_engine.execute_query(
+            "SELECT COUNT(*) FROM events_table"
+        ).fetchone()[0]
+        assert count == 1000
+
+    def test_load_csv_with_batch_size_streams(
+        self, execution_context, real_duckdb_engine, sample_csv_file
+    ):
+        """Test that a CSV source with batch_size is loaded in streaming mode."""
+        pipeline_sql = f"""
+        SOURCE test_csv TYPE CSV PARAMS {{
+            "path": "{sample_csv_file}",
+            "has_header": true,
+            "batch_size": 2,
+            "native_scan": false
+        }};
+
+        LOAD users FROM test_csv MODE REPLACE;
+        """
+
+        result = self._run_pipeline(pipeline_sql, execution_context)
+
+        assert result.success is True, f"Load failed: {result}"
+        load_result = result.step_results[-1]
+        assert load_result.metadata["batches"] == 2
+        rows = real_duckdb_engine.execute_query(
+            "SELECT name FROM users ORDER BY id"
+        ).fetchall()
+        assert [row[0] for row in rows] == ["Alice", "Bob", "Charlie"]
+
+    def test_load_streaming_upsert(
+        self, execution_context, real_duckdb_engine, sample_csv_file
+    ):
+        """Test UPSERT mode applied batch by batch."""
+        real_duckdb_engine.execute_query(
+            "CREATE TABLE users (id BIGINT, name VARCHAR, age BIGINT, city VARCHAR)"
+        )
+        real_duckdb_engine.execute_query(
+            "INSERT INTO users VALUES (1, 'Old Alice', 99, 'Boston'), "
+            "(4, 'Dave', 40, 'Austin')"
+        )
+        pipeline_sql = f"""
+        SOURCE test_csv TYPE CSV PARAMS {{
+            "path": "{sample_csv_file}",
+            "has_header": true,
+            "batch_size": 1
+        }};
+
+        LOAD users FROM test_csv MODE UPSERT KEY id;
+        """
+
+        result = self._run_pipeline(pipeline_sql, execution_context)
+
+        assert result.success is True, f"Upsert failed: {result}"
+        rows = real_duckdb_engine.execute_query(
+            "SELECT id, name FROM users ORDER BY id"
+        ).fetchall()
+        assert rows == [(1, "Alice"), (2, "Bob"), (3, "Charlie"), (4, "Dave")]
+
+    def test_stream_into_schema_qualified_table(self, real_duckdb_engine):
+        """Test streaming into a table in another schema, batch by batch."""
+        import pyarrow as pa
+
+        from sqlflow.core.executors.v2.steps.load import (
+            stream_reader_to_table,
+            upsert_reader_batches,
+        )
+
+        def reader(ids):
+            schema = pa.schema([("id", pa.int64()), ("name", pa.string())])
+            batches = [
+                pa.record_batch([[i], [f"name_{i}"]], schema=schema) for i in ids
+            ]
+            return pa.RecordBatchReader.from_batches(schema, batches)
+
+        real_duckdb_engine.execute_query("CREATE SCHEMA analytics")
+        stream_reader_to_table(
+            real_duckdb_engine, reader([1, 2]), "analytics.users", "REPLACE"
+        )
+        upsert_reader_batches(
+            real_duckdb_engine, reader([3]), "analytics.new_users", ["id"]
+        )
+
+        rows = real_duckdb_engine.execute_query(
+            "SELECT id, name FROM analytics.users UNION ALL "
+            "SELECT id, name FROM analytics.new_users ORDER BY id"
+        ).fetchall()
+        assert rows == [(1, "name_1"), (2, "name_2"), (3, "name_3")]
+
+    def test_load_parquet_uses_native_scan(
+        self, execution_context, real_duckdb_engine, sample_parquet_file
+    ):
+        """Test that local Parquet loads push columns and filters into DuckDB."""
+        pipeline_sql = f"""
+        SOURCE events TYPE PARQUET PARAMS {{
+            "path": "{sample_parquet_file}",
+            "columns": ["id"],
+            "filters": {{"id": {{">=": 990}}}}
+        }};
+
+        LOAD events_table FROM events MODE REPLACE;
+        """
+
+        result = self._run_pipeline(pipeline_sql, execution_context)
+
+        assert result.success is True, f"Load failed: {result}"
+        load_result = result.step_results[-1]
+        assert load_result.rows_affected == 10
+        assert load_result.metadata["native_scan"] is True
+        rows = real_duckdb_engine.execute_query(
+            "SELECT * FROM events_table ORDER BY id"
+        ).fetchall()
+        assert rows == [(i,) for i in range(990, 1000)]
+
+    def test_load_csv_native_scan_matches_connector_types(
+        self, execution_context, real_duckdb_engine, tmp_path
+    ):
+        """Test that a natively scanned CSV keeps dates as strings, like pandas."""
+        csv_path = tmp_path / "orders.csv"
+        csv_path.write_text("id,ordered_at\n1,2024-01-01T12:00:00Z\n2,2024-01-02\n")
+        pipeline_sql = f"""
+        SOURCE orders TYPE CSV PARAMS {{"path": "{csv_path}", "has_header": true}};
+
+        LOAD orders_table FROM orders MODE APPEND;
+        LOAD orders_table FROM orders MODE APPEND;
+        """
+
+        result = self._run_pipeline(pipeline_sql, execution_context)
+
+        assert result.success is True, f"Load failed: {result}"
+        assert all(step.metadata.get("native_scan") for step in result.step_results[1:])
+        rows = real_duckdb_engine.execute_query(
+            "SELECT id, ordered_at FROM orders_table ORDER BY id"
+        ).fetchall()
+        assert rows == [
+            (1, "2024-01-01T12:00:00Z"),
+            (1, "2024-01-01T12:00:00Z"),
+            (2, "2024-01-02"),
+            (2, "2024-01-02"),
+        ]
+
+    def test_load_csv_with_late_type_change_falls_back_to_connector(
+        self, execution_context, real_duckdb_engine, tmp_path
+    ):
+        """Test a column holding integers for 400k rows, then text."""
+        csv_path = tmp_path / "codes.csv"
+        with open(csv_path, "w") as f:
+            f.write("id,code\n")
+            f.writelines(f"{i},{i}\n" for i in range(400_000))
+            f.write("400000,abc\n")
+        pipeline_sql = f"""
+        SOURCE codes TYPE CSV PARAMS {{"path": "{csv_path}", "has_header": true}};
+
+        LOAD codes_table FROM codes MODE REPLACE;
+        """
+
+        result = self._run_pipeline(pipeline_sql, execution_context)
+
+        assert result.success is True, f"Load failed: {result}"
+        assert not result.step_results[-1].metadata.get("native_scan")
+        rows = real_duckdb_engine.execute_query(
+            "SELECT COUNT(*), MAX(id) FROM codes_table"
+        ).fetchone()
+        assert rows == (400_001, 400_000)
@@ -12,9 +12,13 @@ This file tests the step executors with real data and proper V2 architecture.
 import tempfile
 from pathlib import Path
 
+import pyarrow.parquet as pq
+
 from sqlflow.core.engines.duckdb.engine import DuckDBEngine
 from sqlflow.core.executors.v2 import ExecutionCoordinator
 from sqlflow.core.executors.v2.execution.context import create_test_context
+from sqlflow.core.executors.v2.steps.definitions import create_step_from_dict
+from sqlflow.core.executors.v2.steps.export import ExportStepExecutor
 
 
 class TestLoadStepExecutorIntegration:
@@ -204,6 +208,66 @@ class TestExportStepExecutorIntegration:
             Path(csv_path).unlink(missing_ok=True)
             Path(output_path).unlink(missing_ok=True)
 
+    def test_export_step_streams_batches_to_parquet(self, execution_context):
+        """Test that export streams the source table in Arrow batches."""
+        engine = execution_context.engine
+        engine.execute_query(
+            "CREATE TABLE numbers AS SELECT range AS id FROM range(10)"
+        )
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            output_path = Path(temp_dir) / "numbers.parquet"
+            step = create_step_from_dict(
+                {
+                    "id": "export_numbers",
+                    "type": "export",
+                    "source_table": "numbers",
+                    "destination": str(output_path),
+                    "format": "parquet",
+                }
+            )
+
+            executor = ExportStepExecutor(batch_size=4, native_copy=False)
+            result = executor.execute(step, execution_context)
+
+            assert result.success, result.error_message
+            assert result.rows_affected == 10
+            parquet_file = pq.ParquetFile(output_path)
+            assert parquet_file.metadata.num_row_groups == 3
+            assert parquet_file.read().column("id").to_pylist() == list(range(10))
+
+    def test_export_step_uses_native_copy_for_local_files(self, execution_context):
+        """Test that a local Parquet EXPORT is written by DuckDB's COPY."""
+        engine = execution_context.engine
+        engine.execute_query(
+            "CREATE TABLE numbers AS SELECT range AS id FROM range(10)"
+        )
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            output_path = Path(temp_dir) / "numbers.parquet"
+            step = create_step_from_dict(
+                {
+                    "id": "export_numbers",
+                    "type": "export",
+                    "source_table": "numbers",
+                    "query": {
+                        "sql_query": "SELECT * FROM numbers WHERE id >= 6",
+                        "destination_uri": str(output_path),
+                        "options": {"compression": "zstd"},
+                        "type": "parquet",
+                    },
+                }
+            )
+
+            result = ExportStepExecutor().execute(step, execution_context)
+
+            assert result.success, result.error_message
+            assert result.rows_affected == 4
+            assert result.metadata["native_copy"] is True
+            metadata = pq.ParquetFile(output_path).metadata
+            assert metadata.row_group(0).column(0).compression == "ZSTD"
+            assert pq.read_table(output_path).column("id").to_pylist() == [6, 7, 8, 9]
+
 
 class TestCompletePipelineIntegration:
     """Test complete load → transform → export pipeline."""
@@ -1,5 +1,6 @@
 """Tests for pipeline commands."""
 
+import json
 import os
 import tempfile
 
@@ -77,6 +78,64 @@ def test_compile_command(runner, sample_project):
         os.chdir(original_cwd)
 
 
+def test_compile_reuses_unchanged_plans(runner, sample_project, monkeypatch):
+    """Test that compiling an unchanged pipeline reuses its saved plan."""
+    monkeypatch.chdir(sample_project)
+    result = runner.invoke(app, ["pipeline", "compile", "test"])
+    assert result.exit_code == 0
+
+    def fail_parse(*args, **kwargs):
+        raise AssertionError("unchanged pipeline was parsed again")
+
+    monkeypatch.setattr("sqlflow.cli.business_operations.Parser.parse", fail_parse)
+    result = runner.invoke(app, ["pipeline", "compile", "test"])
+    assert result.exit_code == 0, result.output
+    assert "load_raw_data" in result.output
+
+    result = runner.invoke(app, ["pipeline", "compile", "test", "--no-cache"])
+    assert result.exit_code == 1
+
+    monkeypatch.undo()
+    monkeypatch.chdir(sample_project)
+    pipeline_path = os.path.join(sample_project, "pipelines", "test.sf")
+    with open(pipeline_path, "a") as f:
+        f.write("\nLOAD more_data FROM sample;\n")
+    result = runner.invoke(app, ["pipeline", "compile", "test"])
+    assert result.exit_code == 0
+    assert "load_more_data" in result.output
+
+
+def test_compile_and_validate_all_with_jobs(runner, sample_project, monkeypatch):
+    """Test that --jobs reports pipelines in name order."""
+    monkeypatch.chdir(sample_project)
+    pipelines_dir = os.path.join(sample_project, "pipelines")
+    for name in ["c_last", "a_first", "b_middle"]:
+        with open(os.path.join(pipelines_dir, f"{name}.sf"), "w") as f:
+            f.write(
+                'SOURCE s TYPE CSV PARAMS {"path": "data/sample.csv"};\n'
+                f"LOAD {name} FROM s;\n"
+            )
+
+    result = runner.invoke(app, ["pipeline", "compile", "--all", "--jobs", "2"])
+    assert result.exit_code == 0, result.output
+    positions = [
+        result.output.index(f"] {name}.sf")
+        for name in ["a_first", "b_middle", "c_last", "test"]
+    ]
+    assert positions == sorted(positions)
+    assert os.path.exists(
+        os.path.join(sample_project, "target", "compiled", "b_middle.json")
+    )
+
+    for name in ["c_last", "a_first"]:
+        with open(os.path.join(pipelines_dir, f"{name}.sf"), "w") as f:
+            f.write(f"LOAD {name} FROM missing_source;\n")
+    result = runner.invoke(app, ["pipeline", "validate", "--jobs", "2"])
+    assert result.exit_code == 1
+    assert "Validation failed for 2 pipeline(s)" in result.output
+    assert result.output.index("a_first") < result.output.index("c_last")
+
+
 def test_run_command(runner, sample_project):
     """Test the run command with real V2 ExecutionCoordinator - no mocks!"""
     original_cwd = os.getcwd()
@@ -93,6 +152,33 @@ def test_run_command(runner, sample_project):
         os.chdir(original_cwd)
 
 
+def test_run_durations_become_compile_cost_hints(runner, sample_project, monkeypatch):
+    """Test that run records step durations and compile plans with them."""
+    monkeypatch.chdir(sample_project)
+    result = runner.invoke(app, ["pipeline", "run", "test"])
+    assert result.exit_code == 0, result.output
+
+    durations_path = os.path.join(
+        sample_project, "target", "run", "test.durations.json"
+    )
+    with open(durations_path) as f:
+        durations = json.load(f)
+    assert len(durations) == 2
+    load_id = next(step_id for step_id in durations if step_id.startswith("load_"))
+
+    result = runner.invoke(app, ["pipeline", "compile", "test"])
+    assert result.exit_code == 0, result.output
+
+    # New timings must not be hidden by the plan cached above
+    with open(durations_path, "w") as f:
+        json.dump({load_id: 42.0}, f)
+    result = runner.invoke(app, ["pipeline", "compile", "test"])
+    assert result.exit_code == 0, result.output
+    assert "Parallel waves" in result.output
+    # The source has no recorded duration and gets the default of one second
+    assert "~43.0s" in result.output
+
+
 def make_profile(tmp_path, name, mode, path=None):
     profile = {"engines": {"duckdb": {"mode": mode}}}
     if path:
@@ -2,6 +2,7 @@ import unittest
 from typing import Any, Dict, Optional
 
 import pandas as pd
+import pyarrow as pa
 
 from sqlflow.connectors.base.destination_connector import DestinationConnector
 
@@ -9,8 +10,15 @@ from sqlflow.connectors.base.destination_connector import DestinationConnector
 class MockDestinationConnector(DestinationConnector):
     """A mock destination connector for testing."""
 
-    def write(self, df: pd.DataFrame, options: Optional[Dict[str, Any]] = None) -> None:
+    def write(
+        self,
+        df: pd.DataFrame,
+        options: Optional[Dict[str, Any]] = None,
+        mode: str = "append",
+        keys=None,
+    ) -> None:
         self.written_df = df
+        self.written_mode = mode
 
 
 class TestDestinationConnector(unittest.TestCase):
@@ -28,6 +36,21 @@ class TestDestinationConnector(unittest.TestCase):
         self.assertTrue(hasattr(connector, "written_df"))
         self.assertTrue(df.equals(connector.written_df))
 
+    def test_write_batches_defaults_to_write(self):
+        """Test that write_batches collects batches and delegates to write."""
+        connector = MockDestinationConnector({})
+        schema = pa.schema([("a", pa.int64())])
+        batches = [
+            pa.record_batch([pa.array([1, 2])], schema=schema),
+            pa.record_batch([pa.array([3])], schema=schema),
+        ]
+
+        rows = connector.write_batches(iter(batches), schema)
+
+        self.assertEqual(rows, 3)
+        self.assertEqual(connector.written_df["a"].tolist(), [1, 2, 3])
+        self.assertEqual(connector.written_mode, "replace")
+
 
 if __name__ == "__main__":
     unittest.main()
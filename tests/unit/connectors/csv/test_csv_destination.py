@@ -4,6 +4,7 @@ import time
 import unittest
 
 import pandas as pd
+import pyarrow as pa
 
 from sqlflow.connectors.csv.destination import CSVDestination
 
@@ -215,6 +216,35 @@ class TestCSVDestination(unittest.TestCase):
             if os.path.exists(file_path):
                 os.remove(file_path)
 
+    def test_write_batches_streams_all_batches(self):
+        """Test that Arrow batches are written with a single header."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            file_path = os.path.join(temp_dir, "out", "streamed.csv")
+            table = pa.Table.from_pandas(self.test_data, preserve_index=False)
+
+            connector = CSVDestination(config={"path": file_path})
+            rows = connector.write_batches(
+                table.to_batches(max_chunksize=1), table.schema
+            )
+
+            self.assertEqual(rows, 3)
+            pd.testing.assert_frame_equal(pd.read_csv(file_path), self.test_data)
+            self.assertEqual(os.listdir(os.path.dirname(file_path)), ["streamed.csv"])
+
+    def test_write_batches_append(self):
+        """Test that appending batches does not repeat the header."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            file_path = os.path.join(temp_dir, "streamed.csv")
+            table = pa.Table.from_pandas(self.test_data, preserve_index=False)
+            connector = CSVDestination(config={"path": file_path})
+
+            connector.write_batches(table.to_batches(), table.schema)
+            connector.write_batches(table.to_batches(), table.schema, mode="append")
+
+            written_df = pd.read_csv(file_path)
+            self.assertEqual(len(written_df), 6)
+            self.assertEqual(written_df["id"].tolist(), [1, 2, 3, 1, 2, 3])
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -11,9 +11,13 @@ Following our testing standards: "Minimize mocking" - use real implementations.
 
 import os
 import tempfile
+import time
 import unittest
 
+import duckdb
 import pandas as pd
+import pyarrow as pa
+import pytest
 
 from sqlflow.connectors.csv.source import (
     DEFAULT_CHUNK_SIZE,
@@ -21,6 +25,8 @@ from sqlflow.connectors.csv.source import (
     MEMORY_EFFICIENT_CHUNK_SIZE,
     CSVSource,
 )
+from sqlflow.core.state.backends import DuckDBStateBackend
+from sqlflow.core.state.file_manifest import FileManifest
 
 
 class TestCSVPerformanceOptimizations(unittest.TestCase):
@@ -247,6 +253,22 @@ class TestCSVPerformanceOptimizations(unittest.TestCase):
         finally:
             os.unlink(file_path)
 
+    def test_pyarrow_chunks_survive_type_change_after_first_block(self):
+        """Test a column holding integers for 400k rows, then text."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            file_path = os.path.join(temp_dir, "mixed.csv")
+            with open(file_path, "w") as f:
+                f.write("id,code\n")
+                f.writelines(f"{i},{i}\n" for i in range(400_000))
+                f.write("400000,abc\n")
+
+            connector = CSVSource(config={"path": file_path, "engine": "pyarrow"})
+            chunks = list(connector.read(batch_size=50_000))
+
+        self.assertEqual(sum(len(chunk) for chunk in chunks), 400_001)
+        self.assertEqual(chunks[-1]["code"].iloc[-1], "abc")
+        self.assertEqual(chunks[0]["id"].iloc[0], 0)
+
     def test_read_incremental_uses_optimizations(self):
         """Test that read_incremental benefits from the same optimizations."""
         with tempfile.NamedTemporaryFile(mode="w", delete=False, suffix=".csv") as f:
@@ -283,5 +305,299 @@ class TestCSVPerformanceOptimizations(unittest.TestCase):
             os.unlink(file_path)
 
 
+class TestCSVTypedIncremental(unittest.TestCase):
+    """Test the typed PyArrow path of read_incremental against pandas."""
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def _write_csv(self, content: str) -> str:
+        file_path = os.path.join(self.temp_dir.name, "events.csv")
+        with open(file_path, "w") as f:
+            f.write(content)
+        return file_path
+
+    def _read_ids(self, file_path, cursor_field, cursor_value, **kwargs):
+        connector = CSVSource(config={"path": file_path})
+        chunks = list(
+            connector.read_incremental(
+                object_name=file_path,
+                cursor_field=cursor_field,
+                cursor_value=cursor_value,
+                **kwargs,
+            )
+        )
+        ids = [row_id for chunk in chunks for row_id in chunk.pandas_df["id"]]
+        return ids, chunks
+
+    def test_timestamp_cursor_matches_pandas(self):
+        """Test timestamps with fractional seconds and null cursor values."""
+        rows = [f"{i},2024-01-01 00:00:{i:02d}" for i in range(50)]
+        rows.append("50,2024-01-01 00:00:50.5")
+        rows.append("51,")
+        file_path = self._write_csv("id,updated_at\n" + "\n".join(rows) + "\n")
+
+        typed_ids, chunks = self._read_ids(
+            file_path, "updated_at", "2024-01-01 00:00:40", batch_size=4
+        )
+        pandas_ids, _ = self._read_ids(
+            file_path, "updated_at", "2024-01-01 00:00:40", engine="pandas"
+        )
+
+        self.assertEqual(typed_ids, list(range(41, 51)))
+        self.assertEqual(typed_ids, pandas_ids)
+        self.assertTrue(all(len(chunk) <= 4 for chunk in chunks))
+
+    def test_integer_and_date_cursors(self):
+        """Test numeric and date cursors with watermarks of various types."""
+        file_path = self._write_csv(
+            "id,day\n1,2024-01-01\n2,2024-01-02\n3,2024-01-03\n"
+        )
+        self.assertEqual(self._read_ids(file_path, "id", 1)[0], [2, 3])
+        self.assertEqual(self._read_ids(file_path, "id", "2")[0], [3])
+        self.assertEqual(self._read_ids(file_path, "day", "2024-01-01")[0], [2, 3])
+        self.assertEqual(
+            self._read_ids(file_path, "day", pd.Timestamp("2024-01-02"))[0], [3]
+        )
+        self.assertEqual(self._read_ids(file_path, "id", None)[0], [1, 2, 3])
+        self.assertEqual(self._read_ids(file_path, "id", 3)[0], [])
+
+    def test_selected_columns_exclude_cursor(self):
+        """Test that the cursor column is read for filtering but not returned."""
+        file_path = self._write_csv("id,name,seq\n1,a,10\n2,b,20\n3,c,30\n")
+        _, chunks = self._read_ids(file_path, "seq", 15, columns=["id", "name"])
+
+        self.assertEqual(chunks[0].pandas_df.columns.tolist(), ["id", "name"])
+        self.assertEqual(
+            [row for chunk in chunks for row in chunk.pandas_df["name"]], ["b", "c"]
+        )
+
+    def test_column_changing_type_after_first_block(self):
+        """Test a column holding integers until row 250000, then text."""
+        rows = [f"{i},{i}" for i in range(250_000)]
+        rows += [f"{i},code-{i}" for i in range(250_000, 250_010)]
+        file_path = self._write_csv("id,ref\n" + "\n".join(rows) + "\n")
+
+        ids, chunks = self._read_ids(file_path, "id", 249_995)
+        refs = [str(ref) for chunk in chunks for ref in chunk.pandas_df["ref"]]
+
+        self.assertEqual(ids, list(range(249_996, 250_010)))
+        self.assertEqual(
+            refs[:5], ["249996", "249997", "249998", "249999", "code-250000"]
+        )
+        self.assertEqual(len(refs), 14)
+
+    def test_integer_cursor_with_later_decimals(self):
+        """Test that an integer cursor still parses decimals in later blocks."""
+        rows = [f"{i}" for i in range(250_000)] + ["250000.5"]
+        file_path = self._write_csv("id\n" + "\n".join(rows) + "\n")
+
+        ids = [
+            row_id
+            for chunk in CSVSource(config={"path": file_path}).read_incremental(
+                file_path, "id", 249_999
+            )
+            for row_id in chunk.pandas_df["id"]
+        ]
+
+        self.assertEqual(ids, [250_000.5])
+
+    def test_column_types_follow_inference(self):
+        """Test that columns other than the cursor keep their inferred types."""
+        file_path = self._write_csv(
+            "id,amount,ts\n1,1.5,2024-01-01 00:00:00\n2,2.5,2024-01-02 00:00:00\n"
+        )
+        _, chunks = self._read_ids(file_path, "id", None)
+        schema = chunks[0].arrow_table.schema
+
+        self.assertEqual(schema.field("id").type, pa.int64())
+        self.assertEqual(schema.field("amount").type, pa.float64())
+        self.assertEqual(schema.field("ts").type, pa.timestamp("s"))
+
+    def test_integer_cursor_past_float_precision(self):
+        """Test that integer cursors compare exactly beyond 2**53."""
+        file_path = self._write_csv("id\n9007199254740992\n9007199254740993\n")
+
+        ids, chunks = self._read_ids(file_path, "id", 9007199254740992)
+
+        self.assertEqual(ids, [9007199254740993])
+        self.assertEqual(chunks[0].arrow_table.schema.field("id").type, pa.int64())
+
+    def test_text_cursors_and_missing_columns(self):
+        """Test the pandas fallback for text cursors and absent cursor columns."""
+        file_path = self._write_csv("id,code\n1,a\n2,b\n3,c\n")
+        self.assertEqual(self._read_ids(file_path, "code", "a")[0], [2, 3])
+        self.assertEqual(self._read_ids(file_path, "missing", 1)[0], [])
+
+
+class TestCSVResumeFromOffset(unittest.TestCase):
+    """Test resuming incremental reads of append-only files at a byte offset."""
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.file_path = os.path.join(self.temp_dir.name, "events.csv")
+        self.backend = DuckDBStateBackend(duckdb.connect(":memory:"))
+
+    def tearDown(self):
+        self.backend.close()
+        self.temp_dir.cleanup()
+
+    def _write(self, content: str, mode: str = "a"):
+        with open(self.file_path, mode) as f:
+            f.write(content)
+
+    def _read_ids(self, **kwargs):
+        """Read without a watermark, so only resuming can skip old rows."""
+        connector = CSVSource(config={"path": self.file_path})
+        connector.file_manifest = FileManifest(self.backend, "p.events.events")
+        chunks = list(connector.read_incremental(self.file_path, "id", None, **kwargs))
+        connector.file_manifest.commit()
+        return [row_id for chunk in chunks for row_id in chunk.pandas_df["id"]]
+
+    def _entry(self):
+        return FileManifest(self.backend, "p.events.events").entries[self.file_path]
+
+    def test_appended_rows_are_read_from_offset(self):
+        """Test that each run parses only the lines appended since the last."""
+        self._write("id,name\n1,a\n2,b\n", mode="w")
+        self.assertEqual(self._read_ids(), [1, 2])
+        self.assertEqual(self._entry()["offset"], os.path.getsize(self.file_path))
+
+        self.assertEqual(self._read_ids(), [])
+        self._write("3,c\n4,d\n")
+        self.assertEqual(self._read_ids(), [3, 4])
+        self.assertEqual(self._entry()["rows_ingested"], 4)
+
+        self._write("5,e\n")
+        self.assertEqual(self._read_ids(columns=["id"]), [5])
+
+    def test_replaced_file_is_read_fully(self):
+        """Test that a rewritten start of the file falls back to a full scan."""
+        self._write("id,name\n1,a\n2,b\n", mode="w")
+        self._read_ids()
+
+        self._write("id,name\n7,x\n8,y\n9,z\n", mode="w")
+        self.assertEqual(self._read_ids(), [7, 8, 9])
+
+        os.replace(self.file_path, self.file_path + ".old")
+        self._write("id,name\n7,x\n8,y\n9,z\n10,w\n", mode="w")
+        self.assertEqual(self._read_ids(), [7, 8, 9, 10])
+
+    def test_unterminated_last_line_is_read_again(self):
+        """Test that the offset stops before a line still being written."""
+        self._write("id,name\n1,a\n2,b", mode="w")
+        self.assertEqual(self._read_ids(), [1, 2])
+        self.assertEqual(self._entry()["offset"], len("id,name\n1,a\n"))
+
+        self._write("\n3,c\n")
+        self.assertEqual(self._read_ids(), [2, 3])
+
+    def test_offset_skips_line_breaks_in_quoted_values(self):
+        """Test that a newline inside quotes does not end the resumed range."""
+        self._write('id,note\n1,"a\nb"\n2,"c\nd"', mode="w")
+        self.assertEqual(self._read_ids(), [1, 2])
+        self.assertEqual(self._entry()["offset"], len('id,note\n1,"a\nb"\n'))
+
+        self._write('\n3,"e\nf"\n')
+        self.assertEqual(self._read_ids(), [2, 3])
+
+    def test_pandas_engine_skips_unchanged_files(self):
+        """Test that the pandas path records files without an offset."""
+        self._write("id,name\n1,a\n2,b\n", mode="w")
+        self.assertEqual(self._read_ids(engine="pandas"), [1, 2])
+        self.assertIsNone(self._entry()["offset"])
+        self.assertEqual(self._read_ids(engine="pandas"), [])
+
+
+@pytest.mark.performance
+class TestCSVTypedIncrementalPerformance(unittest.TestCase):
+    """Benchmark cursor filtering of an append-only log."""
+
+    def test_filter_large_log_past_watermark(self):
+        """Test that the typed path filters 1M rows faster than pandas."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            file_path = os.path.join(temp_dir, "log.csv")
+            timestamps = pd.date_range("2024-01-01", periods=1_000_000, freq="s")
+            pd.DataFrame(
+                {"id": range(len(timestamps)), "ts": timestamps, "value": 1.5}
+            ).to_csv(file_path, index=False)
+            watermark = str(timestamps[-1000])
+            connector = CSVSource(config={"path": file_path})
+
+            start = time.perf_counter()
+            typed_rows = sum(
+                len(chunk)
+                for chunk in connector.read_incremental(file_path, "ts", watermark)
+            )
+            elapsed = time.perf_counter() - start
+
+            pandas_start = time.perf_counter()
+            pandas_rows = sum(
+                len(chunk)
+                for chunk in connector.read_incremental(
+                    file_path, "ts", watermark, engine="pandas"
+                )
+            )
+            pandas_elapsed = time.perf_counter() - pandas_start
+
+        print(
+            f"\nFiltered 1M rows in {elapsed:.3f}s "
+            f"(pandas chunks: {pandas_elapsed:.3f}s)"
+        )
+        self.assertEqual(typed_rows, 999)
+        self.assertEqual(pandas_rows, 999)
+        self.assertLess(elapsed, 5.0)
+
+    def test_resume_growing_log_at_offset(self):
+        """Test that reading rows appended to a 1M-row log skips the old bytes."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            file_path = os.path.join(temp_dir, "log.csv")
+            timestamps = pd.date_range("2024-01-01", periods=1_001_000, freq="s")
+            log = pd.DataFrame(
+                {"id": range(len(timestamps)), "ts": timestamps, "value": 1.5}
+            )
+            log.iloc[:1_000_000].to_csv(file_path, index=False)
+            backend = DuckDBStateBackend(duckdb.connect(":memory:"))
+
+            def read_rows(watermark):
+                connector = CSVSource(config={"path": file_path})
+                connector.file_manifest = FileManifest(backend, "p.log.log")
+                rows = sum(
+                    len(chunk)
+                    for chunk in connector.read_incremental(file_path, "ts", watermark)
+                )
+                connector.file_manifest.commit()
+                return rows
+
+            read_rows(None)
+            log.iloc[1_000_000:].to_csv(file_path, mode="a", header=False, index=False)
+            watermark = str(timestamps[999_999])
+
+            full_start = time.perf_counter()
+            full_rows = sum(
+                len(chunk)
+                for chunk in CSVSource(config={"path": file_path}).read_incremental(
+                    file_path, "ts", watermark
+                )
+            )
+            full_elapsed = time.perf_counter() - full_start
+
+            start = time.perf_counter()
+            resumed_rows = read_rows(watermark)
+            elapsed = time.perf_counter() - start
+            backend.close()
+
+        print(
+            f"\nRead 1000 appended rows in {elapsed:.3f}s "
+            f"(full scan: {full_elapsed:.3f}s)"
+        )
+        self.assertEqual(resumed_rows, 1000)
+        self.assertEqual(full_rows, 1000)
+        self.assertLess(elapsed, 5.0)
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,228 @@
+import os
+import random
+import shutil
+import tempfile
+import threading
+import time
+import unittest
+from unittest import mock
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.csv as pacsv
+import pytest
+
+from sqlflow.connectors.csv.parallel_reader import read_csv_parallel
+from sqlflow.connectors.csv.source import CSVSource
+
+
+def write_orders(file_path, rows, seed=7):
+    """Write orders whose notes include quoted commas, quotes and newlines."""
+    notes = ["plain", '"with, comma"', '"two\nlines"', '"say ""hi"""', ""]
+    rng = random.Random(seed)
+    with open(file_path, "w") as f:
+        f.write("id,note,amount\n")
+        for i in range(rows):
+            f.write(f"{i},{rng.choice(notes)},{i * 0.25}\n")
+
+
+class TestReadCSVParallel(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.file_path = os.path.join(self.temp_dir, "orders.csv")
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir)
+
+    def test_matches_single_threaded_read_for_any_range_size(self):
+        """Test that quoted line breaks never split a record across ranges."""
+        write_orders(self.file_path, 5000)
+        parse_options = pacsv.ParseOptions(newlines_in_values=True)
+        expected = pacsv.read_csv(self.file_path, parse_options=parse_options)
+
+        for range_size in [7, 100, 4096, 10**9]:
+            tables = list(
+                read_csv_parallel(
+                    self.file_path,
+                    parse_options=parse_options,
+                    range_size=range_size,
+                    max_workers=4,
+                )
+            )
+            self.assertTrue(pa.concat_tables(tables).equals(expected), range_size)
+
+    def test_line_break_after_cut_inside_quotes(self):
+        """Test a cut point that falls inside a quoted multi-line value."""
+        with open(self.file_path, "w") as f:
+            f.write('id,note\n1,"a\nb\nc\nd"\n2,x\n3,"\n"\n')
+
+        tables = list(
+            read_csv_parallel(
+                self.file_path,
+                parse_options=pacsv.ParseOptions(newlines_in_values=True),
+                range_size=3,
+            )
+        )
+
+        table = pa.concat_tables(tables)
+        self.assertEqual(table["id"].to_pylist(), [1, 2, 3])
+        self.assertEqual(table["note"].to_pylist(), ["a\nb\nc\nd", "x", "\n"])
+
+    def test_selected_columns_and_generated_names(self):
+        """Test column selection and files without a header row."""
+        with open(self.file_path, "w") as f:
+            f.writelines(f"{i},{i % 3},name_{i}\n" for i in range(1000))
+
+        tables = list(
+            read_csv_parallel(
+                self.file_path,
+                read_options=pacsv.ReadOptions(autogenerate_column_names=True),
+                convert_options=pacsv.ConvertOptions(include_columns=["f0", "f2"]),
+                range_size=500,
+            )
+        )
+
+        self.assertGreater(len(tables), 1)
+        table = pa.concat_tables(tables)
+        self.assertEqual(table.column_names, ["f0", "f2"])
+        self.assertEqual(table["f0"].to_pylist(), list(range(1000)))
+
+    def test_ranges_in_flight_stay_within_budget(self):
+        """Test that workers wait for the consumer once the budget is used."""
+        write_orders(self.file_path, 5000)
+        read_csv = pacsv.read_csv
+        started = []
+        lock = threading.Lock()
+
+        def counting_read_csv(*args, **kwargs):
+            with lock:
+                started.append(1)
+            return read_csv(*args, **kwargs)
+
+        consumed = 0
+        with mock.patch.object(pacsv, "read_csv", counting_read_csv):
+            for _ in read_csv_parallel(
+                self.file_path,
+                parse_options=pacsv.ParseOptions(newlines_in_values=True),
+                range_size=1000,
+                max_workers=4,
+                max_buffered_bytes=3000,
+            ):
+                consumed += 1
+                time.sleep(0.001)
+                with lock:
+                    self.assertLessEqual(len(started) - consumed, 3)
+        self.assertGreater(consumed, 50)
+
+    def test_stopping_early_shuts_down_workers(self):
+        """Test that closing the reader stops its workers before unmapping."""
+        write_orders(self.file_path, 5000)
+        tables = read_csv_parallel(
+            self.file_path,
+            parse_options=pacsv.ParseOptions(newlines_in_values=True),
+            range_size=1000,
+            max_workers=4,
+        )
+
+        self.assertGreater(next(tables).num_rows, 0)
+        tables.close()
+
+        self.assertFalse(
+            [
+                thread
+                for thread in threading.enumerate()
+                if thread.name.startswith("sqlflow-csv-parse")
+            ]
+        )
+
+    def test_rejects_skipped_rows(self):
+        """Test that skip_rows, which would apply per range, is rejected."""
+        write_orders(self.file_path, 10)
+        with self.assertRaises(ValueError):
+            list(
+                read_csv_parallel(
+                    self.file_path, read_options=pacsv.ReadOptions(skip_rows=1)
+                )
+            )
+
+
+class TestCSVSourceParallelRead(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.file_path = os.path.join(self.temp_dir, "orders.csv")
+        write_orders(self.file_path, 3000)
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir)
+
+    def _read(self, **params):
+        source = CSVSource(
+            {
+                "path": self.file_path,
+                "engine": "pyarrow",
+                "newlines_in_values": True,
+                **params,
+            }
+        )
+        return pd.concat(source.read(batch_size=700), ignore_index=True)
+
+    def test_large_files_are_parsed_in_ranges(self):
+        """Test that ranges are used above two range sizes and match streaming."""
+        with mock.patch(
+            "sqlflow.connectors.csv.source.read_csv_parallel",
+            wraps=read_csv_parallel,
+        ) as parallel:
+            result = self._read(parallel_workers=4, parallel_range_mb=0.01)
+
+        parallel.assert_called_once()
+        pd.testing.assert_frame_equal(result, self._read(parallel_workers=1))
+
+    def test_single_worker_and_small_files_stream(self):
+        """Test that small files and parallel_workers=1 use the streaming reader."""
+        with mock.patch("sqlflow.connectors.csv.source.read_csv_parallel") as parallel:
+            self._read(parallel_workers=1, parallel_range_mb=0.01)
+            self._read(parallel_workers=4)
+
+        parallel.assert_not_called()
+
+
+@pytest.mark.performance
+class TestReadCSVParallelPerformance(unittest.TestCase):
+    def test_parse_large_file_in_ranges(self):
+        """Benchmark range parsing against the streaming reader."""
+        temp_dir = tempfile.mkdtemp()
+        try:
+            file_path = os.path.join(temp_dir, "events.csv")
+            pd.DataFrame(
+                {
+                    "id": range(2_000_000),
+                    "ts": pd.date_range("2024-01-01", periods=2_000_000, freq="s"),
+                    "amount": [i * 0.5 for i in range(2_000_000)],
+                    "label": ["event"] * 2_000_000,
+                }
+            ).to_csv(file_path, index=False)
+
+            start = time.perf_counter()
+            streamed = sum(
+                batch.num_rows
+                for batch in pacsv.open_csv(
+                    file_path, read_options=pacsv.ReadOptions(use_threads=False)
+                )
+            )
+            streaming_elapsed = time.perf_counter() - start
+
+            start = time.perf_counter()
+            parsed = sum(
+                table.num_rows
+                for table in read_csv_parallel(file_path, range_size=8 * 1024**2)
+            )
+            elapsed = time.perf_counter() - start
+
+            print(
+                f"\nParsed {parsed} rows in ranges on {os.cpu_count()} cores "
+                f"in {elapsed:.3f}s (streaming: {streaming_elapsed:.3f}s)"
+            )
+            self.assertEqual(parsed, streamed)
+            self.assertLess(elapsed, 5.0)
+        finally:
+            shutil.rmtree(temp_dir)
@@ -1,6 +1,7 @@
 import os
 
 import pandas as pd
+import pyarrow as pa
 import pyarrow.parquet as pq
 import pytest
 
@@ -25,3 +26,37 @@ def test_missing_path_config():
     """Test that an error is raised if 'path' is not in config."""
     with pytest.raises(ValueError, match="path"):
         ParquetDestination(config={})
+
+
+def test_write_batches_row_groups(tmp_path):
+    """Test that streamed batches are written as row groups of one file."""
+    file_path = tmp_path / "streamed.parquet"
+    table = pa.table({"a": list(range(10)), "b": [str(i) for i in range(10)]})
+
+    connector = ParquetDestination(config={"path": str(file_path)})
+    rows = connector.write_batches(
+        table.to_batches(max_chunksize=4),
+        table.schema,
+        options={"row_group_size": 4},
+    )
+
+    assert rows == 10
+    parquet_file = pq.ParquetFile(file_path)
+    assert parquet_file.metadata.num_row_groups == 3
+    assert parquet_file.read().equals(table)
+
+
+def test_write_batches_partitioned(tmp_path):
+    """Test that partition_cols writes a hive-partitioned dataset."""
+    output_dir = tmp_path / "partitioned"
+    table = pa.table({"region": ["eu", "us", "eu"], "value": [1, 2, 3]})
+
+    connector = ParquetDestination(config={"path": str(output_dir)})
+    rows = connector.write_batches(
+        table.to_batches(), table.schema, options={"partition_cols": ["region"]}
+    )
+
+    assert rows == 3
+    assert sorted(os.listdir(output_dir)) == ["region=eu", "region=us"]
+    written = pq.read_table(output_dir).to_pandas()
+    assert sorted(written["value"].tolist()) == [1, 2, 3]
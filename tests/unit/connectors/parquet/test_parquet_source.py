@@ -1,12 +1,18 @@
 import os
 import tempfile
 import unittest
+from unittest.mock import patch
 
+import duckdb
 import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
 
 from sqlflow.connectors.base.connection_test_result import ConnectionTestResult
 from sqlflow.connectors.data_chunk import DataChunk
 from sqlflow.connectors.parquet.source import ParquetSource
+from sqlflow.core.state.backends import DuckDBStateBackend
+from sqlflow.core.state.file_manifest import FileManifest
 
 
 class TestParquetSource(unittest.TestCase):
@@ -192,6 +198,20 @@ class TestParquetSource(unittest.TestCase):
         self.assertIn("name", df.columns)
         self.assertNotIn("value", df.columns)
 
+    def test_read_with_configured_filters(self):
+        """Test that filters from the source params are pushed into the read."""
+        connector = ParquetSource()
+        connector.configure(
+            {
+                "path": self.single_file,
+                "filters": {"name": {"in": ["Bob", "Eve"]}, "value": {">": 25}},
+            }
+        )
+
+        df = pd.concat(chunk.pandas_df for chunk in connector.read())
+
+        self.assertEqual(df["name"].tolist(), ["Eve"])
+
     def test_read_multiple_files_combined(self):
         """Test reading multiple files with combination."""
         pattern = os.path.join(self.temp_dir, "test_*.parquet")
@@ -252,6 +272,97 @@ class TestParquetSource(unittest.TestCase):
 
         self.assertIsNone(cursor_value)
 
+    def test_get_cursor_value_from_statistics(self):
+        """Test that the cursor maximum comes from footers, not data pages."""
+        pattern = os.path.join(self.temp_dir, "test_*.parquet")
+        connector = ParquetSource()
+        connector.configure({"path": pattern})
+
+        with patch.object(pq.ParquetFile, "read") as read:
+            cursor_value = connector.get_cursor_value("test", "id")
+
+        read.assert_not_called()
+        self.assertEqual(cursor_value, 4)
+
+    def test_get_cursor_value_for_chunk(self):
+        """Test cursor value extraction from a chunk of loaded rows."""
+        connector = ParquetSource()
+        chunk = DataChunk(self.test_df.iloc[:3])
+
+        self.assertEqual(connector.get_cursor_value(chunk, "id"), 3)
+
+    def _write_row_groups(self, name, ids):
+        """Write ids as a file with one two-row group per pair."""
+        path = os.path.join(self.temp_dir, name)
+        table = pa.table({"id": ids, "label": [f"row{i}" for i in ids]})
+        pq.write_table(table, path, row_group_size=2)
+        return path
+
+    def test_read_incremental_skips_old_files_and_row_groups(self):
+        """Test that statistics prune files and row groups before the cursor."""
+        self._write_row_groups("events_0.parquet", [1, 2, 3, 4])
+        self._write_row_groups("events_1.parquet", [5, 6, 7, 8])
+        connector = ParquetSource()
+        connector.configure({"path": os.path.join(self.temp_dir, "events_*.parquet")})
+
+        read_groups = []
+        iter_batches = pq.ParquetFile.iter_batches
+
+        def record_iter_batches(parquet_file, *args, **kwargs):
+            read_groups.append(kwargs["row_groups"])
+            return iter_batches(parquet_file, *args, **kwargs)
+
+        with patch.object(pq.ParquetFile, "iter_batches", record_iter_batches):
+            chunks = list(
+                connector.read_incremental(
+                    "events", "id", cursor_value=5, columns=["label"]
+                )
+            )
+
+        rows = pd.concat([chunk.pandas_df for chunk in chunks])
+        self.assertEqual(read_groups, [[0, 1]])
+        self.assertEqual(rows["label"].tolist(), ["row6", "row7", "row8"])
+
+    def test_read_incremental_with_string_cursor(self):
+        """Test that stored string watermarks are compared as timestamps."""
+        connector = ParquetSource()
+        connector.configure({"path": self.single_file})
+
+        chunks = list(
+            connector.read_incremental("test.parquet", "timestamp", "2023-01-03")
+        )
+
+        rows = pd.concat([chunk.pandas_df for chunk in chunks])
+        self.assertEqual(rows["id"].tolist(), [4, 5])
+
+    def test_read_incremental_without_cursor_reads_everything(self):
+        """Test that the first incremental run reads every row."""
+        connector = ParquetSource()
+        connector.configure({"path": self.single_file})
+
+        chunks = list(connector.read_incremental("test.parquet", "timestamp"))
+
+        self.assertEqual(sum(len(chunk.pandas_df) for chunk in chunks), 5)
+
+    def test_read_incremental_skips_files_in_manifest(self):
+        """Test that files recorded in the manifest are not read again."""
+        pattern = os.path.join(self.temp_dir, "test_*.parquet")
+        backend = DuckDBStateBackend(duckdb.connect(":memory:"))
+
+        def read_ids():
+            connector = ParquetSource()
+            connector.configure({"path": pattern})
+            connector.file_manifest = FileManifest(backend, "p.events.events")
+            chunks = list(connector.read_incremental(None, "id"))
+            connector.file_manifest.commit()
+            return sorted(id_ for chunk in chunks for id_ in chunk.pandas_df["id"])
+
+        self.assertEqual(read_ids(), [1, 2, 2, 3, 3, 4])
+        self.assertEqual(read_ids(), [])
+
+        self.test_df.iloc[4:].to_parquet(self.multi_files[1])
+        self.assertEqual(read_ids(), [5])
+
     def test_read_specific_object(self):
         """Test reading a specific file by object name."""
         pattern = os.path.join(self.temp_dir, "test_*.parquet")
@@ -1,9 +1,18 @@
+import datetime
 import unittest
+from decimal import Decimal
 from unittest.mock import MagicMock, patch
 
 import pandas as pd
+import psycopg2
+import pyarrow as pa
 
-from sqlflow.connectors.postgres.source import PostgresSource
+from sqlflow.connectors.data_chunk import DataChunk
+from sqlflow.connectors.postgres.source import (
+    PostgresSource,
+    _range_predicates,
+    _split_range,
+)
 
 
 class TestPostgresSource(unittest.TestCase):
@@ -140,5 +149,257 @@ class TestPostgresSource(unittest.TestCase):
         self.assertFalse(connector._use_server_side_cursor("SELECT * FROM small_table"))
 
 
+def mock_copy_cursor(description, copy_output, error=None):
+    """Create a cursor whose copy_expert writes copy_output, then raises error."""
+    cursor = MagicMock()
+    cursor.description = description
+
+    def copy_expert(sql, sink):
+        sink.write(copy_output)
+        if error:
+            raise error
+
+    cursor.copy_expert.side_effect = copy_expert
+    return cursor
+
+
+class TestPostgresSourceCopyMode(unittest.TestCase):
+    """Test reads streamed through COPY and PyArrow's CSV reader."""
+
+    DESCRIPTION = [
+        ("id", 23, None, 4, None, None, None),
+        ("note", 25, None, -1, None, None, None),
+        ("amount", 1700, None, -1, 10, 2, None),
+        ("active", 16, None, 1, None, None, None),
+        ("created_at", 1184, None, 8, None, None, None),
+    ]
+
+    def setUp(self):
+        patcher = patch("sqlflow.connectors.postgres.source.create_engine")
+        engine = patcher.start().return_value
+        self.addCleanup(patcher.stop)
+        self.raw_connection = engine.raw_connection.return_value
+        self.connector = PostgresSource(
+            config={"query": "SELECT * FROM orders;", "read_mode": "copy"}
+        )
+
+    def _read(self, cursor, batch_size=10000):
+        self.raw_connection.cursor.return_value = cursor
+        return list(
+            self.connector._execute_query_in_chunks("SELECT * FROM orders;", batch_size)
+        )
+
+    def test_invalid_read_mode(self):
+        """Test that unknown read modes are rejected."""
+        with self.assertRaises(ValueError):
+            PostgresSource(config={"query": "SELECT 1", "read_mode": "binary"})
+
+    def test_copy_output_is_parsed_with_query_types(self):
+        """Test column types, NULLs, empty strings, quoting and batching."""
+        cursor = mock_copy_cursor(
+            self.DESCRIPTION,
+            b"1,NA,12.50,t,2024-01-01 10:00:00+00\n"
+            b'2,"",,f,\n'
+            b'3,"two\nlines, ""quoted""",0.10,,2024-01-02 00:00:00.5+00\n',
+        )
+
+        chunks = self._read(cursor, batch_size=2)
+
+        self.assertEqual([chunk.arrow_table.num_rows for chunk in chunks], [2, 1])
+        table = pa.concat_tables([chunk.arrow_table for chunk in chunks])
+        self.assertEqual(
+            table.schema.types,
+            [
+                pa.int32(),
+                pa.string(),
+                pa.decimal128(10, 2),
+                pa.bool_(),
+                pa.timestamp("us", tz="UTC"),
+            ],
+        )
+        self.assertEqual(table["note"].to_pylist(), ["NA", "", 'two\nlines, "quoted"'])
+        self.assertEqual(table["amount"].null_count, 1)
+        self.assertEqual(table["active"].to_pylist(), [True, False, None])
+
+        copy_sql = cursor.copy_expert.call_args[0][0]
+        self.assertEqual(
+            copy_sql,
+            "COPY (SELECT * FROM orders) TO STDOUT WITH (FORMAT csv, ENCODING 'UTF8')",
+        )
+        self.raw_connection.invalidate.assert_not_called()
+        self.raw_connection.close.assert_called_once()
+
+    def test_unconstrained_numeric_is_read_as_text(self):
+        """Test that NUMERIC without precision keeps every digit of every row."""
+        cursor = mock_copy_cursor(
+            [("ratio", 1700, None, -1, None, None, None)],
+            b"1\n2.5\n12345678901234567890.123456789012345\n\n",
+        )
+
+        chunks = self._read(cursor, batch_size=2)
+
+        table = pa.concat_tables([chunk.arrow_table for chunk in chunks])
+        self.assertEqual(table.schema.types, [pa.string()])
+        self.assertEqual(
+            table["ratio"].to_pylist(),
+            ["1", "2.5", "12345678901234567890.123456789012345", None],
+        )
+
+    def test_empty_result(self):
+        """Test that an empty COPY output yields no chunks."""
+        chunks = self._read(mock_copy_cursor(self.DESCRIPTION, b""))
+        self.assertEqual(chunks, [])
+
+    def test_failed_copy_raises_and_discards_connection(self):
+        """Test that a COPY failing part-way raises its own error."""
+        error = psycopg2.OperationalError("server closed the connection")
+        cursor = mock_copy_cursor(self.DESCRIPTION, b"1,a,1.00,t,\n2,b", error)
+
+        with self.assertRaises(psycopg2.OperationalError):
+            self._read(cursor)
+
+        self.raw_connection.invalidate.assert_called_once()
+
+
+class TestPostgresSourcePartitionedRead(unittest.TestCase):
+    """Test splitting reads into partition slices read concurrently."""
+
+    def setUp(self):
+        patcher = patch("sqlflow.connectors.postgres.source.create_engine")
+        engine = patcher.start().return_value
+        self.addCleanup(patcher.stop)
+        self.connection = engine.connect.return_value.__enter__.return_value
+        self.config = {"host": "db", "port": 5432, "dbname": "warehouse"}
+        self.config.update({"user": "etl", "password": "secret"})
+
+    def _read(self, config, **read_kwargs):
+        connector = PostgresSource(config={**self.config, **config})
+        queries = []
+
+        def execute(sql, batch_size):
+            queries.append(sql)
+            yield DataChunk(pa.table({"n": [len(queries)]}))
+
+        with patch.object(connector, "_execute_query_in_chunks", side_effect=execute):
+            chunks = list(connector.read(**read_kwargs))
+        return chunks, queries
+
+    def test_split_range(self):
+        """Test cut points for integers, decimals, dates and timestamps."""
+        self.assertEqual(_split_range(0, 100, 4), [25, 50, 75])
+        self.assertEqual(_split_range(1, 3, 8), [2])
+        self.assertEqual(_split_range(5, 5, 4), [])
+        self.assertEqual(
+            _split_range(Decimal("0"), Decimal("1.5"), 3),
+            [Decimal("0.5"), Decimal("1.0")],
+        )
+        self.assertEqual(
+            _split_range(datetime.date(2024, 1, 1), datetime.date(2024, 1, 5), 2),
+            [datetime.date(2024, 1, 3)],
+        )
+        start = datetime.datetime(2024, 1, 1)
+        self.assertEqual(
+            _split_range(start, start + datetime.timedelta(hours=1), 2),
+            [start + datetime.timedelta(minutes=30)],
+        )
+        with self.assertRaises(ValueError):
+            _split_range("a", "z", 2)
+
+    def test_range_predicates_cover_every_row_once(self):
+        """Test that slices are contiguous and the first one takes NULLs."""
+        self.assertEqual(
+            _range_predicates('"id"', [10, 20]),
+            [
+                '"id" < 10 OR "id" IS NULL',
+                '"id" >= 10 AND "id" < 20',
+                '"id" >= 20',
+            ],
+        )
+
+    def test_query_is_read_in_column_slices(self):
+        """Test that min/max bound the slices of a query."""
+        self.connection.execute.return_value.fetchone.return_value = (0, 300)
+
+        chunks, queries = self._read(
+            {"partition_column": "id", "partitions": 3},
+            options={"query": "SELECT * FROM events;"},
+        )
+
+        bounds_sql = str(self.connection.execute.call_args[0][0])
+        self.assertEqual(
+            bounds_sql,
+            'SELECT MIN("id"), MAX("id") FROM (SELECT * FROM events) AS sqlflow_query',
+        )
+        self.assertEqual(
+            sorted(queries),
+            sorted(
+                f"SELECT * FROM (SELECT * FROM events) AS sqlflow_partition WHERE {p}"
+                for p in _range_predicates('"id"', [100, 200])
+            ),
+        )
+        self.assertEqual(len(chunks), 3)
+
+    def test_empty_query_is_read_unpartitioned(self):
+        """Test that a query without partition column values is read once."""
+        self.connection.execute.return_value.fetchone.return_value = (None, None)
+
+        _, queries = self._read(
+            {"partition_column": "id"}, options={"query": "SELECT * FROM events"}
+        )
+
+        self.assertEqual(queries, ["SELECT * FROM events"])
+
+    def test_table_is_read_in_page_slices(self):
+        """Test ctid slices of a table read appended to its filters."""
+        self.connection.execute.return_value.scalar.return_value = 1000
+
+        _, queries = self._read(
+            {"partition_column": "ctid", "partitions": 2},
+            object_name="events",
+            filters={"kind": "click"},
+        )
+
+        self.assertEqual(
+            self.connection.execute.call_args[0][1], {"relation": 'public."events"'}
+        )
+        self.assertEqual(
+            sorted(queries),
+            [
+                'SELECT * FROM public."events" WHERE "kind" = \'click\' '
+                "AND (ctid < '(500,0)'::tid)",
+                'SELECT * FROM public."events" WHERE "kind" = \'click\' '
+                "AND (ctid >= '(500,0)'::tid)",
+            ],
+        )
+
+    def test_ctid_partitioning_requires_a_table(self):
+        """Test that ctid partitioning of an arbitrary query is rejected."""
+        with self.assertRaises(ValueError):
+            self._read({"partition_column": "ctid"}, options={"query": "SELECT 1 AS n"})
+
+    def test_concurrency_is_limited_by_the_pool(self):
+        """Test that slices never wait on more connections than the pool has."""
+        connector = PostgresSource(
+            config={
+                **self.config,
+                "partition_column": "id",
+                "partitions": 16,
+                "pool_size": 2,
+                "max_overflow": 1,
+            }
+        )
+        self.assertEqual(connector._get_partition_concurrency(), 3)
+
+        connector = PostgresSource(
+            config={**self.config, "dbname": "testdb", "partition_column": "id"}
+        )
+        self.assertEqual(connector._get_partition_concurrency(), 1)
+
+    def test_invalid_partitions(self):
+        """Test that a partition count below one is rejected."""
+        with self.assertRaises(ValueError):
+            PostgresSource(config={**self.config, "partitions": 0})
+
+
 if __name__ == "__main__":
     unittest.main()
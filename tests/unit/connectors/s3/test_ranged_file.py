@@ -0,0 +1,77 @@
+import io
+import unittest
+
+import boto3
+import pyarrow as pa
+import pyarrow.parquet as pq
+from moto import mock_aws
+
+from sqlflow.connectors.s3.ranged_file import S3RangedFile, column_chunk_ranges
+
+
+@mock_aws
+class TestS3RangedFile(unittest.TestCase):
+    def setUp(self):
+        """Set up a mock S3 object with known content."""
+        self.s3_client = boto3.client("s3", region_name="us-east-1")
+        self.s3_client.create_bucket(Bucket="test-bucket")
+        self.content = bytes(range(256)) * 4096  # 1 MiB
+        self.s3_client.put_object(Bucket="test-bucket", Key="blob", Body=self.content)
+
+    def open(self, **kwargs):
+        return S3RangedFile(self.s3_client, "test-bucket", "blob", **kwargs)
+
+    def test_seek_and_read(self):
+        """Test that reads at any offset return the object's bytes."""
+        ranged_file = self.open(block_size=1024)
+        self.assertEqual(ranged_file.size, len(self.content))
+
+        ranged_file.seek(5000)
+        self.assertEqual(ranged_file.read(100), self.content[5000:5100])
+        self.assertEqual(ranged_file.tell(), 5100)
+
+        ranged_file.seek(-10, io.SEEK_END)
+        self.assertEqual(ranged_file.read(), self.content[-10:])
+        self.assertEqual(ranged_file.read(), b"")
+
+    def test_read_ahead_is_cached(self):
+        """Test that small sequential reads share one range request."""
+        ranged_file = self.open(block_size=4096)
+        for offset in range(0, 4096, 512):
+            self.assertEqual(ranged_file.read(512), self.content[offset : offset + 512])
+        self.assertEqual(ranged_file.bytes_fetched, 4096)
+
+    def test_prefetch_fetches_only_requested_ranges(self):
+        """Test that prefetched ranges are served without further requests."""
+        ranged_file = self.open(block_size=1024)
+        ranges = [(0, 2000), (500_000, 510_000), (900_000, 900_500)]
+        ranged_file.prefetch(ranges)
+        fetched = ranged_file.bytes_fetched
+        self.assertEqual(fetched, 2000 + 10_000 + 500)
+
+        for start, end in ranges:
+            ranged_file.seek(start)
+            self.assertEqual(ranged_file.read(end - start), self.content[start:end])
+        self.assertEqual(ranged_file.bytes_fetched, fetched)
+
+    def test_column_chunk_ranges(self):
+        """Test that ranges cover only the selected Parquet columns."""
+        table = pa.table({f"c{i}": list(range(1000)) for i in range(20)})
+        buffer = io.BytesIO()
+        pq.write_table(table, buffer)
+        self.s3_client.put_object(
+            Bucket="test-bucket", Key="wide.parquet", Body=buffer.getvalue()
+        )
+
+        ranged_file = S3RangedFile(self.s3_client, "test-bucket", "wide.parquet")
+        parquet_file = pq.ParquetFile(ranged_file)
+        row_group = parquet_file.metadata.row_group(0)
+        self.assertEqual(len(column_chunk_ranges(row_group)), 20)
+
+        ranged_file.prefetch(column_chunk_ranges(row_group, ["c3", "c7"]))
+        result = parquet_file.read(columns=["c3", "c7"])
+        self.assertEqual(result, table.select(["c3", "c7"]))
+
+
+if __name__ == "__main__":
+    unittest.main()
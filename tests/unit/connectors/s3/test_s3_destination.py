@@ -3,10 +3,11 @@ import unittest
 
 import boto3
 import pandas as pd
+import pyarrow as pa
 import pyarrow.parquet as pq
 from moto import mock_aws
 
-from sqlflow.connectors.s3.destination import S3Destination
+from sqlflow.connectors.s3.destination import S3Destination, S3MultipartStream
 
 
 @mock_aws
@@ -65,6 +66,48 @@ class TestS3Destination(unittest.TestCase):
         with self.assertRaises(ValueError):
             S3Destination(config={})
 
+    def test_write_batches_csv(self):
+        """Test streaming Arrow batches to a CSV object."""
+        key = "streamed.csv"
+        connector = S3Destination(config={"uri": f"s3://{self.bucket_name}/{key}"})
+        table = pa.Table.from_pandas(self.df, preserve_index=False)
+
+        rows = connector.write_batches(table.to_batches(max_chunksize=1), table.schema)
+
+        self.assertEqual(rows, 3)
+        response = self.s3_client.get_object(Bucket=self.bucket_name, Key=key)
+        written = pd.read_csv(io.BytesIO(response["Body"].read()))
+        pd.testing.assert_frame_equal(written, self.df)
+
+    def test_write_batches_parquet(self):
+        """Test streaming Arrow batches to a Parquet object."""
+        key = "streamed.parquet"
+        connector = S3Destination(config={"uri": f"s3://{self.bucket_name}/{key}"})
+        table = pa.Table.from_pandas(self.df, preserve_index=False)
+
+        rows = connector.write_batches(table.to_batches(max_chunksize=2), table.schema)
+
+        self.assertEqual(rows, 3)
+        response = self.s3_client.get_object(Bucket=self.bucket_name, Key=key)
+        written = pq.read_table(io.BytesIO(response["Body"].read()))
+        self.assertTrue(written.equals(table))
+
+    def test_multipart_stream_uploads_parts(self):
+        """Test that data larger than one part is uploaded as a multipart upload."""
+        key = "multipart.bin"
+        stream = S3MultipartStream(
+            self.s3_client, self.bucket_name, key, S3MultipartStream.MIN_PART_SIZE
+        )
+        payload = bytes(range(256)) * (48 * 1024)  # 12MB -> 3 parts
+
+        for offset in range(0, len(payload), 1024 * 1024):
+            stream.write(payload[offset : offset + 1024 * 1024])
+        stream.finish()
+
+        response = self.s3_client.get_object(Bucket=self.bucket_name, Key=key)
+        self.assertEqual(response["Body"].read(), payload)
+        self.assertIn("-3", response["ETag"])
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -2,12 +2,15 @@ import io
 import unittest
 
 import boto3
+import duckdb
 import pandas as pd
 import pyarrow as pa
 import pyarrow.parquet as pq
 from moto import mock_aws
 
 from sqlflow.connectors.s3.source import S3Source
+from sqlflow.core.state.backends import DuckDBStateBackend
+from sqlflow.core.state.file_manifest import FileManifest
 
 
 @mock_aws
@@ -89,6 +92,109 @@ class TestS3Source(unittest.TestCase):
             list(connector.read(object_name=txt_key))
         self.assertIn("Unsupported file format", str(context.exception))
 
+    def test_read_incremental_reads_only_new_objects(self):
+        """Test that objects recorded in the manifest are not fetched again."""
+        for day in (1, 2):
+            self.s3_client.put_object(
+                Bucket=self.bucket_name,
+                Key=f"events/day={day}.csv",
+                Body=f"id,day\n{day}1,{day}\n{day}2,{day}",
+            )
+        backend = DuckDBStateBackend(duckdb.connect(":memory:"))
+
+        def read_ids():
+            connector = S3Source(
+                config={"bucket": self.bucket_name, "path_prefix": "events/"}
+            )
+            connector.file_manifest = FileManifest(backend, "p.events.events")
+            chunks = list(connector.read_incremental("events", "id"))
+            connector.file_manifest.commit()
+            return sorted(id_ for chunk in chunks for id_ in chunk.pandas_df["id"])
+
+        self.assertEqual(read_ids(), [11, 12, 21, 22])
+        self.assertEqual(read_ids(), [])
+
+        self.s3_client.put_object(
+            Bucket=self.bucket_name, Key="events/day=3.csv", Body="id,day\n31,3"
+        )
+        self.s3_client.put_object(
+            Bucket=self.bucket_name,
+            Key="events/day=1.csv",
+            Body="id,day\n11,1\n12,1\n13,1",
+        )
+        self.assertEqual(read_ids(), [11, 12, 13, 31])
+        entries = FileManifest(backend, "p.events.events").entries
+        self.assertEqual(entries["events/day=1.csv"]["rows_ingested"], 3)
+
+    def test_read_parquet_fetches_only_selected_columns(self):
+        """Test that reading a few columns of a wide file skips the others."""
+        table = pa.table({f"col_{i}": [str(i) * 50] * 2000 for i in range(100)})
+        buffer = io.BytesIO()
+        pq.write_table(table, buffer, compression="none", use_dictionary=False)
+        self.s3_client.put_object(
+            Bucket=self.bucket_name, Key="wide.parquet", Body=buffer.getvalue()
+        )
+
+        connector = S3Source(config={"bucket": self.bucket_name})
+        fetched = []
+        get_object = connector.s3_client.get_object
+
+        def recording_get_object(**kwargs):
+            response = get_object(**kwargs)
+            fetched.append(response["ContentLength"])
+            return response
+
+        connector.s3_client.get_object = recording_get_object
+        chunks = list(
+            connector.read(object_name="wide.parquet", columns=["col_1", "col_2"])
+        )
+
+        df = pd.concat([chunk.pandas_df for chunk in chunks])
+        self.assertEqual(list(df.columns), ["col_1", "col_2"])
+        self.assertEqual(len(df), 2000)
+        self.assertLess(sum(fetched), len(buffer.getvalue()) / 10)
+
+    def test_schema_sample_reads_only_object_head(self):
+        """Test that CSV schema sampling does not download the whole object."""
+        body = "id,value\n" + "".join(f"{i},v{i}\n" for i in range(200_000))
+        self.s3_client.put_object(Bucket=self.bucket_name, Key="big.csv", Body=body)
+
+        connector = S3Source(config={"bucket": self.bucket_name})
+        get_object = connector.s3_client.get_object
+        ranges = []
+
+        def recording_get_object(**kwargs):
+            ranges.append(kwargs.get("Range"))
+            return get_object(**kwargs)
+
+        connector.s3_client.get_object = recording_get_object
+        schema = connector.get_schema("big.csv")
+
+        self.assertEqual(schema.arrow_schema.names, ["id", "value"])
+        self.assertEqual(len(ranges), 1)
+        self.assertIsNotNone(ranges[0])
+
+    def test_read_prefix_reads_all_objects(self):
+        """Test that reading without an object name reads every discovered object."""
+        for i in range(12):
+            self.s3_client.put_object(
+                Bucket=self.bucket_name,
+                Key=f"logs/part-{i}.jsonl",
+                Body=f'{{"id": {i}, "value": "a"}}\n{{"id": {i + 100}, "value": "b"}}',
+            )
+        connector = S3Source(
+            config={
+                "bucket": self.bucket_name,
+                "path_prefix": "logs/",
+                "file_format": "jsonl",
+                "max_concurrent_objects": 4,
+            }
+        )
+
+        chunks = list(connector.read())
+        ids = sorted(id_ for chunk in chunks for id_ in chunk.pandas_df["id"])
+        self.assertEqual(ids, sorted(list(range(12)) + list(range(100, 112))))
+
     def test_missing_uri_config(self):
         """Test that an error is raised if neither 'uri' nor 'bucket' is provided."""
         with self.assertRaises(ValueError) as context:
@@ -0,0 +1,108 @@
+import threading
+import time
+import unittest
+
+import pyarrow as pa
+
+from sqlflow.connectors.concurrent_reader import read_concurrently
+from sqlflow.connectors.data_chunk import DataChunk
+
+
+def make_reader(chunks_per_object=3, rows=10, delay=0.0):
+    """Create a read_object function yielding numbered chunks."""
+
+    def read_object(name):
+        for i in range(chunks_per_object):
+            time.sleep(delay)
+            yield DataChunk(pa.table({"object": [name] * rows, "chunk": [i] * rows}))
+
+    return read_object
+
+
+class TestReadConcurrently(unittest.TestCase):
+    def test_reads_all_objects_in_chunk_order(self):
+        """Test that every chunk arrives and chunks of an object stay ordered."""
+        names = [f"obj_{i}.jsonl" for i in range(20)]
+        chunks = list(read_concurrently(make_reader(), names, max_concurrency=4))
+
+        self.assertEqual(len(chunks), 60)
+        seen = {}
+        for chunk in chunks:
+            table = chunk.arrow_table
+            name, index = table["object"][0].as_py(), table["chunk"][0].as_py()
+            self.assertEqual(index, seen.get(name, -1) + 1)
+            seen[name] = index
+        self.assertEqual(set(seen), set(names))
+
+    def test_objects_are_read_concurrently(self):
+        """Test that per-object latency overlaps across workers."""
+        start = time.monotonic()
+        list(
+            read_concurrently(
+                make_reader(chunks_per_object=1, delay=0.2),
+                [f"obj_{i}" for i in range(8)],
+                max_concurrency=8,
+            )
+        )
+        self.assertLess(time.monotonic() - start, 1.0)
+
+    def test_buffered_bytes_stay_within_budget(self):
+        """Test that readers wait for the consumer once the budget is used."""
+        chunk_bytes = DataChunk(
+            pa.table({"object": ["x"] * 10, "chunk": [0] * 10})
+        ).memory_usage
+        produced = []
+        lock = threading.Lock()
+        reader = make_reader(chunks_per_object=10)
+
+        def counting_reader(name):
+            for chunk in reader(name):
+                with lock:
+                    produced.append(chunk)
+                yield chunk
+
+        consumed = 0
+        for _ in read_concurrently(
+            counting_reader,
+            [f"obj_{i}" for i in range(4)],
+            max_concurrency=4,
+            max_buffered_bytes=chunk_bytes * 3,
+        ):
+            consumed += 1
+            time.sleep(0.01)
+            with lock:
+                # Buffered chunks, plus one parsed chunk per waiting worker
+                self.assertLessEqual(len(produced) - consumed, 3 + 4)
+        self.assertEqual(consumed, 40)
+
+    def test_failed_objects(self):
+        """Test that failures raise, or are skipped with skip_failed."""
+        reader = make_reader(chunks_per_object=1)
+
+        def failing_reader(name):
+            if name == "bad":
+                raise ValueError("corrupt object")
+            return reader(name)
+
+        with self.assertRaises(ValueError):
+            list(read_concurrently(failing_reader, ["a", "bad", "b"]))
+
+        chunks = list(
+            read_concurrently(failing_reader, ["a", "bad", "b"], skip_failed=True)
+        )
+        self.assertEqual(len(chunks), 2)
+
+    def test_consumer_can_stop_early(self):
+        """Test that closing the stream releases blocked workers."""
+        stream = read_concurrently(
+            make_reader(chunks_per_object=100),
+            [f"obj_{i}" for i in range(10)],
+            max_concurrency=4,
+            max_buffered_bytes=1,
+        )
+        next(stream)
+        stream.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
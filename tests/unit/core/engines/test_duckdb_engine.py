@@ -3,6 +3,7 @@
 import os
 import tempfile
 import unittest
+from concurrent.futures import ThreadPoolExecutor
 from unittest.mock import MagicMock, patch
 
 from sqlflow.core.engines.duckdb.constants import DuckDBConstants
@@ -307,6 +308,66 @@ class TestDuckDBEngine(unittest.TestCase):
 
         self.assertTrue(result)
 
+    def test_create_cursor_engine_shares_database(self):
+        """Test that a cursor engine sees the same tables on its own connection."""
+        engine = DuckDBEngine(":memory:")
+        try:
+            engine.execute_query("CREATE TABLE shared AS SELECT 42 AS answer")
+            cursor_engine = engine.create_cursor_engine()
+
+            self.assertIsNot(cursor_engine.connection, engine.connection)
+            self.assertTrue(cursor_engine.table_exists("shared"))
+            self.assertIs(cursor_engine.transaction_manager.engine, cursor_engine)
+
+            cursor_engine.execute_query("CREATE TABLE from_cursor AS SELECT 1 AS x")
+            cursor_engine.close()
+            self.assertTrue(engine.table_exists("from_cursor"))
+            self.assertEqual(
+                engine.execute_query("SELECT answer FROM shared").fetchone()[0], 42
+            )
+        finally:
+            engine.close()
+
+    def test_cursor_engines_share_stats_across_threads(self):
+        """Test that queries run by cursor engines on threads are all counted."""
+        engine = DuckDBEngine(":memory:")
+        try:
+            cursor_engines = [engine.create_cursor_engine() for _ in range(4)]
+
+            def run_queries(cursor_engine):
+                for _ in range(50):
+                    cursor_engine.execute_query("SELECT 1")
+
+            with ThreadPoolExecutor(max_workers=4) as executor:
+                list(executor.map(run_queries, cursor_engines))
+
+            self.assertEqual(engine.stats.query_count, 200)
+            self.assertEqual(len(engine.stats.query_times), 200)
+            for cursor_engine in cursor_engines:
+                cursor_engine.close()
+        finally:
+            engine.close()
+
+    def test_export_data_streams_query_result_to_csv(self):
+        """Test that a query result is exported to CSV without a DataFrame."""
+        engine = DuckDBEngine(":memory:")
+        try:
+            with tempfile.TemporaryDirectory() as temp_dir:
+                destination = os.path.join(temp_dir, "numbers.csv")
+                result = engine.execute_query(
+                    "SELECT range AS id FROM range(5) ORDER BY id"
+                )
+
+                with patch.object(engine, "_convert_data_to_dataframe") as convert:
+                    outcome = engine.export_data(result, "CSV", destination)
+
+                convert.assert_not_called()
+                self.assertEqual(outcome, {"status": "success", "rows_exported": 5})
+                with open(destination) as f:
+                    self.assertEqual(f.read().split(), ["id", "0", "1", "2", "3", "4"])
+        finally:
+            engine.close()
+
     def test_table_exists_false(self):
         """Test table_exists method when table doesn't exist."""
         mock_result = MagicMock()
@@ -0,0 +1,178 @@
+"""Tests for native DuckDB COPY exports."""
+
+import os
+
+import pyarrow.parquet as pq
+import pytest
+
+from sqlflow.core.engines.duckdb import DuckDBEngine
+from sqlflow.core.engines.duckdb.export import (
+    build_copy_options,
+    build_copy_statement,
+    get_partition_columns,
+)
+
+
+@pytest.fixture
+def duckdb_engine():
+    """Create a DuckDB engine with a small table."""
+    engine = DuckDBEngine(":memory:")
+    engine.execute_query(
+        "CREATE TABLE sales AS SELECT range AS id, "
+        "CASE WHEN range % 2 = 0 THEN 'eu' ELSE 'us' END AS region "
+        "FROM range(10)"
+    )
+    yield engine
+    engine.close()
+
+
+def test_csv_options_are_mapped():
+    """Test that CSV export options map to COPY options."""
+    options = build_copy_options(
+        "csv", {"header": False, "delimiter": "|", "compression": "gzip"}
+    )
+
+    assert options == [
+        "FORMAT CSV",
+        "HEADER false",
+        "DELIMITER '|'",
+        "COMPRESSION gzip",
+    ]
+
+
+def test_csv_header_defaults_to_true():
+    """Test that CSV exports write a header unless told otherwise."""
+    assert build_copy_options("csv", {"file_format": "csv"}) == [
+        "FORMAT CSV",
+        "HEADER true",
+    ]
+
+
+def test_parquet_options_are_mapped():
+    """Test that Parquet compression and row group size map to COPY options."""
+    options = build_copy_options(
+        "PARQUET",
+        {"compression": "ZSTD", "row_group_size": 50000, "partition_by": "year,month"},
+    )
+
+    assert options == [
+        "FORMAT PARQUET",
+        "COMPRESSION zstd",
+        "ROW_GROUP_SIZE 50000",
+        'PARTITION_BY ("year", "month"), OVERWRITE_OR_IGNORE true',
+    ]
+
+
+@pytest.mark.parametrize(
+    "file_format, options",
+    [
+        ("json", {}),
+        ("csv", {"date_format": 5}),
+        ("csv", {"index": True}),
+        ("csv", {"encoding": "latin-1"}),
+        ("parquet", {"compression": "lzo"}),
+        ("parquet", {"row_group_size": "many"}),
+        ("parquet", {"partition_by": ["year; DROP TABLE x"]}),
+    ],
+)
+def test_unmappable_exports_are_not_pushed_down(file_format, options):
+    """Test that options without a COPY equivalent keep the connector path."""
+    assert build_copy_options(file_format, options) is None
+
+
+def test_remote_destinations_are_not_pushed_down():
+    """Test that only local paths are exported with COPY."""
+    assert build_copy_statement("SELECT 1", "s3://bucket/x.csv", "csv") is None
+
+
+def test_copy_statement_quotes_path():
+    """Test that the destination path is quoted as a literal."""
+    statement = build_copy_statement("SELECT 1;", "out/o'brien.csv", "csv")
+
+    assert (
+        statement == "COPY (SELECT 1) TO 'out/o''brien.csv' (FORMAT CSV, HEADER true)"
+    )
+
+
+def test_get_partition_columns():
+    """Test partition columns from string and list options."""
+    assert get_partition_columns({"partition_cols": ["a", "b"]}) == ["a", "b"]
+    assert get_partition_columns({"partition_by": "a, b"}) == ["a", "b"]
+    assert get_partition_columns({}) == []
+
+
+def test_copy_query_to_parquet(duckdb_engine, tmp_path):
+    """Test exporting a query to Parquet with row group size and compression."""
+    destination = tmp_path / "nested" / "sales.parquet"
+
+    rows = duckdb_engine.copy_query_to_file(
+        "SELECT * FROM sales WHERE id < 8",
+        str(destination),
+        "parquet",
+        {"compression": "zstd", "row_group_size": 3},
+    )
+
+    assert rows == 8
+    metadata = pq.ParquetFile(destination).metadata
+    assert metadata.num_rows == 8
+    assert metadata.row_group(0).column(0).compression == "ZSTD"
+
+
+def test_copy_query_partitioned(duckdb_engine, tmp_path):
+    """Test exporting a hive-partitioned directory, twice over."""
+    destination = tmp_path / "sales"
+
+    for _ in range(2):
+        rows = duckdb_engine.copy_query_to_file(
+            "SELECT * FROM sales",
+            str(destination),
+            "parquet",
+            {"partition_by": "region"},
+        )
+
+    assert rows == 10
+    assert sorted(os.listdir(destination)) == ["region=eu", "region=us"]
+
+
+def test_copy_query_rejects_unsupported_export(duckdb_engine, tmp_path):
+    """Test that unsupported exports raise instead of silently changing format."""
+    assert not duckdb_engine.can_copy_to_file(str(tmp_path / "x.json"), "json")
+
+    with pytest.raises(ValueError, match="native COPY"):
+        duckdb_engine.copy_query_to_file(
+            "SELECT * FROM sales", str(tmp_path / "x.json"), "json"
+        )
+
+
+def test_copy_query_writes_booleans_like_csv_connector(duckdb_engine, tmp_path):
+    """Test that CSV booleans are written as True/False, NULLs as empty."""
+    destination = tmp_path / "flags.csv"
+
+    duckdb_engine.copy_query_to_file(
+        'SELECT id, id % 2 = 0 AS "is even", NULL::BOOLEAN AS unknown '
+        "FROM sales WHERE id < 2 ORDER BY id",
+        str(destination),
+        "csv",
+    )
+
+    assert destination.read_text().splitlines() == [
+        "id,is even,unknown",
+        "0,True,",
+        "1,False,",
+    ]
+
+
+def test_failed_copy_keeps_previous_file(duckdb_engine, tmp_path):
+    """Test that a failing export leaves the destination and no staging file."""
+    destination = tmp_path / "sales.csv"
+    destination.write_text("previous\n")
+
+    with pytest.raises(Exception):
+        duckdb_engine.copy_query_to_file(
+            "SELECT CAST('x' || id AS INTEGER) AS broken FROM sales",
+            str(destination),
+            "csv",
+        )
+
+    assert destination.read_text() == "previous\n"
+    assert os.listdir(tmp_path) == ["sales.csv"]
@@ -0,0 +1,110 @@
+"""Tests for native DuckDB file scans."""
+
+import datetime
+
+import pandas as pd
+import pytest
+
+from sqlflow.connectors.parquet.source import ParquetSource
+from sqlflow.core.engines.duckdb import DuckDBEngine
+from sqlflow.core.engines.duckdb.scan import build_filter_clause, build_scan_query
+
+
+@pytest.fixture
+def parquet_files(tmp_path):
+    """Write two Parquet files of events."""
+    for part in range(2):
+        pd.DataFrame(
+            {
+                "id": range(part * 5, part * 5 + 5),
+                "kind": ["a", "b", "a", "b", "c"],
+                "amount": [1.5, 2.5, 3.5, 4.5, 5.5],
+            }
+        ).to_parquet(tmp_path / f"events_{part}.parquet", index=False)
+    return str(tmp_path / "events_*.parquet")
+
+
+def test_filter_clause_matches_parquet_filter_grammar():
+    """Test equality, comparison and IN filters."""
+    clause = build_filter_clause(
+        {
+            "kind": "a",
+            "amount": {">=": 2, "<": 5.5},
+            "id": {"in": [1, 2]},
+            "day": {"!=": datetime.date(2024, 1, 2)},
+        }
+    )
+
+    assert clause == (
+        '"kind" = \'a\' AND "amount" >= 2 AND "amount" < 5.5 AND '
+        '"id" IN (1, 2) AND "day" <> DATE \'2024-01-02\''
+    )
+
+
+@pytest.mark.parametrize(
+    "filters",
+    [
+        {"kind": {"like": "a%"}},
+        {"kind": {"in": []}},
+        {"amount": float("nan")},
+        {"bad column": 1},
+        {"kind": object()},
+    ],
+)
+def test_untranslatable_filters(filters):
+    """Test that filters SQL cannot express exactly disable the scan."""
+    assert build_filter_clause(filters) is None
+
+
+def test_parquet_scan_lists_files_and_pushes_down(parquet_files):
+    """Test that globbed files, columns and filters end up in the scan."""
+    query = build_scan_query(
+        "parquet",
+        {"path": parquet_files, "columns": ["id"], "filters": {"kind": "a"}},
+    )
+
+    assert query.startswith('SELECT "id" FROM read_parquet([')
+    assert "events_0.parquet', '" in query
+    assert query.endswith("union_by_name = true) WHERE \"kind\" = 'a'")
+
+
+def test_sources_that_need_their_connector(tmp_path, parquet_files):
+    """Test that non-local, missing, headerless or opted-out sources are skipped."""
+    csv_path = tmp_path / "data.csv"
+    csv_path.write_text("a\n1\n")
+
+    assert build_scan_query("postgres", {"path": str(csv_path)}) is None
+    assert build_scan_query("csv", {"path": "s3://bucket/data.csv"}) is None
+    assert build_scan_query("csv", {"path": str(tmp_path / "missing.csv")}) is None
+    assert build_scan_query("csv", {"path": str(csv_path), "has_header": False}) is None
+    assert (
+        build_scan_query("csv", {"path": str(csv_path), "encoding": "latin-1"}) is None
+    )
+    assert (
+        build_scan_query("parquet", {"path": parquet_files, "native_scan": False})
+        is None
+    )
+
+
+def test_native_scan_matches_connector_rows(parquet_files):
+    """Test that the native scan returns the same rows as ParquetSource."""
+    params = {
+        "path": parquet_files,
+        "columns": ["id", "amount"],
+        "filters": {"kind": {"in": ["a", "c"]}, "amount": {">": 1.5}},
+    }
+    source = ParquetSource()
+    source.configure(params)
+    expected = pd.concat([chunk.pandas_df for chunk in source.read()])
+
+    engine = DuckDBEngine(":memory:")
+    try:
+        query = engine.native_scan_query("parquet", params)
+        actual = engine.execute_query(f"{query} ORDER BY id").df()
+    finally:
+        engine.close()
+
+    pd.testing.assert_frame_equal(
+        actual, expected.sort_values("id").reset_index(drop=True), check_dtype=False
+    )
+    assert actual["id"].tolist() == [2, 4, 7, 9]
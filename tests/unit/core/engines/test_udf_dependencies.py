@@ -39,14 +39,14 @@ class TestTableUDFDependencyResolver:
     def test_extract_from_clause_tables(self, resolver):
         """Test extraction of table names from FROM clauses."""
         sql = "SELECT * FROM customers WHERE id = 1"
-        tables = resolver._extract_from_clause_tables(sql)
+        tables = resolver.extract_table_dependencies(sql)
 
         assert "customers" in tables
 
     def test_extract_from_clause_with_schema(self, resolver):
         """Test extraction with schema.table format."""
         sql = "SELECT * FROM schema.customers"
-        tables = resolver._extract_from_clause_tables(sql)
+        tables = resolver.extract_table_dependencies(sql)
 
         assert "schema.customers" in tables
 
@@ -57,7 +57,7 @@ class TestTableUDFDependencyResolver:
         INNER JOIN orders o ON c.id = o.customer_id
         LEFT JOIN products p ON o.product_id = p.id
         """
-        tables = resolver._extract_join_clause_tables(sql)
+        tables = resolver.extract_table_dependencies(sql)
 
         assert "orders" in tables
         assert "products" in tables
@@ -65,21 +65,21 @@ class TestTableUDFDependencyResolver:
     def test_extract_udf_parameter_tables(self, resolver):
         """Test extraction of table names from UDF parameters."""
         sql = 'SELECT * FROM PYTHON_FUNC("module.function", customers)'
-        tables = resolver._extract_udf_parameter_tables(sql)
+        tables = resolver.extract_table_dependencies(sql)
 
         assert "customers" in tables
 
     def test_extract_udf_direct_calls(self, resolver):
         """Test extraction from direct UDF calls."""
         sql = "SELECT * FROM udf1(customers)"
-        tables = resolver._extract_udf_parameter_tables(sql)
+        tables = resolver.extract_table_dependencies(sql)
 
         assert "customers" in tables
 
     def test_extract_subquery_tables(self, resolver):
         """Test extraction from subqueries."""
         sql = "SELECT * FROM (SELECT * FROM customers) c"
-        tables = resolver._extract_subquery_tables(sql)
+        tables = resolver.extract_table_dependencies(sql)
 
         assert "customers" in tables
 
@@ -91,27 +91,32 @@ class TestTableUDFDependencyResolver:
         )
         SELECT * FROM customer_orders
         """
-        tables = resolver._extract_cte_tables(sql)
+        tables = resolver.extract_table_dependencies(sql)
 
         assert "customers" in tables
         assert "orders" in tables
 
-    def test_filter_and_deduplicate(self, resolver):
-        """Test filtering and deduplication of dependencies."""
-        deps = [
-            "customers",
-            "read_csv_auto",
-            "customers",
-            "orders",
-            "information_schema",
-        ]
-        filtered = resolver._filter_and_deduplicate(deps)
-
-        assert "customers" in filtered
-        assert "orders" in filtered
-        assert "read_csv_auto" not in filtered
-        assert "information_schema" not in filtered
-        assert len([d for d in filtered if d == "customers"]) == 1  # No duplicates
+    def test_extract_skips_table_functions_and_duplicates(self, resolver):
+        """Test that table functions are skipped and tables reported once."""
+        sql = """
+        SELECT * FROM customers
+        JOIN read_csv_auto('data/orders.csv') o ON customers.id = o.customer_id
+        JOIN information_schema.tables t ON true
+        WHERE customers.id IN (SELECT customer_id FROM customers)
+        """
+        filtered = resolver.extract_table_dependencies(sql)
+
+        assert filtered == ["customers"]
+
+    def test_extract_cte_names_are_not_dependencies(self, resolver):
+        """Test that CTE names are scoped out of the dependencies."""
+        sql = """
+        WITH customer_orders AS (SELECT * FROM orders)
+        SELECT * FROM customer_orders JOIN "Customers" ON true
+        """
+        dependencies = resolver.extract_table_dependencies(sql)
+
+        assert dependencies == ["orders", "customers"]
 
     def test_extract_table_dependencies_comprehensive(self, resolver):
         """Test comprehensive table dependency extraction."""
@@ -421,7 +426,7 @@ class TestTableUDFDependencyResolver:
         CROSS JOIN regions r
         """
 
-        tables = resolver._extract_join_clause_tables(sql)
+        tables = resolver.extract_table_dependencies(sql)
 
         expected = ["orders", "products", "categories", "suppliers", "regions"]
         for table in expected:
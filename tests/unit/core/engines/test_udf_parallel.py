@@ -0,0 +1,148 @@
+"""Unit tests for process-pool table UDF execution."""
+
+import os
+import tempfile
+import textwrap
+import unittest
+
+import pandas as pd
+import pyarrow as pa
+
+from sqlflow.core.engines.duckdb.engine import DuckDBEngine
+from sqlflow.core.engines.duckdb.udf.parallel import (
+    get_udf_processes,
+    locate_udf,
+    run_table_udf_in_processes,
+    split_row_ranges,
+)
+from sqlflow.udfs.decorators import python_table_udf
+from sqlflow.udfs.manager import PythonUDFManager
+
+
+# Spawned workers load UDFs from their module, so they live at module level
+@python_table_udf(
+    output_schema={"id": "INTEGER", "squared": "INTEGER", "pid": "INTEGER"},
+    processes=3,
+)
+def add_square(df: pd.DataFrame) -> pd.DataFrame:
+    result = df.copy()
+    result["squared"] = result["id"] * result["id"]
+    result["pid"] = os.getpid()
+    return result
+
+
+@python_table_udf(output_schema={"id": "INTEGER", "pid": "INTEGER"}, processes=2)
+def tag_pid(df: pd.DataFrame) -> pd.DataFrame:
+    result = df.copy()
+    result["pid"] = os.getpid()
+    return result
+
+
+class TestSplitRowRanges(unittest.TestCase):
+    """Test row range partitioning."""
+
+    def test_ranges_cover_all_rows_in_order(self):
+        """Test that ranges are contiguous and balanced."""
+        self.assertEqual(split_row_ranges(10, 3), [(0, 4), (4, 3), (7, 3)])
+
+    def test_fewer_rows_than_partitions(self):
+        """Test that no empty ranges are produced for small inputs."""
+        self.assertEqual(split_row_ranges(2, 8), [(0, 1), (1, 1)])
+
+    def test_empty_input(self):
+        """Test that an empty input yields a single empty range."""
+        self.assertEqual(split_row_ranges(0, 4), [(0, 0)])
+
+
+class TestRunTableUDFInProcesses(unittest.TestCase):
+    """Test running table UDFs across worker processes."""
+
+    def test_get_udf_processes(self):
+        """Test that only UDFs opting into more than one process are parallel."""
+
+        @python_table_udf(output_schema={"x": "INTEGER"}, processes=4)
+        def parallel_udf(df: pd.DataFrame) -> pd.DataFrame:
+            return df
+
+        @python_table_udf(output_schema={"x": "INTEGER"})
+        def serial_udf(df: pd.DataFrame) -> pd.DataFrame:
+            return df
+
+        self.assertEqual(get_udf_processes(parallel_udf), 4)
+        self.assertEqual(get_udf_processes(serial_udf), 0)
+
+    def test_results_match_in_process_execution(self):
+        """Test that partition results are stitched back in input order."""
+        table = pa.table({"id": list(range(1000))})
+        result = run_table_udf_in_processes(add_square, table, 3)
+
+        self.assertEqual(result.column("id").to_pylist(), list(range(1000)))
+        self.assertEqual(
+            result.column("squared").to_pylist(), [i * i for i in range(1000)]
+        )
+        self.assertNotIn(os.getpid(), set(result.column("pid").to_pylist()))
+
+    def test_udf_from_project_file(self):
+        """Test a UDF loaded from a file that is not importable by name."""
+        with tempfile.TemporaryDirectory() as project_dir:
+            udf_dir = os.path.join(project_dir, "python_udfs")
+            os.makedirs(udf_dir)
+            with open(os.path.join(udf_dir, "scoring.py"), "w") as f:
+                f.write(
+                    textwrap.dedent(
+                        """
+                        import pandas as pd
+
+                        from sqlflow.udfs.decorators import python_table_udf
+
+
+                        @python_table_udf(
+                            output_schema={"id": "INTEGER", "score": "INTEGER"},
+                            processes=2,
+                        )
+                        def score(df: pd.DataFrame) -> pd.DataFrame:
+                            return df.assign(score=df["id"] * 10)
+                        """
+                    )
+                )
+            udfs = PythonUDFManager(project_dir).discover_udfs()
+            (score,) = [udf for name, udf in udfs.items() if name.endswith("score")]
+
+            table = pa.table({"id": list(range(10))})
+            result = run_table_udf_in_processes(score, table, 2)
+
+        self.assertEqual(result.column("score").to_pylist(), list(range(0, 100, 10)))
+
+    def test_nested_udf_runs_in_process(self):
+        """Test that UDFs workers cannot load fall back to in-process execution."""
+
+        @python_table_udf(output_schema={"id": "INTEGER", "pid": "INTEGER"})
+        def local_tag_pid(df: pd.DataFrame) -> pd.DataFrame:
+            return df.assign(pid=os.getpid())
+
+        self.assertIsNone(locate_udf(local_tag_pid))
+        result = run_table_udf_in_processes(local_tag_pid, pa.table({"id": [1, 2]}), 2)
+        self.assertEqual(result.column("pid").to_pylist(), [os.getpid()] * 2)
+
+    def test_query_processor_uses_processes(self):
+        """Test that a table UDF in a query runs through the process pool."""
+        engine = DuckDBEngine(":memory:")
+        try:
+            engine.execute_query(
+                "CREATE TABLE numbers AS SELECT range AS id FROM range(10)"
+            )
+            engine.registered_udfs["tag_pid"] = tag_pid
+
+            query = engine.process_query_for_udfs(
+                "SELECT * FROM tag_pid(numbers)", {"tag_pid": tag_pid}
+            )
+            rows = engine.execute_query(f"{query} ORDER BY id").fetchall()
+
+            self.assertEqual([row[0] for row in rows], list(range(10)))
+            self.assertNotIn(os.getpid(), {row[1] for row in rows})
+        finally:
+            engine.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,64 @@
+"""Tests for when LocalExecutor commits the file manifest of a load."""
+
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+import pandas as pd
+import pytest
+
+from sqlflow.core.executors.local_executor import LocalExecutor
+
+
+@pytest.fixture
+def executor():
+    """Executor whose incremental source yields rows through a mock connector."""
+    executor = LocalExecutor()
+    connector = SimpleNamespace(file_manifest=MagicMock())
+    patches = [
+        patch.object(executor, "_get_connector_instance", return_value=connector),
+        patch.object(
+            executor,
+            "_load_incremental_source_data",
+            return_value=pd.DataFrame({"id": [1, 2]}),
+        ),
+        patch.object(executor, "_update_watermark_if_needed"),
+        patch.object(executor, "_load_full_refresh_data", return_value=0),
+    ]
+    for patcher in patches:
+        patcher.start()
+    yield executor, connector.file_manifest
+    for patcher in patches:
+        patcher.stop()
+
+
+def load(executor):
+    load_step = SimpleNamespace(
+        source_name="events", table_name="events", pipeline_name="daily"
+    )
+    return executor._load_incremental_data(
+        load_step, {"params": {"cursor_field": "id"}}
+    )
+
+
+def test_manifest_committed_after_rows_are_registered(executor):
+    """Test that files are recorded once their rows are registered."""
+    executor, file_manifest = executor
+
+    assert load(executor) == 2
+
+    file_manifest.commit.assert_called_once()
+    file_manifest.discard.assert_not_called()
+    assert executor.duckdb_engine.table_exists("events")
+
+
+def test_failed_registration_discards_manifest(executor):
+    """Test that a failed load leaves its files unrecorded."""
+    executor, file_manifest = executor
+
+    with patch.object(
+        executor.duckdb_engine, "register_table", side_effect=RuntimeError("boom")
+    ):
+        load(executor)
+
+    file_manifest.commit.assert_not_called()
+    file_manifest.discard.assert_called_once()
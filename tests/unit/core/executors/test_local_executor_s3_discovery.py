@@ -0,0 +1,66 @@
+"""Tests for how LocalExecutor registers discovered S3 files with DuckDB."""
+
+from types import SimpleNamespace
+
+import pandas as pd
+import pytest
+
+from sqlflow.connectors.data_chunk import DataChunk
+from sqlflow.core.executors.local_executor import LocalExecutor
+
+
+def discovered_connector(chunks_read):
+    """Connector whose discovered objects yield one chunk each."""
+
+    def read_objects(object_names, batch_size=10000, skip_failed=False):
+        for index, _ in enumerate(object_names):
+            chunks_read.append(index)
+            yield DataChunk(pd.DataFrame({"id": [index * 2, index * 2 + 1]}))
+
+    return SimpleNamespace(read_objects=read_objects)
+
+
+@pytest.fixture
+def executor():
+    return LocalExecutor()
+
+
+def test_discovered_files_stream_into_table(executor):
+    """Test that every discovered file lands in one DuckDB table."""
+    chunks_read = []
+    connector = discovered_connector(chunks_read)
+
+    result = executor._process_discovered_s3_files(
+        {}, connector, "events", ["a.csv", "b.csv", "c.csv"]
+    )
+
+    assert result["rows_processed"] == 6
+    assert "events" not in executor.table_data
+    rows = executor.duckdb_engine.execute_query(
+        "SELECT id FROM events ORDER BY id"
+    ).fetchall()
+    assert [row[0] for row in rows] == [0, 1, 2, 3, 4, 5]
+
+
+def test_streamed_source_is_not_read_again(executor):
+    """Test that a load of a streamed source reuses the DuckDB table."""
+    chunks_read = []
+    connector = discovered_connector(chunks_read)
+    executor._process_discovered_s3_files({}, connector, "events", ["a", "b"])
+
+    load_step = SimpleNamespace(source_name="events")
+
+    assert executor._load_and_prepare_source_data(load_step) == 4
+    assert chunks_read == [0, 1]
+
+
+def test_single_chunk_is_registered_as_view(executor):
+    """Test that one chunk is registered directly, as before."""
+    executor._register_chunks("events", iter([DataChunk(pd.DataFrame({"id": [7]}))]))
+
+    rows = executor.duckdb_engine.execute_query("SELECT id FROM events").fetchall()
+    assert rows == [(7,)]
+
+
+def test_no_chunks_registers_nothing(executor):
+    assert executor._register_chunks("events", iter([])) is None
@@ -139,6 +139,20 @@ class TestSimpleObservabilityManager:
         step_details = metrics["step_details"]["load_data"]
         assert step_details["rows_affected"] == 1000
 
+    def test_record_batch(self):
+        """Test recording streamed batches for a step."""
+        manager = SimpleObservabilityManager("test")
+
+        manager.start_step("load_data")
+        manager.record_batch("load_data", rows=500, num_bytes=4000)
+        manager.record_batch("load_data", rows=250, num_bytes=2000)
+        manager.end_step("load_data", success=True)
+
+        step_details = manager.get_metrics()["step_details"]["load_data"]
+        assert step_details["batches"] == 2
+        assert step_details["bytes_processed"] == 6000
+        assert step_details["rows_affected"] == 750
+
     def test_add_step_metadata(self):
         """Test adding metadata to steps."""
         manager = SimpleObservabilityManager("test")
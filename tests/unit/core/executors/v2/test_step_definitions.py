@@ -387,6 +387,25 @@ class TestStepFactory:
         assert step.destination == "s3://bucket/output.json"
         assert step.format == ExportFormat.JSON
 
+    def test_create_export_step_keeps_query_and_options(self):
+        """Test that the planner's EXPORT query and options reach the step."""
+        step_dict = {
+            "id": "test_export",
+            "type": "export",
+            "source_table": "test_table",
+            "query": {
+                "sql_query": "SELECT * FROM test_table WHERE id > 1",
+                "destination_uri": "output/test.parquet",
+                "options": {"compression": "zstd"},
+                "type": "parquet",
+            },
+        }
+
+        step = create_step_from_dict(step_dict)
+
+        assert step.query == "SELECT * FROM test_table WHERE id > 1"
+        assert step.options == {"compression": "zstd"}
+
     def test_create_source_step_from_dict(self):
         """Test creating SourceStep from dictionary."""
         step_dict = {
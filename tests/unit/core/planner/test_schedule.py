@@ -0,0 +1,78 @@
+"""Tests for the level-based parallel schedule of execution plans."""
+
+from sqlflow.core.planner.schedule import (
+    DEFAULT_BYTES_PER_SECOND,
+    DEFAULT_STEP_SECONDS,
+    annotate_schedule,
+    estimate_step_costs,
+    summarize_schedule,
+)
+
+
+def _op(step_id, op_type="transform", depends_on=None, **fields):
+    return {"id": step_id, "type": op_type, "depends_on": depends_on or [], **fields}
+
+
+def test_diamond_waves_and_critical_path():
+    """Test that independent branches share a wave and the slow one is critical."""
+    operations = [
+        _op("load_raw", "load", name="raw"),
+        _op("transform_a", depends_on=["load_raw"], name="a"),
+        _op("transform_b", depends_on=["load_raw"], name="b"),
+        _op("transform_c", depends_on=["transform_a", "transform_b"], name="c"),
+    ]
+    annotate_schedule(operations, {"transform_b": 5.0})
+
+    assert [op["wave"] for op in operations] == [0, 1, 1, 2]
+    assert [op["on_critical_path"] for op in operations] == [True, False, True, True]
+
+    summary = summarize_schedule(operations)
+    assert summary["waves"] == [
+        ["load_raw"],
+        ["transform_a", "transform_b"],
+        ["transform_c"],
+    ]
+    assert summary["critical_path"] == ["load_raw", "transform_b", "transform_c"]
+    assert summary["critical_path_seconds"] == 5.0 + 2 * DEFAULT_STEP_SECONDS
+
+
+def test_writes_to_same_table_keep_plan_order():
+    """Test that loads into one table are chained even without a read edge."""
+    operations = [
+        _op("load_1", "load", target_table="users"),
+        _op("load_2", "load", target_table="users"),
+        _op("load_3", "load", target_table="orders"),
+    ]
+    annotate_schedule(operations)
+
+    assert operations[1]["depends_on"] == ["load_1"]
+    assert operations[2]["depends_on"] == []
+    assert [op["wave"] for op in operations] == [0, 1, 0]
+
+
+def test_unknown_and_duplicate_dependencies_are_tolerated():
+    """Test that dangling and repeated dependencies do not break annotation."""
+    operations = [
+        _op("a", depends_on=["missing"]),
+        _op("b", depends_on=["a", "a"]),
+    ]
+    annotate_schedule(operations)
+
+    assert operations[1]["depends_on"] == ["a"]
+    assert [op["wave"] for op in operations] == [0, 1]
+
+
+def test_load_estimate_uses_source_file_size(tmp_path):
+    """Test that loads from large local files are estimated by size."""
+    path = tmp_path / "big.csv"
+    path.write_bytes(b"x" * (3 * DEFAULT_BYTES_PER_SECOND))
+    operations = [
+        _op("source_big", "source_definition", name="big", query={"path": str(path)}),
+        _op("load_big", "load", source_name="big", target_table="big"),
+        _op("load_other", "load", source_name="other", target_table="other"),
+    ]
+    costs = estimate_step_costs(operations, {"load_other": 0.25})
+
+    assert costs["load_big"] == 3.0
+    assert costs["load_other"] == 0.25
+    assert costs["source_big"] == DEFAULT_STEP_SECONDS
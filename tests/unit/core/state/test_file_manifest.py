@@ -0,0 +1,157 @@
+"""Tests for FileManifest."""
+
+from contextlib import nullcontext
+from datetime import datetime
+from typing import Any, Dict, Optional
+
+import duckdb
+import pytest
+
+from sqlflow.core.state.backends import DuckDBStateBackend, StateBackend
+from sqlflow.core.state.file_manifest import FileManifest, fingerprint_file
+
+
+class DictStateBackend(StateBackend):
+    """Minimal key-value backend relying on the default manifest methods."""
+
+    def __init__(self):
+        self.values: Dict[str, Any] = {}
+
+    def get(self, key: str) -> Optional[Any]:
+        return self.values.get(key)
+
+    def set(self, key: str, value: Any, timestamp: Optional[datetime] = None) -> None:
+        self.values[key] = value
+
+    def delete(self, key: str) -> bool:
+        return self.values.pop(key, None) is not None
+
+    def transaction(self):
+        return nullcontext()
+
+    def close(self) -> None:
+        pass
+
+
+@pytest.fixture(params=["duckdb", "key_value"])
+def backend(request):
+    """Create each kind of state backend."""
+    if request.param == "duckdb":
+        backend = DuckDBStateBackend(duckdb.connect(":memory:"))
+        yield backend
+        backend.close()
+    else:
+        yield DictStateBackend()
+
+
+def test_manifest_key():
+    """Test manifest key generation."""
+    assert FileManifest.get_manifest_key("daily", "events", "raw_events") == (
+        "daily.events.raw_events"
+    )
+
+
+def test_new_and_changed_files(backend):
+    """Test that only unseen files or files with a new version are changed."""
+    manifest = FileManifest(backend, "daily.events.raw_events")
+    manifest.record("a.parquet", 100, 1700, 10)
+    manifest.record("b.parquet", 200, "etag-b", 20)
+    assert manifest.commit() == 2
+
+    manifest = FileManifest(backend, "daily.events.raw_events")
+    assert not manifest.is_changed("a.parquet", 100, 1700)
+    assert not manifest.is_changed("b.parquet", 200, "etag-b")
+    assert manifest.is_changed("a.parquet", 150, 1700)
+    assert manifest.is_changed("b.parquet", 200, "etag-c")
+    assert manifest.is_changed("c.parquet", 10, 1)
+    assert manifest.get_rows_ingested("b.parquet") == 20
+    assert manifest.get_rows_ingested("c.parquet") == 0
+
+
+def test_uncommitted_files_are_not_persisted(backend):
+    """Test that files are persisted only by commit."""
+    manifest = FileManifest(backend, "daily.events.raw_events")
+    manifest.record("a.parquet", 100, 1700, 10)
+    manifest.discard()
+
+    assert manifest.commit() == 0
+    assert FileManifest(backend, "daily.events.raw_events").entries == {}
+
+
+def test_manifests_are_separate(backend):
+    """Test that sources do not see each other's files."""
+    first = FileManifest(backend, "daily.events.raw_events")
+    first.record("a.parquet", 100, 1700, 10)
+    first.commit()
+
+    other = FileManifest(backend, "daily.orders.raw_orders")
+    assert other.is_changed("a.parquet", 100, 1700)
+
+
+def test_recording_replaces_previous_version():
+    """Test that re-ingesting a file replaces its manifest row."""
+    backend = DuckDBStateBackend(duckdb.connect(":memory:"))
+    for size in (100, 150):
+        manifest = FileManifest(backend, "daily.events.raw_events")
+        manifest.record("a.parquet", size, 1700, size // 10)
+        manifest.commit()
+
+    rows = backend.connection.execute(
+        "SELECT size, rows_ingested FROM sqlflow_file_manifest"
+    ).fetchall()
+    assert rows == [(150, 15)]
+
+
+def test_resume_offset_requires_same_file(backend, tmp_path):
+    """Test that offsets are trusted only for the file they were recorded for."""
+    log_path = tmp_path / "events.log"
+    log_path.write_text("id\n1\n2\n")
+    path = str(log_path)
+
+    manifest = FileManifest(backend, "daily.events.raw_events")
+    manifest.record(path, 8, 1700, 2, offset=8, fingerprint=fingerprint_file(path))
+    manifest.record("other.log", 8, 1700, 2)
+    manifest.commit()
+
+    with open(path, "a") as f:
+        f.write("3\n")
+    manifest = FileManifest(backend, "daily.events.raw_events")
+    assert manifest.get_resume_offset(path) == 8
+    assert manifest.get_resume_offset("other.log") == 0
+
+    log_path.write_text("id\n9\n")
+    assert manifest.get_resume_offset(path) == 0
+
+    log_path.write_text("ix\n1\n2\n3\n")
+    assert manifest.get_resume_offset(path) == 0
+
+
+def test_manifest_table_gains_resume_columns():
+    """Test that manifests created without resume columns are migrated."""
+    connection = duckdb.connect(":memory:")
+    connection.execute(
+        """
+        CREATE TABLE sqlflow_file_manifest (
+            manifest_key VARCHAR NOT NULL,
+            path VARCHAR NOT NULL,
+            size BIGINT,
+            modified VARCHAR,
+            rows_ingested BIGINT DEFAULT 0,
+            last_ingested TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            PRIMARY KEY(manifest_key, path)
+        )
+    """
+    )
+    connection.execute(
+        "INSERT INTO sqlflow_file_manifest (manifest_key, path, size, modified) "
+        "VALUES ('k', 'a.csv', 10, '1700')"
+    )
+
+    backend = DuckDBStateBackend(connection)
+    manifest = FileManifest(backend, "k")
+    assert manifest.entries["a.csv"]["offset"] is None
+    manifest.record("a.csv", 20, 1800, 3, offset=20, fingerprint="1:20:abc")
+    manifest.commit()
+
+    entry = FileManifest(backend, "k").entries["a.csv"]
+    assert (entry["offset"], entry["fingerprint"]) == (20, "1:20:abc")
@@ -171,3 +171,18 @@ def test_failed_operation_recording(tmp_path: Path) -> None:
 
     # Assert - Finalized metadata
     assert final_metadata["status"] == "failed"
+
+
+def test_step_durations_survive_run_dir_cleaning(tmp_path: Path) -> None:
+    """Test that recorded step durations are merged and kept across runs."""
+    manager = ArtifactManager(str(tmp_path))
+    assert manager.load_step_durations("test_pipeline") == {}
+
+    manager.save_step_durations("test_pipeline", {"load_a": 2.0, "transform_b": 1.5})
+    manager.clean_run_dir("test_pipeline")
+    manager.save_step_durations("test_pipeline", {"transform_b": 0.5})
+
+    assert manager.load_step_durations("test_pipeline") == {
+        "load_a": 2.0,
+        "transform_b": 0.5,
+    }
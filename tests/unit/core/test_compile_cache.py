@@ -0,0 +1,111 @@
+"""Tests for the CompileCache class."""
+
+import json
+from pathlib import Path
+
+from sqlflow.core.storage.compile_cache import CompileCache, compute_compile_key
+
+PIPELINE = """
+INCLUDE "lib/common.sf" AS common;
+SOURCE s TYPE CSV PARAMS {"path": "${data_dir}/s.csv"};
+LOAD t FROM s;
+"""
+
+
+def test_compile_key_tracks_inputs(tmp_path: Path, monkeypatch) -> None:
+    """Test that the key changes only with inputs that affect the plan."""
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "lib").mkdir()
+    (tmp_path / "lib" / "common.sf").write_text("SET x = 1;")
+    pipeline_path = str(tmp_path / "p.sf")
+    variables = {"data_dir": "data", "UNRELATED_ENV": "1"}
+
+    key = compute_compile_key(PIPELINE, pipeline_path, variables, {"engines": {}})
+
+    assert key == compute_compile_key(
+        PIPELINE, pipeline_path, {**variables, "UNRELATED_ENV": "2"}, {"engines": {}}
+    )
+    assert key != compute_compile_key(
+        PIPELINE + "\n", pipeline_path, variables, {"engines": {}}
+    )
+    assert key != compute_compile_key(
+        PIPELINE, pipeline_path, {"data_dir": "other"}, {"engines": {}}
+    )
+    assert key != compute_compile_key(PIPELINE, pipeline_path, variables, {})
+    assert key != compute_compile_key(
+        PIPELINE, pipeline_path, variables, {"engines": {}}, {"load_raw": 42.0}
+    )
+
+    (tmp_path / "lib" / "common.sf").write_text("SET x = 2;")
+    assert key != compute_compile_key(
+        PIPELINE, pipeline_path, variables, {"engines": {}}
+    )
+
+
+def test_load_requires_matching_key(tmp_path: Path) -> None:
+    """Test that a plan is reused only under the key it was saved with."""
+    target_path = str(tmp_path / "compiled" / "p.json")
+    (tmp_path / "compiled").mkdir()
+    operations = [{"id": "load_t", "type": "load"}]
+    Path(target_path).write_text(json.dumps(operations))
+
+    cache = CompileCache()
+    assert cache.load(target_path, "k1") is None
+
+    cache.save(target_path, "k1")
+    assert cache.load(target_path, "k1") == operations
+    assert cache.load(target_path, "k2") is None
+    assert CompileCache(enabled=False).load(target_path, "k1") is None
+
+    cache.invalidate(target_path)
+    assert cache.load(target_path, "k1") is None
+
+
+def test_load_ignores_missing_or_corrupt_plans(tmp_path: Path) -> None:
+    """Test that unreadable plans are treated as cache misses."""
+    target_path = str(tmp_path / "p.json")
+    cache = CompileCache()
+    cache.save(target_path, "k1")
+    assert cache.load(target_path, "k1") is None
+
+    Path(target_path).write_text("{not json")
+    assert cache.load(target_path, "k1") is None
+
+
+def test_load_unwraps_compilation_results(tmp_path: Path) -> None:
+    """Test that plans saved with their pipeline name are reused too."""
+    target_path = str(tmp_path / "p.json")
+    operations = [{"id": "load_t", "type": "load"}]
+    Path(target_path).write_text(
+        json.dumps({"pipeline_name": "p", "operations": operations})
+    )
+
+    cache = CompileCache()
+    cache.save(target_path, "k1")
+    assert cache.load(target_path, "k1") == operations
+
+
+def test_compile_key_follows_nested_includes(tmp_path: Path, monkeypatch) -> None:
+    """Test that variables and files reached only through includes count."""
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "lib").mkdir()
+    (tmp_path / "lib" / "common.sf").write_text(
+        '-- INCLUDE "lib/commented.sf" AS c;\nINCLUDE "nested.sf" AS nested;'
+    )
+    (tmp_path / "lib" / "nested.sf").write_text(
+        'INCLUDE "lib/common.sf" AS common;\nSET table = "${target_table}";'
+    )
+    pipeline_path = str(tmp_path / "p.sf")
+    variables = {"data_dir": "data", "target_table": "a"}
+
+    key = compute_compile_key(PIPELINE, pipeline_path, variables)
+
+    assert key != compute_compile_key(
+        PIPELINE, pipeline_path, {**variables, "target_table": "b"}
+    )
+    (tmp_path / "lib" / "nested.sf").write_text('SET table = "${target_table}";')
+    assert key != compute_compile_key(PIPELINE, pipeline_path, variables)
+    (tmp_path / "lib" / "commented.sf").write_text("SET x = 1;")
+    key = compute_compile_key(PIPELINE, pipeline_path, variables)
+    (tmp_path / "lib" / "commented.sf").write_text("SET x = 2;")
+    assert key == compute_compile_key(PIPELINE, pipeline_path, variables)
@@ -0,0 +1,160 @@
+"""Tests for the compact dependency graph."""
+
+import unittest
+
+from sqlflow.core.dependencies import DependencyResolver
+from sqlflow.core.errors import CircularDependencyError
+from sqlflow.core.graph import DependencyGraph
+
+
+def generate_layered_graph(num_nodes: int, width: int = 100) -> DependencyGraph:
+    """Generate a layered DAG; each node depends on two nodes of the layer above."""
+    graph = DependencyGraph()
+    for i in range(num_nodes):
+        graph.add_node(f"step_{i}")
+        if i >= width:
+            previous_layer = (i // width - 1) * width
+            graph.add_edge(f"step_{i}", f"step_{i - width}")
+            graph.add_edge(f"step_{i}", f"step_{previous_layer + (i + 1) % width}")
+    return graph
+
+
+class TestDependencyGraph(unittest.TestCase):
+    """Test components, cycles, ordering and closures."""
+
+    def test_components_are_dependencies_first(self):
+        """Test that Tarjan groups mutual dependencies and orders components."""
+        graph = DependencyGraph.from_mapping(
+            {"a": ["b"], "b": ["c"], "c": ["b", "d"], "d": []}
+        )
+        self.assertEqual(
+            graph.strongly_connected_components(), [["d"], ["b", "c"], ["a"]]
+        )
+
+    def test_find_cycles(self):
+        """Test one simple cycle per cyclic component, including self-loops."""
+        graph = DependencyGraph.from_mapping(
+            {"a": ["b"], "b": ["c", "x"], "c": ["a"], "s": ["s"], "x": []}
+        )
+        self.assertTrue(graph.has_cycles())
+        self.assertEqual(graph.find_cycles(), [["a", "b", "c"], ["s"]])
+
+        # The walk from a reaches the inner b <-> c loop first
+        nested = DependencyGraph.from_mapping({"a": ["b"], "b": ["c"], "c": ["b", "a"]})
+        self.assertEqual(nested.find_cycles(), [["a", "b", "c"]])
+
+        acyclic = DependencyGraph.from_mapping({"a": ["b", "missing"], "b": []})
+        self.assertFalse(acyclic.has_cycles())
+        self.assertEqual(acyclic.find_cycles(), [])
+
+    def test_cycle_through_node(self):
+        """Test the shortest cycle through a node, empty off any cycle."""
+        graph = DependencyGraph.from_mapping(
+            {"a": ["b"], "b": ["c", "a"], "c": ["a"], "x": ["a"]}
+        )
+        self.assertEqual(graph.cycle_through("a"), ["a", "b"])
+        self.assertEqual(graph.cycle_through("c"), ["c", "a", "b"])
+        self.assertEqual(graph.cycle_through("x"), [])
+        self.assertEqual(graph.cycle_through("missing"), [])
+
+    def test_known_only_ignores_external_nodes(self):
+        """Test that edges to nodes outside the mapping are dropped."""
+        graph = DependencyGraph.from_mapping(
+            {"a": ["external"], "b": ["a"]}, known_only=True
+        )
+        self.assertNotIn("external", graph)
+        self.assertFalse(graph.has_cycles())
+
+    def test_dependency_order_matches_depth_first_resolution(self):
+        """Test that shared roots resolve like resolving each root in turn."""
+        graph = DependencyGraph.from_mapping(
+            {"a": ["b", "c"], "b": ["d"], "e": ["d", "c"]}
+        )
+        self.assertEqual(
+            graph.dependency_order(["a", "e", "lonely"]),
+            ["d", "b", "c", "a", "e", "lonely"],
+        )
+
+    def test_dependency_order_reports_cycle_path(self):
+        """Test that the reported cycle starts and ends at the repeated node."""
+        graph = DependencyGraph.from_mapping({"a": ["b"], "b": ["c"], "c": ["b"]})
+        with self.assertRaises(CircularDependencyError) as context:
+            graph.dependency_order(["a"])
+        self.assertEqual(context.exception.cycle, ["b", "c", "b"])
+
+    def test_transitive_dependencies_are_cached_and_invalidated(self):
+        """Test closures through components and refresh after new edges."""
+        graph = DependencyGraph.from_mapping(
+            {"a": ["b"], "b": ["c"], "c": ["b", "d"], "d": []}
+        )
+        self.assertEqual(graph.transitive_dependencies("a"), {"b", "c", "d"})
+        self.assertEqual(graph.transitive_dependencies("b"), {"b", "c", "d"})
+        self.assertEqual(graph.transitive_dependencies("d"), set())
+        self.assertTrue(graph.depends_on("a", "d"))
+        self.assertFalse(graph.depends_on("d", "a"))
+
+        graph.add_edge("d", "e")
+        self.assertTrue(graph.depends_on("a", "e"))
+        self.assertEqual(graph.transitive_dependencies("d"), {"e"})
+
+    def test_resolver_resolve_order_and_closure(self):
+        """Test the resolver's single-pass order and cached closures."""
+        resolver = DependencyResolver()
+        resolver.add_dependency("c", "b")
+        resolver.add_dependency("b", "a")
+        resolver.add_dependency("d", "a")
+
+        self.assertEqual(resolver.resolve_order(["c", "d"]), ["a", "b", "c", "d"])
+        self.assertEqual(resolver.last_resolved_order, ["a", "b", "c", "d"])
+        self.assertEqual(resolver.get_all_dependencies("c"), {"a", "b"})
+        self.assertEqual(resolver.find_cycles(), [])
+
+
+class TestDependencyGraphScale(unittest.TestCase):
+    """Test graph analyses on 10k-node graphs."""
+
+    def test_10k_node_analyses(self):
+        """Test SCC, ordering and closures on a 10k-node layered graph."""
+        graph = generate_layered_graph(10_000)
+        self.assertFalse(graph.has_cycles())
+
+        order = graph.dependency_order(graph.nodes)
+        self.assertEqual(sorted(order), sorted(graph.nodes))
+        position = {node: i for i, node in enumerate(order)}
+        for node in graph.nodes:
+            for dependency in graph.successors(node):
+                self.assertLess(position[dependency], position[node])
+
+        reachable = set()
+        pending = ["step_9999"]
+        while pending:
+            for dependency in graph.successors(pending.pop()):
+                if dependency not in reachable:
+                    reachable.add(dependency)
+                    pending.append(dependency)
+        self.assertEqual(graph.transitive_dependencies("step_9999"), reachable)
+
+    def test_10k_node_chain_does_not_recurse(self):
+        """Test that a 10k-deep dependency cycle is found without recursion."""
+        resolver = DependencyResolver()
+        for i in range(1, 10_000):
+            resolver.add_dependency(f"step_{i}", f"step_{i - 1}")
+        resolver.add_dependency("step_0", "step_9999")
+
+        cycles = resolver.find_cycles()
+        self.assertEqual(len(cycles), 1)
+        self.assertEqual(len(cycles[0]), 10_000)
+
+        with self.assertRaises(CircularDependencyError) as context:
+            resolver.resolve_dependencies("step_9999")
+        cycle = context.exception.cycle
+        self.assertEqual(len(cycle), 10_001)
+        self.assertEqual(cycle[0], cycle[-1])
+
+        cycle = resolver._find_cycle("step_5000")
+        self.assertEqual(cycle[:2], ["step_5000", "step_4999"])
+        self.assertEqual(len(cycle), 10_001)
+
+
+if __name__ == "__main__":
+    unittest.main()
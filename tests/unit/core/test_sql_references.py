@@ -0,0 +1,73 @@
+"""Tests for tokenizer-based SQL table reference extraction."""
+
+import pytest
+
+from sqlflow.core.sql_references import extract_table_references
+
+
+@pytest.mark.parametrize(
+    "sql,expected",
+    [
+        ("SELECT * FROM users", ["users"]),
+        (
+            "SELECT * FROM users, orders o, products AS p",
+            ["users", "orders", "products"],
+        ),
+        (
+            "SELECT * FROM users u LEFT JOIN orders o ON u.id = o.user_id",
+            ["users", "orders"],
+        ),
+        ('SELECT * FROM "Main"."Users" JOIN main.orders ON true', ["users", "orders"]),
+        ("SELECT * FROM analytics.orders", ["analytics.orders"]),
+        ("SELECT * FROM (SELECT * FROM (SELECT * FROM customers) c) f", ["customers"]),
+        ("FROM raw_events SELECT id", ["raw_events"]),
+        ("SELECT * FROM (a JOIN b ON a.id = b.id)", ["a", "b"]),
+        (
+            "SELECT * FROM ((a JOIN b USING (id)) x JOIN (SELECT * FROM c) y ON true)",
+            ["a", "b", "c"],
+        ),
+    ],
+)
+def test_extracts_tables(sql, expected):
+    """Test FROM lists, joins, qualified names and subqueries."""
+    assert extract_table_references(sql) == expected
+
+
+def test_cte_names_are_scoped():
+    """Test that CTE names only hide tables inside their defining query."""
+    sql = """
+    WITH a AS (SELECT * FROM raw),
+         b AS (SELECT * FROM a JOIN dims USING (id))
+    SELECT * FROM b
+    WHERE b.id IN (WITH dims AS (SELECT 1 AS id) SELECT id FROM dims)
+    """
+    assert extract_table_references(sql) == ["raw", "dims"]
+
+    sql = (
+        "WITH RECURSIVE t(n) AS (SELECT 1 UNION ALL SELECT n + 1 FROM t) "
+        "SELECT * FROM t"
+    )
+    assert extract_table_references(sql) == []
+
+
+def test_ignores_literals_comments_and_function_from():
+    """Test that FROM in strings, comments and function calls is not a table."""
+    sql = """
+    -- FROM commented_out
+    SELECT 'a FROM b' AS s, EXTRACT(year FROM ts) AS y, /* JOIN nope */
+           substring(name FROM 2) AS n
+    FROM events
+    """
+    assert extract_table_references(sql) == ["events"]
+
+
+def test_table_functions():
+    """Test table UDF arguments, file readers and system catalogs."""
+    sql = """
+    SELECT * FROM PYTHON_FUNC("module.enrich", customers)
+    JOIN read_csv_auto('data/orders.csv') o ON true
+    JOIN information_schema.tables t ON true
+    JOIN my_udf(payments) p ON true
+    """
+    assert extract_table_references(sql) == ["customers"]
+    assert extract_table_references(sql, ["my_udf"]) == ["customers", "payments"]
@@ -0,0 +1,118 @@
+"""Tests and benchmark for indexed table typo suggestions."""
+
+import random
+import time
+import unittest
+
+import pytest
+
+from sqlflow.core.table_suggestions import TableNameSuggester, bounded_edit_distance
+
+
+def generate_table_names(count: int, seed: int = 7) -> list:
+    """Generate distinct snake_case table names like stg_orders_daily_12."""
+    rng = random.Random(seed)
+    words = [
+        "orders",
+        "customers",
+        "events",
+        "sessions",
+        "payments",
+        "products",
+        "inventory",
+        "returns",
+        "campaigns",
+        "accounts",
+    ]
+    prefixes = ["stg", "int", "fct", "dim", "raw", "agg"]
+    names = set()
+    while len(names) < count:
+        parts = [rng.choice(prefixes), rng.choice(words), rng.choice(words)]
+        names.add(f"{'_'.join(parts)}_{rng.randint(0, 999)}")
+    return sorted(names)
+
+
+class TestBoundedEditDistance(unittest.TestCase):
+    """Test the banded, bounded Levenshtein distance."""
+
+    def test_distances_within_bound(self):
+        """Test exact distances up to the bound."""
+        self.assertEqual(bounded_edit_distance("users", "users", 2), 0)
+        self.assertEqual(bounded_edit_distance("users", "usres", 2), 2)
+        self.assertEqual(bounded_edit_distance("users", "user", 2), 1)
+        self.assertEqual(bounded_edit_distance("", "ab", 2), 2)
+
+    def test_distances_over_bound_are_capped(self):
+        """Test that distances above the bound are reported as bound + 1."""
+        self.assertEqual(bounded_edit_distance("orders", "customers", 2), 3)
+        self.assertEqual(bounded_edit_distance("a", "abcdef", 2), 3)
+        self.assertEqual(bounded_edit_distance("kitten", "sitting", 3), 3)
+
+
+class TestTableNameSuggester(unittest.TestCase):
+    """Test candidate matching and best suggestions."""
+
+    def setUp(self):
+        self.suggester = TableNameSuggester(
+            ["users", "users_table", "orders", "stg_events", "sales_summary"]
+        )
+
+    def test_edit_distance_typos(self):
+        """Test misspellings within two edits."""
+        self.assertEqual(self.suggester.suggest("usres"), "users")
+        self.assertEqual(self.suggester.suggest("ordrs"), "orders")
+        self.assertEqual(self.suggester.suggest("sale_sumary"), "sales_summary")
+
+    def test_underscore_affixes(self):
+        """Test debugging suffixes and prefixes in both directions."""
+        self.assertEqual(self.suggester.suggest("users_table_failed"), "users_table")
+        self.assertEqual(self.suggester.suggest("events"), "stg_events")
+        self.assertEqual(self.suggester.suggest("tmp_orders"), "orders")
+        self.assertEqual(
+            self.suggester.candidates("users_table_wrong"),
+            {"users_table": 6},
+        )
+
+    def test_unrelated_names_have_no_suggestion(self):
+        """Test that external-looking tables are not reported as typos."""
+        self.assertIsNone(self.suggester.suggest("external_warehouse"))
+        self.assertIsNone(self.suggester.suggest("users_table_with_a_long_suffix"))
+        self.assertIsNone(TableNameSuggester([]).suggest("users"))
+
+    def test_best_suggestion_prefers_smallest_distance(self):
+        """Test that the closest candidate wins, ties broken by name."""
+        suggester = TableNameSuggester(["orders_b", "orders_a", "orders"])
+        self.assertEqual(
+            suggester.candidates("orders_c"),
+            {"orders_a": 1, "orders_b": 1, "orders": 2},
+        )
+        self.assertEqual(suggester.suggest("orders_c"), "orders_a")
+        self.assertEqual(TableNameSuggester(["abcd", "abce"]).suggest("abcf"), "abcd")
+
+
+@pytest.mark.performance
+class TestTableNameSuggesterPerformance(unittest.TestCase):
+    """Benchmark suggestions against thousands of defined tables."""
+
+    def test_suggestions_for_large_project(self):
+        """Test 1k undefined names against 10k defined tables stays interactive."""
+        defined = generate_table_names(10_000)
+        rng = random.Random(11)
+        undefined = []
+        for name in rng.sample(defined, 500):
+            position = rng.randrange(len(name))
+            undefined.append(name[:position] + name[position + 1 :])
+        undefined.extend(f"external_source_{i}" for i in range(500))
+
+        start = time.perf_counter()
+        suggester = TableNameSuggester(defined)
+        suggestions = [suggester.suggest(name) for name in undefined]
+        elapsed = time.perf_counter() - start
+
+        print(f"\nSuggested 1k names against 10k tables in {elapsed:.3f}s")
+        self.assertTrue(all(suggestions[:500]))
+        self.assertLess(elapsed, 5.0)
+
+
+if __name__ == "__main__":
+    unittest.main()
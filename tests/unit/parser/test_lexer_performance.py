@@ -0,0 +1,163 @@
+"""Tokenization and scaling tests for the single-pass lexer."""
+
+import time
+import unittest
+
+import pytest
+
+from sqlflow.parser.lexer import Lexer, TokenType
+
+
+def generate_pipeline(num_lines: int) -> str:
+    """Generate a synthetic .sf pipeline of roughly num_lines lines."""
+    blocks = []
+    lines = 0
+    i = 0
+    while lines < num_lines:
+        blocks.append(
+            f"-- block {i}\n"
+            f'SOURCE src_{i} TYPE CSV PARAMS {{"path": "data/file_{i}.csv", '
+            f'"has_header": true}};\n'
+            f"LOAD raw_{i} FROM src_{i} MODE APPEND;\n"
+            f"IF ${{env}} == 'prod' THEN\n"
+            f"  CREATE TABLE t_{i} AS\n"
+            f"  SELECT a.id, a.name || '_' || b.tag AS label, a.amount * 1.5 AS x\n"
+            f"  FROM raw_{i} a JOIN dims b ON a.id = b.id\n"
+            f"  WHERE a.amount >= {i} AND a.kind IN ('x', 'y');\n"
+            f"ELSE IF ${{env|dev}} != 'test' THEN\n"
+            f"  EXPORT SELECT * FROM raw_{i} TO 's3://bucket/out_{i}.csv' "
+            f'TYPE CSV OPTIONS {{"header": true}};\n'
+            f"END IF;\n"
+        )
+        lines += 12
+        i += 1
+    return "".join(blocks)
+
+
+class TestLexerTokens(unittest.TestCase):
+    """Test token classification of the combined-pattern lexer."""
+
+    def test_keywords_are_case_insensitive_whole_words(self):
+        """Test keyword lookup for words and identifiers prefixed by keywords."""
+        tokens = Lexer("source Sources SOURCE_x FROM_ from").tokenize()
+        self.assertEqual(
+            [token.type for token in tokens],
+            [
+                TokenType.SOURCE,
+                TokenType.IDENTIFIER,
+                TokenType.IDENTIFIER,
+                TokenType.IDENTIFIER,
+                TokenType.FROM,
+                TokenType.EOF,
+            ],
+        )
+
+    def test_two_word_conditional_keywords(self):
+        """Test ELSE IF and END IF written with and without whitespace."""
+        tokens = Lexer("ELSEIF else\n  if ELSE ENDIF end if END").tokenize()
+        self.assertEqual(
+            [(token.type, token.value) for token in tokens[:-1]],
+            [
+                (TokenType.ELSE_IF, "ELSEIF"),
+                (TokenType.ELSE_IF, "else\n  if"),
+                (TokenType.ELSE, "ELSE"),
+                (TokenType.END_IF, "ENDIF"),
+                (TokenType.END_IF, "end if"),
+                (TokenType.IDENTIFIER, "END"),
+            ],
+        )
+
+    def test_positions_after_multiline_tokens(self):
+        """Test line and column tracking across multi-line tokens."""
+        text = '-- comment\nSET x = {\n  "a": 1\n} ;\n  y'
+        tokens = Lexer(text).tokenize()
+        positions = {
+            token.value: (token.line, token.column, token.char_position)
+            for token in tokens
+        }
+        self.assertEqual(positions["SET"], (2, 1, 11))
+        self.assertEqual(positions[";"], (4, 3, 32))
+        self.assertEqual(positions["y"], (5, 3, 36))
+
+
+class CountingLexer(Lexer):
+    """Lexer that counts the characters it consumes."""
+
+    def __init__(self, text: str):
+        super().__init__(text)
+        self.consumed = 0
+
+    def _advance(self, value: str) -> None:
+        self.consumed += len(value)
+        super()._advance(value)
+
+
+class CopyCountingText(str):
+    """Text that counts the characters copied out of it by slicing.
+
+    Matching each token against text[pos:] copies the rest of the input
+    for every token, which makes tokenizing quadratic.
+    """
+
+    copied = 0
+
+    def __getitem__(self, key):
+        value = super().__getitem__(key)
+        CopyCountingText.copied += len(value)
+        return value
+
+
+class TestLexerScaling(unittest.TestCase):
+    """Test that tokenizing large pipelines is a single linear pass."""
+
+    def _tokenize(self, text: str) -> CountingLexer:
+        lexer = CountingLexer(text)
+        tokens = lexer.tokenize()
+        self.assertEqual(tokens[-1].type, TokenType.EOF)
+        return lexer
+
+    def _copied(self, text: str) -> int:
+        """Count the characters copied out of the text while tokenizing it."""
+        CopyCountingText.copied = 0
+        self._tokenize(CopyCountingText(text))
+        return CopyCountingText.copied
+
+    def test_each_character_is_consumed_once(self):
+        """Test that a 10k-line pipeline is scanned exactly once."""
+        text = generate_pipeline(10_000)
+        lexer = self._tokenize(text)
+        # Characters no pattern matches are skipped one at a time as errors
+        errors = sum(token.type == TokenType.ERROR for token in lexer.tokens)
+        self.assertEqual(lexer.consumed + errors, len(text))
+        self.assertEqual(lexer.pos, len(text))
+
+    def test_text_is_not_copied_per_token(self):
+        """Test that copies grow with the input, not with tokens times input."""
+        small_text = generate_pipeline(1_000)
+        large_text = generate_pipeline(4_000)
+        small = self._copied(small_text)
+        large = self._copied(large_text)
+
+        self.assertLessEqual(large, 3 * len(large_text))
+        self.assertAlmostEqual(large / small, 4.0, delta=0.1)
+
+
+@pytest.mark.performance
+class TestLexerPerformance(unittest.TestCase):
+    """Benchmark tokenizing a large pipeline."""
+
+    def test_tokenize_20k_line_pipeline(self):
+        """Test that a 20k-line pipeline tokenizes in a few seconds."""
+        text = generate_pipeline(20_000)
+
+        start = time.perf_counter()
+        tokens = Lexer(text).tokenize()
+        elapsed = time.perf_counter() - start
+
+        print(f"\nTokenized {len(text)} characters in {elapsed:.3f}s")
+        self.assertEqual(tokens[-1].type, TokenType.EOF)
+        self.assertLess(elapsed, 5.0)
+
+
+if __name__ == "__main__":
+    unittest.main()
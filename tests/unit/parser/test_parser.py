@@ -211,6 +211,20 @@ class TestParser:
 
         assert "Expected 'PARAMS' after connector type" in str(excinfo.value)
 
+    def test_parse_source_directive_keeps_variable_references(self):
+        """Test that ${run_date} in PARAMS is left for run-time substitution."""
+        text = """SOURCE daily TYPE CSV PARAMS {
+            "path": "data/${run_date}.csv",
+            "has_header": true,
+        };"""
+
+        pipeline = Parser(text).parse(validate=False)
+
+        assert pipeline.steps[0].params == {
+            "path": "data/${run_date}.csv",
+            "has_header": True,
+        }
+
     def test_parse_source_directive_invalid_json(self):
         """Test that the parser raises an error for a SOURCE directive with invalid JSON."""
         text = """SOURCE users TYPE POSTGRES PARAMS {
@@ -0,0 +1,118 @@
+"""Import-time checks and benchmark for the package and the CLI.
+
+Each check runs in a fresh interpreter so that modules already imported by
+the test session do not hide eager imports.
+"""
+
+import json
+import subprocess
+import sys
+import time
+import unittest
+
+import pytest
+
+HEAVY_MODULES = [
+    "boto3",
+    "duckdb",
+    "googleapiclient",
+    "psycopg2",
+    "requests",
+    "sqlalchemy",
+]
+
+
+def run_python(code: str) -> dict:
+    """Run code in a fresh interpreter and return the JSON it prints last."""
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def loaded_modules_after(statements: str) -> dict:
+    """Report which heavy and connector modules statements import."""
+    return run_python(
+        f"""
+import json, sys
+{statements}
+print(json.dumps({{
+    "heavy": [m for m in {HEAVY_MODULES!r} if m in sys.modules],
+    "sqlflow": sorted(m for m in sys.modules if m.startswith("sqlflow.")),
+}}))
+"""
+    )
+
+
+class TestLazyImports(unittest.TestCase):
+    """Test that optional dependencies are only imported when used."""
+
+    def test_import_sqlflow_is_light(self):
+        """Test that importing the package loads neither UDFs nor connectors."""
+        loaded = loaded_modules_after("import sqlflow")
+        self.assertEqual(loaded["heavy"], [])
+        self.assertNotIn("sqlflow.udfs", loaded["sqlflow"])
+        self.assertNotIn("sqlflow.connectors", loaded["sqlflow"])
+
+    def test_connectors_load_on_first_lookup(self):
+        """Test that connector packages are imported by registry lookups."""
+        loaded = loaded_modules_after("import sqlflow.connectors")
+        self.assertEqual(loaded["heavy"], [])
+        self.assertNotIn("sqlflow.connectors.csv", loaded["sqlflow"])
+        self.assertNotIn("sqlflow.connectors.s3", loaded["sqlflow"])
+
+        loaded = loaded_modules_after(
+            "from sqlflow.connectors.registry import enhanced_registry\n"
+            "enhanced_registry.get_source_connector_class('csv')"
+        )
+        self.assertIn("sqlflow.connectors.csv", loaded["sqlflow"])
+        self.assertNotIn("sqlflow.connectors.s3", loaded["sqlflow"])
+
+    def test_cli_help_does_not_import_commands(self):
+        """Test that listing commands does not import command modules."""
+        loaded = loaded_modules_after(
+            "from typer.testing import CliRunner\n"
+            "from sqlflow.cli.main import app\n"
+            "result = CliRunner().invoke(app, ['--help'])\n"
+            "assert 'pipeline' in result.output, result.output"
+        )
+        self.assertEqual(loaded["heavy"], [])
+        self.assertNotIn("sqlflow.cli.commands.pipeline", loaded["sqlflow"])
+        self.assertNotIn("sqlflow.core.executors", loaded["sqlflow"])
+
+    def test_lazy_commands_match_sub_apps(self):
+        """Test that the declared help of lazy commands matches their sub-apps."""
+        from sqlflow.cli.main import SQLFlowGroup
+
+        for name, (
+            module,
+            attribute,
+            help_text,
+        ) in SQLFlowGroup.lazy_subcommands.items():
+            sub_app = getattr(__import__(module, fromlist=[attribute]), attribute)
+            self.assertEqual(sub_app.info.name, name)
+            self.assertEqual(sub_app.info.help, help_text)
+
+
+@pytest.mark.performance
+class TestImportTimePerformance(unittest.TestCase):
+    """Benchmark interpreter startup for the package and the CLI."""
+
+    def _time_import(self, module: str) -> float:
+        start = time.perf_counter()
+        subprocess.run([sys.executable, "-c", f"import {module}"], check=True)
+        return time.perf_counter() - start
+
+    def test_import_time(self):
+        """Test that importing sqlflow and its CLI stays well under a second."""
+        baseline = self._time_import("json")
+        package = self._time_import("sqlflow") - baseline
+        cli = self._time_import("sqlflow.cli.main") - baseline
+
+        print(f"\nimport sqlflow: {package:.3f}s, import sqlflow.cli.main: {cli:.3f}s")
+        self.assertLess(package, 1.0)
+        self.assertLess(cli, 1.0)
+
+
+if __name__ == "__main__":
+    unittest.main()